@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Project-relative paths shared by the asset and generator scripts
+Everything is resolved from the repository root (the parent of scripts/), so
+the tools work from any checkout and any working directory. A checkout that
+keeps assets elsewhere can override entries in civ-assets.json at the project
+root; relative values are resolved against the project root:
+
+    {"event_images": "../art/events", "cache": "D:/civ-cache"}
+
+Only the standard library is imported here, so `civ_assets.py` can list and
+dry-run commands without loading Pillow, NumPy or any provider SDK.
+"""
+
+import json
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+PROJECT_DIR = SCRIPT_DIR.parent
+CONFIG_FILE = PROJECT_DIR / 'civ-assets.json'
+
+DEFAULTS = {
+    'src': 'src',
+    'asset_images': 'src/assets/images',
+    'events_config': 'src/config/events',
+    'images': 'public/images',
+    'event_images': 'public/images/events',
+    'prompts': 'prompts/event_prompts.md',
+    'building_prompts': 'prompts/building_prompts.md',
+    'tracks': 'tracks.json',
+    'cache': '.asset-cache',
+    'dist': 'dist',
+    'android_res': 'android/app/src/main/res',
+}
+
+
+def _load():
+    paths = dict(DEFAULTS)
+    if CONFIG_FILE.exists():
+        overrides = json.loads(CONFIG_FILE.read_text(encoding='utf-8'))
+        unknown = set(overrides) - set(DEFAULTS)
+        if unknown:
+            raise ValueError(f"{CONFIG_FILE.name}: unknown path keys {sorted(unknown)}; "
+                             f"expected some of {sorted(DEFAULTS)}")
+        paths.update(overrides)
+    return {key: (PROJECT_DIR / value).resolve() for key, value in paths.items()}
+
+
+PATHS = _load()
+
+SRC_DIR = PATHS['src']
+ASSET_IMAGES_DIR = PATHS['asset_images']
+EVENTS_CONFIG_DIR = PATHS['events_config']
+IMAGES_DIR = PATHS['images']
+EVENT_IMAGES_DIR = PATHS['event_images']
+PROMPTS_FILE = PATHS['prompts']
+BUILDING_PROMPTS_FILE = PATHS['building_prompts']
+TRACKS_FILE = PATHS['tracks']
+CACHE_DIR = PATHS['cache']
+DIST_DIR = PATHS['dist']
+ANDROID_RES_DIR = PATHS['android_res']
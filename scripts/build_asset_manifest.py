@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Epoch Asset Manifest Builder - Split the image registry into per-epoch bundles
+src/utils/imageRegistry.js registers every building, event and background
+image up front. This build step assigns each image to the epochs in which the
+player can see it and writes src/utils/epochAssetManifest.generated.js:
+
+  EPOCH_ASSET_MANIFEST   epoch -> { preload, bytes, introduced, introducedBytes }
+                         preload lists every image visible in that epoch in
+                         load order; introduced is the part not visible earlier
+  ASSET_FILES            asset id ('buildings/farm') -> [file under src/assets/images, bytes]
+  UNASSIGNED_ASSETS      images that belong to no epoch
+
+so the front end can load the current epoch's preload list and prefetch the
+next epoch's introduced list. Epochs come from the configs first and the
+prompt files second:
+
+  buildings    BUILDINGS[].epoch in src/config/buildings.js (visible from that
+               epoch on), else the "## Epoch N" section of prompts/building_prompts.md
+  events       triggerConditions minEpoch/maxEpoch (via build_event_index.py),
+               else the "> **Epoch:** a - b" line of prompts/event_prompts.md
+  backgrounds  ERA_BG_MAP in src/components/layout/EraBackground.jsx
+
+Preload order within an epoch: the epoch's background, buildings (newest
+unlocks first), then events (narrowest epoch range first, so the events
+specific to this epoch load before the ones that can fire at any time).
+
+Usage:
+    python build_asset_manifest.py            # regenerate if configs or images changed
+    python build_asset_manifest.py --force
+    python build_asset_manifest.py --check    # fail if stale; list images that belong to no epoch
+    python build_asset_manifest.py --report   # print the bundles without writing
+"""
+
+import argparse
+import re
+import sys
+
+from asset_paths import ASSET_IMAGES_DIR, BUILDING_PROMPTS_FILE, PROJECT_DIR, PROMPTS_FILE, SRC_DIR
+from build_event_index import EPOCHS_FILE, event_gates, load_events
+from build_event_index import source_files as event_source_files
+from generated_module import hash_sources, read_source_hash, render_frozen_module
+from js_tokenizer import JsSyntaxError, parse_module
+
+BUILDINGS_FILE = SRC_DIR / 'config' / 'buildings.js'
+ERA_BACKGROUND_FILE = SRC_DIR / 'components' / 'layout' / 'EraBackground.jsx'
+BUILDING_PROMPTS = BUILDING_PROMPTS_FILE
+EVENT_PROMPTS = PROMPTS_FILE
+OUTPUT_FILE = SRC_DIR / 'utils' / 'epochAssetManifest.generated.js'
+
+# The directories imageRegistry.js globs, and the extension it globs for
+KINDS = ('backgrounds', 'buildings', 'events')
+IMAGE_SUFFIX = '.webp'
+
+GENERATOR_VERSION = 1
+
+_BUILDING_SECTION = re.compile(r'^## Epoch (\d+)', re.M)
+_BUILDING_ENTRY = re.compile(r'^- \*\*(\w+)\*\*:', re.M)
+_EVENT_HEADING = re.compile(r'^### .*\(`([\w-]+)`\)', re.M)
+_EVENT_EPOCH = re.compile(r'^> \*\*Epoch:\*\* (\d+|Any) - (\d+|Any)', re.M)
+_ERA_BG = re.compile(r"^\s*(\d+):\s*'([\w-]+)\.webp'", re.M)
+
+
+def image_files():
+    """(asset id, path) of every image imageRegistry.js registers"""
+    found = []
+    for kind in KINDS:
+        folder = ASSET_IMAGES_DIR / kind
+        if folder.is_dir():
+            for path in sorted(folder.glob(f'*{IMAGE_SUFFIX}')):
+                # normalizeKey strips only the last extension: 'copper_mine.bak.webp' -> 'copper_mine.bak'
+                found.append((f'{kind}/{path.name[:-len(IMAGE_SUFFIX)]}', path))
+    return found
+
+
+def source_files():
+    configs = [BUILDINGS_FILE, ERA_BACKGROUND_FILE, BUILDING_PROMPTS, EVENT_PROMPTS, EPOCHS_FILE]
+    return configs + [p for p in event_source_files() if p not in configs] + [p for _, p in image_files()]
+
+
+def epoch_count():
+    epochs = parse_module(EPOCHS_FILE.read_text(encoding='utf-8')).get('EPOCHS')
+    return len(epochs) if isinstance(epochs, list) else 8
+
+
+def building_epochs(count):
+    """building id -> (first epoch, source)"""
+    epochs = {}
+    text = BUILDING_PROMPTS.read_text(encoding='utf-8') if BUILDING_PROMPTS.exists() else ''
+    sections = list(_BUILDING_SECTION.finditer(text))
+    for i, section in enumerate(sections):
+        end = sections[i + 1].start() if i + 1 < len(sections) else len(text)
+        for m in _BUILDING_ENTRY.finditer(text, section.end(), end):
+            epochs[m.group(1)] = (int(section.group(1)), 'building_prompts.md')
+    try:
+        buildings = parse_module(BUILDINGS_FILE.read_text(encoding='utf-8')).get('BUILDINGS') or []
+    except JsSyntaxError as e:
+        print(f"[ERROR] {BUILDINGS_FILE.name}: {e}")
+        sys.exit(1)
+    for building in buildings:
+        if isinstance(building, dict) and isinstance(building.get('epoch'), int):
+            epochs[building['id']] = (min(building['epoch'], count - 1), 'buildings.js')
+    return epochs
+
+
+def event_epochs(count):
+    """event id -> ((min epoch, max epoch), source)"""
+    ranges = {}
+    text = EVENT_PROMPTS.read_text(encoding='utf-8') if EVENT_PROMPTS.exists() else ''
+    headings = list(_EVENT_HEADING.finditer(text))
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+        m = _EVENT_EPOCH.search(text, heading.end(), end)
+        if m:
+            low = 0 if m.group(1) == 'Any' else int(m.group(1))
+            high = count - 1 if m.group(2) == 'Any' else int(m.group(2))
+            ranges[heading.group(1)] = ((low, high), 'event_prompts.md')
+    events, _ = load_events()
+    for event in events:
+        if not isinstance(event, dict) or not isinstance(event.get('id'), str):
+            continue
+        epoch_range = event_gates(event, count)[0]
+        # Gates that are not literals can open in any epoch
+        ranges[event['id']] = (epoch_range or (0, count - 1), 'event config')
+    return ranges
+
+
+def background_epochs():
+    """background key -> epoch"""
+    text = ERA_BACKGROUND_FILE.read_text(encoding='utf-8') if ERA_BACKGROUND_FILE.exists() else ''
+    return {name: int(epoch) for epoch, name in _ERA_BG.findall(text)}
+
+
+def build_manifest(images, count):
+    """Assign images to epochs; returns (tables, per-source counts)"""
+    buildings = building_epochs(count)
+    events = event_epochs(count)
+    backgrounds = background_epochs()
+
+    files = {}
+    visible = {}      # asset id -> (set of epochs, preload sort key)
+    unassigned = []
+    sources = {}
+    for asset_id, path in images:
+        kind, key = asset_id.split('/', 1)
+        files[asset_id] = [path.relative_to(ASSET_IMAGES_DIR).as_posix(), path.stat().st_size]
+        if kind == 'backgrounds' and key in backgrounds:
+            epoch = backgrounds[key]
+            visible[asset_id] = ({epoch}, (0, 0, key))
+            sources['EraBackground.jsx'] = sources.get('EraBackground.jsx', 0) + 1
+        elif kind == 'buildings' and key in buildings:
+            first, source = buildings[key]
+            # Newest unlocks first: the build tab highlights what was just unlocked
+            visible[asset_id] = (set(range(first, count)), (1, -first, key))
+            sources[source] = sources.get(source, 0) + 1
+        elif kind == 'events' and key in events and events[key][0][0] <= events[key][0][1]:
+            (low, high), source = events[key]
+            visible[asset_id] = (set(range(max(low, 0), min(high, count - 1) + 1)), (2, high - low, key))
+            sources[source] = sources.get(source, 0) + 1
+        else:
+            unassigned.append(asset_id)
+
+    manifest = {}
+    seen = set()
+    for epoch in range(count):
+        ids = sorted((a for a, (epochs, _) in visible.items() if epoch in epochs), key=lambda a: visible[a][1])
+        introduced = [a for a in ids if a not in seen]
+        seen.update(ids)
+        manifest[epoch] = {
+            'preload': ids,
+            'bytes': sum(files[a][1] for a in ids),
+            'introduced': introduced,
+            'introducedBytes': sum(files[a][1] for a in introduced),
+        }
+    tables = {
+        'EPOCH_ASSET_MANIFEST': manifest,
+        'ASSET_FILES': files,
+        'UNASSIGNED_ASSETS': unassigned,
+    }
+    return tables, sources
+
+
+def render_module(tables, digest):
+    header = [
+        'Generated by scripts/build_asset_manifest.py from the images in src/assets/images,',
+        'the building/event configs and prompts/*.md. Do not edit; re-run the script instead.',
+    ]
+    return render_frozen_module(header, tables, digest)
+
+
+def print_report(tables, sources):
+    mb = 1024 * 1024
+    files = tables['ASSET_FILES']
+    total = sum(size for _, size in files.values())
+    print(f"[INFO] {len(files)} images, {total / mb:.1f} MB; epochs from "
+          + ', '.join(f"{name} ({n})" for name, n in sorted(sources.items())))
+    print()
+    print(f"  {'epoch':>5} {'images':>7} {'MB':>7} {'new':>5} {'new MB':>7}   current + next new")
+    epochs = tables['EPOCH_ASSET_MANIFEST']
+    for epoch, bundle in epochs.items():
+        following = epochs.get(epoch + 1, {'introducedBytes': 0})
+        window = (bundle['bytes'] + following['introducedBytes']) / mb
+        print(f"  {epoch:>5} {len(bundle['preload']):>7} {bundle['bytes'] / mb:>7.2f} "
+              f"{len(bundle['introduced']):>5} {bundle['introducedBytes'] / mb:>7.2f}   "
+              f"{window:.2f} MB ({window * mb / total:.0%} of all)")
+    print()
+    for asset_id in tables['UNASSIGNED_ASSETS']:
+        print(f"[WARN] {asset_id}: belongs to no epoch ({files[asset_id][1] / 1024:.0f} KB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write per-epoch image manifests with sizes and preload order')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if configs and images are unchanged')
+    parser.add_argument('--check', action='store_true',
+                        help='Do not write; fail if the manifest is stale (images in no epoch are listed)')
+    parser.add_argument('--report', action='store_true', help='Print the bundles without writing')
+    args = parser.parse_args()
+
+    digest = hash_sources(source_files(), GENERATOR_VERSION)
+    output_rel = OUTPUT_FILE.relative_to(PROJECT_DIR)
+    stale = read_source_hash(OUTPUT_FILE) != digest
+
+    if args.check:
+        failed = False
+        if stale:
+            print(f"[ERROR] {output_rel} is stale; run: python scripts/build_asset_manifest.py")
+            failed = True
+        else:
+            print(f"[OK] {output_rel} matches the current images and configs")
+        tables, _ = build_manifest(image_files(), epoch_count())
+        for asset_id in tables['UNASSIGNED_ASSETS']:
+            print(f"[WARN] {asset_id}: belongs to no epoch")
+        sys.exit(1 if failed else 0)
+
+    if args.report:
+        tables, sources = build_manifest(image_files(), epoch_count())
+        print_report(tables, sources)
+        return
+
+    if not args.force and not stale:
+        print(f"[INFO] {output_rel} is up to date")
+        return
+
+    tables, sources = build_manifest(image_files(), epoch_count())
+    OUTPUT_FILE.write_text(render_module(tables, digest), encoding='utf-8')
+    print(f"[OK] Wrote {output_rel}")
+    print_report(tables, sources)
+
+
+if __name__ == '__main__':
+    main()
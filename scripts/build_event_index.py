@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Event Trigger Index Builder - Bucket random events by epoch at build time
+Evaluates the event arrays that src/config/events/index.js combines into
+EVENTS (with js_tokenizer; no JS is executed), extracts each event's static
+gating fields from triggerConditions and writes
+src/config/events/eventTriggerIndex.generated.js:
+
+  EVENT_TRIGGER_INDEX.ids           event ids in EVENTS order (staleness guard)
+  EVENT_TRIGGER_INDEX.epochBuckets  epoch -> EVENTS positions whose epoch range covers it
+  EVENT_TRIGGER_INDEX.gates         per event [minPopulation, minScience], 0 when absent
+
+getRandomEvent then only runs canTriggerEvent over the current epoch's bucket,
+after dropping the events whose population or science gate the state misses.
+Buckets keep EVENTS order, so the filtered list (and the random pick) is
+identical to a full scan. Events whose epoch gates are not literals go in
+every bucket, and non-literal population/science gates are recorded as 0.
+classConditions are left to canTriggerEvent: a condition such as maxPop or
+maxApproval also passes for a stratum the state does not have, so they cannot
+rule out an event ahead of the full check.
+
+--verify compares the index with a brute-force scan: statically for every
+event and epoch, and (with node available) by running canTriggerEvent over
+EVENTS for generated game states.
+
+Usage:
+    python build_event_index.py             # regenerate if the event configs changed
+    python build_event_index.py --check     # fail if the generated index is stale
+    python build_event_index.py --verify [--states 500]
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+
+from generated_module import hash_sources, read_source_hash, render_frozen_module
+from js_tokenizer import JsExpr, JsSyntaxError, parse_module
+
+from asset_paths import EVENTS_CONFIG_DIR, PROJECT_DIR
+
+EVENTS_DIR = EVENTS_CONFIG_DIR
+EVENTS_INDEX = EVENTS_DIR / 'index.js'
+EPOCHS_FILE = EVENTS_DIR.parent / 'epochs.js'
+OUTPUT_FILE = EVENTS_DIR / 'eventTriggerIndex.generated.js'
+
+GENERATOR_VERSION = 2
+
+_IMPORT = re.compile(r"import\s*\{([^}]*)\}\s*from\s*'\./([\w.]+?)(?:\.js)?'")
+
+
+def _imports(index_text):
+    """local name -> (module file, exported name) for the named imports of index.js"""
+    names = {}
+    for m in _IMPORT.finditer(index_text):
+        for part in m.group(1).split(','):
+            part = part.strip()
+            if not part:
+                continue
+            exported, _, local = part.partition(' as ')
+            names[(local or exported).strip()] = (m.group(2) + '.js', exported.strip())
+    return names
+
+
+def source_files():
+    index_text = EVENTS_INDEX.read_text(encoding='utf-8')
+    modules = sorted({module for module, _ in _imports(index_text).values()} - {OUTPUT_FILE.name})
+    return [EVENTS_INDEX, EPOCHS_FILE] + [EVENTS_DIR / m for m in modules]
+
+
+def load_events():
+    """EVENTS as evaluated from index.js, plus the number of epochs"""
+    index_text = EVENTS_INDEX.read_text(encoding='utf-8')
+    declared = re.search(r'export const EVENTS\s*=\s*\[([^\]]*)\]', index_text)
+    if not declared:
+        print("[ERROR] export const EVENTS = [...] not found in src/config/events/index.js")
+        sys.exit(1)
+    spread_names = re.findall(r'\.\.\.\s*(\w+)', declared.group(1))
+
+    imports = _imports(index_text)
+    parsed = {}
+    scope = {}
+    for local in spread_names:
+        module, exported = imports[local]
+        if module not in parsed:
+            try:
+                parsed[module] = parse_module((EVENTS_DIR / module).read_text(encoding='utf-8'))
+            except JsSyntaxError as e:
+                print(f"[ERROR] {module}: {e}")
+                sys.exit(1)
+        value = parsed[module].get(exported)
+        if not isinstance(value, list):
+            print(f"[ERROR] {exported} in {module} is not an array literal")
+            sys.exit(1)
+        scope[local] = value
+
+    events = parse_module(index_text, scope=scope)['EVENTS']
+    epochs = parse_module(EPOCHS_FILE.read_text(encoding='utf-8')).get('EPOCHS')
+    return events, len(epochs) if isinstance(epochs, list) else 8
+
+
+def _literal_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def event_gates(event, epoch_count):
+    """
+    Static gating fields of one event, following canTriggerEvent in eventUtils.js
+
+    Returns:
+        (epoch range or None if not static, minPopulation, minScience)
+    """
+    conditions = event.get('triggerConditions') if isinstance(event, dict) else None
+    if conditions is None:
+        return (0, epoch_count - 1), 0, 0
+    if not isinstance(conditions, dict):
+        return None, 0, 0
+    min_epoch = conditions.get('minEpoch', 0)
+    max_epoch = conditions.get('maxEpoch', epoch_count - 1)
+    # canTriggerEvent compares with `!== undefined`, so null acts as 0 for minEpoch and maxEpoch
+    min_epoch = 0 if min_epoch is None else min_epoch
+    max_epoch = 0 if max_epoch is None else max_epoch
+    epoch_range = (min_epoch, max_epoch) if _literal_number(min_epoch) and _literal_number(max_epoch) else None
+    min_pop = conditions.get('minPopulation') or 0
+    min_science = conditions.get('minScience') or 0
+    return (epoch_range,
+            min_pop if _literal_number(min_pop) else 0,
+            min_science if _literal_number(min_science) else 0)
+
+
+def build_index(events, epoch_count):
+    buckets = {str(epoch): [] for epoch in range(epoch_count)}
+    gates = []
+    for position, event in enumerate(events):
+        epoch_range, min_pop, min_science = event_gates(event, epoch_count)
+        for epoch in range(epoch_count):
+            if epoch_range is None or epoch_range[0] <= epoch <= epoch_range[1]:
+                buckets[str(epoch)].append(position)
+        gates.append([min_pop, min_science])
+    return {
+        'eventCount': len(events),
+        'epochCount': epoch_count,
+        'ids': [e.get('id') if isinstance(e, dict) else None for e in events],
+        'epochBuckets': buckets,
+        'gates': gates,
+    }
+
+
+def render_module(index, digest):
+    header = [
+        'Generated by scripts/build_event_index.py from the event arrays combined in',
+        'src/config/events/index.js. Do not edit; re-run the script instead.',
+    ]
+    return render_frozen_module(header, {'EVENT_TRIGGER_INDEX': index}, digest)
+
+
+def verify_static(index, events, epoch_count):
+    """Brute force over every (event, epoch) pair; returns mismatch messages"""
+    problems = []
+    for epoch in range(epoch_count):
+        bucket = set(index['epochBuckets'][str(epoch)])
+        for position, event in enumerate(events):
+            conditions = event.get('triggerConditions') if isinstance(event, dict) else None
+            if isinstance(conditions, dict):
+                min_epoch = conditions.get('minEpoch')
+                max_epoch = conditions.get('maxEpoch')
+                if isinstance(min_epoch, JsExpr) or isinstance(max_epoch, JsExpr):
+                    passes = True  # unknown statically; must be in every bucket
+                else:
+                    passes = not ((min_epoch is not None and epoch < min_epoch)
+                                  or (max_epoch is not None and epoch > max_epoch))
+            else:
+                passes = True
+            if passes and position not in bucket:
+                problems.append(f"epoch {epoch}: event {index['ids'][position]} (#{position}) missing")
+            if not passes and position in bucket:
+                problems.append(f"epoch {epoch}: event {index['ids'][position]} (#{position}) should not be listed")
+    return problems
+
+
+# Runs canTriggerEvent over all EVENTS and over the gate-filtered epoch bucket for
+# generated states and reports any state where the eligible lists differ
+_RUNTIME_VERIFY = """
+const { EVENTS, canTriggerEvent } = await import('./src/config/events/index.js');
+const { EVENT_TRIGGER_INDEX } = await import('./src/config/events/eventTriggerIndex.generated.js');
+const { STRATA } = await import('./src/config/strata.js');
+let seed = 12345;
+const rand = () => ((seed = (seed * 1103515245 + 12345) % 2147483648) / 2147483648);
+const strata = Object.keys(STRATA);
+const count = Number(process.argv[1]);
+const problems = [];
+if (EVENT_TRIGGER_INDEX.eventCount !== EVENTS.length
+    || EVENT_TRIGGER_INDEX.ids.some((id, i) => EVENTS[i]?.id !== id)) {
+    problems.push('index ids do not match EVENTS order');
+}
+for (let n = 0; n < count && problems.length < 20; n++) {
+    const perStratum = (fn) => Object.fromEntries(strata.map(k => [k, fn()]));
+    const state = {
+        epoch: Math.floor(rand() * EVENT_TRIGGER_INDEX.epochCount),
+        population: Math.floor(rand() ** 2 * 20000),
+        resources: { science: Math.floor(rand() * 5000) },
+        popStructure: perStratum(() => Math.floor(rand() * 3000)),
+        classApproval: perStratum(() => Math.floor(rand() * 100)),
+        classInfluence: perStratum(() => rand() * 100),
+        classWealth: perStratum(() => rand() * 50000),
+        classWealthDelta: perStratum(() => (rand() - 0.5) * 200),
+        classIncome: perStratum(() => rand() * 100),
+    };
+    const brute = EVENTS.map((e, i) => (canTriggerEvent(e, state) ? i : -1)).filter(i => i >= 0);
+    const indexed = EVENT_TRIGGER_INDEX.epochBuckets[state.epoch].filter(i => {
+        const [minPopulation, minScience] = EVENT_TRIGGER_INDEX.gates[i];
+        return !(minPopulation && state.population < minPopulation)
+            && !(minScience && state.resources.science < minScience)
+            && canTriggerEvent(EVENTS[i], state);
+    });
+    if (brute.join() !== indexed.join()) {
+        problems.push(`state ${n} (epoch ${state.epoch}): brute force ${brute.length} events, index ${indexed.length}`);
+    }
+}
+process.stdout.write(JSON.stringify({ problems, checked: count }));
+"""
+
+
+def verify_runtime(node, states):
+    try:
+        proc = subprocess.run(
+            [node, '--import', './scripts/node_src_loader.mjs', '--input-type=module', '-e', _RUNTIME_VERIFY,
+             str(states)],
+            cwd=PROJECT_DIR, capture_output=True, text=True, encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    if proc.returncode != 0:
+        return [f"node failed: {(proc.stderr.strip().splitlines() or ['?'])[-1]}"]
+    return json.loads(proc.stdout)['problems']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompile the epoch-bucketed event trigger index')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if the event configs are unchanged')
+    parser.add_argument('--check', action='store_true', help='Do not write; fail if the generated index is stale')
+    parser.add_argument('--verify', action='store_true',
+                        help='Do not write; compare the generated index with a brute-force scan')
+    parser.add_argument('--states', type=int, default=500,
+                        help='Random game states for the node part of --verify (default: 500)')
+    parser.add_argument('--node', default='node', help='Node executable (default: node)')
+    args = parser.parse_args()
+
+    digest = hash_sources(source_files(), GENERATOR_VERSION)
+    output_rel = OUTPUT_FILE.relative_to(PROJECT_DIR)
+    stale = read_source_hash(OUTPUT_FILE) != digest
+
+    if args.check or args.verify:
+        failed = False
+        if stale:
+            print(f"[ERROR] {output_rel} is stale; run: python scripts/build_event_index.py")
+            failed = True
+        else:
+            print(f"[OK] {output_rel} matches the current event configs")
+        if args.verify and not stale:
+            events, epoch_count = load_events()
+            index = build_index(events, epoch_count)
+            problems = verify_static(index, events, epoch_count)
+            print(f"[{'ERROR' if problems else 'OK'}] Static scan: {len(events)} events x {epoch_count} epochs, "
+                  f"{len(problems)} mismatches")
+            runtime = verify_runtime(args.node, args.states)
+            if runtime is None:
+                print("[WARN] node not found; runtime scan skipped")
+            else:
+                print(f"[{'ERROR' if runtime else 'OK'}] Runtime scan: {args.states} game states, "
+                      f"{len(runtime)} mismatches")
+                problems += runtime
+            for problem in problems[:50]:
+                print(f"  - {problem}")
+            failed = failed or bool(problems)
+        sys.exit(1 if failed else 0)
+
+    if not args.force and not stale:
+        print(f"[INFO] {output_rel} is up to date")
+        return
+
+    events, epoch_count = load_events()
+    index = build_index(events, epoch_count)
+    OUTPUT_FILE.write_text(render_module(index, digest), encoding='utf-8')
+    sizes = [len(bucket) for bucket in index['epochBuckets'].values()]
+    print(f"[OK] Wrote {output_rel}")
+    print(f"[INFO] {len(events)} events; per-epoch candidates {min(sizes)}-{max(sizes)} "
+          f"(avg {sum(sizes) / len(sizes):.0f})")
+
+
+if __name__ == '__main__':
+    main()
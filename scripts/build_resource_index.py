@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Resource Index Builder - Precompute resource/building lookup tables at build time
+Reads src/config/buildings.js, buildingUpgrades.js and industryChains.js with
+js_tokenizer (no JS is executed) and writes a frozen JS module with:
+
+  RESOURCE_PRODUCERS     resource -> [{ buildingId, level, amount }] for every upgrade level
+  RESOURCE_CONSUMERS     resource -> [{ buildingId, level, amount }]
+  BUILDING_LEVEL_IO      buildingId -> [{ level, name, input, output, jobs, owner }]
+                         (level 0 is the base building, as getBuildingEffectiveConfig)
+  BUILDING_UNLOCKS       buildingId -> { epoch, requiresTech }
+  EPOCH_BUILDINGS        epoch -> buildings unlocked at that epoch
+  RESOURCE_CHAINS        resource -> industry chain ids
+  BUILDING_CHAINS        buildingId -> industry chain ids
+
+The module records a hash of its sources, so the build is skipped when the
+configs are unchanged. --check fails if the module is stale, and (with node
+available) diffs it against the runtime index and getBuildingEffectiveConfig.
+
+Usage:
+    python build_resource_index.py            # regenerate if the configs changed
+    python build_resource_index.py --force
+    python build_resource_index.py --check    # CI / pre-commit
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+from generated_module import hash_sources, read_source_hash, render_frozen_module
+from js_tokenizer import JsSyntaxError, parse_module
+
+from asset_paths import PROJECT_DIR, SRC_DIR
+
+CONFIG_DIR = SRC_DIR / 'config'
+SOURCES = [CONFIG_DIR / 'buildings.js', CONFIG_DIR / 'buildingUpgrades.js', CONFIG_DIR / 'industryChains.js']
+OUTPUT_FILE = SRC_DIR / 'logic' / 'economy' / 'resourceBuildingTables.generated.js'
+
+# Bump when the generated layout changes so existing outputs count as stale
+GENERATOR_VERSION = 1
+
+
+def sources_hash():
+    return hash_sources(SOURCES, GENERATOR_VERSION)
+
+
+def load_configs():
+    consts = {}
+    for path in SOURCES:
+        try:
+            consts.update(parse_module(path.read_text(encoding='utf-8')))
+        except JsSyntaxError as e:
+            print(f"[ERROR] {path.relative_to(PROJECT_DIR)}: {e}")
+            sys.exit(1)
+    for name in ('BUILDINGS', 'BUILDING_UPGRADES', 'INDUSTRY_CHAINS'):
+        if not isinstance(consts.get(name), (list, dict)):
+            print(f"[ERROR] {name} is not a literal in src/config; cannot build the index")
+            sys.exit(1)
+    return consts
+
+
+def _io(mapping):
+    """Numeric entries of an input/output map; expressions are dropped"""
+    if not isinstance(mapping, dict):
+        return {}
+    return {k: v for k, v in mapping.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+
+
+def effective_levels(building, upgrades):
+    """Per-level config, mirroring getBuildingEffectiveConfig in buildingUpgrades.js"""
+    base = {
+        'level': 0,
+        'name': building.get('name'),
+        'input': _io(building.get('input')),
+        'output': _io(building.get('output')),
+        'jobs': _io(building.get('jobs')),
+        'owner': building.get('owner'),
+    }
+    levels = [base]
+    for i, upgrade in enumerate(upgrades or [], start=1):
+        if not isinstance(upgrade, dict):
+            continue
+        levels.append({
+            'level': i,
+            'name': upgrade.get('name') or base['name'],
+            'input': _io(upgrade['input']) if upgrade.get('input') else base['input'],
+            'output': _io(upgrade['output']) if upgrade.get('output') else base['output'],
+            'jobs': _io(upgrade['jobs']) if upgrade.get('jobs') else base['jobs'],
+            'owner': upgrade.get('owner') or base['owner'],
+        })
+    return levels
+
+
+def build_tables(consts):
+    buildings = [b for b in consts['BUILDINGS'] if isinstance(b, dict) and isinstance(b.get('id'), str)]
+    upgrades = consts['BUILDING_UPGRADES']
+    chains = consts['INDUSTRY_CHAINS']
+
+    producers = {}
+    consumers = {}
+    level_io = {}
+    unlocks = {}
+    epoch_buildings = {}
+    for building in buildings:
+        bid = building['id']
+        levels = effective_levels(building, upgrades.get(bid))
+        level_io[bid] = levels
+        for cfg in levels:
+            for resource, amount in cfg['output'].items():
+                if amount > 0:
+                    producers.setdefault(resource, []).append(
+                        {'buildingId': bid, 'level': cfg['level'], 'amount': amount})
+            for resource, amount in cfg['input'].items():
+                if amount > 0:
+                    consumers.setdefault(resource, []).append(
+                        {'buildingId': bid, 'level': cfg['level'], 'amount': amount})
+        epoch = building.get('epoch') if isinstance(building.get('epoch'), int) else 0
+        tech = building.get('requiresTech')
+        unlocks[bid] = {'epoch': epoch, 'requiresTech': tech if isinstance(tech, str) else None}
+        epoch_buildings.setdefault(str(epoch), []).append(bid)
+
+    resource_chains = {}
+    building_chains = {}
+    for chain_id, chain in chains.items():
+        if not isinstance(chain, dict):
+            continue
+        for stage in chain.get('stages') or []:
+            if not isinstance(stage, dict):
+                continue
+            for key in ('input', 'output'):
+                resources = stage.get(key)
+                for resource in resources if isinstance(resources, list) else [resources]:
+                    if isinstance(resource, str) and chain_id not in resource_chains.setdefault(resource, []):
+                        resource_chains[resource].append(chain_id)
+            for bid in stage.get('buildings') or []:
+                if isinstance(bid, str) and chain_id not in building_chains.setdefault(bid, []):
+                    building_chains[bid].append(chain_id)
+
+    return {
+        'RESOURCE_PRODUCERS': dict(sorted(producers.items())),
+        'RESOURCE_CONSUMERS': dict(sorted(consumers.items())),
+        'BUILDING_LEVEL_IO': level_io,
+        'BUILDING_UNLOCKS': unlocks,
+        'EPOCH_BUILDINGS': dict(sorted(epoch_buildings.items(), key=lambda kv: int(kv[0]))),
+        'RESOURCE_CHAINS': dict(sorted(resource_chains.items())),
+        'BUILDING_CHAINS': dict(sorted(building_chains.items())),
+    }
+
+
+def render_module(tables, digest):
+    header = [
+        'Generated by scripts/build_resource_index.py from src/config/buildings.js,',
+        'buildingUpgrades.js and industryChains.js. Do not edit; re-run the script instead.',
+    ]
+    return render_frozen_module(header, tables, digest)
+
+
+def existing_hash():
+    return read_source_hash(OUTPUT_FILE)
+
+
+# Evaluates the real config modules and dumps what the generated tables must match
+_RUNTIME_DUMP = """
+const { BUILDINGS } = await import('./src/config/buildings.js');
+const { getBuildingEffectiveConfig, getMaxUpgradeLevel } = await import('./src/config/buildingUpgrades.js');
+const { buildResourceToOutputBuildingsIndex } = await import('./src/logic/economy/resourceBuildingIndex.js');
+const levels = {};
+BUILDINGS.forEach(b => {
+    levels[b.id] = [];
+    for (let level = 0; level <= getMaxUpgradeLevel(b.id); level++) {
+        const cfg = getBuildingEffectiveConfig(b, level);
+        levels[b.id].push({ level, name: cfg.name, input: cfg.input, output: cfg.output, jobs: cfg.jobs, owner: cfg.owner });
+    }
+});
+const index = {};
+Object.entries(buildResourceToOutputBuildingsIndex()).forEach(([res, list]) => {
+    if (list.length) index[res] = list.map(e => ({ buildingId: e.buildingId, amount: e.outputAmount }));
+});
+process.stdout.write(JSON.stringify({ levels, index }));
+"""
+
+
+def runtime_check(tables, node):
+    """Diff the tables against the JS runtime; returns a list of mismatch messages"""
+    try:
+        proc = subprocess.run(
+            [node, '--import', './scripts/node_src_loader.mjs', '--input-type=module', '-e', _RUNTIME_DUMP],
+            cwd=PROJECT_DIR, capture_output=True, text=True, encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    if proc.returncode != 0:
+        return [f"node failed: {(proc.stderr.strip().splitlines() or ['?'])[-1]}"]
+    runtime = json.loads(proc.stdout)
+
+    problems = []
+    for bid, levels in runtime['levels'].items():
+        generated = tables['BUILDING_LEVEL_IO'].get(bid)
+        if generated is None:
+            problems.append(f"{bid}: missing from BUILDING_LEVEL_IO")
+            continue
+        if len(generated) != len(levels):
+            problems.append(f"{bid}: {len(generated)} levels generated, runtime has {len(levels)}")
+        for gen, run in zip(generated, levels):
+            for key in ('name', 'input', 'output', 'jobs', 'owner'):
+                if gen[key] != run[key]:
+                    problems.append(f"{bid} level {run['level']} {key}: generated {gen[key]!r}, runtime {run[key]!r}")
+
+    base_producers = {
+        resource: [{'buildingId': e['buildingId'], 'amount': e['amount']} for e in entries if e['level'] == 0]
+        for resource, entries in tables['RESOURCE_PRODUCERS'].items()
+    }
+    for resource, entries in runtime['index'].items():
+        if base_producers.get(resource) != entries:
+            problems.append(f"producers of {resource}: generated {base_producers.get(resource)}, runtime {entries}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute resource/building tables from the config modules')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if the configs are unchanged')
+    parser.add_argument('--check', action='store_true',
+                        help='Do not write; fail if the module is stale or disagrees with the runtime')
+    parser.add_argument('--node', default='node', help='Node executable for the runtime check (default: node)')
+    parser.add_argument('--no-runtime', action='store_true', help='Skip the node runtime comparison in --check')
+    args = parser.parse_args()
+
+    digest = sources_hash()
+    output_rel = OUTPUT_FILE.relative_to(PROJECT_DIR)
+
+    if args.check:
+        failed = False
+        if existing_hash() != digest:
+            print(f"[ERROR] {output_rel} is stale; run: python scripts/build_resource_index.py")
+            failed = True
+        else:
+            print(f"[OK] {output_rel} matches the current configs")
+        if not args.no_runtime:
+            problems = runtime_check(build_tables(load_configs()), args.node)
+            if problems is None:
+                print("[WARN] node not found; runtime comparison skipped")
+            elif problems:
+                failed = True
+                print(f"[ERROR] {len(problems)} differences from the runtime index:")
+                for problem in problems[:50]:
+                    print(f"  - {problem}")
+            else:
+                print("[OK] Tables agree with getBuildingEffectiveConfig and the runtime output index")
+        sys.exit(1 if failed else 0)
+
+    if not args.force and existing_hash() == digest:
+        print(f"[INFO] {output_rel} is up to date")
+        return
+
+    tables = build_tables(load_configs())
+    OUTPUT_FILE.write_text(render_module(tables, digest), encoding='utf-8')
+    print(f"[OK] Wrote {output_rel}")
+    print(f"[INFO] {len(tables['BUILDING_LEVEL_IO'])} buildings, "
+          f"{len(tables['RESOURCE_PRODUCERS'])} produced / {len(tables['RESOURCE_CONSUMERS'])} consumed resources")
+
+
+if __name__ == '__main__':
+    main()
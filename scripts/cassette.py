@@ -0,0 +1,670 @@
+#!/usr/bin/env python3
+"""
+Provider Cassettes - Record/replay image provider traffic and load-test offline
+The generators send their HTTP traffic through http_pool (and the OpenAI client
+for DALL-E). With CASSETTE_SERVER=http://127.0.0.1:<port> set, all of it goes
+to a local server started by this script instead of the real provider:
+
+  record    Forwards to the real provider and stores every response
+            (DALL-E JSON plus the image download, Gemini inlineData, Venus
+            venus_multimodal_url data URLs) in a cassette
+  synth     Builds a cassette for venus/gemini/dalle from fixture images in
+            each provider's response format, for boxes with no network at all
+  serve     Replays a cassette with a latency / error-rate / 429 profile
+  loadtest  Replays a cassette and drives the full generate_queue.py job
+            (init + N workers, validation included) against it, then reports
+            throughput, tail latency, retries and peak worker memory
+  info      Lists what a cassette holds
+
+Replay matches the request exactly (method, URL without query, body hash).
+It then falls back to any response recorded for the same host and path, then
+for the same host, round-robin. A handful of recordings can therefore serve
+a whole job. Query strings (API keys, SAS tokens) and request headers are
+never stored.
+
+Usage:
+    python cassette.py record --cassette venus-real          # then run a generator with CASSETTE_SERVER set
+    python cassette.py synth --fixtures public/images/buildings --cassette offline
+    python cassette.py serve --cassette offline --profile flaky
+    python cassette.py loadtest --cassette offline --provider venus --workers 8 --profile throttled
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import itertools
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from asset_paths import CACHE_DIR, PROMPTS_FILE, SCRIPT_DIR
+
+CASSETTE_ROOT = CACHE_DIR / 'cassettes'
+QUEUE_SCRIPT = SCRIPT_DIR / 'generate_queue.py'
+
+DEFAULT_PORT = 8765
+CHUNK_SIZE = 64 * 1024
+
+# Endpoints the providers call, for synthesized cassettes
+VENUS_URL = 'http://v2.open.venus.oa.com/llmproxy/v1/chat/completions'
+GEMINI_URL = 'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-image:generateContent'
+DALLE_URL = 'https://api.openai.com/v1/images/generations'
+DALLE_BLOB_URL = 'https://oaidalleapiprodscus.blob.core.windows.net/private/cassette/img-{}.png'
+
+# Replay profiles; --latency/--error-rate/--rate-limit/--429-rate override them.
+# latency: seconds, "min-max", or "recorded[xF]" (recorded time times F)
+PROFILES = {
+    'instant': {'latency': '0', 'error_rate': 0.0, 'rate_limit': 0.0, 'throttle_rate': 0.0},
+    'typical': {'latency': '8-20', 'error_rate': 0.02, 'rate_limit': 0.0, 'throttle_rate': 0.0},
+    'recorded': {'latency': 'recorded', 'error_rate': 0.0, 'rate_limit': 0.0, 'throttle_rate': 0.0},
+    'flaky': {'latency': '5-30', 'error_rate': 0.15, 'rate_limit': 0.0, 'throttle_rate': 0.05},
+    'throttled': {'latency': '8-20', 'error_rate': 0.02, 'rate_limit': 0.5, 'throttle_rate': 0.0},
+}
+
+
+def _body_hash(body):
+    """Hash of a request body; JSON is canonicalized so key order doesn't matter"""
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False).encode('utf-8')
+    except (ValueError, UnicodeDecodeError):
+        pass
+    return hashlib.sha256(body or b'').hexdigest()
+
+
+def _strip_query(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class Cassette:
+    """
+    A directory of recorded responses: index.json plus content-addressed
+    bodies/<sha256>.bin, so identical images are stored once
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.bodies = self.path / 'bodies'
+        self.index_file = self.path / 'index.json'
+        self.entries = json.loads(self.index_file.read_text(encoding='utf-8')) if self.index_file.exists() else []
+        self._lock = threading.Lock()
+        self._cycles = {}
+        self._build_lookup()
+
+    def _build_lookup(self):
+        self.exact = {}
+        self.by_path = {}
+        self.by_host = {}
+        for entry in self.entries:
+            url = entry['url']
+            host = urlsplit(url).netloc
+            self.exact[(entry['method'], url, entry['body_hash'])] = entry
+            self.by_path.setdefault((entry['method'], url), []).append(entry)
+            self.by_host.setdefault((entry['method'], host), []).append(entry)
+
+    def add(self, method, url, request_body, status, content_type, body, elapsed):
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self.bodies / f"{digest}.bin"
+        with self._lock:
+            self.bodies.mkdir(parents=True, exist_ok=True)
+            if not body_path.exists():
+                body_path.write_bytes(body)
+            entry = {
+                'method': method,
+                'url': _strip_query(url),
+                'body_hash': _body_hash(request_body),
+                'status': status,
+                'content_type': content_type,
+                'body': digest,
+                'bytes': len(body),
+                'elapsed': round(elapsed, 3),
+                'recorded_at': time.time(),
+            }
+            key = (entry['method'], entry['url'], entry['body_hash'])
+            self.entries = [e for e in self.entries if (e['method'], e['url'], e['body_hash']) != key]
+            self.entries.append(entry)
+            self._build_lookup()
+            self.save()
+        return entry
+
+    def save(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_file.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.entries, indent=1), encoding='utf-8')
+        tmp.replace(self.index_file)
+
+    def _next(self, key, candidates):
+        with self._lock:
+            cycle = self._cycles.get(key)
+            if cycle is None:
+                cycle = self._cycles[key] = itertools.cycle(candidates)
+            return next(cycle)
+
+    def lookup(self, method, url, request_body):
+        """(entry, match kind) for a request, or (None, None)"""
+        url = _strip_query(url)
+        entry = self.exact.get((method, url, _body_hash(request_body)))
+        if entry:
+            return entry, 'exact'
+        candidates = self.by_path.get((method, url))
+        if candidates:
+            return self._next(('path', method, url), candidates), 'path'
+        host = urlsplit(url).netloc
+        candidates = self.by_host.get((method, host))
+        if candidates:
+            return self._next(('host', method, host), candidates), 'host'
+        return None, None
+
+    def body(self, entry):
+        return (self.bodies / f"{entry['body']}.bin").read_bytes()
+
+
+def parse_latency(value):
+    """Returns a function entry -> seconds"""
+    value = str(value)
+    if value.startswith('recorded'):
+        factor = float(value.split('x', 1)[1]) if 'x' in value else 1.0
+        return lambda entry: entry.get('elapsed', 0.0) * factor
+    if '-' in value:
+        low, high = (float(x) for x in value.split('-', 1))
+        return lambda entry: random.uniform(low, high)
+    seconds = float(value)
+    return lambda entry: seconds
+
+
+class TokenBucket:
+    """Requests per second with a burst of one second's worth; rate 0 disables it"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = max(rate, 1.0)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        if self.rate <= 0:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(max(self.rate, 1.0), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class CassetteServer(ThreadingHTTPServer):
+    """Record (forward + store) or replay server; requests arrive as /<scheme>/<host>/<path>"""
+
+    daemon_threads = True
+
+    def __init__(self, address, cassette, mode='replay', profile=None, bandwidth=0.0, seed=None, quiet=False):
+        super().__init__(address, _Handler)
+        self.cassette = cassette
+        self.mode = mode
+        profile = profile or PROFILES['instant']
+        self.latency = parse_latency(profile['latency'])
+        self.error_rate = profile['error_rate']
+        self.throttle_rate = profile['throttle_rate']
+        self.bucket = TokenBucket(profile['rate_limit'])
+        self.bandwidth = bandwidth
+        self.rng = random.Random(seed)
+        self.quiet = quiet
+        self.stats = {'requests': 0, 'exact': 0, 'path': 0, 'host': 0, 'missing': 0, 'errors': 0,
+                      'throttled': 0, 'recorded': 0, 'bytes': 0}
+        self.stats_lock = threading.Lock()
+
+    def count(self, key, n=1):
+        with self.stats_lock:
+            self.stats[key] += n
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, fmt, *args):
+        if not self.server.quiet:
+            sys.stderr.write(f"[cassette] {fmt % args}\n")
+
+    def _upstream_url(self):
+        scheme, _, rest = self.path.lstrip('/').partition('/')
+        if scheme not in ('http', 'https') or not rest:
+            return None
+        return f"{scheme}://{rest}"
+
+    def _send(self, status, body, content_type='application/json', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.server.bandwidth > 0:
+            chunk = max(1024, int(self.server.bandwidth * 1024 / 10))
+            for i in range(0, len(body), chunk):
+                self.wfile.write(body[i:i + chunk])
+                time.sleep(len(body[i:i + chunk]) / (self.server.bandwidth * 1024))
+        else:
+            self.wfile.write(body)
+        self.server.count('bytes', len(body))
+
+    def _handle(self):
+        server = self.server
+        server.count('requests')
+        length = int(self.headers.get('Content-Length') or 0)
+        request_body = self.rfile.read(length) if length else b''
+        url = self._upstream_url()
+        if url is None:
+            self._send(400, b'{"error": "expected /<scheme>/<host>/<path>"}')
+            return
+        if server.mode == 'record':
+            self._record(url, request_body)
+        else:
+            self._replay(url, request_body)
+
+    def _record(self, url, request_body):
+        import requests
+
+        headers = {k: v for k, v in self.headers.items()
+                   if k.lower() not in ('host', 'content-length', 'accept-encoding', 'connection')}
+        started = time.perf_counter()
+        try:
+            upstream = requests.request(self.command, url, data=request_body or None, headers=headers, timeout=300)
+        except requests.RequestException as e:
+            self._send(502, json.dumps({'error': f"upstream failed: {e}"}).encode('utf-8'))
+            return
+        elapsed = time.perf_counter() - started
+        content_type = upstream.headers.get('Content-Type', 'application/octet-stream')
+        if upstream.status_code == 200:
+            self.server.cassette.add(self.command, url, request_body, upstream.status_code, content_type,
+                                     upstream.content, elapsed)
+            self.server.count('recorded')
+        self._send(upstream.status_code, upstream.content, content_type)
+
+    def _replay(self, url, request_body):
+        server = self.server
+        entry, kind = server.cassette.lookup(self.command, url, request_body)
+        if entry is None:
+            server.count('missing')
+            self._send(404, json.dumps({'error': f"no cassette entry for {self.command} {_strip_query(url)}"}).encode())
+            return
+        server.count(kind)
+        if not server.bucket.take() or server.rng.random() < server.throttle_rate:
+            server.count('throttled')
+            self._send(429, b'{"error": {"code": 429, "message": "Rate limit exceeded (cassette)"}}',
+                       headers={'Retry-After': '1'})
+            return
+        time.sleep(max(0.0, server.latency(entry)))
+        if server.rng.random() < server.error_rate:
+            server.count('errors')
+            self._send(500, b'{"error": {"code": 500, "message": "Injected server error (cassette)"}}')
+            return
+        self._send(entry['status'], server.cassette.body(entry), entry['content_type'])
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+def start_server(cassette, mode, port, profile=None, bandwidth=0.0, seed=None, quiet=False):
+    server = CassetteServer(('127.0.0.1', port), cassette, mode=mode, profile=profile, bandwidth=bandwidth,
+                            seed=seed, quiet=quiet)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def resolve_profile(args):
+    profile = dict(PROFILES[args.profile])
+    for key in ('latency', 'error_rate', 'rate_limit', 'throttle_rate'):
+        value = getattr(args, key, None)
+        if value is not None:
+            profile[key] = value
+    return profile
+
+
+def cassette_path(name):
+    path = Path(name)
+    return path if path.is_absolute() or path.exists() else CASSETTE_ROOT / name
+
+
+# ---------------------------------------------------------------------------
+# synth
+
+
+def _fixture_pngs(fixtures, limit):
+    """PNG bytes of up to `limit` fixture images (re-encoded so validation sees real PNGs)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+    images = sorted(f for f in Path(fixtures).iterdir() if f.suffix.lower() in ('.png', '.jpg', '.jpeg', '.webp'))
+    out = []
+    for path in images[:limit]:
+        if path.suffix.lower() == '.png' or Image is None:
+            out.append(path.read_bytes())
+            continue
+        with Image.open(path) as img:
+            buf = io.BytesIO()
+            img.convert('RGB').save(buf, 'PNG')
+            out.append(buf.getvalue())
+    return out
+
+
+def synth_entries(cassette, pngs, providers):
+    for i, png in enumerate(pngs):
+        b64 = base64.b64encode(png).decode('ascii')
+        marker = json.dumps({'fixture': i}).encode()
+        if 'venus' in providers:
+            body = {
+                'id': f'chatcmpl-cassette-{i}',
+                'object': 'chat.completion',
+                'choices': [{
+                    'index': 0,
+                    'finish_reason': 'stop',
+                    'message': {'role': 'assistant', 'content': [{
+                        'type': 'venus_multimodal_url',
+                        'venus_multimodal_url': {'url': f'data:image/png;base64,{b64}'},
+                    }]},
+                }],
+            }
+            cassette.add('POST', VENUS_URL, marker, 200, 'application/json', json.dumps(body).encode(), 20.0)
+        if 'gemini' in providers:
+            body = {'candidates': [{
+                'content': {'role': 'model', 'parts': [{'inlineData': {'mimeType': 'image/png', 'data': b64}}]},
+                'finishReason': 'STOP',
+            }]}
+            cassette.add('POST', GEMINI_URL, marker, 200, 'application/json', json.dumps(body).encode(), 15.0)
+        if 'dalle' in providers:
+            blob_url = DALLE_BLOB_URL.format(hashlib.sha256(png).hexdigest()[:16])
+            body = {'created': int(time.time()), 'data': [{'url': blob_url, 'revised_prompt': 'cassette'}]}
+            cassette.add('POST', DALLE_URL, marker, 200, 'application/json', json.dumps(body).encode(), 12.0)
+            cassette.add('GET', blob_url, b'', 200, 'image/png', png, 1.5)
+
+
+def cmd_synth(args):
+    pngs = _fixture_pngs(args.fixtures, args.limit)
+    if not pngs:
+        print(f"[ERROR] No fixture images in {args.fixtures}")
+        sys.exit(1)
+    cassette = Cassette(cassette_path(args.cassette))
+    providers = [p.strip() for p in args.providers.split(',')]
+    synth_entries(cassette, pngs, providers)
+    print(f"[OK] {cassette.path}: {len(cassette.entries)} entries from {len(pngs)} fixtures ({', '.join(providers)})")
+
+
+# ---------------------------------------------------------------------------
+# record / serve / info
+
+
+def _serve_until_interrupted(server, mode):
+    print(f"[INFO] {mode} server on {server.url}")
+    print(f"[INFO] Point the generators at it:  {'set' if os.name == 'nt' else 'export'} "
+          f"CASSETTE_SERVER={server.url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    server.shutdown()
+    print()
+    print(f"[RESULT] {json.dumps(server.stats)}")
+
+
+def cmd_record(args):
+    cassette = Cassette(cassette_path(args.cassette))
+    server = start_server(cassette, 'record', args.port, quiet=args.quiet)
+    print(f"[INFO] Recording into {cassette.path} ({len(cassette.entries)} entries so far)")
+    _serve_until_interrupted(server, 'Record')
+
+
+def cmd_serve(args):
+    cassette = Cassette(cassette_path(args.cassette))
+    if not cassette.entries:
+        print(f"[ERROR] {cassette.path} is empty; record or synth it first")
+        sys.exit(1)
+    server = start_server(cassette, 'replay', args.port, resolve_profile(args), args.bandwidth, args.seed,
+                          quiet=args.quiet)
+    print(f"[INFO] Replaying {len(cassette.entries)} entries from {cassette.path}, profile {args.profile}")
+    _serve_until_interrupted(server, 'Replay')
+
+
+def cmd_info(args):
+    cassette = Cassette(cassette_path(args.cassette))
+    print(f"{cassette.path}: {len(cassette.entries)} entries")
+    groups = {}
+    for entry in cassette.entries:
+        group = groups.setdefault((entry['method'], entry['url'] if entry['method'] == 'POST'
+                                   else urlsplit(entry['url']).netloc), [0, 0, 0.0])
+        group[0] += 1
+        group[1] += entry['bytes']
+        group[2] += entry['elapsed']
+    for (method, target), (count, size, elapsed) in sorted(groups.items()):
+        print(f"  {method:<5} {target:<90} {count:>4} x  avg {size / count / 1024:8.1f} KB  "
+              f"avg {elapsed / count:5.1f}s")
+
+
+# ---------------------------------------------------------------------------
+# loadtest
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def _wait_rusage(proc):
+    """Wait for a child; returns its peak RSS in MB where the platform reports it"""
+    if hasattr(os, 'wait4'):
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        # ru_maxrss is KB on Linux, bytes on macOS
+        return usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+    proc.wait()
+    return None
+
+
+def _log_tail(path, lines=15):
+    try:
+        return path.read_text(encoding='utf-8', errors='replace').splitlines()[-lines:]
+    except OSError:
+        return []
+
+
+def cmd_loadtest(args):
+    import sqlite3
+
+    cassette = Cassette(cassette_path(args.cassette))
+    if not cassette.entries:
+        print(f"[ERROR] {cassette.path} is empty; record or synth it first")
+        sys.exit(1)
+    profile = resolve_profile(args)
+    server = start_server(cassette, 'replay', args.port, profile, args.bandwidth, args.seed, quiet=True)
+
+    workdir = Path(tempfile.mkdtemp(prefix='cassette-load-'))
+    db = workdir / 'queue.sqlite'
+    output_dir = workdir / 'images'
+    env = dict(os.environ, CASSETTE_SERVER=server.url, PYTHONUNBUFFERED='1')
+    env.setdefault({'venus': 'VENUS_API_KEY', 'gemini': 'GOOGLE_API_KEY', 'dalle': 'OPENAI_API_KEY'}[args.provider],
+                   'cassette')
+
+    init = [sys.executable, str(QUEUE_SCRIPT), '--db', str(db), 'init', '--prompts', str(args.prompts),
+            '--output-dir', str(output_dir), '--force']
+    if args.only:
+        init += ['--only', args.only]
+    proc = subprocess.run(init, env=env, capture_output=True, text=True, encoding='utf-8', errors='replace')
+    if proc.returncode != 0:
+        print(f"[ERROR] generate_queue.py init failed:\n{proc.stdout}{proc.stderr}")
+        sys.exit(1)
+
+    print(f"[INFO] Replaying {cassette.path.name} on {server.url} with profile {args.profile} {profile}")
+    print(f"[INFO] {args.workers} '{args.provider}' workers draining {db}")
+    work = [sys.executable, str(QUEUE_SCRIPT), '--db', str(db), 'work', '--provider', args.provider,
+            '--wait', '--lease', str(args.lease), '--max-attempts', str(args.max_attempts)]
+    if args.no_validate:
+        work.append('--no-validate')
+
+    started = time.time()
+    logs = []
+    workers = []
+    for i in range(args.workers):
+        log = open(workdir / f'worker-{i}.log', 'w', encoding='utf-8')
+        logs.append(log)
+        workers.append(subprocess.Popen(work + ['--worker-id', f'load-{i}'], env=env, stdout=log,
+                                        stderr=subprocess.STDOUT))
+    peaks = [_wait_rusage(p) for p in workers]
+    wall = time.time() - started
+    # A worker exits non-zero only when it could not run (missing SDK, bad provider setup, crash);
+    # failed tasks are recorded in the queue instead
+    crashed = {i: p.returncode for i, p in enumerate(workers) if p.returncode != 0}
+    for log in logs:
+        log.close()
+    server.shutdown()
+
+    conn = sqlite3.connect(db)
+    results = conn.execute('SELECT ok, finished_at - started_at, bytes FROM results').fetchall()
+    states = dict(conn.execute('SELECT state, COUNT(*) FROM tasks GROUP BY state').fetchall())
+    attempts = dict(conn.execute('SELECT attempts, COUNT(*) FROM tasks GROUP BY attempts').fetchall())
+    conn.close()
+
+    ok_latency = [r[1] for r in results if r[0]]
+    all_latency = [r[1] for r in results]
+    done = states.get('done', 0)
+    report = {
+        'provider': args.provider,
+        'cassette': str(cassette.path),
+        'profile': args.profile,
+        'profile_settings': profile,
+        'workers': args.workers,
+        'wall_seconds': round(wall, 2),
+        'tasks': states,
+        'attempts_histogram': attempts,
+        'attempts': len(results),
+        'throughput_per_min': round(done / wall * 60, 2) if wall else 0.0,
+        'latency_ok': {p: round(percentile(ok_latency, p), 3) for p in (50, 95, 99)},
+        'latency_all': {p: round(percentile(all_latency, p), 3) for p in (50, 95, 99)},
+        'latency_max': round(max(all_latency, default=0.0), 3),
+        'bytes_written': sum(r[2] or 0 for r in results),
+        'peak_rss_mb': {
+            'max': round(max(p for p in peaks if p is not None), 1) if any(p is not None for p in peaks) else None,
+            'sum': round(sum(p for p in peaks if p is not None), 1) if any(p is not None for p in peaks) else None,
+        },
+        'server': server.stats,
+        'worker_exit_codes': [p.returncode for p in workers],
+        'workdir': str(workdir),
+    }
+
+    print()
+    print("=" * 70)
+    print(f"Tasks: {done} done, {states.get('failed', 0)} failed, {states.get('pending', 0)} pending "
+          f"({len(results)} attempts)")
+    print(f"Wall: {wall:.1f}s   Throughput: {report['throughput_per_min']:.1f} images/min")
+    lat = report['latency_ok']
+    print(f"Latency (ok): p50 {lat[50]:.2f}s  p95 {lat[95]:.2f}s  p99 {lat[99]:.2f}s  max {report['latency_max']:.2f}s")
+    print(f"Attempts per task: {dict(sorted(attempts.items()))}")
+    if report['peak_rss_mb']['max'] is not None:
+        print(f"Peak RSS: {report['peak_rss_mb']['max']:.1f} MB per worker, "
+              f"{report['peak_rss_mb']['sum']:.1f} MB summed over {args.workers} workers")
+    s = server.stats
+    print(f"Server: {s['requests']} requests, {s['throttled']} x 429, {s['errors']} x 500, {s['missing']} unmatched, "
+          f"{s['bytes'] / 1024 / 1024:.1f} MB served")
+    print("=" * 70)
+
+    for i, code in crashed.items():
+        print(f"[ERROR] worker-{i} exited with code {code}; end of worker-{i}.log:")
+        for line in _log_tail(workdir / f'worker-{i}.log'):
+            print(f"  {line}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"[INFO] Report written to {args.output}")
+    if args.keep:
+        print(f"[INFO] Queue, images and worker logs kept in {workdir}")
+    else:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if s['missing']:
+        print(f"[WARN] {s['missing']} requests had no cassette entry; record or synth the '{args.provider}' endpoints")
+    if crashed:
+        print(f"[ERROR] {len(crashed)} of {args.workers} workers failed; the numbers above do not measure throughput")
+        sys.exit(1)
+
+
+def _add_profile_args(parser):
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='instant', help='Replay profile (default: instant)')
+    parser.add_argument('--latency', help='Override latency: seconds, "min-max", or "recorded[xF]"')
+    parser.add_argument('--error-rate', type=float, help='Override the injected HTTP 500 rate (0-1)')
+    parser.add_argument('--rate-limit', type=float, help='Override the allowed requests/second before 429 (0 = off)')
+    parser.add_argument('--429-rate', dest='throttle_rate', type=float, help='Override the random 429 rate (0-1)')
+    parser.add_argument('--bandwidth', type=float, default=0.0, help='Throttle response bodies to KB/s (default: off)')
+    parser.add_argument('--seed', type=int, help='Seed for injected errors')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record/replay image provider traffic and load-test the generators')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_record = sub.add_parser('record', help='Forward to the real providers and record responses')
+    p_record.add_argument('--cassette', default='default', help=f'Cassette name under {CASSETTE_ROOT} or a path')
+    p_record.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Listen port (default: {DEFAULT_PORT})')
+    p_record.add_argument('--quiet', action='store_true', help='Do not log every request')
+    p_record.set_defaults(func=cmd_record)
+
+    p_synth = sub.add_parser('synth', help='Build a cassette from fixture images, without network')
+    p_synth.add_argument('--fixtures', required=True, help='Directory of fixture images')
+    p_synth.add_argument('--cassette', default='default', help=f'Cassette name under {CASSETTE_ROOT} or a path')
+    p_synth.add_argument('--providers', default='venus,gemini,dalle', help='Providers to synthesize (default: all)')
+    p_synth.add_argument('--limit', type=int, default=8, help='Fixture images to use (default: 8)')
+    p_synth.set_defaults(func=cmd_synth)
+
+    p_serve = sub.add_parser('serve', help='Replay a cassette')
+    p_serve.add_argument('--cassette', default='default', help=f'Cassette name under {CASSETTE_ROOT} or a path')
+    p_serve.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Listen port (default: {DEFAULT_PORT})')
+    p_serve.add_argument('--quiet', action='store_true', help='Do not log every request')
+    _add_profile_args(p_serve)
+    p_serve.set_defaults(func=cmd_serve)
+
+    p_load = sub.add_parser('loadtest', help='Drive the full generate_queue job against a replayed cassette')
+    p_load.add_argument('--cassette', default='default', help=f'Cassette name under {CASSETTE_ROOT} or a path')
+    p_load.add_argument('--provider', choices=('venus', 'gemini', 'dalle'), default='venus',
+                        help='Provider the workers use (default: venus)')
+    p_load.add_argument('--workers', type=int, default=4, help='Worker processes (default: 4)')
+    p_load.add_argument('--prompts', default=str(PROMPTS_FILE), help='Prompts markdown file')
+    p_load.add_argument('--only', help='Only these event IDs (comma-separated)')
+    p_load.add_argument('--lease', type=float, default=180.0, help='Worker lease seconds (default: 180)')
+    p_load.add_argument('--max-attempts', type=int, default=3, help='Attempts per task (default: 3)')
+    p_load.add_argument('--no-validate', action='store_true', help='Skip the image validation gate')
+    p_load.add_argument('--port', type=int, default=0, help='Server port (default: any free port)')
+    p_load.add_argument('--output', help='Write the report as JSON')
+    p_load.add_argument('--keep', action='store_true', help='Keep the queue, images and worker logs')
+    _add_profile_args(p_load)
+    p_load.set_defaults(func=cmd_loadtest)
+
+    p_info = sub.add_parser('info', help='Summarize a cassette')
+    p_info.add_argument('--cassette', default='default', help=f'Cassette name under {CASSETTE_ROOT} or a path')
+    p_info.set_defaults(func=cmd_info)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
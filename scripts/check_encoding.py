@@ -1,36 +1,56 @@
+#!/usr/bin/env python3
+"""
+Encoding Check - Report whether a source file decodes as UTF-8 or GBK
+Prints the lines around --line with whichever encoding works.
 
-import os
+Usage:
+    python check_encoding.py
+    python check_encoding.py src/logic/simulation.js --line 3450
+"""
 
-path = 'f:\\Developent\\civ-game\\src\\logic\\simulation.js'
+import argparse
+import sys
+from pathlib import Path
 
-try:
-    with open(path, 'rb') as f:
-        # Read around line 3450
-        content = f.read()
-        
-    print(f"File size: {len(content)}")
-    
-    # Try decoding as utf-8
+from asset_paths import PROJECT_DIR, SRC_DIR
+
+DEFAULT_FILE = SRC_DIR / 'logic' / 'simulation.js'
+
+
+def show_lines(decoded, line, context):
+    lines = decoded.splitlines()
+    for i in range(max(0, line - 1 - context), min(len(lines), line + context)):
+        print(f"Line {i + 1}: {lines[i]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check whether a file decodes as UTF-8 or GBK')
+    parser.add_argument('path', nargs='?', default=str(DEFAULT_FILE), help='File to check (default: src/logic/simulation.js)')
+    parser.add_argument('--line', type=int, default=3452, help='Line to show context around (default: 3452)')
+    parser.add_argument('--context', type=int, default=6, help='Lines of context (default: 6)')
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    if not path.is_absolute() and not path.exists():
+        path = PROJECT_DIR / path
     try:
-        decoded = content.decode('utf-8')
-        print("UTF-8 Decode: Success")
-        lines = decoded.splitlines()
-        for i, line in enumerate(lines):
-            if i > 3445 and i < 3460:
-                print(f"Line {i+1}: {line}")
-    except Exception as e:
-        print(f"UTF-8 Decode: Failed ({e})")
-        
-        # Try GBK
+        content = path.read_bytes()
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"File size: {len(content)}")
+    for encoding in ('utf-8', 'gbk'):
         try:
-            decoded = content.decode('gbk')
-            print("GBK Decode: Success")
-            lines = decoded.splitlines()
-            for i, line in enumerate(lines):
-                if i > 3445 and i < 3460:
-                    print(f"Line {i+1}: {line}")
-        except Exception as e2:
-             print(f"GBK Decode: Failed ({e2})")
-
-except Exception as e:
-    print(f"Error: {e}")
+            decoded = content.decode(encoding)
+        except UnicodeDecodeError as e:
+            print(f"{encoding.upper()} Decode: Failed ({e})")
+            continue
+        print(f"{encoding.upper()} Decode: Success")
+        show_lines(decoded, args.line, args.context)
+        return
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
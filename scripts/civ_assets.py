@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+civ-assets - One entry point for the asset, generator and analysis scripts
+Each subcommand runs one script in scripts/ exactly as if it were invoked
+directly (same arguments, same output, same exit code). Only the chosen
+script is imported, so Pillow, NumPy and the provider SDKs load only for the
+subcommands that need them, and `list`, `--help`, the generators' --list and
+--dry-run start without them. Paths come from asset_paths.py (overridable in
+civ-assets.json at the project root).
+
+Usage:
+    python civ_assets.py                          # list subcommands
+    python civ_assets.py gen-venus --dry-run --only good_harvest
+    python civ_assets.py validate-images public/images/events --jobs 4
+    python civ_assets.py paths                    # show the resolved project paths
+    npm run civ-assets -- compress-webp --help
+"""
+
+import runpy
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+
+# name -> (module in scripts/, group, summary); summaries are kept here so
+# listing never has to import a script
+COMMANDS = {
+    # Event image generation
+    'gen-dalle': ('generate_event_images', 'generate', 'Generate event images with DALL-E 3 (openai)'),
+    'gen-gemini': ('generate_event_images_gemini', 'generate', 'Generate event images with the Gemini REST API'),
+    'gen-google': ('generate_event_images_google', 'generate', 'Generate event images with Google AI Studio'),
+    'gen-genai': ('generate_event_images_genai', 'generate', 'Generate event images with the google-genai SDK'),
+    'gen-venus': ('generate_event_images_venus', 'generate', 'Generate event images through Venus'),
+    'queue': ('generate_queue', 'generate', 'SQLite work queue for resumable multi-worker generation'),
+    'cassette': ('cassette', 'generate', 'Record/replay provider traffic and load-test offline'),
+    'prompts': ('compile_event_prompts', 'generate', 'Compile prompts/event_prompts.md from the event configs'),
+    # Images
+    'validate-images': ('validate_images', 'images', 'Catch broken generator output, optionally quarantining it'),
+    'compress': ('compress_images', 'images', 'Compress images with Pillow'),
+    'compress-advanced': ('compress_images_advanced', 'images', 'Resize and compress images with presets'),
+    'compress-png': ('compress_png', 'images', 'Resize large PNGs and optimize them'),
+    'compress-webp': ('compress_to_webp', 'images', 'Convert PNG to WebP'),
+    'encode-tournament': ('encode_tournament', 'images', 'Try several encodings per image, keep the smallest'),
+    'remove-bg': ('remove_bg', 'images', 'Remove flat backgrounds from building sprites'),
+    'app-icons': ('generate_app_icons', 'images', 'Generate Android launcher icons from logo.png'),
+    'android-res': ('optimize_android_res', 'images', 'Right-size and re-encode Android res rasters'),
+    'pixel-cache': ('pixel_cache', 'images', 'Inspect or trim the shared decoded-pixel cache'),
+    'contact-sheets': ('contact_sheets', 'images', 'Paged contact sheets and an HTML index for reviewing art'),
+    # Build
+    'event-index': ('build_event_index', 'build', 'Precompile the epoch-bucketed event trigger index'),
+    'resource-index': ('build_resource_index', 'build', 'Precompute resource/building lookup tables'),
+    'asset-manifest': ('build_asset_manifest', 'build', 'Per-epoch image bundles with sizes and preload order'),
+    'precompress': ('precompress_dist', 'build', 'Write .br/.gz siblings and check asset size budgets'),
+    'music': ('music_pipeline', 'build', 'Low-bitrate music variants, loudness gains and intros'),
+    # Saves and performance
+    'save-inspect': ('save_inspector', 'analysis', 'Attribute serialized bytes to each subtree of a save'),
+    'save-lab': ('save_compression_lab', 'analysis', 'Measure codecs for compressed saves'),
+    'save-corpus': ('save_corpus', 'analysis', 'Decode many saves into a columnar analytics store'),
+    'sim-bench': ('sim_bench', 'analysis', 'Benchmark simulateTick across scenarios and saves'),
+    'tick-delta': ('tick_delta', 'analysis', 'Per-field size and change rate of the worker tick messages'),
+    'cpu-profile': ('cpu_profile', 'analysis', 'Fold .cpuprofile samples into a hot-function report'),
+    'alloc-audit': ('js_alloc_audit', 'analysis', 'Rank allocation-heavy JS patterns on the simulateTick path'),
+    'event-chunk-lab': ('event_chunk_lab', 'analysis', 'Measure how much event data a per-epoch loader could defer'),
+    # Source text maintenance
+    'check-encoding': ('check_encoding', 'text', 'Check whether a source file is UTF-8 or GBK'),
+    'convert-encoding': ('convert_encoding', 'text', 'Convert a GBK source file to UTF-8'),
+    'find-garbled': ('find_garbled', 'text', 'Find template strings that render garbled amounts'),
+}
+
+GROUPS = {
+    'generate': 'Event image generation',
+    'images': 'Images',
+    'build': 'Build steps',
+    'analysis': 'Saves and performance',
+    'text': 'Source text',
+}
+
+
+def print_commands():
+    print("usage: civ_assets.py <command> [args...]    (civ_assets.py <command> --help for options)")
+    for group, title in GROUPS.items():
+        print()
+        print(f"{title}:")
+        for name, (module, command_group, summary) in COMMANDS.items():
+            if command_group == group:
+                print(f"  {name:<18} {summary}")
+    print()
+    print("Other:")
+    print(f"  {'list':<18} Show this list")
+    print(f"  {'paths':<18} Show the project paths every command uses")
+
+
+def print_paths():
+    from asset_paths import CONFIG_FILE, PATHS, PROJECT_DIR
+
+    source = CONFIG_FILE.name if CONFIG_FILE.exists() else 'defaults'
+    print(f"Project: {PROJECT_DIR}  ({source})")
+    for key, path in PATHS.items():
+        print(f"  {key:<18} {path}{'' if path.exists() else '  (missing)'}")
+
+
+def _suggest(name):
+    import difflib
+
+    return difflib.get_close_matches(name, list(COMMANDS), n=3)
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    timing = '--timing' in argv[:1]
+    if timing:
+        argv.pop(0)
+    if not argv or argv[0] in ('list', '-h', '--help'):
+        print_commands()
+        return 0
+    if argv[0] == 'paths':
+        print_paths()
+        return 0
+
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        suggestions = _suggest(name)
+        print(f"[ERROR] Unknown command '{name}'"
+              + (f"; did you mean {', '.join(suggestions)}?" if suggestions else ''))
+        print("Run: python civ_assets.py list")
+        return 2
+
+    module = COMMANDS[name][0]
+    if str(SCRIPT_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPT_DIR))
+    sys.argv = [module, *rest]
+    start = time.perf_counter()
+    try:
+        # run_module executes the script as __main__, so `if __name__ == '__main__'`
+        # blocks and `exit(main())` behave exactly as when the script is run directly;
+        # alter_sys keeps sys.modules['__main__'] pointing at it for process pools
+        runpy.run_module(module, run_name='__main__', alter_sys=True)
+    except SystemExit as e:
+        code = e.code
+    else:
+        code = 0
+    if timing:
+        print(f"[INFO] {name} finished in {(time.perf_counter() - start) * 1000:.0f} ms", file=sys.stderr)
+    return code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
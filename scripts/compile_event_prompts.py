@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Event Prompt Compiler - Keep prompts/event_prompts.md in sync with src/config/events
+Extracts id, name, description and trigger epochs from every event source
+file with js_tokenizer (no JS is executed) and renders one `## Source: <file>`
+section per file from a style template, in the layout the image generators
+parse (### name (`id`) ... ```text prompt```).
+
+Each generated section records a hash of its events and the template. A
+re-run only re-parses source files whose content hash changed (extracted
+events are cached in .asset-cache/) and only rewrites sections whose hash
+changed; the header and hand-written sections such as "Dynamic & Generic
+Events" are kept as they are.
+
+Usage:
+    python compile_event_prompts.py
+    python compile_event_prompts.py --template my_style.txt
+    python compile_event_prompts.py --check      # fail if the file is out of date
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from js_tokenizer import JsSyntaxError, parse_module
+
+from asset_paths import CACHE_DIR, EVENTS_CONFIG_DIR, PROJECT_DIR, PROMPTS_FILE
+
+EVENTS_DIR = EVENTS_CONFIG_DIR
+CACHE_FILE = CACHE_DIR / 'event_prompts.json'
+
+# Bump when extraction or section layout changes so every section is rebuilt
+COMPILER_VERSION = 1
+
+DEFAULT_TEMPLATE = ('A cinematic oil painting of {name}, {epoch}. {description} Victoria 3 art style, '
+                    'heavy impasto, dramatic lighting, detailed background, no text, masterpiece. --ar 16:9')
+
+EPOCH_NAMES = {
+    0: 'Stone Age',
+    1: 'Bronze Age',
+    2: 'Classical Era',
+    3: 'Middle Ages',
+    4: 'Age of Exploration',
+    5: 'Enlightenment Era',
+    6: 'Industrial Revolution',
+    7: 'Modern Era',
+}
+
+DEFAULT_HEADER = """# Event Image Generation Prompts
+
+> [!NOTE]
+> This file contains AI validation prompts for all static game events.
+> **Style Guide:** Victoria 3 art style, oil painting texture, cinematic composition, highly detailed.
+> **Aspect Ratio:** 16:9 (--ar 16:9)
+
+"""
+
+SOURCE_HEADING = '## Source: '
+_HASH_LINE = re.compile(r'^<!-- source-hash: ([0-9a-f]{64}) -->$', re.M)
+_SECTION_START = re.compile(r'^## ', re.M)
+
+
+def sha256_text(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def source_files():
+    return sorted((p for p in EVENTS_DIR.glob('*.js') if not p.name.endswith('.generated.js')),
+                  key=lambda p: p.name.lower())
+
+
+def _int_or_none(value):
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def extract_events(text):
+    """Static events (dicts with string id and name) from the top-level arrays of a module"""
+    events = []
+    for value in parse_module(text).values():
+        if not isinstance(value, list):
+            continue
+        for event in value:
+            if not (isinstance(event, dict) and isinstance(event.get('id'), str)
+                    and isinstance(event.get('name'), str)):
+                continue
+            description = event.get('description')
+            triggers = event.get('triggerConditions')
+            triggers = triggers if isinstance(triggers, dict) else {}
+            events.append({
+                'id': event['id'],
+                'name': event['name'],
+                'description': ' '.join(description.split()) if isinstance(description, str) else '',
+                'minEpoch': _int_or_none(triggers.get('minEpoch')),
+                'maxEpoch': _int_or_none(triggers.get('maxEpoch')),
+            })
+    return events
+
+
+def load_cache():
+    if CACHE_FILE.exists():
+        try:
+            cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+            if cache.get('version') == COMPILER_VERSION:
+                return cache.get('files', {})
+        except (OSError, json.JSONDecodeError):
+            pass
+    return {}
+
+
+def save_cache(files):
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps({'version': COMPILER_VERSION, 'files': files}, ensure_ascii=False),
+                          encoding='utf-8')
+
+
+def collect_events(cache):
+    """source name -> events, parsing only files whose hash is not cached; returns (events, parsed names)"""
+    by_source = {}
+    parsed = []
+    for path in source_files():
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        cached = cache.get(path.name)
+        if cached and cached.get('hash') == digest:
+            by_source[path.name] = cached['events']
+            continue
+        try:
+            events = extract_events(raw.decode('utf-8'))
+        except JsSyntaxError as e:
+            print(f"[ERROR] {path.relative_to(PROJECT_DIR)}: {e}")
+            sys.exit(1)
+        cache[path.name] = {'hash': digest, 'events': events}
+        by_source[path.name] = events
+        parsed.append(path.name)
+    for stale in set(cache) - set(by_source):
+        del cache[stale]
+    return by_source, parsed
+
+
+def select_events(by_source):
+    """Events per section: named, described, first occurrence of an id wins, ordered by minEpoch"""
+    seen = set()
+    sections = {}
+    for source, events in by_source.items():
+        kept = []
+        for event in events:
+            if event['name'] == 'Unknown' or not event['description'] or event['id'] in seen:
+                continue
+            seen.add(event['id'])
+            kept.append(event)
+        if kept:
+            sections[source] = sorted(kept, key=lambda e: e['minEpoch'] or 0)
+    return sections
+
+
+def epoch_context(event):
+    for epoch in (event['minEpoch'], event['maxEpoch']):
+        if epoch is not None:
+            return EPOCH_NAMES.get(epoch, 'Historical setting')
+    return 'Historical setting'
+
+
+def _epoch_label(value):
+    return 'Any' if value is None else str(value)
+
+
+def section_hash(source, events, template):
+    return sha256_text(json.dumps([COMPILER_VERSION, source, template, events], ensure_ascii=False))
+
+
+def render_section(source, events, template, digest):
+    parts = [f'{SOURCE_HEADING}{source}\n<!-- source-hash: {digest} -->\n\n']
+    for e in events:
+        prompt = template.format_map({'name': e['name'], 'epoch': epoch_context(e), 'description': e['description'],
+                                      'id': e['id']})
+        parts.append(
+            f"### {e['name']} (`{e['id']}`)\n"
+            f"> **Description:** {e['description']}\n"
+            f"> **Epoch:** {_epoch_label(e['minEpoch'])} - {_epoch_label(e['maxEpoch'])}\n\n"
+            f"```text\n{prompt}\n```\n\n")
+    parts.append('\n')
+    return ''.join(parts)
+
+
+def split_document(text):
+    """(header, [(heading line, section text)]) with section texts concatenating back to the input"""
+    starts = [m.start() for m in _SECTION_START.finditer(text)]
+    if not starts:
+        return text, []
+    header = text[:starts[0]]
+    sections = []
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        chunk = text[start:end]
+        sections.append((chunk.split('\n', 1)[0], chunk))
+    return header, sections
+
+
+def compile_document(existing, sections, template):
+    """New document text plus (rebuilt, kept, removed) source section names"""
+    header, old_sections = split_document(existing) if existing else (DEFAULT_HEADER, [])
+    old_source = {}
+    other = []
+    for heading, chunk in old_sections:
+        if heading.startswith(SOURCE_HEADING):
+            old_source[heading[len(SOURCE_HEADING):].strip()] = chunk
+        else:
+            other.append(chunk)
+
+    rebuilt, kept = [], []
+    out = [header]
+    for source, events in sections.items():
+        digest = section_hash(source, events, template)
+        chunk = old_source.get(source)
+        m = _HASH_LINE.search(chunk) if chunk else None
+        if m and m.group(1) == digest:
+            out.append(chunk)
+            kept.append(source)
+        else:
+            out.append(render_section(source, events, template, digest))
+            rebuilt.append(source)
+    out.extend(other)
+    removed = sorted(set(old_source) - set(sections))
+    return ''.join(out), rebuilt, kept, removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile prompts/event_prompts.md from the event configs')
+    parser.add_argument('--output', default=str(PROMPTS_FILE), help=f'Markdown file to update (default: {PROMPTS_FILE})')
+    parser.add_argument('--template',
+                        help='Text file with the prompt template ({name}, {epoch}, {description}, {id}); '
+                             'default is the Victoria 3 oil painting style')
+    parser.add_argument('--check', action='store_true', help='Do not write; exit 1 if the file is out of date')
+    parser.add_argument('--force', action='store_true', help='Re-parse every source and rebuild every section')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    template = DEFAULT_TEMPLATE
+    if args.template:
+        template = Path(args.template).read_text(encoding='utf-8').strip()
+    try:
+        template.format_map({'name': '', 'epoch': '', 'description': '', 'id': ''})
+    except (KeyError, ValueError, IndexError) as e:
+        print(f"[ERROR] Bad template: {e!r}; available fields are {{name}}, {{epoch}}, {{description}}, {{id}}")
+        sys.exit(1)
+
+    cache = {} if args.force else load_cache()
+    by_source, parsed = collect_events(cache)
+    sections = select_events(by_source)
+
+    output = Path(args.output)
+    existing = output.read_text(encoding='utf-8') if output.exists() else ''
+    if args.force:
+        existing = re.sub(_HASH_LINE, '<!-- source-hash: stale -->', existing)
+    text, rebuilt, kept, removed = compile_document(existing, sections, template)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    event_count = sum(len(events) for events in sections.values())
+    if args.check:
+        if text != existing:
+            print(f"[ERROR] {output.name} is out of date (sections: {', '.join(rebuilt + removed)}); "
+                  f"run: python scripts/compile_event_prompts.py")
+            sys.exit(1)
+        print(f"[OK] {output.name} matches {event_count} events in {len(sections)} source files")
+        return
+
+    save_cache(cache)
+    if text != existing:
+        output.write_text(text, encoding='utf-8')
+    print(f"[INFO] Parsed {len(parsed)} of {len(by_source)} event files; {event_count} events")
+    for source in rebuilt:
+        print(f"[OK] Rebuilt section {source} ({len(sections[source])} events)")
+    for source in removed:
+        print(f"[WARN] Removed section {source} (no static events left)")
+    print(f"[RESULT] {len(rebuilt)} rebuilt, {len(kept)} unchanged in {elapsed:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,10 +9,11 @@ Advanced Image Compression Script
 import os
 import subprocess
 import shutil
-from pathlib import Path
 from PIL import Image
 import sys
 
+from asset_paths import EVENT_IMAGES_DIR
+
 def get_actual_format(filepath):
     """Detect actual image format by reading file header"""
     with open(filepath, 'rb') as f:
@@ -111,9 +112,7 @@ def compress_jpeg_with_pillow(filepath, quality=85):
 
 def main():
     # Define paths
-    script_dir = Path(__file__).parent
-    project_dir = script_dir.parent
-    images_dir = project_dir / 'public' / 'images' / 'events'
+    images_dir = EVENT_IMAGES_DIR
     backup_dir = images_dir / 'backup_original'
     
     print("=" * 70)
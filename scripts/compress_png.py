@@ -8,6 +8,8 @@ import os
 import sys
 from pathlib import Path
 
+from asset_paths import IMAGES_DIR
+
 try:
     from PIL import Image
 except ImportError:
@@ -71,9 +73,7 @@ def compress_png(input_path, max_dimension=1024):
         return None
 
 def main():
-    script_dir = Path(__file__).parent
-    project_dir = script_dir.parent
-    images_dir = project_dir / 'public' / 'images'
+    images_dir = IMAGES_DIR
     
     print("=" * 70)
     print("   PNG Compression Script")
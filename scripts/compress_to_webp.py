@@ -4,16 +4,47 @@ Image Compression Script - Convert PNG to WebP for much smaller file sizes
 WebP format can reduce file size by 50-80% compared to PNG
 """
 
-import os
+import argparse
 import sys
 from pathlib import Path
 
+from asset_paths import IMAGES_DIR
+
 try:
     from PIL import Image
 except ImportError:
     print("[ERROR] Pillow not installed. Run: pip install Pillow")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: decoded pixels are shared with the other image stages (pixel_cache.py),
+# which exits without NumPy
+if np is not None:
+    import pixel_cache
+else:
+    pixel_cache = None
+
+
+def open_source(input_path):
+    """
+    Open a source image for WebP encoding
+
+    Returns:
+        (image, has_alpha) - RGBA when some pixel is transparent, RGB otherwise,
+        so a fully opaque RGBA source is encoded without an alpha channel
+    """
+    if pixel_cache is not None and pixel_cache.get_cache().enabled:
+        img = Image.fromarray(pixel_cache.get_cache().load_rgba(input_path), 'RGBA')
+    else:
+        with Image.open(input_path) as src:
+            img = src.convert('RGBA')
+    has_alpha = img.getchannel('A').getextrema()[0] < 255
+    return (img if has_alpha else img.convert('RGB')), has_alpha
+
 def convert_to_webp(input_path, quality=85):
     """
     Convert PNG to WebP format with optional quality setting
@@ -31,15 +62,9 @@ def convert_to_webp(input_path, quality=85):
     original_size = input_path.stat().st_size
     
     try:
-        with Image.open(input_path) as img:
-            # Convert to RGB if necessary (WebP doesn't support all modes)
-            if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
-                # Keep alpha channel for WebP
-                img.save(output_path, 'WEBP', quality=quality, method=6, lossless=False)
-            else:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                img.save(output_path, 'WEBP', quality=quality, method=6, lossless=False)
+        # RGBA keeps the alpha channel for WebP, everything else is encoded as RGB
+        img, _ = open_source(input_path)
+        img.save(output_path, 'WEBP', quality=quality, method=6, lossless=False)
         
         new_size = output_path.stat().st_size
         return original_size, new_size, output_path
@@ -80,19 +105,14 @@ def compress_png_aggressive(input_path, max_dimension=1024, quality=85):
     original_size = input_path.stat().st_size
     
     try:
-        with Image.open(input_path) as img:
-            original_dims = img.size
-            
-            # Resize if too large
-            img, was_resized = resize_if_too_large(img, max_dimension)
-            
-            # Convert and save as WebP
-            if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
-                img.save(output_path, 'WEBP', quality=quality, method=6)
-            else:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                img.save(output_path, 'WEBP', quality=quality, method=6)
+        img, _ = open_source(input_path)
+        original_dims = img.size
+        
+        # Resize if too large
+        img, was_resized = resize_if_too_large(img, max_dimension)
+        
+        # Save as WebP (alpha kept when the source has transparency)
+        img.save(output_path, 'WEBP', quality=quality, method=6)
         
         new_size = output_path.stat().st_size
         return original_size, new_size, was_resized, output_path, original_dims, img.size
@@ -101,10 +121,14 @@ def compress_png_aggressive(input_path, max_dimension=1024, quality=85):
         return None
 
 def main():
-    # Define paths
-    script_dir = Path(__file__).parent
-    project_dir = script_dir.parent
-    images_dir = project_dir / 'public' / 'images'
+    parser = argparse.ArgumentParser(description='Resize and convert the PNGs under public/images to WebP')
+    if pixel_cache is not None:
+        pixel_cache.add_arguments(parser)
+    args = parser.parse_args()
+    if pixel_cache is not None:
+        pixel_cache.configure(args)
+
+    images_dir = IMAGES_DIR
     
     print("=" * 70)
     print("   Aggressive Image Compression Script")
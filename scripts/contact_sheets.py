@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Contact Sheet Builder - Review a folder of generated art at a glance
+Decodes thumbnails in parallel worker processes (reduced-resolution decoding
+via draft/reduce where the format allows it), tiles them with labels
+(id, name, file size, dimensions) into paged WebP contact sheets and writes a
+static index.html linking every page and every original file.
+
+Each page records a signature of its images (name, size, mtime), their labels
+and the layout; a later run only decodes and re-renders the pages whose
+signature changed, so reviewing a regenerated batch touches only the pages
+that hold new or replaced images.
+
+Names come from the event and building configs. They are drawn on the sheet
+when a CJK-capable font is found (--font, or a system font), otherwise only
+the index.html shows them.
+
+Usage:
+    python contact_sheets.py                                  # event + building art
+    python contact_sheets.py public/images/events --columns 5 --rows 4
+    python contact_sheets.py --force --output review/
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    print("[ERROR] Pillow not installed. Run: pip install Pillow")
+    sys.exit(1)
+
+from asset_paths import ASSET_IMAGES_DIR, CACHE_DIR, EVENT_IMAGES_DIR, PROJECT_DIR, SRC_DIR
+
+DEFAULT_OUTPUT = CACHE_DIR / 'contact-sheets'
+STATE_FILE = 'sheets.json'
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+LAYOUT_VERSION = 1
+LABEL_HEIGHT = 40
+GAP = 8
+BACKGROUND = (24, 24, 28)
+TEXT = (235, 235, 235)
+MUTED = (160, 160, 170)
+
+# Tried in order when --font is not given; the first that exists and renders CJK is used
+FONT_CANDIDATES = [
+    'C:/Windows/Fonts/msyh.ttc',
+    'C:/Windows/Fonts/simhei.ttf',
+    '/System/Library/Fonts/PingFang.ttc',
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/truetype/wqy/wqy-microhei.ttc',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+]
+
+
+def default_folders():
+    folders = [ASSET_IMAGES_DIR / 'events', ASSET_IMAGES_DIR / 'buildings', EVENT_IMAGES_DIR]
+    return [f for f in folders if f.is_dir()]
+
+
+def collect_images(folder):
+    return sorted(p for p in Path(folder).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+
+
+def load_names():
+    """id -> display name from the event and building configs (empty if they cannot be read)"""
+    from js_tokenizer import JsSyntaxError, parse_module
+
+    names = {}
+    try:
+        buildings = parse_module((SRC_DIR / 'config' / 'buildings.js').read_text(encoding='utf-8')).get('BUILDINGS')
+        for building in buildings or []:
+            if isinstance(building, dict) and isinstance(building.get('name'), str):
+                names[building['id']] = building['name']
+    except (OSError, JsSyntaxError) as e:
+        print(f"[WARN] Building names unavailable: {e}")
+    try:
+        from build_event_index import load_events
+
+        for event in load_events()[0]:
+            if isinstance(event, dict) and isinstance(event.get('name'), str):
+                names[event['id']] = event['name']
+    except (OSError, JsSyntaxError, SystemExit) as e:
+        print(f"[WARN] Event names unavailable: {e}")
+    return names
+
+
+def load_font(path, size):
+    """(font, renders CJK) for --font or the first usable candidate"""
+    for candidate in ([path] if path else FONT_CANDIDATES):
+        try:
+            font = ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+        return font, _renders_cjk(font)
+    if path:
+        print(f"[WARN] Font not found: {path}; using the built-in font")
+    return ImageFont.load_default(size), False
+
+
+def _renders_cjk(font):
+    # Fonts without CJK glyphs draw the same .notdef box for every character
+    glyphs = []
+    for char in '测试':
+        img = Image.new('L', (64, 64))
+        ImageDraw.Draw(img).text((0, 0), char, fill=255, font=font)
+        glyphs.append(img.tobytes())
+    return glyphs[0] != glyphs[1]
+
+
+def make_thumbnail(path, box):
+    """
+    Worker: decode one image at reduced resolution
+
+    Returns:
+        Dict with name, bytes, original size and the RGB thumbnail (mode, size, raw bytes),
+        or an error message
+    """
+    path = Path(path)
+    try:
+        with Image.open(path) as img:
+            size = img.size
+            # JPEG decodes at 1/2..1/8 scale; other formats are box-reduced before resampling
+            img.draft('RGB', (box[0] * 2, box[1] * 2))
+            img = img.convert('RGB')
+            img.thumbnail(box, Image.Resampling.LANCZOS, reducing_gap=2.0)
+            thumb = (img.mode, img.size, img.tobytes())
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        return {'path': str(path), 'error': f"{type(e).__name__}: {e}"}
+    return {'path': str(path), 'bytes': path.stat().st_size, 'size': size, 'thumb': thumb}
+
+
+def page_signature(images, names, layout):
+    digest = hashlib.sha256(json.dumps(layout, sort_keys=True).encode())
+    for path in images:
+        stat = path.stat()
+        digest.update(f"{path.name}\0{stat.st_size}\0{stat.st_mtime_ns}\0{names.get(path.stem, '')}\n".encode())
+    return digest.hexdigest()
+
+
+def fmt_bytes(size):
+    return f"{size / 1024 / 1024:.1f} MB" if size >= 1024 * 1024 else f"{size / 1024:.0f} KB"
+
+
+def render_page(items, layout, font, small_font, draw_names, names):
+    """Tile one page of thumbnails with their labels"""
+    cell_w, cell_h = layout['thumb']
+    columns = layout['columns']
+    rows = (len(items) + columns - 1) // columns
+    sheet = Image.new('RGB', (GAP + columns * (cell_w + GAP), GAP + rows * (cell_h + LABEL_HEIGHT + GAP)), BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+    for n, item in enumerate(items):
+        x = GAP + (n % columns) * (cell_w + GAP)
+        y = GAP + (n // columns) * (cell_h + LABEL_HEIGHT + GAP)
+        stem = Path(item['path']).stem
+        if 'error' in item:
+            draw.rectangle((x, y, x + cell_w - 1, y + cell_h - 1), outline=(200, 60, 60), width=2)
+            draw.text((x + 6, y + 6), 'decode failed', fill=(230, 90, 90), font=small_font)
+            meta = item['error'][:48]
+        else:
+            mode, size, raw = item['thumb']
+            thumb = Image.frombytes(mode, size, raw)
+            sheet.paste(thumb, (x + (cell_w - size[0]) // 2, y + (cell_h - size[1]) // 2))
+            meta = f"{fmt_bytes(item['bytes'])}  {item['size'][0]}×{item['size'][1]}"
+        title = stem
+        if draw_names and names.get(stem):
+            title = f"{stem}  {names[stem]}"
+        draw.text((x, y + cell_h + 4), _fit(draw, title, font, cell_w), fill=TEXT, font=font)
+        draw.text((x, y + cell_h + 22), meta, fill=MUTED, font=small_font)
+    return sheet
+
+
+def _fit(draw, text, font, width):
+    """Trim text with an ellipsis to fit width pixels"""
+    if draw.textlength(text, font=font) <= width:
+        return text
+    while text and draw.textlength(text + '…', font=font) > width:
+        text = text[:-1]
+    return text + '…'
+
+
+def sheet_name(folder):
+    """Output subdirectory for a source folder, unique across folders with the same name"""
+    folder = Path(folder).resolve()
+    try:
+        rel = folder.relative_to(PROJECT_DIR).as_posix()
+    except ValueError:
+        rel = folder.name
+    return rel.replace('/', '_')
+
+
+def build_folder(folder, args, names, fonts, pool):
+    """Render the changed pages of one folder; returns its index entry"""
+    images = collect_images(folder)
+    out_dir = Path(args.output) / sheet_name(folder)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    state_path = out_dir / STATE_FILE
+    state = json.loads(state_path.read_text(encoding='utf-8')) if state_path.exists() and not args.force else {}
+
+    layout = {'version': LAYOUT_VERSION, 'columns': args.columns, 'rows': args.rows,
+              'thumb': [args.thumb, round(args.thumb * 9 / 16)], 'quality': args.quality,
+              'names': fonts[2]}
+    per_page = args.columns * args.rows
+    pages = [images[i:i + per_page] for i in range(0, len(images), per_page)]
+    signatures = [page_signature(page, names, layout) for page in pages]
+    dirty = [n for n, sig in enumerate(signatures)
+             if state.get('pages', {}).get(str(n + 1), {}).get('signature') != sig
+             or not (out_dir / f"page-{n + 1:03d}.webp").exists()]
+
+    # Decode only the images on dirty pages, all pages' images in one pool
+    todo = [path for n in dirty for path in pages[n]]
+    box = tuple(layout['thumb'])
+    results = {}
+    for result in pool.map(make_thumbnail, todo, [box] * len(todo), chunksize=2):
+        results[result['path']] = result
+
+    page_state = {}
+    for n, page in enumerate(pages):
+        page_file = f"page-{n + 1:03d}.webp"
+        if n in dirty:
+            items = [results[str(path)] for path in page]
+            sheet = render_page(items, layout, fonts[0], fonts[1], fonts[2], names)
+            sheet.save(out_dir / page_file, 'WEBP', quality=args.quality, method=4)
+            entries = [{'file': Path(i['path']).name, 'bytes': i.get('bytes'), 'size': i.get('size'),
+                        'error': i.get('error')} for i in items]
+        else:
+            entries = state['pages'][str(n + 1)]['images']
+        page_state[str(n + 1)] = {'signature': signatures[n], 'file': page_file, 'images': entries}
+    for stale in out_dir.glob('page-*.webp'):
+        if stale.name not in {p['file'] for p in page_state.values()}:
+            stale.unlink()
+    state = {'folder': str(Path(folder).resolve()), 'pages': page_state}
+    state_path.write_text(json.dumps(state, ensure_ascii=False, indent=1), encoding='utf-8')
+    errors = sum(1 for p in page_state.values() for i in p['images'] if i.get('error'))
+    return {'name': sheet_name(folder), 'state': state, 'images': len(images), 'rendered': len(dirty),
+            'errors': errors}
+
+
+def write_index(output, entries, names):
+    """Static index.html: every page image, then a label table per page linking the originals"""
+    output = Path(output)
+    parts = ['<!doctype html><html><head><meta charset="utf-8"><title>Contact sheets</title><style>',
+             'body{background:#18181c;color:#eee;font-family:sans-serif;margin:24px}',
+             'a{color:#9cf}img{max-width:100%;display:block;margin:8px 0}',
+             'table{border-collapse:collapse;font-size:13px;margin-bottom:32px}',
+             'td,th{padding:2px 10px;text-align:left}.err{color:#f66}',
+             '</style></head><body><h1>Contact sheets</h1><ul>']
+    for entry in entries:
+        parts.append(f'<li><a href="#{entry["name"]}">{html.escape(entry["name"])}</a> '
+                     f'({entry["images"]} images)</li>')
+    parts.append('</ul>')
+    for entry in entries:
+        folder = Path(entry['state']['folder'])
+        parts.append(f'<h2 id="{entry["name"]}">{html.escape(entry["name"])}</h2>')
+        for number, page in entry['state']['pages'].items():
+            parts.append(f'<h3>Page {number}</h3><img src="{entry["name"]}/{page["file"]}" loading="lazy">')
+            parts.append('<table><tr><th>id</th><th>name</th><th>size</th><th>dimensions</th></tr>')
+            for image in page['images']:
+                stem = Path(image['file']).stem
+                link = Path(os.path.relpath(folder / image['file'], output)).as_posix()
+                if image.get('error'):
+                    detail = f'<td colspan="2" class="err">{html.escape(image["error"])}</td>'
+                else:
+                    detail = f'<td>{fmt_bytes(image["bytes"])}</td><td>{image["size"][0]}×{image["size"][1]}</td>'
+                parts.append(f'<tr><td><a href="{html.escape(link)}">{html.escape(stem)}</a></td>'
+                             f'<td>{html.escape(names.get(stem, ""))}</td>{detail}</tr>')
+            parts.append('</table>')
+    parts.append('</body></html>')
+    (output / 'index.html').write_text('\n'.join(parts), encoding='utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build paged contact sheets and an HTML index for image folders')
+    parser.add_argument('folders', nargs='*', help='Image folders (default: src/assets/images/events and buildings, '
+                                                   'plus the generator output folder if it exists)')
+    parser.add_argument('--output', '-o', default=str(DEFAULT_OUTPUT), help=f'Output directory (default: {DEFAULT_OUTPUT})')
+    parser.add_argument('--columns', type=int, default=6, help='Thumbnails per row (default: 6)')
+    parser.add_argument('--rows', type=int, default=5, help='Rows per page (default: 5)')
+    parser.add_argument('--thumb', type=int, default=320, help='Thumbnail width in pixels (default: 320)')
+    parser.add_argument('--quality', type=int, default=82, help='WebP quality of the sheets (default: 82)')
+    parser.add_argument('--font', help='TTF/TTC font for labels (default: first CJK-capable system font)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Re-render every page')
+    args = parser.parse_args()
+
+    folders = [Path(f) for f in args.folders] or default_folders()
+    missing = [f for f in folders if not f.is_dir()]
+    if missing or not folders:
+        print(f"[ERROR] Folder not found: {', '.join(map(str, missing)) or 'no default image folders'}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    names = load_names()
+    font, cjk = load_font(args.font, 15)
+    small_font = load_font(args.font, 12)[0]
+    if not cjk:
+        print("[INFO] No CJK-capable font found; names are shown in index.html only (--font to set one)")
+
+    print("=" * 70)
+    print("CONTACT SHEETS")
+    print("=" * 70)
+    entries = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for folder in folders:
+            entry = build_folder(folder, args, names, (font, small_font, cjk), pool)
+            entries.append(entry)
+            pages = len(entry['state']['pages'])
+            print(f"[OK] {entry['name']}: {entry['images']} images, {pages} pages "
+                  f"({entry['rendered']} re-rendered, {pages - entry['rendered']} unchanged)")
+            if entry['errors']:
+                print(f"[WARN] {entry['errors']} images failed to decode (marked red on the sheet)")
+    write_index(args.output, entries, names)
+    print(f"[RESULT] {Path(args.output) / 'index.html'}  ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,26 +1,49 @@
+#!/usr/bin/env python3
+"""
+Encoding Converter - Re-save a GBK source file as UTF-8
+A .bak copy of the original (still GBK) is written next to the file first.
 
-import os
+Usage:
+    python convert_encoding.py
+    python convert_encoding.py src/logic/simulation.js --from gbk
+"""
 
-file_path = 'f:\\Developent\\civ-game\\src\\logic\\simulation.js'
-backup_path = file_path + '.bak'
+import argparse
+import sys
+from pathlib import Path
 
-try:
-    # 1. Read as GBK
-    with open(file_path, 'r', encoding='gbk') as f:
-        content = f.read()
-    print(f"Successfully read {len(content)} characters using GBK.")
+from asset_paths import PROJECT_DIR, SRC_DIR
 
-    # 2. Create backup
-    with open(backup_path, 'w', encoding='gbk') as f:
-        f.write(content)
-    print(f"Created backup at {backup_path}")
+DEFAULT_FILE = SRC_DIR / 'logic' / 'simulation.js'
 
-    # 3. Write as UTF-8
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"Successfully converted {file_path} to UTF-8.")
 
-except Exception as e:
-    print(f"Error during conversion: {e}")
-    # Restore from backup if backup exists and main file is potentially corrupted (though we haven't written to it if read failed)
-    # If write failed, we might have a partial file, but the logic above implies sequential steps.
+def main():
+    parser = argparse.ArgumentParser(description='Convert a GBK source file to UTF-8, keeping a .bak backup')
+    parser.add_argument('path', nargs='?', default=str(DEFAULT_FILE), help='File to convert (default: src/logic/simulation.js)')
+    parser.add_argument('--from', dest='source_encoding', default='gbk', help='Current encoding (default: gbk)')
+    args = parser.parse_args()
+
+    file_path = Path(args.path)
+    if not file_path.is_absolute() and not file_path.exists():
+        file_path = PROJECT_DIR / file_path
+    backup_path = file_path.with_name(file_path.name + '.bak')
+
+    try:
+        # 1. Read in the source encoding
+        content = file_path.read_text(encoding=args.source_encoding)
+        print(f"Successfully read {len(content)} characters using {args.source_encoding.upper()}.")
+
+        # 2. Create backup
+        backup_path.write_text(content, encoding=args.source_encoding)
+        print(f"Created backup at {backup_path}")
+
+        # 3. Write as UTF-8
+        file_path.write_text(content, encoding='utf-8')
+        print(f"Successfully converted {file_path} to UTF-8.")
+    except (OSError, UnicodeError) as e:
+        print(f"Error during conversion: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
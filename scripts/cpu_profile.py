@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Tick Profiler - Fold V8 .cpuprofile samples into a hot-function report
+Runs the headless simulation (sim_bench_runner.mjs) under `node --cpu-prof`,
+then parses the .cpuprofile as a stream (nodes are decoded one at a time and
+samples are kept as a packed int array, so multi-hundred-MB profiles are fine).
+Samples are folded by source file and function into:
+
+  - a ranked self/total time table per function and per source file
+  - a collapsed-stack file for flamegraph.pl / speedscope / inferno
+  - a diff of two runs showing which functions regressed
+
+Only stacks under --root (default simulateTick) are folded, so module loading
+and the runner's own setup do not crowd the report; garbage collector samples
+are kept because V8 reports them outside any JS stack. Directories given to
+report/diff resolve to the main-thread profiles in them (node also writes one
+for the module loader thread).
+
+Usage:
+    python cpu_profile.py run --scenario british_empire --ticks 300 --collapsed ticks.folded
+    python cpu_profile.py run --save late_game.cgsave --profile-dir profiles/after
+    python cpu_profile.py report profiles/*.cpuprofile [--top 40] [--root '']
+    python cpu_profile.py diff profiles/before profiles/after
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+
+from save_codec import SaveFormatError, read_save_bytes
+
+from asset_paths import PROJECT_DIR, SCRIPT_DIR
+
+RUNNER = SCRIPT_DIR / 'sim_bench_runner.mjs'
+
+CHUNK_SIZE = 1 << 20
+_INT = re.compile(r'\s*(-?\d+)\s*([,\]])')
+_WS = re.compile(r'\s*')
+
+# Samples attributed to these V8 pseudo-frames are not program time
+IDLE_FRAMES = {'(idle)', '(program)'}
+# Pseudo-frames that V8 puts directly under (root) but that belong to whatever JS was running
+ROOTLESS_FRAMES = {'(garbage collector)'}
+DEFAULT_ROOT = 'simulateTick'
+
+# node --cpu-prof names files CPU.<date>.<time>.<pid>.<thread id>.<seq>.cpuprofile; thread 0 is main
+_PROFILE_NAME = re.compile(r'^CPU\.\d+\.\d+\.\d+\.(\d+)\.\d+\.cpuprofile$')
+
+
+class _Stream:
+    """Chunked text buffer with just enough JSON handling for .cpuprofile files"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def skip_ws(self):
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self._fill():
+                return
+
+    def peek(self):
+        self.skip_ws()
+        return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} at {self.buf[self.pos:self.pos + 20]!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode one JSON value, reading more input until it is complete"""
+        self.skip_ws()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number at the very end of the buffer may continue in the next chunk
+                if end == len(self.buf) and not self.eof and self._fill():
+                    continue
+                self.pos = end
+                return obj
+            except ValueError:
+                if not self._fill():
+                    raise
+
+    def ints(self):
+        """Yield the integers of a JSON array of ints"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            m = _INT.match(self.buf, self.pos)
+            if m is None:
+                if not self._fill():
+                    raise ValueError("truncated integer array")
+                continue
+            self.pos = m.end()
+            yield int(m.group(1))
+            if m.group(2) == ']':
+                return
+
+    def objects(self):
+        """Yield the elements of a JSON array one at a time"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            c = self.peek()
+            self.pos += 1
+            if c == ']':
+                return
+            if c != ',':
+                raise ValueError(f"expected ',' or ']' in array, got {c!r}")
+
+
+def frame_label(call_frame):
+    """Function label '<name> (<file>:<line>)' with project-relative paths"""
+    name = call_frame.get('functionName') or '(anonymous)'
+    url = call_frame.get('url') or ''
+    if not url:
+        return name, ''
+    path = url
+    if url.startswith('file://'):
+        try:
+            path = Path(url[len('file://'):]).resolve().relative_to(PROJECT_DIR.resolve()).as_posix()
+        except (ValueError, OSError):
+            path = url[len('file://'):]
+    return f"{name} ({path}:{call_frame.get('lineNumber', -1) + 1})", path
+
+
+class Profile:
+    """
+    Folded samples of one or more .cpuprofile files
+
+    Attributes:
+        self_us: function label -> self time (µs)
+        total_us: function label -> inclusive time (µs), recursion counted once
+        file_self_us / file_total_us: the same keyed by source file
+        stacks: collapsed stack ('a;b;c') -> µs
+        sampled_us: total non-idle time under the root function
+        excluded_us: non-idle time outside the root function
+    """
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = root
+        self.excluded_us = 0
+        self.self_us = {}
+        self.total_us = {}
+        self.file_self_us = {}
+        self.file_total_us = {}
+        self.stacks = {}
+        self.sampled_us = 0
+        self.samples = 0
+        self.files = []
+
+    def add_file(self, path):
+        parent = {}
+        labels = {}
+        names = {}
+        files = {}
+        samples = array('I')
+        weights = array('I')
+        with open(path, 'r', encoding='utf-8') as f:
+            stream = _Stream(f)
+            stream.expect('{')
+            while True:
+                c = stream.peek()
+                if c == '}':
+                    break
+                if c == ',':
+                    stream.pos += 1
+                    continue
+                key = stream.value()
+                stream.expect(':')
+                if key == 'nodes':
+                    for node in stream.objects():
+                        node_id = node['id']
+                        labels[node_id], files[node_id] = frame_label(node['callFrame'])
+                        names[node_id] = node['callFrame'].get('functionName', '')
+                        for child in node.get('children', ()):
+                            parent[child] = node_id
+                elif key == 'samples':
+                    samples.extend(stream.ints())
+                elif key == 'timeDeltas':
+                    # timeDeltas[i] is the gap before sample i; attribute the gap after it instead
+                    deltas = stream.ints()
+                    next(deltas, None)
+                    weights = array('I', (max(0, d) for d in deltas))
+                else:
+                    stream.value()
+        weights.append(0)
+        self._fold(samples, weights, parent, labels, names, files)
+        self.files.append(str(path))
+
+    def _stack(self, node_id, parent, labels, names):
+        """Node ids from the outermost root call down to node_id, or None if outside the root"""
+        stack = []
+        current = node_id
+        while current in labels:
+            if labels[current] != '(root)':
+                stack.append(current)
+            current = parent.get(current)
+        stack.reverse()
+        if not self.root or (len(stack) == 1 and labels[stack[0]] in ROOTLESS_FRAMES):
+            return stack
+        for i, n in enumerate(stack):
+            if names[n] == self.root:
+                return stack[i:]
+        return None
+
+    def _fold(self, samples, weights, parent, labels, names, files):
+        stack_cache = {}
+        for node_id, weight in zip(samples, weights):
+            if labels.get(node_id) in IDLE_FRAMES:
+                continue
+            if node_id not in stack_cache:
+                stack_cache[node_id] = self._stack(node_id, parent, labels, names)
+            stack = stack_cache[node_id]
+            if stack is None:
+                self.excluded_us += weight
+                continue
+            self.samples += 1
+            self.sampled_us += weight
+            if not stack:
+                continue
+            leaf = stack[-1]
+            self.self_us[labels[leaf]] = self.self_us.get(labels[leaf], 0) + weight
+            leaf_file = files[leaf] or '(native)'
+            self.file_self_us[leaf_file] = self.file_self_us.get(leaf_file, 0) + weight
+            for label in {labels[n] for n in stack}:
+                self.total_us[label] = self.total_us.get(label, 0) + weight
+            for source in {files[n] or '(native)' for n in stack}:
+                self.file_total_us[source] = self.file_total_us.get(source, 0) + weight
+            key = ';'.join(labels[n] for n in stack)
+            self.stacks[key] = self.stacks.get(key, 0) + weight
+
+    def write_collapsed(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, weight in sorted(self.stacks.items()):
+                if weight:
+                    f.write(f"{stack} {weight}\n")
+
+    def to_dict(self, top):
+        def ranked(self_map, total_map):
+            rows = [{'name': k, 'self_ms': self_map.get(k, 0) / 1000, 'total_ms': v / 1000}
+                    for k, v in total_map.items()]
+            rows.sort(key=lambda r: r['self_ms'], reverse=True)
+            return rows[:top]
+        return {
+            'files': self.files,
+            'root': self.root or None,
+            'samples': self.samples,
+            'sampled_ms': self.sampled_us / 1000,
+            'excluded_ms': self.excluded_us / 1000,
+            'functions': ranked(self.self_us, self.total_us),
+            'sources': ranked(self.file_self_us, self.file_total_us),
+        }
+
+
+def profile_files(path):
+    """A .cpuprofile, or the main-thread profiles in a run directory (oldest first)"""
+    path = Path(path)
+    if not path.is_dir():
+        return [path]
+    found = []
+    for p in path.glob('*.cpuprofile'):
+        m = _PROFILE_NAME.match(p.name)
+        if m is None or m.group(1) == '0':
+            found.append(p)
+    return sorted(found, key=lambda p: p.stat().st_mtime)
+
+
+def load_profiles(paths, root=DEFAULT_ROOT):
+    profile = Profile(root)
+    for path in paths:
+        profile.add_file(path)
+    return profile
+
+
+def load_run(path, root, label):
+    """Profile of one run for diff: a file, or the newest main-thread profile in a directory"""
+    files = profile_files(path)
+    if not files:
+        print(f"[ERROR] {label}: no main-thread .cpuprofile in {path}")
+        sys.exit(1)
+    if Path(path).is_dir():
+        print(f"[INFO] {label}: {files[-1]}" + (f" (newest of {len(files)})" if len(files) > 1 else ""))
+    return load_profiles(files[-1:], root)
+
+
+def print_table(title, rows, sampled_ms, top):
+    print(f"\n{title}")
+    print(f"  {'self ms':>10} {'self %':>7} {'total ms':>10} {'total %':>8}  name")
+    for r in rows[:top]:
+        print(f"  {r['self_ms']:>10.1f} {r['self_ms'] / sampled_ms:>7.1%} {r['total_ms']:>10.1f} "
+              f"{r['total_ms'] / sampled_ms:>8.1%}  {r['name']}")
+
+
+def print_report(profile, top):
+    data = profile.to_dict(max(top, 1))
+    sampled = data['sampled_ms'] or 1
+    print("=" * 78)
+    print("   CPU Profile Report")
+    print("=" * 78)
+    print(f"[INFO] {len(data['files'])} profile(s), {data['samples']:,} samples, {data['sampled_ms']:,.1f} ms sampled"
+          + (f" under {profile.root} ({data['excluded_ms']:,.1f} ms outside it excluded)" if profile.root else ""))
+    print_table("Hot functions (by self time):", data['functions'], sampled, top)
+    print_table("Source files:", data['sources'], sampled, min(top, 20))
+
+
+def cmd_run(args):
+    prof_dir = Path(args.profile_dir or tempfile.mkdtemp(prefix='cpu_profile_'))
+    prof_dir.mkdir(parents=True, exist_ok=True)
+    before = set(prof_dir.glob('*.cpuprofile'))
+    cmd = [args.node, '--cpu-prof', f'--cpu-prof-dir={prof_dir}',
+           f'--cpu-prof-interval={args.interval}', str(RUNNER),
+           '--ticks', str(args.ticks), '--warmup', str(args.warmup), '--seed', str(args.seed)]
+    with tempfile.TemporaryDirectory(prefix='cpu_profile_save_') as temp_dir:
+        if args.save:
+            # The runner reads plain payload JSON; decode .cgsave wrappers here
+            try:
+                payload = read_save_bytes(args.save)
+            except (OSError, SaveFormatError) as e:
+                print(f"[ERROR] {args.save}: {e}")
+                sys.exit(1)
+            save_json = Path(temp_dir) / (Path(args.save).stem + '.json')
+            save_json.write_bytes(payload)
+            cmd += ['--save', str(save_json)]
+        else:
+            cmd += ['--scenario', args.scenario]
+        print(f"[INFO] Profiling {args.save or args.scenario} for {args.ticks} ticks...")
+        proc = subprocess.run(cmd, cwd=PROJECT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+        print(f"[ERROR] Runner failed: {(proc.stderr.strip().splitlines() or ['?'])[-1]}")
+        sys.exit(1)
+    # The resolve hooks run on their own thread and write a second profile; report the main thread's
+    profiles = [p for p in profile_files(prof_dir) if p not in before]
+    print(f"[OK] Wrote {profiles[-1]}")
+    return report_paths(profiles[-1:], args)
+
+
+def report_paths(paths, args):
+    profile = load_profiles(paths, args.root)
+    if args.json:
+        json.dump(profile.to_dict(args.top), sys.stdout, indent=2)
+        print()
+    else:
+        print_report(profile, args.top)
+    if args.collapsed:
+        profile.write_collapsed(args.collapsed)
+        print(f"\n[OK] Collapsed stacks written to {args.collapsed}")
+    return profile
+
+
+def cmd_report(args):
+    report_paths([p for path in args.profiles for p in profile_files(path)], args)
+
+
+def cmd_diff(args):
+    """Compare per-function self and total time between two runs"""
+    before = load_run(args.before, args.root, 'before')
+    after = load_run(args.after, args.root, 'after')
+    scale = 1.0
+    if args.normalize and before.sampled_us:
+        # Compare as if both runs sampled the same amount of time
+        scale = after.sampled_us / before.sampled_us
+    rows = []
+    for name in set(before.total_us) | set(after.total_us):
+        old_self = before.self_us.get(name, 0) * scale / 1000
+        new_self = after.self_us.get(name, 0) / 1000
+        old_total = before.total_us.get(name, 0) * scale / 1000
+        new_total = after.total_us.get(name, 0) / 1000
+        rows.append((new_self - old_self, old_self, new_self, new_total - old_total, name))
+    rows.sort(reverse=True)
+
+    print("=" * 78)
+    print("   CPU Profile Diff")
+    print("=" * 78)
+    print(f"[INFO] before: {before.sampled_us / 1000:,.1f} ms sampled   after: {after.sampled_us / 1000:,.1f} ms sampled"
+          + ("   (before scaled to after)" if args.normalize else ""))
+    print(f"\n  {'Δself ms':>10} {'before':>10} {'after':>10} {'Δtotal ms':>10}  function")
+    regressed = [r for r in rows if r[0] > 0][:args.top]
+    improved = [r for r in reversed(rows) if r[0] < 0][:args.top]
+    for label, group in (("Regressed:", regressed), ("Improved:", improved)):
+        print(f"{label}")
+        for delta, old, new, delta_total, name in group:
+            print(f"  {delta:>+10.1f} {old:>10.1f} {new:>10.1f} {delta_total:>+10.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fold V8 CPU profiles of simulateTick into hot-function reports')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def root_option(p):
+        p.add_argument('--root', default=DEFAULT_ROOT,
+                       help=f"Fold only stacks under this function; '' for the whole process (default: {DEFAULT_ROOT})")
+
+    def output_options(p):
+        root_option(p)
+        p.add_argument('--top', type=int, default=40, help='Rows to show (default: 40)')
+        p.add_argument('--collapsed', help='Write flamegraph collapsed stacks (µs weights) to this file')
+        p.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    p_run = sub.add_parser('run', help='Profile the headless simulation and report')
+    target = p_run.add_mutually_exclusive_group(required=True)
+    target.add_argument('--scenario', help='Scenario id from src/config/scenarios.js')
+    target.add_argument('--save', help='.cgsave or save JSON to start from')
+    p_run.add_argument('--ticks', type=int, default=200, help='Ticks to profile (default: 200)')
+    p_run.add_argument('--warmup', type=int, default=10, help='Warm-up ticks (default: 10)')
+    p_run.add_argument('--seed', type=int, default=1)
+    p_run.add_argument('--interval', type=int, default=500, help='Sampling interval in µs (default: 500)')
+    p_run.add_argument('--profile-dir', help='Keep the .cpuprofile here (default: a temp dir)')
+    p_run.add_argument('--node', default='node', help='Node executable (default: node)')
+    output_options(p_run)
+    p_run.set_defaults(func=cmd_run)
+
+    p_report = sub.add_parser('report', help='Report on existing .cpuprofile files (merged)')
+    p_report.add_argument('profiles', nargs='+', help='.cpuprofile files or run directories')
+    output_options(p_report)
+    p_report.set_defaults(func=cmd_report)
+
+    p_diff = sub.add_parser('diff', help='Show functions that got slower or faster between two profiles')
+    p_diff.add_argument('before', help='.cpuprofile file or run directory')
+    p_diff.add_argument('after', help='.cpuprofile file or run directory')
+    root_option(p_diff)
+    p_diff.add_argument('--top', type=int, default=25, help='Rows per section (default: 25)')
+    p_diff.add_argument('--normalize', action='store_true',
+                        help='Scale the before run to the after run\'s sampled time (for runs of different length)')
+    p_diff.set_defaults(func=cmd_diff)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Encoder Tournament Script - Try several encodings per image, keep the smallest
+Every candidate (webp lossy/lossless, palette PNG, optimized JPEG) is encoded in
+parallel worker processes and scored against the source with a block SSIM gate.
+The smallest candidate that passes the gate wins and is recorded, so later runs
+re-encode with the recorded winner directly instead of running the tournament.
+A winner that is not at least --min-saving smaller than the source is not
+written: the original is kept and recorded, so lossy sources are not
+re-encoded (and degraded again) for a marginal gain. A winner written beside
+its source (foo.png -> foo.webp) is not picked up as a source itself, and the
+source counts as up to date while that output keeps its recorded bytes.
+
+Usage:
+    python encode_tournament.py [paths...] [--min-ssim 0.97] [--jobs N]
+    python encode_tournament.py src/assets/images/events --formats webp
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    print("[ERROR] Pillow not installed. Run: pip install Pillow")
+    sys.exit(1)
+
+try:
+    import numpy as np
+except ImportError:
+    print("[ERROR] NumPy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+import pixel_cache
+
+from asset_paths import ASSET_IMAGES_DIR, CACHE_DIR, PROJECT_DIR
+
+DEFAULT_IMAGES_DIR = ASSET_IMAGES_DIR
+WINNERS_FILE = CACHE_DIR / 'encode_tournament.json'
+
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+# name -> (format family, file extension, Pillow save options)
+CANDIDATES = {
+    'webp_q75_m4': ('webp', '.webp', {'format': 'WEBP', 'quality': 75, 'method': 4}),
+    'webp_q85_m4': ('webp', '.webp', {'format': 'WEBP', 'quality': 85, 'method': 4}),
+    'webp_q85_m6': ('webp', '.webp', {'format': 'WEBP', 'quality': 85, 'method': 6}),
+    'webp_q92_m6': ('webp', '.webp', {'format': 'WEBP', 'quality': 92, 'method': 6}),
+    'webp_lossless': ('webp', '.webp', {'format': 'WEBP', 'lossless': True, 'quality': 80, 'method': 4}),
+    'png_palette': ('png', '.png', {'format': 'PNG', 'optimize': True, 'compress_level': 9}),
+    'jpeg_q85': ('jpeg', '.jpg', {'format': 'JPEG', 'quality': 85, 'optimize': True, 'progressive': True}),
+    'jpeg_q92': ('jpeg', '.jpg', {'format': 'JPEG', 'quality': 92, 'optimize': True, 'progressive': True}),
+}
+
+LOSSLESS_CANDIDATES = {'webp_lossless'}
+
+DEFAULT_MIN_SAVING = 0.10
+
+
+def file_hash(path):
+    """Return the sha256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_rgba(path, source_hash=None):
+    """
+    RGBA pixels of an image (a shared memory map when the pixel cache has them),
+    the image on top of them, and whether it has any transparency
+    """
+    pixels = pixel_cache.get_cache().load_rgba(path, source_hash)
+    return pixels, Image.fromarray(pixels, 'RGBA'), bool(pixels[..., 3].min() < 255)
+
+
+def encode_candidate(img, name, has_alpha):
+    """
+    Encode an RGBA image with one tournament candidate
+
+    Returns:
+        Encoded bytes, or None when the candidate does not apply to the image
+    """
+    family, _, options = CANDIDATES[name]
+    if family == 'jpeg':
+        if has_alpha:
+            return None
+        img = img.convert('RGB')
+    elif family == 'png':
+        # Palette PNG: FASTOCTREE is the only built-in Pillow quantizer that keeps alpha
+        if has_alpha:
+            method = Image.Quantize.FASTOCTREE
+        else:
+            img = img.convert('RGB')
+            method = Image.Quantize.MEDIANCUT
+        img = img.quantize(colors=256, method=method, dither=Image.Dither.FLOYDSTEINBERG)
+    elif not has_alpha:
+        img = img.convert('RGB')
+
+    buf = io.BytesIO()
+    img.save(buf, **options)
+    return buf.getvalue()
+
+
+def _luma(rgba):
+    """Luma plane of an RGBA array composited over black (premultiplied)"""
+    rgba = rgba.astype(np.float32)
+    alpha = rgba[..., 3:4] / 255.0
+    rgb = rgba[..., :3] * alpha
+    return rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def block_ssim(reference, candidate, block=8):
+    """
+    Mean SSIM over non-overlapping blocks of the luma plane
+
+    A vectorized approximation of windowed SSIM that is cheap enough to score
+    every candidate of every image.
+    """
+    a = _luma(reference)
+    b = _luma(candidate)
+    h = (a.shape[0] // block) * block
+    w = (a.shape[1] // block) * block
+    if h == 0 or w == 0:
+        return 1.0 if np.array_equal(reference, candidate) else 0.0
+
+    def blocks(x):
+        return x[:h, :w].reshape(h // block, block, w // block, block).swapaxes(1, 2).reshape(-1, block * block)
+
+    a = blocks(a)
+    b = blocks(b)
+    mu_a = a.mean(axis=1)
+    mu_b = b.mean(axis=1)
+    var_a = a.var(axis=1)
+    var_b = b.var(axis=1)
+    cov = ((a - mu_a[:, None]) * (b - mu_b[:, None])).mean(axis=1)
+
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+    ssim = ((2 * mu_a * mu_b + c1) * (2 * cov + c2)) / ((mu_a ** 2 + mu_b ** 2 + c1) * (var_a + var_b + c2))
+    return float(ssim.mean())
+
+
+def score_candidate(reference, data):
+    """Decode candidate bytes and score them against the reference pixels"""
+    with Image.open(io.BytesIO(data)) as decoded:
+        candidate = np.asarray(decoded.convert('RGBA'))
+    return block_ssim(reference, candidate)
+
+
+def warm_pixels(path, source_hash):
+    """Worker entry point: decode a source into the pixel cache ahead of its candidates"""
+    pixel_cache.get_cache().load_rgba(path, source_hash)
+
+
+def run_candidate(path, name, source_hash=None):
+    """
+    Worker entry point: encode and score one candidate for one image
+
+    Returns:
+        Dict with candidate name, encoded bytes, size and SSIM, or None if
+        the candidate does not apply (e.g. JPEG for a transparent image)
+    """
+    pixels, img, has_alpha = load_rgba(path, source_hash)
+    data = encode_candidate(img, name, has_alpha)
+    if data is None:
+        return None
+    score = 1.0 if name in LOSSLESS_CANDIDATES else score_candidate(pixels, data)
+    return {'candidate': name, 'data': data, 'size': len(data), 'ssim': score}
+
+
+def is_lossy_source(path):
+    """Whether a source image is already lossy-encoded (JPEG, or WebP with a VP8 bitstream)"""
+    suffix = path.suffix.lower()
+    if suffix in ('.jpg', '.jpeg'):
+        return True
+    if suffix != '.webp':
+        return False
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if header[:4] != b'RIFF' or header[8:12] != b'WEBP':
+            return False
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return False
+            fourcc, size = chunk[:4], struct.unpack('<I', chunk[4:])[0]
+            if fourcc == b'VP8 ':
+                return True
+            if fourcc == b'VP8L':
+                return False
+            f.seek(size + (size & 1), os.SEEK_CUR)
+
+
+def pick_winner(results, min_ssim, source_size=None, min_saving=0.0):
+    """
+    Choose what to write for one source
+
+    Returns:
+        (result, None) for the smallest candidate that passes the quality
+        gate and saves at least min_saving of source_size; (None, 'gate') when
+        no candidate passes the gate; (None, 'saving') when the best passing
+        candidate is not small enough to replace the source
+    """
+    passing = [r for r in results if r and r['ssim'] >= min_ssim]
+    if not passing:
+        return None, 'gate'
+    best = min(passing, key=lambda r: r['size'])
+    if source_size is not None and best['size'] > source_size * (1 - min_saving):
+        return None, 'saving'
+    return best, None
+
+
+def size_change(original_size, new_size):
+    """Signed size change for the report, e.g. '-17%' when smaller, '+4%' when larger"""
+    if original_size <= 0:
+        return '+0%'
+    return f"{(new_size / original_size - 1) * 100:+.0f}%"
+
+
+def run_jobs(pool, jobs, hashes, results):
+    """Run (source, candidate) jobs on the pool and collect their results per source"""
+    futures = {pool.submit(run_candidate, src, name, hashes[src]): src for src, name in jobs}
+    for future in as_completed(futures):
+        src = futures[future]
+        try:
+            results[src].append(future.result())
+        except Exception as e:
+            print(f"[WARN] Candidate failed for {src.name}: {e}")
+
+
+def load_winners():
+    """Load recorded winners, keyed by project-relative source path"""
+    if not WINNERS_FILE.exists():
+        return {}
+    try:
+        with open(WINNERS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        print(f"[WARN] Ignoring unreadable winners file: {WINNERS_FILE}")
+        return {}
+
+
+def save_winners(winners):
+    """Persist recorded winners atomically"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temp_path = WINNERS_FILE.with_suffix('.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(winners, f, indent=2, sort_keys=True)
+    os.replace(temp_path, WINNERS_FILE)
+
+
+def relative_key(path):
+    """Stable key for the winners file"""
+    try:
+        return path.resolve().relative_to(PROJECT_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def collect_sources(paths):
+    """Expand files and directories into a sorted list of source images"""
+    sources = []
+    for p in paths:
+        p = Path(p)
+        if p.is_dir():
+            sources.extend(f for f in p.rglob('*') if f.suffix.lower() in SOURCE_EXTENSIONS)
+        elif p.suffix.lower() in SOURCE_EXTENSIONS:
+            sources.append(p)
+    return sorted({f for f in sources if 'backup' not in str(f).lower()})
+
+
+def output_path_for(source, name, output_dir):
+    """Where the winning encoding of a source image is written"""
+    ext = CANDIDATES[name][1]
+    target_dir = Path(output_dir) if output_dir else source.parent
+    return target_dir / f"{source.stem}{ext}"
+
+
+def recorded_outputs(winners):
+    """Outputs written beside another source that still exists (foo.png -> foo.webp); these are not sources"""
+    return {record.get('output') for key, record in winners.items()
+            if record.get('output') != key and (PROJECT_DIR / key).exists()}
+
+
+def output_is_current(source, record, source_hash, output_dir):
+    """The recorded winner of an unchanged source is on disk with the recorded bytes"""
+    if record.get('source_hash') != source_hash or record.get('candidate') not in CANDIDATES:
+        return False
+    out_path = output_path_for(source, record['candidate'], output_dir)
+    return (relative_key(out_path) == record.get('output') and out_path.exists()
+            and file_hash(out_path) == record.get('output_hash'))
+
+
+def write_output(source, result, output_dir):
+    """Write winning bytes, never clobbering the source mid-write"""
+    out_path = output_path_for(source, result['candidate'], output_dir)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = out_path.with_name(out_path.name + '.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(result['data'])
+    os.replace(temp_path, out_path)
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Encode images with several candidates in parallel and keep the smallest acceptable one',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Candidates:
+  """ + '\n  '.join(CANDIDATES) + """
+
+Note: src/utils/imageRegistry.js only picks up .webp files, so use
+--formats webp when encoding art under src/assets/images.
+"""
+    )
+    parser.add_argument('paths', nargs='*', default=[str(DEFAULT_IMAGES_DIR)],
+                        help=f'Image files or directories (default: {DEFAULT_IMAGES_DIR})')
+    parser.add_argument('--formats', default='webp,png,jpeg',
+                        help='Comma-separated candidate families to try (default: webp,png,jpeg)')
+    parser.add_argument('--min-ssim', type=float, default=0.97,
+                        help='Perceptual quality gate: minimum block SSIM vs. source (default: 0.97)')
+    parser.add_argument('--min-saving', type=float, default=DEFAULT_MIN_SAVING,
+                        help='Keep the original unless the winner is at least this fraction smaller '
+                             f'(default: {DEFAULT_MIN_SAVING})')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--output-dir', help='Write winners here instead of next to the source')
+    parser.add_argument('--retune', action='store_true',
+                        help='Ignore recorded winners and run the full tournament again')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Run the tournament and report, but do not write outputs or winners')
+    pixel_cache.add_arguments(parser)
+    args = parser.parse_args()
+    # Every candidate worker needs the source pixels; decode each source once
+    pixel_cache.configure(args)
+
+    families = {f.strip() for f in args.formats.split(',') if f.strip()}
+    candidate_names = [name for name, (family, _, _) in CANDIDATES.items() if family in families]
+    if not candidate_names:
+        print(f"[ERROR] No candidates match --formats {args.formats}")
+        sys.exit(1)
+
+    sources = collect_sources(args.paths)
+    if not sources:
+        print("[INFO] No source images found")
+        sys.exit(0)
+
+    print("=" * 70)
+    print("   Encoder Tournament")
+    print(f"   {len(candidate_names)} candidates, SSIM gate >= {args.min_ssim}, {args.jobs} workers")
+    print("=" * 70)
+    print()
+
+    winners = load_winners()
+    # Re-encoding a previous winner as a source of its own would degrade it on every run
+    outputs = recorded_outputs(winners)
+    sources = [src for src in sources if relative_key(src) not in outputs]
+    hashes = {src: file_hash(src) for src in sources}
+
+    # Sources whose recorded winner still matches the source bytes skip the tournament
+    reuse = {}
+    tournament = []
+    up_to_date = 0
+    for src in sources:
+        record = winners.get(relative_key(src))
+        if record and record.get('output_hash') == hashes[src]:
+            # A previous winner written in place, or an original kept as is; re-encoding would only lose quality
+            up_to_date += 1
+            continue
+        if not args.retune and record and output_is_current(src, record, hashes[src], args.output_dir):
+            up_to_date += 1
+            continue
+        if (not args.retune and record and record.get('source_hash') == hashes[src]
+                and record.get('candidate') in candidate_names):
+            reuse[src] = record['candidate']
+        else:
+            tournament.append(src)
+
+    print(f"[INFO] {len(sources)} images: {len(tournament)} in tournament, "
+          f"{len(reuse)} reusing recorded winner, {up_to_date} already up to date")
+    print()
+
+    started = time.perf_counter()
+    results = {src: [] for src in tournament + list(reuse)}
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        if pixel_cache.get_cache().enabled:
+            # Otherwise all candidates of an image start together and each misses the cache
+            sources = tournament + list(reuse)
+            list(pool.map(warm_pixels, sources, [hashes[src] for src in sources]))
+        jobs = [(src, name) for src in tournament for name in candidate_names] + list(reuse.items())
+        run_jobs(pool, jobs, hashes, results)
+
+        # A recorded winner may no longer pass the gate (e.g. a higher --min-ssim); retune those
+        retune = [src for src, name in reuse.items()
+                  if pick_winner(results[src], args.min_ssim)[0] is None]
+        for src in retune:
+            print(f"[INFO] {src.name}: recorded winner {reuse.pop(src)} fails the gate, running the tournament")
+            results[src] = []
+            tournament.append(src)
+        run_jobs(pool, [(src, name) for src in retune for name in candidate_names], hashes, results)
+
+    total_original = 0
+    total_new = 0
+    failed = 0
+    kept = 0
+    for src in tournament + list(reuse):
+        original_size = src.stat().st_size
+        result, reason = pick_winner(results[src], args.min_ssim, original_size, args.min_saving)
+        tag = 'reused' if src in reuse else 'winner'
+
+        if reason == 'gate':
+            print(f"[FAIL] {src.name}: no candidate passed the quality gate")
+            failed += 1
+            continue
+
+        total_original += original_size
+        if reason == 'saving':
+            best, _ = pick_winner(results[src], args.min_ssim)
+            note = ', lossy source' if is_lossy_source(src) else ''
+            print(f"[KEEP] {src.name}: best {best['candidate']} {original_size/1024:.0f}KB -> "
+                  f"{best['size']/1024:.0f}KB ({size_change(original_size, best['size'])}{note}), "
+                  f"keeping the original")
+            total_new += original_size
+            kept += 1
+            if not args.dry_run:
+                # Recorded as its own output, so later runs treat the source as up to date
+                winners[relative_key(src)] = {
+                    'source_hash': hashes[src],
+                    'candidate': None,
+                    'size': original_size,
+                    'output': relative_key(src),
+                    'output_hash': hashes[src],
+                }
+            continue
+
+        total_new += result['size']
+        print(f"[{tag.upper()}] {src.name}: {result['candidate']} "
+              f"{original_size/1024:.0f}KB -> {result['size']/1024:.0f}KB "
+              f"({size_change(original_size, result['size'])}, SSIM {result['ssim']:.4f})")
+
+        if args.dry_run:
+            continue
+        out_path = write_output(src, result, args.output_dir)
+        winners[relative_key(src)] = {
+            'source_hash': hashes[src],
+            'candidate': result['candidate'],
+            'size': result['size'],
+            'ssim': round(result['ssim'], 5),
+            'output': relative_key(out_path),
+            'output_hash': hashlib.sha256(result['data']).hexdigest(),
+        }
+
+    if not args.dry_run:
+        save_winners(winners)
+
+    elapsed = time.perf_counter() - started
+    saved = total_original - total_new
+    percent_saved = (saved / total_original) * 100 if total_original > 0 else 0
+    print()
+    print("=" * 70)
+    print(f"[RESULT] Images encoded: {len(tournament) + len(reuse) - failed - kept} "
+          f"({kept} kept as is, {failed} failed the gate)")
+    print(f"[RESULT] Original size:  {total_original / 1024 / 1024:.2f} MB")
+    print(f"[RESULT] New size:       {total_new / 1024 / 1024:.2f} MB")
+    print(f"[RESULT] Space saved:    {saved / 1024 / 1024:.2f} MB ({percent_saved:.1f}%)")
+    print(f"[RESULT] Time:           {elapsed:.1f}s")
+    if not args.dry_run:
+        print(f"[RESULT] Winners:        {WINNERS_FILE}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Event Chunk Lab - Measure a per-epoch split of the event data
+The event modules combined into EVENTS by src/config/events/index.js
+(epochEvents.js, classConflictEvents.js, baseEvents.js, ...) are all parsed
+at startup, including events for epochs the player is far from. This lab
+answers how much of that data a per-epoch loader could defer: it evaluates the
+modules with js_tokenizer (no JS is executed), splits the pure-data part of
+every event into chunks by earliest epoch, and reports each chunk's size and
+the bytes needed by each epoch. Every run checks that the split round-trips
+through JSON to the evaluated events.
+
+This is an analysis step only. The game still imports every event module;
+loading chunks on demand needs an async EVENTS and the data moved out of the
+source modules, which this lab does not do.
+
+Values js_tokenizer cannot evaluate to data (functions, calls, imported
+identifiers) would have to stay in code; they are left out of the chunks and
+counted as code fields.
+
+--verify also compares the chunks with the runtime EVENTS array (needs node),
+to catch anything the evaluator reads differently from JS. --out writes the
+chunks and their index as JSON for inspection.
+
+Usage:
+    python event_chunk_lab.py
+    python event_chunk_lab.py --verify
+    python event_chunk_lab.py --out .asset-cache/event_chunks
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from build_event_index import EVENTS_DIR, PROJECT_DIR, event_gates, load_events, source_files
+from js_tokenizer import JsExpr
+
+CHUNK_NAME = 'epoch-{}.json'
+
+
+def split_event(event):
+    """(data, code paths): the event with JsExpr values removed, and the dotted paths they were at"""
+    code = []
+
+    def strip(value, path):
+        if isinstance(value, JsExpr):
+            code.append('.'.join(str(p) for p in path))
+            return None
+        if isinstance(value, dict):
+            out = {}
+            for key, child in value.items():
+                if isinstance(child, JsExpr):
+                    code.append('.'.join(str(p) for p in path + [key]))
+                else:
+                    out[key] = strip(child, path + [key])
+            return out
+        if isinstance(value, list):
+            # Array slots keep a null placeholder so later positions do not shift
+            return [strip(v, path + [i]) for i, v in enumerate(value)]
+        return value
+
+    return strip(event, []), code
+
+
+def code_values(event, paths):
+    """dotted path -> JsExpr of the original event"""
+    values = {}
+    for path in paths:
+        node = event
+        for part in path.split('.'):
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        values[path] = node
+    return values
+
+
+def set_path(target, path, value):
+    parts = path.split('.')
+    node = target
+    for part in parts[:-1]:
+        node = node[int(part)] if isinstance(node, list) else node[part]
+    last = parts[-1]
+    if isinstance(node, list):
+        node[int(last)] = value
+    else:
+        node[last] = value
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def build_chunks(events, epoch_count):
+    """Returns (chunk epoch -> list of event data, index)"""
+    chunks = {}
+    index_chunks = {}
+    code_fields = {}
+    for position, event in enumerate(events):
+        epoch_range = event_gates(event, epoch_count)[0]
+        first = min(max(epoch_range[0], 0), epoch_count - 1) if epoch_range else 0
+        data, code = split_event(event)
+        if code:
+            code_fields[event.get('id')] = code
+        chunks.setdefault(first, []).append(data)
+        index_chunks.setdefault(first, {'positions': [], 'bytes': 0})['positions'].append(position)
+    chunks = dict(sorted(chunks.items()))
+    for epoch, chunk in chunks.items():
+        index_chunks[epoch]['bytes'] = len(render_chunk(chunk).encode('utf-8'))
+    index = {
+        'eventCount': len(events),
+        'epochCount': epoch_count,
+        'ids': [e.get('id') if isinstance(e, dict) else None for e in events],
+        'chunks': {str(k): index_chunks[k] for k in chunks},
+        'codeFields': code_fields,
+    }
+    return chunks, index
+
+
+def render_chunk(chunk):
+    """One event per line, so regenerated chunks diff per event"""
+    return '[\n' + ',\n'.join(_dumps(event) for event in chunk) + '\n]\n'
+
+
+def verify_round_trip(events, chunks, index):
+    """Rebuild each event from its rendered chunk plus its code fields; returns mismatch messages"""
+    problems = []
+    rebuilt = [None] * len(events)
+    for epoch, chunk in chunks.items():
+        parsed = json.loads(render_chunk(chunk))
+        for position, data in zip(index['chunks'][str(epoch)]['positions'], parsed):
+            rebuilt[position] = data
+    for position, (original, data) in enumerate(zip(events, rebuilt)):
+        if data is None:
+            problems.append(f"EVENTS[{position}] ({original.get('id')}) is in no chunk")
+            continue
+        paths = index['codeFields'].get(original.get('id'), [])
+        for path, value in code_values(original, paths).items():
+            set_path(data, path, value)
+        if data != original:
+            problems.append(f"EVENTS[{position}] ({original.get('id')}) does not round-trip")
+    return problems
+
+
+_RUNTIME_VERIFY = """
+import fs from 'fs';
+const { EVENTS } = await import('./src/config/events/index.js');
+// stdin: { index, chunks: { epoch: [event data] } }
+const { index: EVENT_CHUNK_INDEX, chunks } = JSON.parse(fs.readFileSync(0, 'utf8'));
+const problems = [];
+// JSON.stringify drops undefined and function values; code fields are compared by presence only
+const strip = (event, paths) => {
+    const copy = JSON.parse(JSON.stringify(event, (key, value) => (typeof value === 'function' ? undefined : value)));
+    paths.forEach((path) => {
+        const parts = path.split('.');
+        let node = copy;
+        parts.slice(0, -1).forEach((part) => { node = node?.[part]; });
+        if (node && typeof node === 'object') {
+            if (Array.isArray(node)) node[parts[parts.length - 1]] = null;
+            else delete node[parts[parts.length - 1]];
+        }
+    });
+    return copy;
+};
+const canonical = (value) => JSON.stringify(value, (key, v) => (v && typeof v === 'object' && !Array.isArray(v)
+    ? Object.fromEntries(Object.keys(v).sort().map((k) => [k, v[k]])) : v));
+if (EVENT_CHUNK_INDEX.eventCount !== EVENTS.length) {
+    problems.push(`index has ${EVENT_CHUNK_INDEX.eventCount} events, EVENTS has ${EVENTS.length}`);
+}
+for (const [epoch, entry] of Object.entries(EVENT_CHUNK_INDEX.chunks)) {
+    const chunk = chunks[epoch];
+    entry.positions.forEach((position, i) => {
+        const runtime = EVENTS[position];
+        const paths = EVENT_CHUNK_INDEX.codeFields[runtime?.id] || [];
+        if (canonical(strip(runtime, paths)) !== canonical(strip(chunk[i], paths))) {
+            problems.push(`EVENTS[${position}] (${runtime?.id}) differs from chunk ${epoch}`);
+        }
+    });
+}
+process.stdout.write(JSON.stringify({ problems }));
+"""
+
+
+def verify_runtime(node, chunks, index):
+    payload = json.dumps({'index': index, 'chunks': {str(k): v for k, v in chunks.items()}}, ensure_ascii=False)
+    try:
+        proc = subprocess.run(
+            [node, '--import', './scripts/node_src_loader.mjs', '--input-type=module', '-e', _RUNTIME_VERIFY],
+            input=payload, cwd=PROJECT_DIR, capture_output=True, text=True, encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    if proc.returncode != 0:
+        return [f"node failed: {(proc.stderr.strip().splitlines() or ['?'])[-1]}"]
+    return json.loads(proc.stdout)['problems']
+
+
+def write_outputs(out_dir, chunks, index):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for epoch, chunk in chunks.items():
+        (out_dir / CHUNK_NAME.format(epoch)).write_text(render_chunk(chunk), encoding='utf-8')
+    (out_dir / 'index.json').write_text(_dumps(index) + '\n', encoding='utf-8')
+
+
+def print_summary(index):
+    kb = 1024
+    modules = sum(p.stat().st_size for p in source_files() if p.parent == EVENTS_DIR and p.name != 'index.js')
+    total = sum(entry['bytes'] for entry in index['chunks'].values())
+    print(f"[RESULT] {index['eventCount']} events in {len(index['chunks'])} chunks, {total / kb:,.0f} KB "
+          f"(event modules: {modules / kb:,.0f} KB)")
+    print(f"  {'chunk':>5} {'events':>7} {'KB':>7}")
+    loaded = 0
+    for epoch, entry in index['chunks'].items():
+        loaded += entry['bytes']
+        print(f"  {epoch:>5} {len(entry['positions']):>7} {entry['bytes'] / kb:>7,.1f}"
+              f"   (loaded by epoch {epoch}: {loaded / kb:,.0f} KB)")
+    fields = sum(len(paths) for paths in index['codeFields'].values())
+    print(f"[INFO] {fields} code-valued fields in {len(index['codeFields'])} events stay in code")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure a per-epoch split of the event data')
+    parser.add_argument('--verify', action='store_true',
+                        help='Also compare the chunks with the runtime EVENTS array (needs node)')
+    parser.add_argument('--node', default='node', help='Node executable (default: node)')
+    parser.add_argument('--out', type=Path, help='Write the chunks and their index as JSON to this directory')
+    args = parser.parse_args()
+
+    events, epoch_count = load_events()
+    chunks, index = build_chunks(events, epoch_count)
+    print_summary(index)
+
+    problems = verify_round_trip(events, chunks, index)
+    print(f"[{'ERROR' if problems else 'OK'}] Round trip: {len(events)} events, {len(problems)} mismatches")
+    if args.verify:
+        runtime = verify_runtime(args.node, chunks, index)
+        if runtime is None:
+            print("[WARN] node not found; runtime comparison skipped")
+        else:
+            print(f"[{'ERROR' if runtime else 'OK'}] Runtime EVENTS: {len(runtime)} mismatches")
+            problems += runtime
+    for problem in problems[:50]:
+        print(f"  - {problem}")
+
+    if args.out:
+        write_outputs(args.out, chunks, index)
+        print(f"[OK] Wrote {len(chunks)} chunks and index.json to {args.out}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,40 +1,52 @@
+#!/usr/bin/env python3
+"""
+Garbled Text Finder - Locate template strings that render "Name(Resourcex15.8"
+Lists JS/TS lines that interpolate values next to an "x" inside parentheses,
+the pattern behind garbled market text in the UI.
 
+Usage:
+    python find_garbled.py
+    python find_garbled.py src/components
+"""
+
+import argparse
 import os
-import re
+
+from asset_paths import SRC_DIR
+
 
 def search_files(directory):
-    pattern = re.compile(r'[`\'"].*?\([^)]*?x\$\{.*?\}', re.IGNORECASE)
-    # Also match simpler "x" patterns inside strings
-    pattern2 = re.compile(r'x\d+(\.\d+)?') 
-    
-    # The user text: "蒸汽财团(纸张x15.8"
-    # Matches: Name ( Resource xAmount ... )
     # Likely code: `${name}(${resource}x${amount}`
-    
-    pattern3 = re.compile(r'\$\{.*?\}\s*\(\s*\$\{.*?\}\s*x\s*\$\{', re.VERBOSE) 
-    
     hits = []
-    
+
     for root, dirs, files in os.walk(directory):
         for file in files:
             if not file.endswith(('.js', '.jsx', '.ts', '.tsx')):
                 continue
-                
+
             path = os.path.join(root, file)
             try:
                 with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.splitlines()
-                    for i, line in enumerate(lines):
-                        if "x" in line and "(" in line and ")" in line:
-                            # Heuristic check
-                            if "${" in line:
-                                hits.append(f"{path}:{i+1}: {line.strip()}")
-            except Exception as e:
+                    lines = f.read().splitlines()
+            except (OSError, UnicodeDecodeError) as e:
                 print(f"Error reading {path}: {e}")
-                
+                continue
+            for i, line in enumerate(lines):
+                # Heuristic check
+                if "x" in line and "(" in line and ")" in line and "${" in line:
+                    hits.append(f"{path}:{i+1}: {line.strip()}")
+
     return hits
 
-results = search_files('f:\\Developent\\civ-game\\src')
-for result in results:
-    print(result)
+
+def main():
+    parser = argparse.ArgumentParser(description='Find template strings that may render garbled "x" amounts')
+    parser.add_argument('directory', nargs='?', default=str(SRC_DIR), help='Directory to search (default: src/)')
+    args = parser.parse_args()
+
+    for result in search_files(args.directory):
+        print(result)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,7 +13,7 @@ setlocal enabledelayedexpansion
 REM Get the script directory
 set "SCRIPT_DIR=%~dp0"
 set "PYTHON_SCRIPT=%SCRIPT_DIR%generate_event_images.py"
-set "OUTPUT_DIR=C:\Users\hkinghuang\Documents\GitHub\simple_nation_game\civ-game\public\images\events"
+set "OUTPUT_DIR=%SCRIPT_DIR%..\public\images\events"
 
 echo ====================================================
 echo         Event Image Generator for Civ Game
@@ -8,13 +8,12 @@ import os
 import re
 import time
 import argparse
-import requests
 from pathlib import Path
-from openai import OpenAI
+
+from asset_paths import EVENT_IMAGES_DIR, PROMPTS_FILE
 
 # Configuration
-PROMPTS_FILE = Path(__file__).parent.parent / "prompts" / "event_prompts.md"
-OUTPUT_DIR = Path(r"C:\Users\hkinghuang\Documents\GitHub\simple_nation_game\civ-game\public\images\events")
+OUTPUT_DIR = EVENT_IMAGES_DIR
 
 # Image generation settings
 IMAGE_SIZE = "1792x1024"  # Closest to 16:9 aspect ratio supported by DALL-E 3
@@ -55,12 +54,14 @@ def parse_events_from_markdown(filepath: Path) -> list[dict]:
     return events
 
 
-def generate_image(client: OpenAI, prompt: str, event_id: str, output_dir: Path) -> bool:
+def generate_image(client, prompt: str, event_id: str, output_dir: Path) -> bool:
     """
     Generate an image using DALL-E 3 API and save it.
     
     Returns True if successful, False otherwise.
     """
+    from http_pool import download_to_file
+
     output_path = output_dir / f"{event_id}.png"
     
     # Skip if image already exists
@@ -82,12 +83,9 @@ def generate_image(client: OpenAI, prompt: str, event_id: str, output_dir: Path)
         # Get the image URL
         image_url = response.data[0].url
         
-        # Download and save the image
-        image_response = requests.get(image_url, timeout=60)
-        image_response.raise_for_status()
-        
-        with open(output_path, 'wb') as f:
-            f.write(image_response.content)
+        # Stream the download to disk through the pooled session
+        if not download_to_file(image_url, output_path, timeout=60):
+            raise RuntimeError(f"image download failed: {image_url}")
         
         print(f"  ✅ Saved: {output_path}")
         return True
@@ -105,6 +103,8 @@ def main():
     parser.add_argument('--delay', type=float, default=2.0, help='Delay between API calls in seconds (default: 2.0)')
     parser.add_argument('--dry-run', action='store_true', help='Parse prompts and show what would be generated without making API calls')
     parser.add_argument('--list', action='store_true', help='List all event IDs')
+    parser.add_argument('--max-attempts', type=int, default=2, help='Attempts per event when the output fails validation (default: 2)')
+    parser.add_argument('--no-validate', action='store_true', help='Skip the image validation gate (validate_images.py)')
     
     args = parser.parse_args()
     
@@ -158,9 +158,20 @@ def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     print(f"📁 Output directory: {OUTPUT_DIR}")
     
-    # Initialize OpenAI client
+    # Initialize OpenAI client (imported here so --list/--dry-run don't load the SDK)
+    try:
+        from openai import OpenAI
+    except ImportError:
+        print("❌ Error: openai package not installed. Run: pip install openai")
+        return 1
     client = OpenAI(api_key=api_key)
     
+    rules = None
+    if not args.no_validate:
+        from validate_images import generate_validated, parse_aspect
+        width, height = IMAGE_SIZE.split('x')
+        rules = {'aspect': parse_aspect(f"{width}:{height}")}
+    
     # Generate images
     print(f"\n🚀 Starting image generation...")
     success_count = 0
@@ -169,7 +180,14 @@ def main():
     for i, event in enumerate(events, 1):
         print(f"\n[{i}/{len(events)}] {event['id']} ({event['name']})")
         
-        success = generate_image(client, event['prompt'], event['id'], OUTPUT_DIR)
+        def generate():
+            return generate_image(client, event['prompt'], event['id'], OUTPUT_DIR)
+        
+        if rules is None:
+            success = generate()
+        else:
+            success = generate_validated(generate, OUTPUT_DIR / f"{event['id']}.png", rules,
+                                         args.max_attempts, args.delay)
         
         if success:
             success_count += 1
@@ -16,18 +16,22 @@ import sys
 import time
 from pathlib import Path
 
-try:
-    from google import genai
-    from google.genai import types
-except ImportError:
-    print("❌ Error: google-genai package not installed")
-    print("   Please run: pip install google-genai")
-    sys.exit(1)
+from asset_paths import EVENT_IMAGES_DIR, PROMPTS_FILE
 
 # Configuration
 DEFAULT_MODEL = "gemini-2.5-flash-image"
-OUTPUT_DIR = Path(__file__).parent.parent / "public" / "images" / "events"
-PROMPTS_FILE = Path(__file__).parent.parent / "prompts" / "event_prompts.md"
+OUTPUT_DIR = EVENT_IMAGES_DIR
+
+
+def load_genai():
+    """Import the SDK only when generating, so --list and --dry-run work without it."""
+    try:
+        from google import genai
+    except ImportError:
+        print("❌ Error: google-genai package not installed")
+        print("   Please run: pip install google-genai")
+        sys.exit(1)
+    return genai
 
 
 def parse_prompts_file(file_path: Path) -> dict:
@@ -56,6 +60,7 @@ def parse_prompts_file(file_path: Path) -> dict:
 
 def generate_image(client, prompt: str, event_id: str, model: str, aspect_ratio: str = "16:9") -> bytes | None:
     """Generate an image using Google GenAI SDK."""
+    from google.genai import types
     
     contents = [
         types.Content(
@@ -170,6 +175,17 @@ Get your API key at:
         action="store_true",
         help="Force regenerate even if image exists"
     )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=2,
+        help="Attempts per event when the output fails validation (default: 2)"
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip the image validation gate (validate_images.py)"
+    )
     
     args = parser.parse_args()
     
@@ -230,7 +246,7 @@ Get your API key at:
     
     # Initialize GenAI client
     print(f"\n🔑 Initializing Google GenAI client...")
-    client = genai.Client(api_key=api_key)
+    client = load_genai().Client(api_key=api_key)
     
     print(f"\n🎨 Generating {len(events)} images...")
     print(f"📁 Output directory: {OUTPUT_DIR}")
@@ -238,6 +254,11 @@ Get your API key at:
     print(f"📐 Aspect ratio: {args.aspect_ratio}")
     print(f"⏱️  Delay between calls: {args.delay}s")
     
+    rules = None
+    if not args.no_validate:
+        from validate_images import generate_validated, parse_aspect
+        rules = {'aspect': parse_aspect(args.aspect_ratio)}
+    
     success_count = 0
     skip_count = 0
     error_count = 0
@@ -253,18 +274,28 @@ Get your API key at:
             continue
         
         print(f"\n[{i}/{len(events)}] {event_id} ({info['name']})")
-        print(f"  🎨 Generating image for {event_id}...")
         
-        image_data = generate_image(
-            client,
-            info['prompt'],
-            event_id,
-            model=args.model,
-            aspect_ratio=args.aspect_ratio
-        )
+        def generate():
+            print(f"  🎨 Generating image for {event_id}...")
+            image_data = generate_image(
+                client,
+                info['prompt'],
+                event_id,
+                model=args.model,
+                aspect_ratio=args.aspect_ratio
+            )
+            if image_data:
+                output_path.write_bytes(image_data)
+            return bool(image_data)
+        
+        if rules is None:
+            ok = generate()
+        else:
+            # With --force an existing image is overwritten, so the replacement is validated too
+            ok = generate_validated(generate, output_path, rules, args.max_attempts, args.delay,
+                                    overwrites=args.force)
         
-        if image_data:
-            output_path.write_bytes(image_data)
+        if ok:
             print(f"  ✅ Saved to {output_path}")
             success_count += 1
         else:
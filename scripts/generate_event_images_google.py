@@ -8,16 +8,13 @@ import os
 import re
 import time
 import argparse
-import base64
-import requests
 from pathlib import Path
 import json
 
+from asset_paths import EVENT_IMAGES_DIR, PROMPTS_FILE
+
 # Configuration
-# Resolving paths relative to this script
-SCRIPT_DIR = Path(__file__).parent.resolve()
-PROMPTS_FILE = SCRIPT_DIR.parent / "prompts" / "event_prompts.md"
-DEFAULT_OUTPUT_DIR = SCRIPT_DIR.parent / "public" / "images" / "events"
+DEFAULT_OUTPUT_DIR = EVENT_IMAGES_DIR
 
 # Image generation settings
 DEFAULT_MODEL = "gemini-2.5-flash-image"
@@ -68,6 +65,8 @@ def generate_image(api_key: str, prompt: str, event_id: str, output_dir: Path, m
     
     Returns True if successful, False otherwise.
     """
+    from http_pool import INLINE_DATA_MARKER, get_session, stream_json_image
+
     output_path = output_dir / f"{event_id}.png"
     
     # Skip if image already exists
@@ -93,46 +92,28 @@ def generate_image(api_key: str, prompt: str, event_id: str, output_dir: Path, m
     headers = {"Content-Type": "application/json"}
     
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=60)
-        
-        if response.status_code != 200:
-            try:
-                error_info = response.json()
-            except:
-                error_info = response.text
-                
-            print(f"  ❌ Error {response.status_code}: {error_info}")
-            return False
+        # Stream the response: inlineData is base64-decoded chunk by chunk straight to disk
+        with get_session().post(url, json=payload, headers=headers, timeout=60, stream=True) as response:
+            if response.status_code != 200:
+                try:
+                    error_info = response.json()
+                except:
+                    error_info = response.text
+                    
+                print(f"  ❌ Error {response.status_code}: {error_info}")
+                return False
             
-        result = response.json()
-        
-        # Extract image data
-        # Response structure for image usually involves inlineData or a specific image field
-        # For 'generateContent' with image modality, it usually returns inline data in the candidates
+            found, body = stream_json_image(response, output_path, markers=(INLINE_DATA_MARKER,))
         
-        candidates = result.get("candidates", [])
-        if not candidates:
-            print(f"  ⚠️  No candidates returned from API.")
+        if not found:
+            # No inlineData: the body is small, parse it to report why
+            result = json.loads(body.decode('utf-8'))
+            if not result.get("candidates"):
+                print(f"  ⚠️  No candidates returned from API.")
+            else:
+                print(f"  ⚠️  No image data found in response.")
             return False
             
-        parts = candidates[0].get("content", {}).get("parts", [])
-        image_data = None
-        
-        for part in parts:
-            if "inlineData" in part:
-               image_data = base64.b64decode(part["inlineData"]["data"])
-               break
-        
-        if not image_data:
-             print(f"  ⚠️  No image data found in response.")
-             # Debug: print keys
-             # print(json.dumps(result, indent=2))
-             return False
-
-        # Save image
-        with open(output_path, 'wb') as f:
-            f.write(image_data)
-            
         print(f"  ✅ Saved: {output_path.name}")
         return True
 
@@ -147,19 +128,17 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Do not call API, just list events')
     parser.add_argument('--only', type=str, help='Comma separated list of event IDs to process')
     parser.add_argument('--model', type=str, default=DEFAULT_MODEL, help=f'Model name (default: {DEFAULT_MODEL})')
+    parser.add_argument('--max-attempts', type=int, default=2, help='Attempts per event when the output fails validation (default: 2)')
+    parser.add_argument('--no-validate', action='store_true', help='Skip the image validation gate (validate_images.py)')
     
     args = parser.parse_args()
     
     # Resolve API Key
     api_key = args.api_key or os.environ.get('GOOGLE_API_KEY')
-    if not api_key:
+    if not api_key and not args.dry_run:
         print("❌ Error: API Key is required. Set GOOGLE_API_KEY env var or pass --api-key")
         return
         
-    # Ensure output directory exists
-    if not DEFAULT_OUTPUT_DIR.exists():
-        DEFAULT_OUTPUT_DIR.mkdir(parents=True)
-        
     # Parse Prompts
     print(f"📖 Reading prompts from {PROMPTS_FILE}...")
     events = parse_events_from_markdown(PROMPTS_FILE)
@@ -176,14 +155,32 @@ def main():
             print(f"  - {e['id']}: {e['prompt'][:50]}...")
         return
 
+    # Ensure output directory exists
+    if not DEFAULT_OUTPUT_DIR.exists():
+        DEFAULT_OUTPUT_DIR.mkdir(parents=True)
+
     # Process
     print(f"\n🚀 Starting generation using model: {args.model}")
+    # No aspect ratio is requested from the API, so only integrity and content are checked
+    rules = None
+    if not args.no_validate:
+        from validate_images import generate_validated
+        rules = {'aspect': ()}
+    
     success_count = 0
     total = len(events)
     
     for i, event in enumerate(events):
         print(f"\n[{i+1}/{total}] Processing {event['id']}...")
-        if generate_image(api_key, event['prompt'], event['id'], DEFAULT_OUTPUT_DIR, args.model):
+        def generate():
+            return generate_image(api_key, event['prompt'], event['id'], DEFAULT_OUTPUT_DIR, args.model)
+        
+        if rules is None:
+            ok = generate()
+        else:
+            ok = generate_validated(generate, DEFAULT_OUTPUT_DIR / f"{event['id']}.png", rules,
+                                    args.max_attempts, 1)
+        if ok:
             success_count += 1
         time.sleep(1) # Simple rate limiting
         
@@ -11,16 +11,15 @@ import sys
 import re
 import json
 import time
-import base64
 import argparse
-import requests
 from pathlib import Path
 
+from asset_paths import EVENT_IMAGES_DIR, PROMPTS_FILE
+
 # Configuration
 VENUS_API_URL = "http://v2.open.venus.oa.com/llmproxy/v1/chat/completions"
 DEFAULT_MODEL = "gemini-3-pro-image"  # Nano Banana Pro - recommended
-OUTPUT_DIR = Path(__file__).parent.parent / "public" / "images" / "events"
-PROMPTS_FILE = Path(__file__).parent.parent / "prompts" / "event_prompts.md"
+OUTPUT_DIR = EVENT_IMAGES_DIR
 
 # Available image generation models on Venus
 AVAILABLE_MODELS = {
@@ -53,8 +52,44 @@ def parse_event_prompts(filepath: Path) -> dict:
     return events
 
 
-def generate_image(api_token: str, prompt: str, event_id: str, model: str = DEFAULT_MODEL, aspect_ratio: str = "16:9") -> bytes | None:
-    """Generate an image using Venus API with specified model."""
+def _extract_image_url(result: dict) -> str | None:
+    """Find a downloadable image URL in a (non-streamed) chat completion result."""
+    choices = result.get("choices", [])
+    if not choices:
+        return None
+    content = choices[0].get("message", {}).get("content")
+    
+    # Content might be a list (multimodal) or string
+    if isinstance(content, list):
+        for item in content:
+            if isinstance(item, dict):
+                # Check for venus_multimodal_url or image_url
+                if item.get("type") == "venus_multimodal_url":
+                    url = item.get("venus_multimodal_url", {}).get("url", "")
+                elif item.get("type") == "image_url":
+                    url = item.get("image_url", {}).get("url", "")
+                else:
+                    continue
+                if url and not url.startswith("data:image"):
+                    return url
+    elif isinstance(content, str):
+        # Check if response contains a URL
+        url_match = re.search(r'https?://[^\s\'"]+\.(png|jpg|jpeg|webp)', content, re.IGNORECASE)
+        if url_match:
+            return url_match.group(0)
+    return None
+
+
+def generate_image(api_token: str, prompt: str, event_id: str, output_path: Path, model: str = DEFAULT_MODEL, aspect_ratio: str = "16:9") -> bool:
+    """
+    Generate an image using Venus API with specified model and write it to output_path.
+    
+    The response is streamed: an embedded data URL is base64-decoded chunk by
+    chunk straight to disk, and image URLs are downloaded through the pooled session.
+    """
+    import requests
+
+    from http_pool import DATA_URL_MARKER, download_to_file, get_session, stream_json_image
     
     headers = {
         "Content-Type": "application/json",
@@ -74,101 +109,52 @@ def generate_image(api_token: str, prompt: str, event_id: str, model: str = DEFA
         "max_tokens": 4096
     }
     
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    session = get_session()
+    
     try:
-        response = requests.post(
+        with session.post(
             VENUS_API_URL,
             headers=headers,
             json=payload,
-            timeout=120
-        )
+            timeout=120,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                error_msg = response.text
+                try:
+                    error_data = response.json()
+                    error_msg = json.dumps(error_data, ensure_ascii=False)
+                except:
+                    pass
+                print(f"  ❌ Error generating {event_id}: {response.status_code} {response.reason}. {error_msg}")
+                return False
+            
+            # Fast path: base64 data URL decoded straight to the output file
+            found, body = stream_json_image(response, output_path, markers=(DATA_URL_MARKER,))
+            if found:
+                return True
         
-        if response.status_code != 200:
-            error_msg = response.text
-            try:
-                error_data = response.json()
-                error_msg = json.dumps(error_data, ensure_ascii=False)
-            except:
-                pass
-            print(f"  ❌ Error generating {event_id}: {response.status_code} {response.reason}. {error_msg}")
-            return None
-        
-        result = response.json()
-        
-        # Parse the response to extract image data
-        # The response format follows OpenAI structure
-        choices = result.get("choices", [])
-        if not choices:
+        # No embedded image: the body is small, parse it and look for a URL
+        result = json.loads(body.decode('utf-8'))
+        if not result.get("choices"):
             print(f"  ❌ No choices in response for {event_id}")
-            return None
+            return False
         
-        message = choices[0].get("message", {})
-        content = message.get("content")
-        
-        # Content might be a list (multimodal) or string
-        if isinstance(content, list):
-            # Look for image content in the list
-            for item in content:
-                if isinstance(item, dict):
-                    # Check for venus_multimodal_url or base64 image
-                    if item.get("type") == "venus_multimodal_url":
-                        url = item.get("venus_multimodal_url", {}).get("url", "")
-                        if url.startswith("data:image"):
-                            # Extract base64 data
-                            match = re.match(r'data:image/\w+;base64,(.+)', url)
-                            if match:
-                                return base64.b64decode(match.group(1))
-                        else:
-                            # It's a URL, download it
-                            img_response = requests.get(url, timeout=60)
-                            if img_response.status_code == 200:
-                                return img_response.content
-                    elif item.get("type") == "image_url":
-                        url = item.get("image_url", {}).get("url", "")
-                        if url.startswith("data:image"):
-                            match = re.match(r'data:image/\w+;base64,(.+)', url)
-                            if match:
-                                return base64.b64decode(match.group(1))
-                        else:
-                            img_response = requests.get(url, timeout=60)
-                            if img_response.status_code == 200:
-                                return img_response.content
-        elif isinstance(content, str):
-            # Check if it's base64 encoded image data
-            if content.startswith("data:image"):
-                match = re.match(r'data:image/\w+;base64,(.+)', content)
-                if match:
-                    return base64.b64decode(match.group(1))
-            # Check if response contains a URL
-            url_match = re.search(r'https?://[^\s\'"]+\.(png|jpg|jpeg|webp)', content, re.IGNORECASE)
-            if url_match:
-                img_response = requests.get(url_match.group(0), timeout=60)
-                if img_response.status_code == 200:
-                    return img_response.content
+        url = _extract_image_url(result)
+        if url and download_to_file(url, output_path, timeout=60, session=session):
+            return True
         
         # If we get here, try to find image data in raw response
         print(f"  ⚠️  Could not extract image from response for {event_id}")
         print(f"  Response structure: {json.dumps(result, ensure_ascii=False, indent=2)[:500]}...")
-        return None
+        return False
         
     except requests.exceptions.Timeout:
         print(f"  ❌ Timeout generating {event_id}")
-        return None
+        return False
     except Exception as e:
         print(f"  ❌ Exception generating {event_id}: {str(e)}")
-        return None
-
-
-def save_image(image_data: bytes, event_id: str, output_dir: Path) -> bool:
-    """Save image data to file."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / f"{event_id}.png"
-    
-    try:
-        with open(output_path, 'wb') as f:
-            f.write(image_data)
-        return True
-    except Exception as e:
-        print(f"  ❌ Error saving {event_id}: {str(e)}")
         return False
 
 
@@ -244,6 +230,17 @@ Examples:
         action="store_true",
         help="Force regenerate even if image exists"
     )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=2,
+        help="Attempts per event when the output fails validation (default: 2)"
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip the image validation gate (validate_images.py)"
+    )
     
     args = parser.parse_args()
     
@@ -332,27 +329,39 @@ Examples:
     print(f"📐 Aspect ratio: {args.aspect_ratio}")
     print()
     
+    rules = None
+    if not args.no_validate:
+        from validate_images import generate_validated, parse_aspect
+        rules = {'aspect': parse_aspect(args.aspect_ratio)}
+    
     success_count = 0
     fail_count = 0
     
     for i, (event_id, info) in enumerate(events.items(), 1):
         print(f"[{i}/{len(events)}] {event_id} ({info['name']})")
-        print(f"  🎨 Generating image for {event_id}...")
+        output_path = OUTPUT_DIR / f"{event_id}.png"
+        
+        def generate():
+            print(f"  🎨 Generating image for {event_id}...")
+            return generate_image(
+                api_key, 
+                info['prompt'], 
+                event_id,
+                output_path,
+                model=args.model,
+                aspect_ratio=args.aspect_ratio
+            )
         
-        image_data = generate_image(
-            api_key, 
-            info['prompt'], 
-            event_id,
-            model=args.model,
-            aspect_ratio=args.aspect_ratio
-        )
+        if rules is None:
+            ok = generate()
+        else:
+            # With --force an existing image is overwritten, so the replacement is validated too
+            ok = generate_validated(generate, output_path, rules, args.max_attempts, args.delay,
+                                    overwrites=args.force)
         
-        if image_data:
-            if save_image(image_data, event_id, OUTPUT_DIR):
-                print(f"  ✅ Saved {event_id}.png")
-                success_count += 1
-            else:
-                fail_count += 1
+        if ok:
+            print(f"  ✅ Saved {event_id}.png")
+            success_count += 1
         else:
             fail_count += 1
         
@@ -3,7 +3,7 @@ const fs = require('fs');
 const path = require('path');
 
 const inputJson = path.join(__dirname, 'extracted_events.json');
-const outputMd = path.join('C:\\Users\\HkingAuditore\\.gemini\\antigravity\\brain\\f54d1ca7-d77d-4979-bf10-94da08278cfc', 'event_prompts.md');
+const outputMd = path.join(__dirname, 'output', 'event_prompts.md');
 
 if (!fs.existsSync(inputJson)) {
     console.error('Input JSON not found!');
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+SQLite Work Queue for Event Image Generation
+Lets several generator processes (each with its own provider and API key)
+drain one art job in parallel without racing on the same <id>.png:
+  - every event is a task row; a worker leases one task at a time
+  - the lease is extended by a heartbeat thread while the image generates
+  - a task whose lease expires (crashed/killed worker) becomes available again
+  - every attempt is recorded in the results table of the same database
+
+Usage:
+    python generate_queue.py init  [--db queue.sqlite] [--only a,b] [--force]
+    python generate_queue.py work  --provider venus --api-key KEY_A
+    python generate_queue.py work  --provider gemini --api-key KEY_B
+    python generate_queue.py work  --provider file --fixtures tests/images
+    python generate_queue.py work  --provider venus --hedge gemini --hedge-percentile 90
+    python generate_queue.py status
+    python generate_queue.py retry-failed
+
+With --hedge, a worker sends a slow request to a second provider as well and
+keeps whichever image arrives first, and routes away from providers whose
+error rate rises (see provider_hedging.py).
+
+The queue is meant for processes on one machine (or a local disk); SQLite
+locking over network filesystems is not reliable.
+"""
+
+import argparse
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from asset_paths import CACHE_DIR, EVENT_IMAGES_DIR, PROMPTS_FILE
+
+DEFAULT_DB = CACHE_DIR / 'generate_queue.sqlite'
+DEFAULT_OUTPUT_DIR = EVENT_IMAGES_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    event_id      TEXT PRIMARY KEY,
+    name          TEXT NOT NULL,
+    prompt        TEXT NOT NULL,
+    state         TEXT NOT NULL DEFAULT 'pending',  -- pending | leased | done | failed
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    updated_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, lease_expires);
+
+CREATE TABLE IF NOT EXISTS results (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id    TEXT NOT NULL,
+    worker      TEXT NOT NULL,
+    provider    TEXT NOT NULL,
+    ok          INTEGER NOT NULL,
+    error       TEXT,
+    bytes       INTEGER,
+    started_at  REAL NOT NULL,
+    finished_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class WorkQueue:
+    """Leased task queue on top of a single SQLite file"""
+
+    def __init__(self, db_path, timeout=30.0):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = self._connect(timeout)
+        self.conn.executescript(SCHEMA)
+
+    def _connect(self, timeout):
+        # isolation_level=None: we issue BEGIN IMMEDIATE ourselves so leasing is atomic
+        conn = sqlite3.connect(str(self.db_path), timeout=timeout, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def close(self):
+        self.conn.close()
+
+    def get_meta(self, key, default=None):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row['value'] if row else default
+
+    def set_meta(self, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, str(value)))
+
+    def enqueue(self, events, reset=False):
+        """
+        Add events as pending tasks
+
+        Args:
+            events: Iterable of (event_id, name, prompt)
+            reset: Re-queue events that already exist (done or failed)
+
+        Returns:
+            Number of tasks added or reset
+        """
+        now = time.time()
+        verb = 'INSERT OR REPLACE' if reset else 'INSERT OR IGNORE'
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                f'{verb} INTO tasks (event_id, name, prompt, state, attempts, updated_at) '
+                f"VALUES (?, ?, ?, 'pending', 0, ?)",
+                [(event_id, name, prompt, now) for event_id, name, prompt in events])
+            added = self.conn.total_changes - before
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return added
+
+    def lease(self, worker, lease_seconds):
+        """
+        Atomically claim the next pending (or lease-expired) task
+
+        Returns:
+            sqlite3.Row of the task, or None when nothing is available
+        """
+        now = time.time()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = self.conn.execute(
+                "SELECT * FROM tasks WHERE state = 'pending' "
+                "OR (state = 'leased' AND lease_expires < ?) "
+                "ORDER BY attempts, rowid LIMIT 1", (now,)).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    "UPDATE tasks SET state = 'leased', lease_owner = ?, lease_expires = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE event_id = ?",
+                    (worker, now + lease_seconds, now, row['event_id']))
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return row
+
+    def heartbeat(self, event_id, worker, lease_seconds):
+        """
+        Extend a lease we still own
+
+        Returns:
+            False if the lease was lost (expired and taken by another worker)
+        """
+        now = time.time()
+        cur = self.conn.execute(
+            "UPDATE tasks SET lease_expires = ?, updated_at = ? "
+            "WHERE event_id = ? AND lease_owner = ? AND state = 'leased'",
+            (now + lease_seconds, now, event_id, worker))
+        return cur.rowcount == 1
+
+    def finish(self, event_id, worker, provider, ok, started_at, error=None, size=None, max_attempts=3):
+        """
+        Record an attempt and move the task to done, pending (retry) or failed
+
+        Returns:
+            The task's new state, or None if the lease had been lost
+        """
+        now = time.time()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self.conn.execute(
+                'INSERT INTO results (event_id, worker, provider, ok, error, bytes, started_at, finished_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (event_id, worker, provider, int(ok), error, size, started_at, now))
+            row = self.conn.execute(
+                "SELECT attempts FROM tasks WHERE event_id = ? AND lease_owner = ? AND state = 'leased'",
+                (event_id, worker)).fetchone()
+            state = None
+            if row is not None:
+                if ok:
+                    state = 'done'
+                elif row['attempts'] >= max_attempts:
+                    state = 'failed'
+                else:
+                    state = 'pending'
+                self.conn.execute(
+                    'UPDATE tasks SET state = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? '
+                    'WHERE event_id = ?', (state, now, event_id))
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return state
+
+    def retry_failed(self):
+        """Move failed tasks back to pending with a fresh attempt budget"""
+        cur = self.conn.execute(
+            "UPDATE tasks SET state = 'pending', attempts = 0, updated_at = ? WHERE state = 'failed'",
+            (time.time(),))
+        return cur.rowcount
+
+    def counts(self):
+        """Task counts by state (expired leases are reported as 'stale')"""
+        now = time.time()
+        rows = self.conn.execute(
+            "SELECT CASE WHEN state = 'leased' AND lease_expires < ? THEN 'stale' ELSE state END AS s, "
+            "COUNT(*) AS n FROM tasks GROUP BY s", (now,)).fetchall()
+        return {row['s']: row['n'] for row in rows}
+
+    def worker_stats(self):
+        """Per-worker attempt counts and mean duration"""
+        return self.conn.execute(
+            'SELECT worker, provider, COUNT(*) AS attempts, SUM(ok) AS ok, '
+            'AVG(finished_at - started_at) AS mean_seconds FROM results GROUP BY worker, provider '
+            'ORDER BY worker').fetchall()
+
+    def recent_attempts(self, providers, limit=50):
+        """(provider, seconds, ok) of the latest attempts per provider, oldest first"""
+        rows = []
+        for provider in providers:
+            rows.extend(self.conn.execute(
+                'SELECT provider, finished_at - started_at AS seconds, ok FROM results WHERE provider = ? '
+                'ORDER BY id DESC LIMIT ?', (provider, limit)).fetchall())
+        return [(row['provider'], row['seconds'], bool(row['ok'])) for row in reversed(rows)]
+
+    def failures(self, limit=20):
+        return self.conn.execute(
+            "SELECT t.event_id, t.attempts, r.error FROM tasks t "
+            "LEFT JOIN results r ON r.id = (SELECT MAX(id) FROM results WHERE event_id = t.event_id) "
+            "WHERE t.state = 'failed' ORDER BY t.event_id LIMIT ?", (limit,)).fetchall()
+
+
+class Heartbeat(threading.Thread):
+    """Keeps a lease alive while the main thread waits on the provider"""
+
+    def __init__(self, db_path, event_id, worker, lease_seconds):
+        super().__init__(daemon=True)
+        self.db_path = db_path
+        self.event_id = event_id
+        self.worker = worker
+        self.lease_seconds = lease_seconds
+        self.stop_event = threading.Event()
+        self.lost = False
+
+    def run(self):
+        queue = WorkQueue(self.db_path)
+        try:
+            while not self.stop_event.wait(self.lease_seconds / 3):
+                if not queue.heartbeat(self.event_id, self.worker, self.lease_seconds):
+                    self.lost = True
+                    return
+        finally:
+            queue.close()
+
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+
+def load_events(prompts_file):
+    """(event_id, name, prompt) tuples from event_prompts.md"""
+    from generate_event_images_venus import parse_event_prompts
+
+    events = parse_event_prompts(prompts_file)
+    return [(event_id, info['name'], info['prompt']) for event_id, info in events.items()]
+
+
+def cmd_init(args):
+    queue = WorkQueue(args.db)
+    events = load_events(Path(args.prompts))
+    print(f"📖 Found {len(events)} events in {args.prompts}")
+
+    if args.only:
+        only_ids = {x.strip() for x in args.only.split(',')}
+        events = [e for e in events if e[0] in only_ids]
+
+    output_dir = Path(args.output_dir)
+    if not args.force:
+        existing = {f.stem for f in output_dir.glob('*.png')} if output_dir.exists() else set()
+        skipped = sum(1 for e in events if e[0] in existing)
+        events = [e for e in events if e[0] not in existing]
+        if skipped:
+            print(f"⏭️  Skipping {skipped} existing images")
+
+    queue.set_meta('output_dir', output_dir.resolve())
+    queue.set_meta('aspect_ratio', args.aspect_ratio)
+    queue.set_meta('force', int(args.force))
+    added = queue.enqueue(events, reset=args.force)
+    print(f"✅ Queued {added} tasks in {args.db}")
+    print_counts(queue)
+    queue.close()
+
+
+def run_task(queue, task, provider, provider_name, worker, args, output_dir, rules):
+    """Generate, validate and record one leased task"""
+    event_id = task['event_id']
+    output_path = output_dir / f"{event_id}.png"
+    if queue.get_meta('force') == '1' and output_path.exists():
+        output_path.unlink()
+
+    heartbeat = Heartbeat(queue.db_path, event_id, worker, args.lease)
+    heartbeat.start()
+    started = time.time()
+    error = None
+    try:
+        ok = bool(provider(task['prompt'], event_id, output_path))
+        if not ok:
+            error = getattr(provider, 'last_error', None) or 'provider returned no image'
+    except Exception as e:
+        ok = False
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        heartbeat.stop()
+    # A hedged provider reports which backend produced (or failed) the image
+    provider_name = getattr(provider, 'last_backend', provider_name)
+
+    if ok and rules is not None:
+        from validate_images import quarantine, validate_image
+
+        check = validate_image(output_path, rules)
+        if not check['ok']:
+            quarantine(output_path, check['reason'])
+            ok = False
+            error = f"validation: {check['reason']}"
+
+    if heartbeat.lost:
+        print(f"  ⚠️  Lease on {event_id} was lost; discarding result")
+        return None
+
+    size = output_path.stat().st_size if ok else None
+    return queue.finish(event_id, worker, provider_name, ok, started, error=error, size=size,
+                        max_attempts=args.max_attempts)
+
+
+def build_provider(args, queue):
+    """The worker's provider; with --hedge, a HedgedProvider over all backends"""
+    from image_providers import get_provider, parse_provider_spec
+
+    base = {
+        'aspect_ratio': queue.get_meta('aspect_ratio', '16:9'),
+        'fixtures': args.fixtures,
+        'delay': args.fixture_delay,
+        'fail_rate': args.fixture_fail_rate,
+    }
+    primary_name, primary_options = parse_provider_spec(args.provider)
+    if not args.hedge:
+        options = dict(base, **primary_options)
+        if args.model:
+            options['model'] = args.model
+        return get_provider(primary_name, api_key=args.api_key, **options)
+
+    from provider_hedging import HedgedProvider
+
+    specs = [args.provider] + [spec.strip() for spec in args.hedge.split(',') if spec.strip()]
+    if args.model and 'model' not in primary_options:
+        # Histograms are per provider and model, so the label carries the model
+        specs[0] = f"{args.provider}:{args.model}"
+    backends = []
+    for spec in specs:
+        name, options = parse_provider_spec(spec)
+        # --api-key belongs to the primary provider; other providers use their env var
+        api_key = args.api_key if name == primary_name else None
+        backends.append((spec, get_provider(name, api_key=api_key, **dict(base, **options))))
+    policy = {
+        'percentile': args.hedge_percentile,
+        'initial_delay': args.hedge_delay,
+        'min_delay': args.hedge_min_delay,
+        'max_error_rate': args.max_error_rate,
+        'cooldown': args.cooldown,
+    }
+    return HedgedProvider(backends, policy, history=queue.recent_attempts(specs))
+
+
+def cmd_work(args):
+    from image_providers import ProviderError
+
+    queue = WorkQueue(args.db)
+    output_dir = Path(queue.get_meta('output_dir', DEFAULT_OUTPUT_DIR))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    worker = args.worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+    try:
+        provider = build_provider(args, queue)
+    except ProviderError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    rules = None
+    if not args.no_validate:
+        from validate_images import parse_aspect
+        rules = {'aspect': parse_aspect(queue.get_meta('aspect_ratio', '16:9'))}
+
+    print(f"👷 Worker {worker} ({args.provider}) draining {args.db}")
+    done = 0
+    while args.limit is None or done < args.limit:
+        task = queue.lease(worker, args.lease)
+        if task is None:
+            counts = queue.counts()
+            if counts.get('leased', 0) and args.wait:
+                # Others still hold leases that may expire; wait for them
+                time.sleep(min(args.lease / 3, 5))
+                continue
+            break
+
+        print(f"[{worker}] {task['event_id']} ({task['name']}) attempt {task['attempts'] + 1}")
+        state = run_task(queue, task, provider, args.provider, worker, args, output_dir, rules)
+        marker = {'done': '✅', 'pending': '🔁', 'failed': '❌'}.get(state, '⚠️ ')
+        print(f"  {marker} {task['event_id']}: {state}")
+        done += 1
+        if args.delay > 0:
+            time.sleep(args.delay)
+
+    print(f"🏁 Worker {worker} finished after {done} tasks")
+    if hasattr(provider, 'summary'):
+        print("⏱️  Backends:")
+        for line in provider.summary():
+            print(f"  {line}")
+    print_counts(queue)
+    queue.close()
+
+
+def print_counts(queue):
+    counts = queue.counts()
+    order = ('pending', 'leased', 'stale', 'done', 'failed')
+    print("📊 " + "  ".join(f"{state}: {counts.get(state, 0)}" for state in order))
+
+
+def cmd_status(args):
+    queue = WorkQueue(args.db)
+    print_counts(queue)
+    stats = queue.worker_stats()
+    if stats:
+        print("\n👷 Workers:")
+        for row in stats:
+            print(f"  {row['worker']:<40} {row['provider']:<8} "
+                  f"{row['ok'] or 0}/{row['attempts']} ok, mean {row['mean_seconds'] or 0:.1f}s")
+    failures = queue.failures()
+    if failures:
+        print("\n❌ Failed tasks:")
+        for row in failures:
+            print(f"  {row['event_id']} ({row['attempts']} attempts): {row['error']}")
+    queue.close()
+
+
+def cmd_retry_failed(args):
+    queue = WorkQueue(args.db)
+    print(f"🔁 Re-queued {queue.retry_failed()} failed tasks")
+    print_counts(queue)
+    queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='SQLite-backed work queue so several generator processes share one job',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--db', default=str(DEFAULT_DB), help=f'Queue database (default: {DEFAULT_DB})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_init = sub.add_parser('init', help='Create the queue and enqueue events from the prompts file')
+    p_init.add_argument('--prompts', default=str(PROMPTS_FILE), help='Prompts markdown file')
+    p_init.add_argument('--output-dir', default=str(DEFAULT_OUTPUT_DIR), help='Where workers write <id>.png')
+    p_init.add_argument('--only', help='Only enqueue these event IDs (comma-separated)')
+    p_init.add_argument('--aspect-ratio', default='16:9', help='Aspect ratio passed to providers (default: 16:9)')
+    p_init.add_argument('--force', action='store_true', help='Enqueue (and regenerate) events that already have images')
+    p_init.set_defaults(func=cmd_init)
+
+    p_work = sub.add_parser('work', help='Lease and process tasks until the queue is drained')
+    p_work.add_argument('--provider', required=True,
+                        help='venus | gemini | dalle | file, optionally with :model or :key=value options')
+    p_work.add_argument('--api-key', help='Provider credentials (or the provider env var)')
+    p_work.add_argument('--model', help='Provider model override')
+    p_work.add_argument('--worker-id', help='Worker name recorded in results (default: host-pid-random)')
+    p_work.add_argument('--lease', type=float, default=180.0, help='Lease length in seconds (default: 180)')
+    p_work.add_argument('--max-attempts', type=int, default=3, help='Attempts before a task is failed (default: 3)')
+    p_work.add_argument('--delay', type=float, default=0.0, help='Delay between tasks in seconds')
+    p_work.add_argument('--limit', type=int, help='Stop after this many tasks')
+    p_work.add_argument('--wait', action='store_true', help="Wait for other workers' leases instead of exiting")
+    p_work.add_argument('--no-validate', action='store_true', help='Skip the image validation gate')
+    p_work.add_argument('--fixtures', help='file provider: directory of fixture images')
+    p_work.add_argument('--fixture-delay', default='0', help='file provider: seconds per call, or "min-max"')
+    p_work.add_argument('--fixture-fail-rate', type=float, default=0.0, help='file provider: simulated failure rate')
+    p_work.add_argument('--hedge', help='Fallback providers for hedged requests, comma-separated '
+                                        '(e.g. "gemini" or "file:delay=1-3")')
+    p_work.add_argument('--hedge-percentile', type=float, default=90.0,
+                        help="Hedge once a request is slower than this percentile of the provider's "
+                             "recent latency (default: 90)")
+    p_work.add_argument('--hedge-delay', type=float, default=45.0,
+                        help='Hedge delay in seconds until a provider has enough latency samples (default: 45)')
+    p_work.add_argument('--hedge-min-delay', type=float, default=2.0, help='Never hedge sooner than this (default: 2)')
+    p_work.add_argument('--max-error-rate', type=float, default=0.5,
+                        help='Route away from a provider whose recent error rate exceeds this (default: 0.5)')
+    p_work.add_argument('--cooldown', type=float, default=120.0,
+                        help='Seconds to route away from a failing provider (default: 120)')
+    p_work.set_defaults(func=cmd_work)
+
+    p_status = sub.add_parser('status', help='Show task counts, per-worker results and failures')
+    p_status.set_defaults(func=cmd_status)
+
+    p_retry = sub.add_parser('retry-failed', help='Move failed tasks back to pending')
+    p_retry.set_defaults(func=cmd_retry_failed)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
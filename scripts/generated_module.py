@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Helpers for the build scripts that emit generated JS modules into src/
+Generated modules start with a comment naming their generator and a
+`// source-hash:` line. Generators compare that hash with a hash of their
+inputs to skip unchanged rebuilds and to detect stale output in --check mode.
+Tables are emitted as deep-frozen object literals, one entry per line.
+"""
+
+import hashlib
+import json
+import re
+
+_HASH_LINE = re.compile(r'^// source-hash: ([0-9a-f]{64})$', re.M)
+
+_DEEP_FREEZE = [
+    'const deepFreeze = (value) => {',
+    "    if (value && typeof value === 'object') {",
+    '        Object.values(value).forEach(deepFreeze);',
+    '        Object.freeze(value);',
+    '    }',
+    '    return value;',
+    '};',
+]
+
+
+def hash_sources(paths, version):
+    """sha256 over the generator version and the named input files"""
+    digest = hashlib.sha256(f"v{version}".encode())
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def read_source_hash(path):
+    """source-hash recorded in a generated module, or None"""
+    if not path.exists():
+        return None
+    m = _HASH_LINE.search(path.read_text(encoding='utf-8'))
+    return m.group(1) if m else None
+
+
+def render_frozen_module(header, tables, digest):
+    """
+    Render a generated module
+
+    Args:
+        header: Comment lines (without '// ') describing the generator and inputs
+        tables: Dict of export name -> dict or list
+        digest: Source hash to record
+    """
+    lines = [f'// {line}' for line in header]
+    lines.append(f'// source-hash: {digest}')
+    lines.append('')
+    lines.extend(_DEEP_FREEZE)
+    lines.append('')
+    for name, table in tables.items():
+        if isinstance(table, dict):
+            lines.append(f'export const {name} = deepFreeze({{')
+            for key, value in table.items():
+                lines.append(f'    {json.dumps(str(key))}: {json.dumps(value, ensure_ascii=False)},')
+            lines.append('});')
+        else:
+            lines.append(f'export const {name} = deepFreeze({json.dumps(table, ensure_ascii=False)});')
+        lines.append('')
+    return '\n'.join(lines)
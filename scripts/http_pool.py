@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP helpers for the image generators
+- One connection-pooled requests.Session per thread, so consecutive images
+  reuse the same TCP/TLS connection instead of paying for a new handshake
+- Streaming decode of base64 image payloads embedded in JSON responses
+  (data URLs, Gemini inlineData) straight to the output file, so only one
+  chunk of the image is held in memory at a time
+- With CASSETTE_SERVER set (see cassette.py), every request is routed to that
+  local record/replay server instead of the real provider
+"""
+
+import base64
+import os
+import re
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CHUNK_SIZE = 64 * 1024
+
+# Where a base64 image payload starts inside a JSON response body
+DATA_URL_MARKER = re.compile(rb'data:image\\?/[\w.+-]+;base64,')
+INLINE_DATA_MARKER = re.compile(rb'"data"\s*:\s*"')
+
+# Base URL of a cassette.py record/replay server, e.g. http://127.0.0.1:8765
+CASSETTE_SERVER_ENV = 'CASSETTE_SERVER'
+
+_local = threading.local()
+
+
+def cassette_url(url):
+    """
+    Rewrite a provider URL to the cassette server, if one is configured:
+    https://host/path?q -> <server>/https/host/path?q
+    """
+    server = os.environ.get(CASSETTE_SERVER_ENV, '').rstrip('/')
+    if not server or url.startswith(server):
+        return url
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ''
+    return f"{server}/{parts.scheme}/{parts.netloc}{parts.path}{query}"
+
+
+class CassetteAdapter(HTTPAdapter):
+    """HTTPAdapter that sends every request to the cassette server"""
+
+    def send(self, request, **kwargs):
+        request.url = cassette_url(request.url)
+        return super().send(request, **kwargs)
+
+
+def get_session(pool_size=8):
+    """
+    Return this thread's pooled session, creating it on first use.
+
+    Args:
+        pool_size: Max keep-alive connections per host
+    """
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        adapter_class = CassetteAdapter if os.environ.get(CASSETTE_SERVER_ENV) else HTTPAdapter
+        adapter = adapter_class(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _local.session = session
+    return session
+
+
+class Base64StreamDecoder:
+    """Incrementally decode base64 text into a binary file object."""
+
+    def __init__(self, out):
+        self.out = out
+        self.pending = b''
+        self.written = 0
+
+    def feed(self, data):
+        data = self.pending + data
+        # Keep a trailing backslash until the escape it starts is complete
+        if data.endswith(b'\\'):
+            data, tail = data[:-1], b'\\'
+        else:
+            tail = b''
+        # JSON may escape '/' as '\/' and wrap long strings with '\n'; drop everything that isn't base64
+        data = (data.replace(b'\\/', b'/').replace(b'\\n', b'').replace(b'\\r', b'')
+                .replace(b'\n', b'').replace(b'\r', b''))
+        usable = len(data) - len(data) % 4
+        if usable:
+            decoded = base64.b64decode(data[:usable])
+            self.out.write(decoded)
+            self.written += len(decoded)
+        self.pending = data[usable:] + tail
+
+    def close(self):
+        if self.pending:
+            # Tolerate unpadded payloads
+            self.feed(b'=' * (-len(self.pending) % 4))
+        return self.written
+
+
+def _write_atomic_stream(chunks, output_path, markers):
+    """
+    Scan streamed JSON for the first base64 image payload and decode it to disk.
+
+    Returns:
+        (found, body_prefix) - body_prefix holds the bytes seen before the
+        payload (or the whole body when no payload was found)
+    """
+    buffer = b''
+    temp_path = f"{output_path}.part"
+    out = None
+    decoder = None
+    found = False
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if decoder is None:
+                buffer += chunk
+                match = None
+                for marker in markers:
+                    m = marker.search(buffer)
+                    if m and (match is None or m.start() < match.start()):
+                        match = m
+                if match is None:
+                    continue
+                out = open(temp_path, 'wb')
+                decoder = Base64StreamDecoder(out)
+                chunk = buffer[match.end():]
+                buffer = buffer[:match.start()]
+
+            end = chunk.find(b'"')
+            if end >= 0:
+                decoder.feed(chunk[:end])
+                found = decoder.close() > 0
+                break
+            decoder.feed(chunk)
+    finally:
+        if out is not None:
+            out.close()
+
+    if found:
+        os.replace(temp_path, output_path)
+    elif os.path.exists(temp_path):
+        os.remove(temp_path)
+    return found, buffer
+
+
+def stream_json_image(response, output_path, markers=(DATA_URL_MARKER, INLINE_DATA_MARKER)):
+    """
+    Decode the first base64 image payload of a streamed JSON response to a file.
+
+    The response must have been requested with stream=True. When the body has
+    no embedded image (errors, plain URLs, text refusals) the full body is
+    returned so the caller can fall back to normal JSON handling.
+
+    Returns:
+        (found, body_prefix)
+    """
+    return _write_atomic_stream(response.iter_content(CHUNK_SIZE), output_path, markers)
+
+
+def download_to_file(url, output_path, timeout=60, session=None):
+    """
+    Stream a binary download to disk through the pooled session.
+
+    Returns:
+        True if the file was written, False on a non-200 response
+    """
+    session = session or get_session()
+    temp_path = f"{output_path}.part"
+    with session.get(url, timeout=timeout, stream=True) as response:
+        if response.status_code != 200:
+            return False
+        with open(temp_path, 'wb') as f:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                f.write(chunk)
+    os.replace(temp_path, output_path)
+    return True
+
+
+def write_bytes_atomic(data, output_path):
+    """Write bytes via a temp file so a crash never leaves a half-written image"""
+    temp_path = f"{output_path}.part"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, output_path)
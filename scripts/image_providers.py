@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Image provider registry shared by the queue workers
+Every provider is a callable (prompt, event_id, output_path) -> bool that
+writes the image to output_path. The real providers wrap the generate_image
+functions of the per-provider generator scripts and are imported only when
+selected, so a worker never loads SDKs it doesn't use.
+
+Providers:
+  venus   Venus OpenAI-compatible API (generate_event_images_venus.py)
+  gemini  Google AI Studio REST API (generate_event_images_google.py)
+  dalle   OpenAI DALL-E 3 (generate_event_images.py)
+  file    Offline stand-in that copies fixture images, for testing
+"""
+
+import os
+import random
+import shutil
+import time
+from pathlib import Path
+
+PROVIDER_NAMES = ('venus', 'gemini', 'dalle', 'file')
+
+API_KEY_ENV = {
+    'venus': 'VENUS_API_KEY',
+    'gemini': 'GOOGLE_API_KEY',
+    'dalle': 'OPENAI_API_KEY',
+}
+
+
+class ProviderError(Exception):
+    """Raised when a provider cannot be configured"""
+
+
+def venus_provider(api_key, model=None, aspect_ratio='16:9', **_):
+    from generate_event_images_venus import DEFAULT_MODEL, generate_image
+
+    model = model or DEFAULT_MODEL
+
+    def generate(prompt, event_id, output_path):
+        return generate_image(api_key, prompt, event_id, Path(output_path), model=model, aspect_ratio=aspect_ratio)
+    return generate
+
+
+def gemini_provider(api_key, model=None, **_):
+    from generate_event_images_google import DEFAULT_MODEL, generate_image
+
+    model = model or DEFAULT_MODEL
+
+    def generate(prompt, event_id, output_path):
+        output_path = Path(output_path)
+        # generate_image names the file <event_id>.png inside output_dir
+        return generate_image(api_key, prompt, event_id, output_path.parent, model)
+    return generate
+
+
+def dalle_provider(api_key, **_):
+    from openai import OpenAI
+    from generate_event_images import generate_image
+    from http_pool import CASSETTE_SERVER_ENV, cassette_url
+
+    if os.environ.get(CASSETTE_SERVER_ENV):
+        client = OpenAI(api_key=api_key, base_url=cassette_url('https://api.openai.com/v1'))
+    else:
+        client = OpenAI(api_key=api_key)
+
+    def generate(prompt, event_id, output_path):
+        return generate_image(client, prompt, event_id, Path(output_path).parent)
+    return generate
+
+
+def file_provider(fixtures=None, delay=0.0, fail_rate=0.0, seed=None, **_):
+    """
+    Offline stand-in: copy <event_id>.<ext> from the fixtures dir, or any
+    fixture image picked deterministically when there is no exact match.
+
+    Args:
+        fixtures: Directory of fixture images
+        delay: Seconds to sleep per call, or "min-max" for a uniform range
+        fail_rate: Probability of a simulated provider failure
+        seed: Seed for the failure/delay RNG
+    """
+    if not fixtures:
+        raise ProviderError("file provider needs --fixtures DIR")
+    fixtures = Path(fixtures)
+    images = sorted(f for f in fixtures.iterdir() if f.suffix.lower() in ('.png', '.jpg', '.jpeg', '.webp'))
+    if not images:
+        raise ProviderError(f"no fixture images in {fixtures}")
+    by_stem = {f.stem: f for f in images}
+    rng = random.Random(seed)
+
+    if isinstance(delay, str) and '-' in delay:
+        low, high = (float(x) for x in delay.split('-', 1))
+    else:
+        low = high = float(delay)
+
+    def generate(prompt, event_id, output_path):
+        if high > 0:
+            time.sleep(rng.uniform(low, high))
+        if rng.random() < fail_rate:
+            print(f"  ❌ Simulated provider failure for {event_id}")
+            return False
+        source = by_stem.get(event_id) or images[sum(map(ord, event_id)) % len(images)]
+        temp_path = f"{output_path}.part"
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, output_path)
+        return True
+    return generate
+
+
+_FACTORIES = {
+    'venus': venus_provider,
+    'gemini': gemini_provider,
+    'dalle': dalle_provider,
+    'file': file_provider,
+}
+
+
+def _coerce(value):
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_provider_spec(spec):
+    """
+    Split a backend spec into (name, options)
+
+    "venus" -> ('venus', {}); "venus:gemini-3-pro-image" -> model option;
+    "file:delay=20-60:fail_rate=0.1" -> key=value options (for stubs)
+    """
+    name, *parts = spec.split(':')
+    options = {}
+    for part in parts:
+        if '=' in part:
+            key, value = part.split('=', 1)
+            options[key.replace('-', '_')] = _coerce(value)
+        elif part:
+            options['model'] = part
+    return name, options
+
+
+def get_provider(name, api_key=None, **options):
+    """
+    Build a provider callable by name
+
+    Args:
+        name: One of PROVIDER_NAMES
+        api_key: Credentials; falls back to the provider's environment variable
+        **options: Provider-specific options (model, aspect_ratio, fixtures, delay, ...)
+    """
+    if name not in _FACTORIES:
+        raise ProviderError(f"unknown provider '{name}' (choose from {', '.join(PROVIDER_NAMES)})")
+    if name in API_KEY_ENV:
+        api_key = api_key or os.environ.get(API_KEY_ENV[name], '')
+        if not api_key:
+            raise ProviderError(f"{name} provider needs --api-key or {API_KEY_ENV[name]}")
+        options['api_key'] = api_key
+    return _FACTORIES[name](**options)
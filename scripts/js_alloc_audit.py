@@ -0,0 +1,646 @@
+#!/usr/bin/env python3
+"""
+Allocation Audit - Rank allocation-heavy JS patterns by how hot their code is
+Tokenizes src/**/*.js with js_tokenizer (no JS is executed) and looks for the
+patterns that churn the garbage collector during a tick:
+
+  deep-clone          JSON.parse(JSON.stringify(...))
+  structured-clone    structuredClone(...)
+  clone-helper-call   a call to a function whose body deep-clones
+  lookup-in-loop      .find/.findIndex/.indexOf/.includes/.some/.every inside a loop
+  array-in-loop       .filter/.map/.slice/.concat/.flatMap, Object.keys/values/entries,
+                      Array.from or [...spread] inside a loop
+  object-in-loop      {...spread}, Object.assign or new Map/Set/Array inside a loop
+
+"Inside a loop" counts for/while/do bodies and the callbacks of forEach, map,
+filter, reduce, some, every, find, flatMap and sort; the nesting depth of
+those loops is recorded per finding. Functions are linked into a call graph
+by name (imports and `export * from` are followed), and a finding is hot
+when its function is reachable from simulateTick (or --root).
+
+    score = severity x 2^(loop depth - 1) x (4 if hot)
+
+The ranked report can be saved as a baseline; --baseline lists findings that
+are not in it, so a review sees exactly which allocations a change added to
+the tick path. Keys are file + function + pattern + line text, not line
+numbers, so unrelated edits do not churn the diff.
+
+Files containing JSX (and .jsx files) are skipped: the tokenizer reads plain
+JS only, and components are not on the simulation path.
+
+Usage:
+    python js_alloc_audit.py                          # ranked report, top 40
+    python js_alloc_audit.py --hot-only --top 20
+    python js_alloc_audit.py --baseline js_alloc_baseline.json   # exit 1 on new hot findings
+    python js_alloc_audit.py --write-baseline js_alloc_baseline.json
+    python js_alloc_audit.py --format markdown > alloc.md
+"""
+
+import argparse
+import bisect
+import json
+import re
+import sys
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+
+from asset_paths import PROJECT_DIR, SRC_DIR
+from js_tokenizer import JsSyntaxError, tokenize
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_BASELINE = SCRIPT_DIR / 'js_alloc_baseline.json'
+DEFAULT_ROOTS = ['simulateTick']
+
+SEVERITY = {
+    'deep-clone': 8,
+    'structured-clone': 6,
+    'clone-helper-call': 6,
+    'lookup-in-loop': 3,
+    'array-in-loop': 2,
+    'object-in-loop': 2,
+}
+HOT_FACTOR = 4
+
+# Array methods whose callback runs once per element
+LOOP_METHODS = {'forEach', 'map', 'filter', 'reduce', 'reduceRight', 'some', 'every', 'find', 'findIndex',
+                'findLast', 'findLastIndex', 'flatMap', 'sort'}
+LOOKUP_METHODS = {'find', 'findIndex', 'findLast', 'findLastIndex', 'indexOf', 'includes', 'some', 'every'}
+ARRAY_METHODS = {'filter', 'map', 'slice', 'concat', 'flatMap', 'flat'}
+STATIC_ALLOCATORS = {('Object', 'keys'), ('Object', 'values'), ('Object', 'entries'),
+                     ('Object', 'fromEntries'), ('Array', 'from')}
+NEW_COLLECTIONS = {'Map', 'Set', 'Array', 'WeakMap', 'Object'}
+
+# Names that look like calls or methods but are statements
+KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'function', 'return', 'with', 'do', 'else', 'typeof',
+            'new', 'await', 'yield', 'delete', 'void', 'throw', 'case', 'in', 'of', 'instanceof'}
+# An expression-bodied arrow ends where the next statement starts
+STATEMENT_STARTS = {'const', 'let', 'var', 'function', 'export', 'import', 'return', 'if', 'for', 'while', 'class'}
+
+_IMPORT = re.compile(r"import\s*\{([^}]*)\}\s*from\s*['\"]([^'\"]+)['\"]")
+_EXPORT_FROM = re.compile(r"export\s*(?:\*|\{([^}]*)\})\s*from\s*['\"]([^'\"]+)['\"]")
+_JSX = re.compile(r"return\s*\(\s*<[A-Za-z>]|=>\s*\(?\s*<[A-Za-z]")
+
+
+class Function:
+    """A named function: token span, callees and (later) hotness"""
+
+    __slots__ = ('file', 'name', 'start', 'body_start', 'end', 'line', 'calls', 'clones', 'hops')
+
+    def __init__(self, file, name, start, body_start, end, line):
+        self.file = file
+        self.name = name
+        self.start = start            # token index of the head
+        self.body_start = body_start  # token index of the first body token
+        self.end = end                # token index past the body
+        self.line = line
+        self.calls = set()            # bare names referenced in the body
+        self.clones = False
+        self.hops = None              # call-graph distance from a root, None if unreachable
+
+    @property
+    def hot(self):
+        return self.hops is not None
+
+
+class SourceFile:
+    """Tokens of one module plus the tables the analysis needs"""
+
+    def __init__(self, path, text, tokens):
+        self.path = path
+        self.rel = path.relative_to(PROJECT_DIR).as_posix()
+        self.text = text
+        self.tokens = tokens
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        self.match, self.parent = _brackets(tokens)
+        self.functions = []
+        self.owner = []               # token index -> innermost Function or None
+        self.depth = []               # token index -> loop nesting depth
+        self.imports = {}             # local name -> (module path, exported name)
+        self.reexports = []           # (module path, names or None for *)
+
+    def line(self, token_index):
+        return bisect.bisect_right(self.line_starts, self.tokens[token_index].start)
+
+    def line_text(self, token_index):
+        n = self.line(token_index)
+        start = self.line_starts[n - 1]
+        end = self.line_starts[n] - 1 if n < len(self.line_starts) else len(self.text)
+        return ' '.join(self.text[start:end].split())
+
+
+def _brackets(tokens):
+    """Matching bracket index and innermost enclosing open bracket for every token"""
+    match = [-1] * len(tokens)
+    parent = [-1] * len(tokens)
+    stack = []
+    for i, tok in enumerate(tokens):
+        parent[i] = stack[-1] if stack else -1
+        if tok.kind != 'punct':
+            continue
+        if tok.value in ('(', '[', '{'):
+            stack.append(i)
+        elif tok.value in (')', ']', '}') and stack:
+            j = stack.pop()
+            match[i], match[j] = j, i
+            parent[i] = stack[-1] if stack else -1
+    return match, parent
+
+
+def _is(tok, kind, *values):
+    return tok is not None and tok.kind == kind and (not values or tok.value in values)
+
+
+def _expression_end(src, i):
+    """Token index past an expression starting at i (arrow bodies, brace-less loop bodies)"""
+    tokens = src.tokens
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok.kind == 'punct':
+            if tok.value in ('(', '[', '{') and src.match[i] > i:
+                i = src.match[i] + 1
+                continue
+            if tok.value in (')', ']', '}', ';', ','):
+                return i
+        elif tok.kind == 'name' and tok.value in STATEMENT_STARTS and i > 0 \
+                and not _is(tokens[i - 1], 'punct', '.'):
+            return i
+        i += 1
+    return i
+
+
+def _body_span(src, i):
+    """(start, end) of a function or loop body starting at token i"""
+    if _is(src.tokens[i] if i < len(src.tokens) else None, 'punct', '{') and src.match[i] > i:
+        return i + 1, src.match[i]
+    return i, _expression_end(src, i)
+
+
+def _binding_name(tokens, head):
+    """Name a function expression is assigned to: `NAME = ...` or `NAME: ...`"""
+    if head > 0 and _is(tokens[head - 1], 'punct', '=', ':') and head > 1 \
+            and tokens[head - 2].kind in ('name', 'str'):
+        return tokens[head - 2].value
+    return None
+
+
+def find_functions(src):
+    """Named function declarations, assigned arrows/function expressions and methods"""
+    tokens = src.tokens
+    found = []
+    for i, tok in enumerate(tokens):
+        if _is(tok, 'name', 'function'):
+            j = i + 1
+            if _is(tokens[j] if j < len(tokens) else None, 'punct', '*'):
+                j += 1
+            name = tokens[j].value if j < len(tokens) and tokens[j].kind == 'name' else None
+            if name is not None:
+                j += 1
+            else:
+                head = i - 1 if i > 0 and _is(tokens[i - 1], 'name', 'async') else i
+                name = _binding_name(tokens, head)
+            if j >= len(tokens) or not _is(tokens[j], 'punct', '(') or src.match[j] < 0:
+                continue
+            start, end = _body_span(src, src.match[j] + 1)
+            if name:
+                found.append((name, i, start, end))
+        elif _is(tok, 'punct', '=>'):
+            prev = i - 1
+            if _is(tokens[prev], 'punct', ')') and src.match[prev] >= 0:
+                head = src.match[prev]
+            else:
+                head = prev
+            if head > 0 and _is(tokens[head - 1], 'name', 'async'):
+                head -= 1
+            name = _binding_name(tokens, head)
+            if name:
+                start, end = _body_span(src, i + 1)
+                found.append((name, head, start, end))
+        elif tok.kind == 'name' and tok.value not in KEYWORDS and i + 1 < len(tokens) \
+                and _is(tokens[i + 1], 'punct', '(') and src.match[i + 1] > i:
+            # Method shorthand: `name(args) {` directly inside an object literal or class body
+            close = src.match[i + 1]
+            if close + 1 >= len(tokens) or not _is(tokens[close + 1], 'punct', '{'):
+                continue
+            prev = tokens[i - 1] if i > 0 else None
+            if prev is not None and not _is(prev, 'punct', '{', ',', '}', ';') \
+                    and not _is(prev, 'name', 'async', 'static', 'get', 'set'):
+                continue
+            enclosing = src.parent[i]
+            if enclosing < 0 or not _is(tokens[enclosing], 'punct', '{'):
+                continue
+            found.append((tok.value, i, close + 2, src.match[close + 1]))
+    functions = []
+    for name, head, start, end in found:
+        functions.append(Function(src.rel, name, head, start, end, src.line(head)))
+    return functions
+
+
+def assign_owners(src):
+    """Map every token to its innermost named function"""
+    owner = [None] * len(src.tokens)
+    # Outer functions first, so inner ones overwrite their own span
+    for fn in sorted(src.functions, key=lambda f: (f.start, -f.end)):
+        for k in range(fn.body_start, fn.end):
+            owner[k] = fn
+    src.owner = owner
+
+
+def loop_depths(src):
+    """Loop nesting depth of every token (difference array over loop body spans)"""
+    tokens = src.tokens
+    n = len(tokens)
+    delta = [0] * (n + 1)
+    for i, tok in enumerate(tokens):
+        span = None
+        if _is(tok, 'name', 'for', 'while') and i + 1 < n and _is(tokens[i + 1], 'punct', '(') \
+                and src.match[i + 1] > i:
+            close = src.match[i + 1]
+            if close + 1 < n and not _is(tokens[close + 1], 'punct', ';'):  # `} while (x);` ends a do
+                span = _body_span(src, close + 1)
+        elif _is(tok, 'name', 'do') and i + 1 < n and _is(tokens[i + 1], 'punct', '{'):
+            span = _body_span(src, i + 1)
+        elif tok.kind == 'name' and tok.value in LOOP_METHODS and i > 0 and _is(tokens[i - 1], 'punct', '.', '?.') \
+                and i + 1 < n and _is(tokens[i + 1], 'punct', '(') and src.match[i + 1] > i:
+            span = (i + 2, src.match[i + 1])
+        if span and span[0] < span[1]:
+            delta[span[0]] += 1
+            delta[span[1]] -= 1
+    depth, running = [0] * n, 0
+    for k in range(n):
+        running += delta[k]
+        depth[k] = running
+    src.depth = depth
+
+
+def _resolve_module(from_file, spec):
+    """Path of a relative import, or None for packages"""
+    if not spec.startswith('.'):
+        return None
+    base = (from_file.parent / spec).resolve()
+    for candidate in (base, base.with_name(base.name + '.js'), base / 'index.js'):
+        if candidate.is_file() and candidate.suffix == '.js':
+            return candidate
+    return None
+
+
+def parse_imports(src):
+    for m in _IMPORT.finditer(src.text):
+        target = _resolve_module(src.path, m.group(2))
+        if target is None:
+            continue
+        for part in m.group(1).split(','):
+            part = part.strip()
+            if part:
+                exported, _, local = part.partition(' as ')
+                src.imports[(local or exported).strip()] = (target, exported.strip())
+    for m in _EXPORT_FROM.finditer(src.text):
+        target = _resolve_module(src.path, m.group(2))
+        if target is None:
+            continue
+        if m.group(1) is None:
+            src.reexports.append((target, None))
+        else:
+            names = {}
+            for part in m.group(1).split(','):
+                part = part.strip()
+                if part:
+                    exported, _, alias = part.partition(' as ')
+                    names[(alias or exported).strip()] = exported.strip()
+            src.reexports.append((target, names))
+
+
+class Project:
+    """All tokenized modules and the name-based call graph between their functions"""
+
+    def __init__(self, files):
+        self.files = {src.path: src for src in files}
+        self.by_name = defaultdict(list)
+        for src in files:
+            for fn in src.functions:
+                self.by_name[fn.name].append(fn)
+
+    def defined_in(self, path, name, seen=None):
+        """Functions exported as `name` by a module, following re-exports"""
+        src = self.files.get(path)
+        if src is None:
+            return []
+        local = [fn for fn in src.functions if fn.name == name]
+        if local:
+            return local
+        seen = seen or set()
+        if path in seen:
+            return []
+        seen.add(path)
+        for target, names in src.reexports:
+            if names is None:
+                found = self.defined_in(target, name, seen)
+            elif name in names:
+                found = self.defined_in(target, names[name], seen)
+            else:
+                continue
+            if found:
+                return found
+        return []
+
+    def resolve(self, src, name):
+        """Functions a bare name in src refers to: import, same file, else any function of that name"""
+        if name in src.imports:
+            target, exported = src.imports[name]
+            found = self.defined_in(target, exported)
+            if found:
+                return found
+        local = [fn for fn in src.functions if fn.name == name]
+        return local or self.by_name.get(name, [])
+
+    def link(self):
+        """Fill Function.calls with the bare names each body references"""
+        for src in self.files.values():
+            tokens = src.tokens
+            for k, tok in enumerate(tokens):
+                fn = src.owner[k]
+                if fn is None or tok.kind != 'name' or tok.value not in self.by_name:
+                    continue
+                prev = tokens[k - 1] if k > 0 else None
+                nxt = tokens[k + 1] if k + 1 < len(tokens) else None
+                if _is(prev, 'punct', '.', '?.') or (_is(nxt, 'punct', ':') and _is(prev, 'punct', '{', ',')):
+                    continue  # property access or object key
+                if tok.value != fn.name:
+                    fn.calls.add(tok.value)
+
+    def mark_hot(self, roots):
+        """BFS from the root functions; returns the roots that were found"""
+        queue = deque()
+        found = []
+        for name in roots:
+            for fn in self.by_name.get(name, []):
+                fn.hops = 0
+                queue.append(fn)
+                found.append(name)
+        while queue:
+            fn = queue.popleft()
+            src = self.files[PROJECT_DIR / fn.file]
+            for name in fn.calls:
+                for callee in self.resolve(src, name):
+                    if callee.hops is None:
+                        callee.hops = fn.hops + 1
+                        queue.append(callee)
+        return sorted(set(found))
+
+
+def load_sources(paths):
+    """Tokenize the .js files under paths; JSX files are skipped with a warning"""
+    files, skipped = [], []
+    for root in paths:
+        root = Path(root)
+        candidates = [root] if root.is_file() else sorted(root.rglob('*.js'))
+        for path in candidates:
+            if 'node_modules' in path.parts or path.name.endswith('.generated.js'):
+                continue
+            text = path.read_text(encoding='utf-8')
+            if _JSX.search(text):
+                skipped.append((path, 'contains JSX'))
+                continue
+            try:
+                tokens, _ = tokenize(text)
+            except JsSyntaxError as e:
+                skipped.append((path, str(e)))
+                continue
+            files.append(SourceFile(path.resolve(), text, tokens))
+    return files, skipped
+
+
+def _finding(src, k, kind, detail):
+    fn = src.owner[k]
+    depth = src.depth[k]
+    hot = fn is not None and fn.hot
+    score = SEVERITY[kind] * (2 ** (depth - 1) if depth > 0 else 1) * (HOT_FACTOR if hot else 1)
+    return {
+        'file': src.rel,
+        'line': src.line(k),
+        'function': fn.name if fn else '<module>',
+        'kind': kind,
+        'detail': detail,
+        'depth': depth,
+        'hot': hot,
+        'hops': fn.hops if hot else None,
+        'score': score,
+        'code': src.line_text(k),
+    }
+
+
+def scan(project, src):
+    """Findings of one file"""
+    tokens = src.tokens
+    n = len(tokens)
+    findings = []
+
+    def tok(k):
+        return tokens[k] if 0 <= k < n else None
+
+    for k, t in enumerate(tokens):
+        depth = src.depth[k]
+        if t.kind == 'name':
+            prev, nxt = tok(k - 1), tok(k + 1)
+            member = _is(prev, 'punct', '.', '?.')
+            call = _is(nxt, 'punct', '(')
+            if t.value == 'JSON' and _is(nxt, 'punct', '.') and _is(tok(k + 2), 'name', 'parse') \
+                    and _is(tok(k + 3), 'punct', '(') and _is(tok(k + 4), 'name', 'JSON') \
+                    and _is(tok(k + 6), 'name', 'stringify'):
+                findings.append(_finding(src, k, 'deep-clone', 'JSON.parse(JSON.stringify())'))
+            elif t.value == 'structuredClone' and call and not member:
+                findings.append(_finding(src, k, 'structured-clone', 'structuredClone()'))
+            elif call and not member and not _is(prev, 'name', 'function') and t.value in project.by_name \
+                    and any(fn.clones for fn in project.resolve(src, t.value)) \
+                    and (src.owner[k] is None or src.owner[k].name != t.value):
+                findings.append(_finding(src, k, 'clone-helper-call', f'{t.value}() deep-clones'))
+            elif depth == 0:
+                continue
+            elif member and call and t.value in LOOKUP_METHODS:
+                findings.append(_finding(src, k, 'lookup-in-loop', f'.{t.value}()'))
+            elif member and call and t.value in ARRAY_METHODS:
+                findings.append(_finding(src, k, 'array-in-loop', f'.{t.value}()'))
+            elif member and call and prev is not None and (tok(k - 2).value, t.value) in STATIC_ALLOCATORS:
+                findings.append(_finding(src, k, 'array-in-loop', f'{tok(k - 2).value}.{t.value}()'))
+            elif member and call and t.value == 'assign' and _is(tok(k - 2), 'name', 'Object'):
+                findings.append(_finding(src, k, 'object-in-loop', 'Object.assign()'))
+            elif t.value == 'new' and _is(nxt, 'name') and nxt.value in NEW_COLLECTIONS:
+                findings.append(_finding(src, k, 'object-in-loop', f'new {nxt.value}()'))
+        elif depth > 0 and _is(t, 'punct', '...'):
+            enclosing = src.parent[k]
+            if enclosing < 0:
+                continue
+            bracket = tokens[enclosing].value
+            if bracket == '{':
+                findings.append(_finding(src, k, 'object-in-loop', '{...spread}'))
+            elif bracket == '[':
+                findings.append(_finding(src, k, 'array-in-loop', '[...spread]'))
+    return findings
+
+
+def analyze(paths, roots):
+    """Tokenize, build the call graph, mark hot functions and collect findings"""
+    files, skipped = load_sources(paths)
+    for src in files:
+        src.functions = find_functions(src)
+        assign_owners(src)
+        loop_depths(src)
+        parse_imports(src)
+    project = Project(files)
+    project.link()
+    for src in files:
+        for k, t in enumerate(src.tokens):
+            if t.value == 'JSON' and t.kind == 'name' and src.owner[k] is not None \
+                    and k + 6 < len(src.tokens) and src.tokens[k + 6].value == 'stringify':
+                src.owner[k].clones = True
+            elif t.value == 'structuredClone' and src.owner[k] is not None:
+                src.owner[k].clones = True
+    found_roots = project.mark_hot(roots)
+
+    findings = []
+    for src in files:
+        findings.extend(scan(project, src))
+    # Stable keys: occurrences of the same pattern on identical lines are numbered in file order
+    seen = Counter()
+    for f in sorted(findings, key=lambda f: (f['file'], f['line'])):
+        base = f"{f['file']}::{f['function']}::{f['kind']}::{f['detail']}::{f['code']}"
+        seen[base] += 1
+        f['key'] = base if seen[base] == 1 else f"{base}#{seen[base]}"
+    findings.sort(key=lambda f: (-f['score'], f['file'], f['line']))
+    hot_functions = sum(1 for src in files for fn in src.functions if fn.hot)
+    total_functions = sum(len(src.functions) for src in files)
+    return {
+        'roots': found_roots,
+        'files': len(files),
+        'skipped': [(Path(p).relative_to(PROJECT_DIR).as_posix(), why) for p, why in skipped],
+        'functions': total_functions,
+        'hot_functions': hot_functions,
+        'findings': findings,
+    }
+
+
+def write_baseline(findings, path):
+    """One finding per line, sorted by key, so baseline updates diff cleanly"""
+    rows = sorted(({'key': f['key'], 'score': f['score'], 'hot': f['hot']} for f in findings),
+                  key=lambda r: r['key'])
+    body = ',\n'.join(json.dumps(r, ensure_ascii=False) for r in rows)
+    Path(path).write_text(f"[\n{body}\n]\n", encoding='utf-8')
+
+
+def load_baseline(path):
+    return {r['key']: r for r in json.loads(Path(path).read_text(encoding='utf-8'))}
+
+
+def _location(f):
+    return f"{f['file']}:{f['line']}"
+
+
+def print_text(report, findings, top):
+    print("=" * 70)
+    print("JS ALLOCATION AUDIT")
+    print("=" * 70)
+    print(f"[INFO] {report['files']} files, {report['functions']} functions, "
+          f"{report['hot_functions']} reachable from {', '.join(report['roots']) or '(no root found)'}")
+    for path, why in report['skipped']:
+        print(f"[WARN] Skipped {path}: {why}")
+    print()
+    print(f"{'score':>5}  {'kind':<17} {'hot':<5} {'loop':>4}  location / function")
+    for f in findings[:top]:
+        hot = f"h{f['hops']}" if f['hot'] else ''
+        print(f"{f['score']:>5}  {f['kind']:<17} {hot:<5} {f['depth']:>4}  {_location(f)}  {f['function']}")
+        print(f"{'':>35}{f['code'][:100]}")
+    if len(findings) > top:
+        print(f"... {len(findings) - top} more (--top to show)")
+
+    print()
+    by_kind = Counter()
+    hot_by_kind = Counter()
+    for f in findings:
+        by_kind[f['kind']] += 1
+        hot_by_kind[f['kind']] += f['hot']
+    for kind in SEVERITY:
+        if by_kind[kind]:
+            print(f"  {kind:<18} {by_kind[kind]:>5} ({hot_by_kind[kind]} hot)")
+    by_file = Counter()
+    for f in findings:
+        by_file[f['file']] += f['score']
+    print()
+    print("Score by file:")
+    for path, score in by_file.most_common(10):
+        print(f"  {score:>6}  {path}")
+
+
+def print_markdown(report, findings, top):
+    print("# JS allocation audit\n")
+    print(f"{report['files']} files, {report['hot_functions']}/{report['functions']} functions reachable from "
+          f"`{'`, `'.join(report['roots'])}`.\n")
+    print("| score | pattern | hot | loop depth | location | function |")
+    print("|---:|---|---|---:|---|---|")
+    for f in findings[:top]:
+        hot = f"yes ({f['hops']} hops)" if f['hot'] else ''
+        print(f"| {f['score']} | {f['kind']} | {hot} | {f['depth']} | `{_location(f)}` | `{f['function']}` |")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rank allocation-heavy JS patterns by loop depth and hot-path reachability')
+    parser.add_argument('paths', nargs='*', help=f'Files or directories to scan (default: {SRC_DIR})')
+    parser.add_argument('--root', action='append', help='Hot-path root function, repeatable (default: simulateTick)')
+    parser.add_argument('--top', type=int, default=40, help='Findings to show (default: 40)')
+    parser.add_argument('--hot-only', action='store_true', help='Only show findings reachable from a root')
+    parser.add_argument('--format', choices=['text', 'json', 'markdown'], default='text')
+    parser.add_argument('--baseline', nargs='?', const=str(DEFAULT_BASELINE),
+                        help=f'Compare with a saved baseline (default file: {DEFAULT_BASELINE.name}); '
+                             'exits 1 if hot findings were added')
+    parser.add_argument('--fail-on', choices=['hot', 'any', 'none'], default='hot',
+                        help='Which new findings fail --baseline (default: hot)')
+    parser.add_argument('--write-baseline', nargs='?', const=str(DEFAULT_BASELINE),
+                        help=f'Save the current findings as the baseline (default file: {DEFAULT_BASELINE.name})')
+    args = parser.parse_args()
+
+    report = analyze(args.paths or [SRC_DIR], args.root or DEFAULT_ROOTS)
+    if not report['roots']:
+        print(f"[WARN] No function named {', '.join(args.root or DEFAULT_ROOTS)}; nothing is marked hot",
+              file=sys.stderr)
+    findings = report['findings']
+    shown = [f for f in findings if f['hot']] if args.hot_only else findings
+
+    if args.write_baseline:
+        write_baseline(findings, args.write_baseline)
+        print(f"[OK] Wrote {len(findings)} findings to {args.write_baseline}")
+        return 0
+
+    if args.baseline:
+        if not Path(args.baseline).exists():
+            print(f"[ERROR] Baseline not found: {args.baseline}")
+            print("Run: python js_alloc_audit.py --write-baseline")
+            return 2
+        baseline = load_baseline(args.baseline)
+        current = {f['key'] for f in findings}
+        added = [f for f in shown if f['key'] not in baseline]
+        removed = sorted(key for key in baseline if key not in current)
+        print("=" * 70)
+        print(f"JS ALLOCATION AUDIT vs {Path(args.baseline).name}")
+        print("=" * 70)
+        for f in added:
+            tag = '[ERROR]' if f['hot'] or args.fail_on == 'any' else '[WARN]'
+            print(f"{tag} new {f['kind']} (score {f['score']}{', hot' if f['hot'] else ''}, "
+                  f"loop depth {f['depth']}) at {_location(f)} in {f['function']}")
+            print(f"        {f['code'][:100]}")
+        for key in removed:
+            print(f"[OK] gone: {key}")
+        failing = [f for f in added if args.fail_on == 'any' or (args.fail_on == 'hot' and f['hot'])]
+        print(f"[RESULT] {len(added)} new, {len(removed)} removed, {len(failing)} failing")
+        if failing:
+            print("[INFO] Fix them, or accept them with --write-baseline and commit the baseline")
+        return 1 if failing else 0
+
+    if args.format == 'json':
+        print(json.dumps(dict(report, findings=shown), ensure_ascii=False, indent=1))
+    elif args.format == 'markdown':
+        print_markdown(report, shown, args.top)
+    else:
+        print_text(report, shown, args.top)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+Minimal JavaScript tokenizer and literal evaluator for the src/config modules
+Lets build scripts read config data without running JS. Top-level
+`[export] const NAME = <value>` declarations are evaluated into Python objects:
+
+  - object/array literals (with spreads), strings, template strings without
+    substitutions, numbers, true/false/null/undefined
+  - arithmetic on numeric literals (e.g. `1.3 * 4.8`)
+  - identifiers that name an earlier const in the same module
+
+Anything else (arrow functions, calls, conditionals, ...) is kept as a JsExpr
+holding the original source text, so data next to code still parses.
+
+Usage:
+    from js_tokenizer import parse_module
+    consts = parse_module(Path('src/config/buildings.js').read_text(encoding='utf-8'))
+    buildings = consts['BUILDINGS']
+"""
+
+import re
+
+_IDENT_START = re.compile(r'[A-Za-z_$\u0080-\uffff]')
+_IDENT = re.compile(r'[A-Za-z0-9_$\u0080-\uffff]+')
+_NUMBER = re.compile(r'0[xX][0-9a-fA-F_]+n?|0[bB][01_]+n?|0[oO][0-7_]+n?|'
+                     r'(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?')
+_PUNCT = re.compile(r'>>>=|\.\.\.|===|!==|\*\*=|<<=|>>=|>>>|\?\?=|&&=|\|\|=|=>|==|!=|<=|>=|&&|\|\||\?\?|\?\.|'
+                    r'\+\+|--|\+=|-=|\*=|/=|%=|&=|\|=|\^=|\*\*|<<|>>|[{}()\[\];,<>+\-*/%&|^!~?:=.@#]')
+_WS = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)+', re.S)
+
+# After these tokens a '/' starts a regex literal rather than a division
+_REGEX_AFTER_WORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw',
+                      'case', 'do', 'else', 'yield', 'await'}
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+
+class JsSyntaxError(Exception):
+    """Raised when the source cannot be tokenized or a literal is malformed"""
+
+
+class Token:
+    __slots__ = ('kind', 'value', 'start', 'end')
+
+    def __init__(self, kind, value, start, end):
+        self.kind = kind      # 'name', 'num', 'str', 'template', 'regex', 'punct'
+        self.value = value
+        self.start = start
+        self.end = end
+
+    def is_punct(self, *values):
+        return self.kind == 'punct' and self.value in values
+
+    def __repr__(self):
+        return f"Token({self.kind}, {self.value!r})"
+
+
+class JsExpr:
+    """A value that is not a plain literal; source holds the original text"""
+
+    __slots__ = ('source',)
+
+    def __init__(self, source):
+        self.source = source
+
+    def __repr__(self):
+        return f"JsExpr({self.source[:60]!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, JsExpr) and other.source == self.source
+
+    def __hash__(self):
+        return hash(self.source)
+
+
+def line_of(text, offset):
+    return text.count('\n', 0, offset) + 1
+
+
+def _unescape(body):
+    out = []
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c != '\\':
+            out.append(c)
+            i += 1
+            continue
+        n = body[i + 1] if i + 1 < len(body) else ''
+        if n == 'u':
+            if body[i + 2:i + 3] == '{':
+                close = body.index('}', i)
+                out.append(chr(int(body[i + 3:close], 16)))
+                i = close + 1
+            else:
+                out.append(chr(int(body[i + 2:i + 6], 16)))
+                i += 6
+        elif n == 'x':
+            out.append(chr(int(body[i + 2:i + 4], 16)))
+            i += 4
+        elif n == '\n':
+            i += 2  # line continuation
+        else:
+            out.append(_ESCAPES.get(n, n))
+            i += 2
+    return ''.join(out)
+
+
+def tokenize(text, pos=0, stop_at_unmatched_brace=False):
+    """
+    Split JavaScript source into tokens (comments and whitespace dropped)
+
+    Args:
+        text: Source text
+        pos: Offset to start at
+        stop_at_unmatched_brace: Return at a '}' that closes nothing (used for
+            template substitutions); the returned end offset points past it
+
+    Returns:
+        (tokens, end offset)
+    """
+    tokens = []
+    depth = 0
+    end = len(text)
+    while True:
+        m = _WS.match(text, pos)
+        if m:
+            pos = m.end()
+        if pos >= end:
+            break
+        c = text[pos]
+
+        if c in '"\'':
+            i = pos + 1
+            while i < end and text[i] != c:
+                if text[i] == '\\':
+                    i += 1
+                elif text[i] == '\n':
+                    raise JsSyntaxError(f"unterminated string on line {line_of(text, pos)}")
+                i += 1
+            if i >= end:
+                raise JsSyntaxError(f"unterminated string on line {line_of(text, pos)}")
+            tokens.append(Token('str', _unescape(text[pos + 1:i]), pos, i + 1))
+            pos = i + 1
+        elif c == '`':
+            i = pos + 1
+            parts = []
+            chunk_start = i
+            has_subst = False
+            while True:
+                if i >= end:
+                    raise JsSyntaxError(f"unterminated template on line {line_of(text, pos)}")
+                ch = text[i]
+                if ch == '\\':
+                    i += 2
+                elif ch == '`':
+                    parts.append(text[chunk_start:i])
+                    i += 1
+                    break
+                elif ch == '$' and text[i + 1:i + 2] == '{':
+                    has_subst = True
+                    parts.append(text[chunk_start:i])
+                    _, i = tokenize(text, i + 2, stop_at_unmatched_brace=True)
+                    chunk_start = i
+                else:
+                    i += 1
+            value = None if has_subst else _unescape(''.join(parts))
+            tokens.append(Token('template', value, pos, i))
+            pos = i
+        elif _IDENT_START.match(c):
+            m = _IDENT.match(text, pos)
+            tokens.append(Token('name', m.group(), pos, m.end()))
+            pos = m.end()
+        elif c.isdigit() or (c == '.' and text[pos + 1:pos + 2].isdigit()):
+            m = _NUMBER.match(text, pos)
+            tokens.append(Token('num', m.group(), pos, m.end()))
+            pos = m.end()
+        elif c == '/' and _regex_allowed(tokens):
+            i = pos + 1
+            in_class = False
+            while i < end:
+                ch = text[i]
+                if ch == '\\':
+                    i += 1
+                elif ch == '[':
+                    in_class = True
+                elif ch == ']':
+                    in_class = False
+                elif ch == '/' and not in_class:
+                    break
+                elif ch == '\n':
+                    raise JsSyntaxError(f"unterminated regex on line {line_of(text, pos)}")
+                i += 1
+            m = _IDENT.match(text, i + 1)
+            i = m.end() if m else i + 1
+            tokens.append(Token('regex', text[pos:i], pos, i))
+            pos = i
+        else:
+            m = _PUNCT.match(text, pos)
+            if not m:
+                raise JsSyntaxError(f"unexpected character {c!r} on line {line_of(text, pos)}")
+            value = m.group()
+            if value in ('{', '(', '['):
+                depth += 1
+            elif value in ('}', ')', ']'):
+                if depth == 0 and value == '}' and stop_at_unmatched_brace:
+                    return tokens, m.end()
+                depth -= 1
+            tokens.append(Token('punct', value, pos, m.end()))
+            pos = m.end()
+    if stop_at_unmatched_brace:
+        raise JsSyntaxError("unterminated template substitution")
+    return tokens, pos
+
+
+def _regex_allowed(tokens):
+    if not tokens:
+        return True
+    prev = tokens[-1]
+    if prev.kind == 'punct':
+        return prev.value not in (')', ']', '}')
+    if prev.kind == 'name':
+        return prev.value in _REGEX_AFTER_WORDS
+    return False
+
+
+def _number(text):
+    text = text.replace('_', '').rstrip('n')
+    if text[:2].lower() == '0x':
+        return int(text, 16)
+    if text[:2].lower() == '0b':
+        return int(text, 2)
+    if text[:2].lower() == '0o':
+        return int(text, 8)
+    value = float(text)
+    return int(value) if value.is_integer() and 'e' not in text.lower() and '.' not in text else value
+
+
+_BINARY_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2, '%': 2}
+_TERMINATORS = (',', '}', ']', ')', ';')
+
+
+class _Parser:
+    def __init__(self, text, tokens, scope):
+        self.text = text
+        self.tokens = tokens
+        self.scope = scope
+        self.i = 0
+
+    def peek(self, offset=0):
+        j = self.i + offset
+        return self.tokens[j] if j < len(self.tokens) else None
+
+    def next(self):
+        tok = self.tokens[self.i]
+        self.i += 1
+        return tok
+
+    def expect(self, value):
+        tok = self.peek()
+        if tok is None or not tok.is_punct(value):
+            where = f"line {line_of(self.text, tok.start)}" if tok else "end of input"
+            raise JsSyntaxError(f"expected '{value}' at {where}")
+        self.i += 1
+
+    def at_terminator(self):
+        tok = self.peek()
+        return tok is None or tok.is_punct(*_TERMINATORS)
+
+    def skip_expression(self):
+        """Advance past one expression; returns its source as a JsExpr"""
+        start_tok = self.peek()
+        depth = 0
+        last = None
+        while self.i < len(self.tokens):
+            tok = self.tokens[self.i]
+            if tok.kind == 'punct':
+                if tok.value in ('{', '(', '['):
+                    depth += 1
+                elif tok.value in ('}', ')', ']'):
+                    if depth == 0:
+                        break
+                    depth -= 1
+                elif depth == 0 and tok.value in (',', ';'):
+                    break
+            last = tok
+            self.i += 1
+        if last is None:
+            return JsExpr('')
+        return JsExpr(self.text[start_tok.start:last.end])
+
+    def value(self):
+        """Parse one value; falls back to JsExpr for non-literal expressions"""
+        start = self.i
+        try:
+            result = self._binary(0)
+        except JsSyntaxError:
+            return self._fallback(start)
+        if not self.at_terminator():
+            return self._fallback(start)
+        return result
+
+    def _fallback(self, start):
+        self.i = start
+        return self.skip_expression()
+
+    def _binary(self, min_prec):
+        left = self._unary()
+        while True:
+            tok = self.peek()
+            if tok is None or tok.kind != 'punct' or tok.value not in _BINARY_PRECEDENCE:
+                return left
+            prec = _BINARY_PRECEDENCE[tok.value]
+            if prec < min_prec:
+                return left
+            self.i += 1
+            right = self._binary(prec + 1)
+            left = _apply(tok.value, left, right)
+
+    def _unary(self):
+        tok = self.peek()
+        if tok is not None and tok.is_punct('-', '+'):
+            self.i += 1
+            operand = self._unary()
+            if not isinstance(operand, (int, float)) or isinstance(operand, bool):
+                raise JsSyntaxError("unary operator on non-number")
+            return -operand if tok.value == '-' else operand
+        return self._primary()
+
+    def _primary(self):
+        tok = self.peek()
+        if tok is None:
+            raise JsSyntaxError("unexpected end of input")
+        if tok.is_punct('{'):
+            return self._object()
+        if tok.is_punct('['):
+            return self._array()
+        if tok.is_punct('('):
+            # Parenthesised literal, e.g. (1.3 * 4.8); arrow functions fail and become JsExpr
+            self.i += 1
+            inner = self._binary(0)
+            self.expect(')')
+            if self.peek() is not None and self.peek().is_punct('=>'):
+                raise JsSyntaxError("arrow function")
+            return inner
+        self.i += 1
+        if tok.kind == 'str':
+            return tok.value
+        if tok.kind == 'template':
+            if tok.value is None:
+                raise JsSyntaxError("template with substitutions")
+            return tok.value
+        if tok.kind == 'num':
+            return _number(tok.value)
+        if tok.kind == 'name':
+            if tok.value == 'true':
+                return True
+            if tok.value == 'false':
+                return False
+            if tok.value in ('null', 'undefined'):
+                return None
+            nxt = self.peek()
+            if nxt is not None and (nxt.is_punct('.', '(', '[', '?.', '=>') or nxt.kind == 'template'):
+                raise JsSyntaxError("member access or call")
+            if tok.value in self.scope:
+                return self.scope[tok.value]
+            return JsExpr(tok.value)
+        raise JsSyntaxError(f"unexpected token {tok.value!r}")
+
+    def _object(self):
+        self.expect('{')
+        obj = {}
+        while True:
+            tok = self.peek()
+            if tok is None:
+                raise JsSyntaxError("unterminated object")
+            if tok.is_punct('}'):
+                self.i += 1
+                return obj
+            if tok.is_punct('...'):
+                self.i += 1
+                spread = self.value()
+                if isinstance(spread, dict):
+                    obj.update(spread)
+                elif not isinstance(spread, JsExpr) and spread is not None:
+                    raise JsSyntaxError("spread of non-object")
+            else:
+                if tok.kind in ('name', 'str'):
+                    key = tok.value
+                    self.i += 1
+                elif tok.kind == 'num':
+                    key = str(_number(tok.value))
+                    self.i += 1
+                elif tok.is_punct('['):
+                    self.i += 1
+                    key_value = self.value()
+                    self.expect(']')
+                    key = key_value if isinstance(key_value, str) else JsExpr(
+                        getattr(key_value, 'source', str(key_value)))
+                else:
+                    raise JsSyntaxError(f"unexpected {tok.value!r} in object on line {line_of(self.text, tok.start)}")
+                nxt = self.peek()
+                if nxt is not None and nxt.is_punct(':'):
+                    self.i += 1
+                    obj[key] = self.value()
+                elif nxt is not None and nxt.is_punct('('):
+                    # Method shorthand: key(...) { ... }
+                    start = nxt.start
+                    self._skip_balanced('(')
+                    body_end = self._skip_balanced('{')
+                    obj[key] = JsExpr(self.text[start:body_end])
+                else:
+                    obj[key] = self.scope.get(key, JsExpr(key)) if isinstance(key, str) else key
+            tok = self.peek()
+            if tok is not None and tok.is_punct(','):
+                self.i += 1
+
+    def _array(self):
+        self.expect('[')
+        arr = []
+        while True:
+            tok = self.peek()
+            if tok is None:
+                raise JsSyntaxError("unterminated array")
+            if tok.is_punct(']'):
+                self.i += 1
+                return arr
+            if tok.is_punct(','):
+                arr.append(None)  # hole
+                self.i += 1
+                continue
+            if tok.is_punct('...'):
+                self.i += 1
+                spread = self.value()
+                if isinstance(spread, list):
+                    arr.extend(spread)
+                else:
+                    arr.append(spread)
+            else:
+                arr.append(self.value())
+            tok = self.peek()
+            if tok is not None and tok.is_punct(','):
+                self.i += 1
+
+    def _skip_balanced(self, opener):
+        closer = {'(': ')', '{': '}', '[': ']'}[opener]
+        self.expect(opener)
+        depth = 1
+        while depth:
+            tok = self.next()
+            if tok.is_punct(opener):
+                depth += 1
+            elif tok.is_punct(closer):
+                depth -= 1
+        return tok.end
+
+
+def _apply(op, left, right):
+    numeric = (int, float)
+    if isinstance(left, bool) or isinstance(right, bool):
+        raise JsSyntaxError("arithmetic on booleans")
+    if op == '+' and isinstance(left, str) and isinstance(right, str):
+        return left + right
+    if not isinstance(left, numeric) or not isinstance(right, numeric):
+        raise JsSyntaxError("arithmetic on non-numbers")
+    if op == '+':
+        return left + right
+    if op == '-':
+        return left - right
+    if op == '*':
+        return left * right
+    if op == '/':
+        return left / right
+    return left % right
+
+
+def parse_value(text, scope=None):
+    """Evaluate a single JS literal expression"""
+    tokens, _ = tokenize(text)
+    return _Parser(text, tokens, scope or {}).value()
+
+
+def parse_module(text, scope=None, with_positions=False):
+    """
+    Evaluate the top-level const/let/var declarations of a module
+
+    Args:
+        text: Module source
+        scope: Extra names available to the declarations (e.g. imported consts)
+        with_positions: Also return name -> (start offset, end offset)
+
+    Returns:
+        Dict of name -> value (JsExpr where the value is not a literal), plus
+        the positions dict when with_positions is set
+    """
+    tokens, _ = tokenize(text)
+    scope = dict(scope or {})
+    consts = {}
+    positions = {}
+    parser = _Parser(text, tokens, scope)
+    depth = 0
+    while parser.i < len(tokens):
+        tok = tokens[parser.i]
+        if tok.kind == 'punct':
+            if tok.value in ('{', '(', '['):
+                depth += 1
+            elif tok.value in ('}', ')', ']'):
+                depth -= 1
+            parser.i += 1
+            continue
+        if (depth == 0 and tok.kind == 'name' and tok.value in ('const', 'let', 'var')
+                and parser.peek(1) is not None and parser.peek(1).kind == 'name'
+                and parser.peek(2) is not None and parser.peek(2).is_punct('=')):
+            name = parser.peek(1).value
+            parser.i += 3
+            start = parser.peek().start if parser.peek() else tok.end
+            value = parser.value()
+            consts[name] = value
+            scope[name] = value
+            positions[name] = (start, tokens[parser.i - 1].end)
+            continue
+        parser.i += 1
+    if with_positions:
+        return consts, positions
+    return consts
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Music Pipeline - Low-bitrate variants, loudness gains and intros for tracks.json
+Takes a local mirror of the files listed in tracks.json and, in parallel via
+the local ffmpeg, writes for every track:
+  - the low-bitrate variants in VARIANTS (Opus in Ogg, AAC-LC in MP4 with the
+    moov atom up front so playback can start before the download finishes)
+  - a short intro segment per variant for fast start
+  - an EBU R128 measurement (integrated loudness / true peak) and the gain in
+    dB that brings the track to --target-lufs. The gain is recorded, not baked in.
+
+The enriched manifest (tracks.manifest.json in the output directory) keeps the
+tracks.json shape ({name, url} per entry), so MusicPlayer can load it as-is,
+and adds duration, source hash, loudness, and bytes per variant and intro. With
+--base-url, `url` points at --default-variant on that host and the original
+URL moves to `sourceUrl`.
+
+Tracks whose source hash and encoding settings match the existing manifest,
+and whose outputs are all present, are skipped.
+
+Usage:
+    python music_pipeline.py --mirror D:/civ-game-music/music
+    python music_pipeline.py --mirror ./music --variants opus-48k --intro-seconds 15 -j 8
+    python music_pipeline.py --mirror ./music --base-url https://cdn.example.com/music/
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import unquote
+
+from asset_paths import CACHE_DIR, TRACKS_FILE
+
+DEFAULT_TRACKS_FILE = TRACKS_FILE
+DEFAULT_OUTPUT_DIR = CACHE_DIR / 'music'
+MANIFEST_NAME = 'tracks.manifest.json'
+
+# Bump when the ffmpeg arguments change so every track is re-encoded
+PIPELINE_VERSION = 1
+
+VARIANTS = {
+    'opus-48k': {
+        'ext': '.opus',
+        'mime': 'audio/ogg; codecs=opus',
+        'args': ['-c:a', 'libopus', '-b:a', '48k', '-vbr', 'on', '-application', 'audio'],
+    },
+    'opus-32k': {
+        'ext': '.opus',
+        'mime': 'audio/ogg; codecs=opus',
+        'args': ['-c:a', 'libopus', '-b:a', '32k', '-vbr', 'on', '-application', 'audio'],
+    },
+    'aac-64k': {
+        'ext': '.m4a',
+        'mime': 'audio/mp4; codecs="mp4a.40.2"',
+        'args': ['-c:a', 'aac', '-b:a', '64k', '-movflags', '+faststart'],
+    },
+}
+DEFAULT_VARIANTS = ('opus-48k', 'aac-64k')
+
+AUDIO_EXTENSIONS = ('.m4a', '.mp3', '.ogg', '.opus', '.flac', '.wav', '.aac')
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def track_id(name):
+    """Stable ASCII id for output paths (track names are not filename-safe everywhere)"""
+    return hashlib.sha1(name.encode('utf-8')).hexdigest()[:12]
+
+
+def load_tracks(path):
+    try:
+        tracks = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[ERROR] Cannot read {path}: {e}")
+        sys.exit(1)
+    if not isinstance(tracks, list):
+        print(f"[ERROR] {path}: expected a JSON list of {{name, url}}")
+        sys.exit(1)
+    return [t for t in tracks if isinstance(t, dict) and isinstance(t.get('url'), str)]
+
+
+def index_mirror(mirror_dir):
+    """basename -> path for every audio file under the mirror"""
+    index = {}
+    for path in Path(mirror_dir).rglob('*'):
+        if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS:
+            index.setdefault(path.name, path)
+    return index
+
+
+def source_filename(url):
+    return unquote(url.rsplit('/', 1)[-1])
+
+
+def _run(cmd):
+    return subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
+
+
+def analyze(ffmpeg, path, target_lufs, true_peak):
+    """
+    One decode pass: duration plus the first loudnorm pass (integrated loudness,
+    true peak) and the gain that brings the track to the target
+    """
+    proc = _run([ffmpeg, '-hide_banner', '-nostats', '-i', str(path), '-vn',
+                 '-af', f'loudnorm=I={target_lufs}:TP={true_peak}:LRA=11:print_format=json',
+                 '-f', 'null', '-'])
+    match = re.search(r'\{[^{}]*"input_i"[^{}]*\}', proc.stderr)
+    duration = re.search(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)', proc.stderr)
+    if proc.returncode != 0 or not match or not duration:
+        raise RuntimeError(f"analysis failed: {proc.stderr.strip()[-200:]}")
+    stats = json.loads(match.group(0))
+    input_i = float(stats['input_i'])
+    input_tp = float(stats['input_tp'])
+    h, m, sec = duration.groups()
+    # Never boost past the true-peak ceiling
+    gain = min(target_lufs - input_i, true_peak - input_tp)
+    return round(int(h) * 3600 + int(m) * 60 + float(sec), 3), {
+        'integratedLufs': round(input_i, 2),
+        'truePeakDb': round(input_tp, 2),
+        'gainDb': round(gain, 2),
+    }
+
+
+def encode(ffmpeg, src, dest, variant, intro_seconds=None):
+    """Encode src to dest atomically; returns the output size in bytes"""
+    tmp = dest.with_name(dest.stem + '.tmp' + dest.suffix)
+    cmd = [ffmpeg, '-hide_banner', '-v', 'error', '-y', '-i', str(src), '-vn', '-map_metadata', '-1',
+           '-ac', '2']
+    if intro_seconds:
+        cmd += ['-t', str(intro_seconds)]
+    cmd += VARIANTS[variant]['args'] + [str(tmp)]
+    proc = _run(cmd)
+    if proc.returncode != 0:
+        tmp.unlink(missing_ok=True)
+        raise RuntimeError(f"{variant} encode failed: {proc.stderr.strip()[-200:]}")
+    tmp.replace(dest)
+    return dest.stat().st_size
+
+
+def outputs_present(entry, output_dir):
+    files = [v['file'] for v in entry.get('variants', {}).values()]
+    files += [v['file'] for v in entry.get('intro', {}).values()]
+    return bool(files) and all((output_dir / f).exists() for f in files)
+
+
+def process_track(track, source, output_dir, settings, ffmpeg):
+    """Encode one track; returns its manifest entry (without url rewriting)"""
+    tid = track_id(track['name'])
+    track_dir = output_dir / tid
+    track_dir.mkdir(parents=True, exist_ok=True)
+    duration, loudness = analyze(ffmpeg, source, settings['target_lufs'], settings['true_peak'])
+
+    entry = {
+        'id': tid,
+        'sourceFile': source.name,
+        'sourceBytes': source.stat().st_size,
+        'sourceHash': sha256_file(source),
+        'settings': settings['signature'],
+        'durationSec': duration,
+        'loudness': loudness,
+        'variants': {},
+        'intro': {},
+    }
+    for variant in settings['variants']:
+        spec = VARIANTS[variant]
+        rel = f"{tid}/{variant}{spec['ext']}"
+        entry['variants'][variant] = {
+            'file': rel,
+            'mime': spec['mime'],
+            'bytes': encode(ffmpeg, source, output_dir / rel, variant),
+        }
+        if settings['intro_seconds']:
+            intro_rel = f"{tid}/{variant}.intro{spec['ext']}"
+            entry['intro'][variant] = {
+                'file': intro_rel,
+                'mime': spec['mime'],
+                'seconds': min(settings['intro_seconds'], entry['durationSec']),
+                'bytes': encode(ffmpeg, source, output_dir / intro_rel, variant, settings['intro_seconds']),
+            }
+    return entry
+
+
+def fmt_size(n):
+    if n >= 1024 * 1024 * 1024:
+        return f"{n / 1024 ** 3:.2f} GB"
+    if n >= 1024 * 1024:
+        return f"{n / 1024 / 1024:.1f} MB"
+    return f"{n / 1024:.1f} KB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Encode low-bitrate music variants and an enriched tracks manifest')
+    parser.add_argument('--mirror', required=True, help='Directory holding local copies of the tracks.json files')
+    parser.add_argument('--tracks', default=str(DEFAULT_TRACKS_FILE), help=f'tracks.json (default: {DEFAULT_TRACKS_FILE})')
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT_DIR), help=f'Output directory (default: {DEFAULT_OUTPUT_DIR})')
+    parser.add_argument('--variants', default=','.join(DEFAULT_VARIANTS),
+                        help=f"Comma-separated variants from: {', '.join(VARIANTS)} (default: {','.join(DEFAULT_VARIANTS)})")
+    parser.add_argument('--intro-seconds', type=float, default=20.0,
+                        help='Length of the fast-start intro segments, 0 to skip (default: 20)')
+    parser.add_argument('--target-lufs', type=float, default=-16.0, help='Loudness target for gainDb (default: -16)')
+    parser.add_argument('--true-peak', type=float, default=-1.5, help='True-peak ceiling in dBTP (default: -1.5)')
+    parser.add_argument('--base-url', help='Public URL of the output directory; rewrites `url` to --default-variant')
+    parser.add_argument('--default-variant', default='aac-64k',
+                        help='Variant `url` points at with --base-url; AAC plays everywhere (default: aac-64k)')
+    parser.add_argument('--only', help='Only process tracks whose name contains this text')
+    parser.add_argument('--force', action='store_true', help='Re-encode even unchanged tracks')
+    parser.add_argument('--jobs', '-j', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='Parallel ffmpeg processes (default: half the CPUs)')
+    parser.add_argument('--ffmpeg', default='ffmpeg', help='ffmpeg executable (default: ffmpeg)')
+    args = parser.parse_args()
+
+    ffmpeg = shutil.which(args.ffmpeg)
+    if not ffmpeg:
+        print("[ERROR] ffmpeg not found. Install ffmpeg or pass --ffmpeg")
+        sys.exit(1)
+
+    variants = [v.strip() for v in args.variants.split(',') if v.strip()]
+    unknown = [v for v in variants if v not in VARIANTS]
+    if unknown or not variants:
+        print(f"[ERROR] Unknown variants: {', '.join(unknown) or '(none given)'}; choose from {', '.join(VARIANTS)}")
+        sys.exit(1)
+    if args.base_url and args.default_variant not in variants:
+        print(f"[ERROR] --default-variant {args.default_variant} is not in --variants")
+        sys.exit(1)
+
+    settings = {
+        'variants': variants,
+        'intro_seconds': args.intro_seconds,
+        'target_lufs': args.target_lufs,
+        'true_peak': args.true_peak,
+    }
+    settings['signature'] = f"v{PIPELINE_VERSION}:" + json.dumps(settings, sort_keys=True)
+
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST_NAME
+    previous = {}
+    if manifest_path.exists():
+        try:
+            previous = {e['name']: e for e in json.loads(manifest_path.read_text(encoding='utf-8'))
+                        if e.get('variants')}
+        except (json.JSONDecodeError, KeyError, TypeError):
+            print(f"[WARN] Ignoring unreadable {manifest_path}")
+
+    tracks = load_tracks(args.tracks)
+    if args.only:
+        tracks = [t for t in tracks if args.only in t.get('name', '')]
+    mirror = index_mirror(args.mirror)
+
+    entries = {}
+    jobs = []
+    missing = []
+    skipped = 0
+    for track in tracks:
+        name = track.get('name') or source_filename(track['url'])
+        track = {'name': name, 'url': track['url']}
+        source = mirror.get(source_filename(track['url']))
+        old = previous.get(name)
+        if source is None:
+            missing.append(name)
+            if old:
+                entries[name] = old
+            continue
+        if old and not args.force and old.get('settings') == settings['signature'] \
+                and old.get('sourceBytes') == source.stat().st_size \
+                and old.get('sourceHash') == sha256_file(source) and outputs_present(old, output_dir):
+            entries[name] = old
+            skipped += 1
+            continue
+        jobs.append((track, source))
+
+    print(f"[INFO] {len(tracks)} tracks: {len(jobs)} to encode, {skipped} unchanged, {len(missing)} not in the mirror")
+    failed = 0
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(process_track, track, source, output_dir, settings, ffmpeg): track
+                   for track, source in jobs}
+        for i, future in enumerate(as_completed(futures), 1):
+            track = futures[future]
+            try:
+                entry = future.result()
+            except (RuntimeError, ValueError, OSError) as e:
+                failed += 1
+                print(f"[ERROR] [{i}/{len(jobs)}] {track['name']}: {e}")
+                continue
+            entries[track['name']] = {'name': track['name'], 'sourceUrl': track['url'], **entry}
+            sizes = ' '.join(f"{v}={fmt_size(info['bytes'])}" for v, info in entry['variants'].items())
+            print(f"[OK] [{i}/{len(jobs)}] {track['name']}: {fmt_size(entry['sourceBytes'])} -> {sizes}, "
+                  f"gain {entry['loudness']['gainDb']:+.1f} dB")
+
+    # Keep tracks.json order; entries stay loadable by MusicPlayer ({name, url})
+    manifest = []
+    for track in tracks:
+        name = track.get('name') or source_filename(track['url'])
+        entry = entries.get(name)
+        if entry is None:
+            manifest.append({'name': name, 'url': track['url']})
+            continue
+        entry = {k: v for k, v in entry.items() if k != 'url'}
+        entry['sourceUrl'] = track['url']
+        if args.base_url and args.default_variant in entry.get('variants', {}):
+            url = args.base_url.rstrip('/') + '/' + entry['variants'][args.default_variant]['file']
+        else:
+            url = track['url']
+        manifest.append({'name': name, 'url': url, **entry})
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding='utf-8')
+
+    encoded = [e for e in manifest if e.get('variants')]
+    source_total = sum(e['sourceBytes'] for e in encoded)
+    print()
+    print("=" * 70)
+    print(f"Manifest: {manifest_path} ({len(encoded)}/{len(manifest)} tracks encoded)")
+    print(f"Sources: {fmt_size(source_total)}")
+    for variant in variants:
+        total = sum(e['variants'][variant]['bytes'] for e in encoded if variant in e['variants'])
+        intro = sum(e['intro'][variant]['bytes'] for e in encoded if variant in e.get('intro', {}))
+        ratio = f" ({total / source_total:.0%} of source)" if source_total else ''
+        print(f"  {variant:<10} {fmt_size(total):>10}{ratio}, intros {fmt_size(intro)}")
+    print("=" * 70)
+    if missing:
+        print(f"[WARN] {len(missing)} tracks not found in {args.mirror}, e.g. {missing[0]}")
+    if failed:
+        print(f"[RESULT] {failed} tracks failed")
+        sys.exit(1)
+    print("[RESULT] Done")
+
+
+if __name__ == '__main__':
+    main()
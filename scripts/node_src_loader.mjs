@@ -0,0 +1,31 @@
+// Lets plain Node import modules from src/ the way Vite does
+//
+// Vite resolves extensionless relative imports ('../logic/simulation'); Node's
+// ESM loader does not. Importing this module first registers a resolve hook
+// that retries such specifiers with .js, .jsx and /index.js appended.
+//
+// Usage:
+//   node --import ./scripts/node_src_loader.mjs my_script.mjs
+//   import './node_src_loader.mjs';   // before any dynamic import of src/
+
+import { register } from 'module';
+
+const RESOLVE_HOOKS = `
+export async function resolve(specifier, context, next) {
+    try {
+        return await next(specifier, context);
+    } catch (error) {
+        if (!specifier.startsWith('.') && !specifier.startsWith('/')) throw error;
+        for (const suffix of ['.js', '.jsx', '/index.js']) {
+            try {
+                return await next(specifier + suffix, context);
+            } catch {
+                // try the next suffix
+            }
+        }
+        throw error;
+    }
+}
+`;
+
+register('data:text/javascript,' + encodeURIComponent(RESOLVE_HOOKS), import.meta.url);
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Android Resource Optimizer - Right-size and re-encode the rasters in android/.../res
+Inventories every PNG/WebP/JPEG under the res tree and, per file:
+  1. Resizes it to its exact density target if it is larger (launcher icons
+     from their dp size, splashes from the Capacitor splash sizes, anything
+     else from its mdpi variant times the density scale)
+  2. Re-encodes it as the smallest of optimized PNG, lossless WebP or, with
+     --near-lossless and cwebp on PATH, near-lossless WebP. Lossless output is
+     pixel-verified against the source (fully transparent pixels excepted);
+     near-lossless output must keep --min-psnr. Nine-patches (.9.png) and
+     lossy sources are never converted.
+Identical files are grouped across densities. A name whose every raster
+variant is byte-identical to another name's (ic_launcher_round vs
+ic_launcher) can be replaced by a resource alias with --alias-duplicates.
+Duplicates of a different name in other density folders are only reported:
+deleting one changes which folder Android resolves for that device.
+
+Files already produced or accepted by a previous run (same content hash and
+settings) are skipped. The reported APK delta is the change in raster bytes,
+since aapt2 stores PNG/WebP uncompressed; release builds also crunch PNGs, so
+the PNG share of the saving is an upper bound.
+
+Usage:
+    python optimize_android_res.py --dry-run          # inventory and plan only
+    python optimize_android_res.py
+    python optimize_android_res.py --near-lossless 60 --alias-duplicates
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageChops, ImageOps, ImageStat
+except ImportError:
+    print("[ERROR] Pillow not installed. Run: pip install Pillow")
+    sys.exit(1)
+
+from asset_paths import ANDROID_RES_DIR, CACHE_DIR
+
+DEFAULT_RES_DIR = ANDROID_RES_DIR
+# The manifest and layouts that reference rasters live next to res/
+ANDROID_APP_DIR = ANDROID_RES_DIR.parent
+CACHE_FILE = CACHE_DIR / 'android_res.json'
+ALIASES_FILE = 'values/optimized_aliases.xml'
+
+RASTER_EXTENSIONS = ('.png', '.webp', '.jpg', '.jpeg')
+
+# Bump when the encoders or target rules change so cached decisions are redone
+OPTIMIZER_VERSION = 1
+
+DENSITY_SCALE = {
+    'ldpi': 0.75,
+    'mdpi': 1.0,
+    'tvdpi': 1.33,
+    'hdpi': 1.5,
+    'xhdpi': 2.0,
+    'xxhdpi': 3.0,
+    'xxxhdpi': 4.0,
+}
+
+# Launcher icon sizes in dp (legacy icons 48dp, adaptive layers 108dp)
+ICON_DP = {
+    'ic_launcher': 48,
+    'ic_launcher_round': 48,
+    'ic_launcher_foreground': 108,
+    'ic_launcher_background': 108,
+}
+
+# Capacitor's landscape splash sizes; portrait is the transpose and the
+# unqualified drawable/ counts as mdpi
+SPLASH_SIZES = {
+    'ldpi': (320, 240),
+    'mdpi': (480, 320),
+    'hdpi': (800, 480),
+    'xhdpi': (1280, 720),
+    'xxhdpi': (1600, 960),
+    'xxxhdpi': (1920, 1280),
+}
+
+# Savings smaller than this are not worth churning a tracked binary file
+MIN_GAIN_BYTES = 256
+MIN_GAIN_RATIO = 0.02
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_folder(folder):
+    """'drawable-land-xxhdpi' -> ('drawable', qualifiers without density, density or None)"""
+    parts = folder.split('-')
+    density = None
+    others = []
+    for q in parts[1:]:
+        if q in DENSITY_SCALE or q in ('nodpi', 'anydpi'):
+            density = q
+        else:
+            others.append(q)
+    return parts[0], tuple(others), density
+
+
+def resource_name(path):
+    """Resource name of a res file: name before the first dot (keeps '.9' out)"""
+    return path.name.split('.', 1)[0]
+
+
+def collect_rasters(res_dir):
+    entries = []
+    for path in sorted(res_dir.glob('*/*')):
+        if not path.is_file() or path.suffix.lower() not in RASTER_EXTENSIONS:
+            continue
+        res_type, qualifiers, density = parse_folder(path.parent.name)
+        with Image.open(path) as img:
+            size = img.size
+        entries.append({
+            'rel': path.relative_to(res_dir).as_posix(),
+            'type': res_type,
+            'name': resource_name(path),
+            'qualifiers': qualifiers,
+            'density': density,
+            'size': size,
+            'bytes': path.stat().st_size,
+            'nine_patch': path.name.lower().endswith('.9.png'),
+        })
+    return entries
+
+
+def target_size(entry, entries):
+    """Exact pixel size this raster should have, or None if there is no rule"""
+    density = entry['density'] or 'mdpi'
+    if density not in DENSITY_SCALE or entry['nine_patch']:
+        return None
+    scale = DENSITY_SCALE[density]
+    if entry['type'] == 'mipmap' and entry['name'] in ICON_DP:
+        side = round(ICON_DP[entry['name']] * scale)
+        return side, side
+    if entry['type'] == 'drawable' and entry['name'] == 'splash' and density in SPLASH_SIZES:
+        w, h = SPLASH_SIZES[density]
+        return (h, w) if 'port' in entry['qualifiers'] else (w, h)
+    for other in entries:
+        if (other['type'], other['name'], other['qualifiers']) == (entry['type'], entry['name'], entry['qualifiers']) \
+                and other['density'] in ('mdpi', None) and other is not entry:
+            w, h = other['size']
+            return round(w * scale), round(h * scale)
+    return None
+
+
+def is_lossy_webp(data):
+    """True if a WebP holds a VP8 (lossy) bitstream rather than VP8L"""
+    pos = 12
+    while pos + 8 <= len(data):
+        fourcc = data[pos:pos + 4]
+        if fourcc == b'VP8 ':
+            return True
+        if fourcc == b'VP8L':
+            return False
+        length = int.from_bytes(data[pos + 4:pos + 8], 'little')
+        pos += 8 + length + (length & 1)
+    return False
+
+
+def _visible(img):
+    """RGBA image with fully transparent pixels zeroed, for lossless comparison"""
+    rgba = img.convert('RGBA')
+    alpha = rgba.getchannel('A')
+    if alpha.getextrema()[0] > 0:
+        return rgba
+    mask = alpha.point(lambda a: 255 if a else 0)
+    return Image.composite(rgba, Image.new('RGBA', rgba.size, (0, 0, 0, 0)), mask)
+
+
+def pixels_equal(a, b):
+    return ImageChops.difference(_visible(a), _visible(b)).getbbox() is None
+
+
+def psnr(a, b):
+    diff = ImageChops.difference(a.convert('RGBA'), b.convert('RGBA'))
+    mse = sum(v * v for v in ImageStat.Stat(diff).rms) / 4
+    return math.inf if mse == 0 else 10 * math.log10(255 * 255 / mse)
+
+
+def decode_ms(data, repeats=3):
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with Image.open(io.BytesIO(data)) as img:
+            img.load()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _encode(img, fmt, **kwargs):
+    buf = io.BytesIO()
+    img.save(buf, fmt, **kwargs)
+    return buf.getvalue()
+
+
+def _cwebp_near_lossless(img, level, cwebp):
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / 'in.png'
+        out = Path(tmp) / 'out.webp'
+        img.save(src, 'PNG')
+        proc = subprocess.run([cwebp, '-quiet', '-near_lossless', str(level), '-z', '9', str(src), '-o', str(out)],
+                              capture_output=True)
+        return out.read_bytes() if proc.returncode == 0 and out.exists() else None
+
+
+def optimize_raster(path, target, settings):
+    """
+    Plan (and unless dry-run, write) the optimized form of one raster
+
+    Returns a dict with the new relative name and byte counts; 'action' is
+    'keep', 'resize', 'reencode' or 'error'.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    ext = path.suffix.lower()
+    result = {'path': str(path), 'action': 'keep', 'old_bytes': len(data), 'new_bytes': len(data),
+              'new_path': str(path), 'format': ext.lstrip('.'), 'old_size': None, 'new_size': None,
+              'old_decode_ms': decode_ms(data), 'new_decode_ms': None, 'output_hash': sha256_bytes(data)}
+    try:
+        with Image.open(io.BytesIO(data)) as src:
+            src.load()
+            img = src.copy()
+    except Exception as e:
+        result['action'] = 'error'
+        result['reason'] = str(e)
+        return result
+    result['old_size'] = result['new_size'] = img.size
+
+    lossy_source = ext in ('.jpg', '.jpeg') or (ext == '.webp' and is_lossy_webp(data))
+    resized = False
+    if target and (img.width > target[0] or img.height > target[1]):
+        img = ImageOps.fit(img, target, Image.Resampling.LANCZOS)
+        result['new_size'] = img.size
+        resized = True
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA' if 'transparency' in img.info or img.mode in ('LA', 'PA') else 'RGB')
+
+    # (format, extension, bytes, must be pixel-exact against `img`)
+    candidates = []
+    if lossy_source:
+        if resized:
+            if ext == '.webp':
+                candidates.append(('webp', '.webp', _encode(img, 'WEBP', quality=90, method=6), False))
+            else:
+                candidates.append(('jpeg', ext, _encode(img.convert('RGB'), 'JPEG', quality=92, optimize=True), False))
+    else:
+        candidates.append(('png', '.png', _encode(img, 'PNG', optimize=True), True))
+        if not settings['keep_format'] or ext == '.webp':
+            candidates.append(('webp', '.webp', _encode(img, 'WEBP', lossless=True, quality=100, method=6), True))
+        if settings['near_lossless'] is not None and settings['cwebp'] and not settings['keep_format']:
+            near = _cwebp_near_lossless(img, settings['near_lossless'], settings['cwebp'])
+            if near:
+                candidates.append(('webp-near-lossless', '.webp', near, False))
+        if settings['keep_format']:
+            candidates = [c for c in candidates if c[1] == ext]
+    if ext == '.png' and path.name.lower().endswith('.9.png'):
+        candidates = []
+
+    verified = []
+    for fmt, new_ext, out, exact in candidates:
+        with Image.open(io.BytesIO(out)) as decoded:
+            decoded.load()
+            ok = pixels_equal(img, decoded) if exact else (lossy_source or psnr(img, decoded) >= settings['min_psnr'])
+        if ok:
+            verified.append((len(out), fmt, new_ext, out))
+    if not verified:
+        return result
+    new_len, fmt, new_ext, out = min(verified, key=lambda c: c[0])
+    gain = len(data) - new_len
+    if not resized and (gain < MIN_GAIN_BYTES or gain < len(data) * MIN_GAIN_RATIO):
+        return result
+
+    new_path = path.with_name(resource_name(path) + new_ext)
+    result.update({
+        'action': 'resize' if resized else 'reencode',
+        'new_bytes': new_len,
+        'new_path': str(new_path),
+        'format': fmt,
+        'new_decode_ms': decode_ms(out),
+        'output_hash': sha256_bytes(out),
+    })
+    if not settings['dry_run']:
+        new_path.write_bytes(out)
+        if new_path != path:
+            path.unlink()
+    return result
+
+
+def find_duplicates(res_dir):
+    """sha -> [relative paths] for raster contents stored more than once"""
+    groups = {}
+    for path in sorted(res_dir.glob('*/*')):
+        if path.is_file() and path.suffix.lower() in RASTER_EXTENSIONS:
+            groups.setdefault(sha256_bytes(path.read_bytes()), []).append(path.relative_to(res_dir).as_posix())
+    return {sha: paths for sha, paths in groups.items() if len(paths) > 1}
+
+
+def alias_candidates(res_dir):
+    """
+    (res_type, alias, target) pairs where every raster variant of `alias` is
+    byte-identical to `target`'s in the same folder, and vice versa
+    """
+    variants = {}
+    for path in sorted(res_dir.glob('*/*')):
+        if path.is_file() and path.suffix.lower() in RASTER_EXTENSIONS:
+            res_type = parse_folder(path.parent.name)[0]
+            key = (res_type, resource_name(path))
+            variants.setdefault(key, {})[path.parent.name] = sha256_bytes(path.read_bytes())
+    pairs = []
+    taken = set()
+    for (res_type, name), folders in sorted(variants.items()):
+        if (res_type, name) in taken:
+            continue
+        for (other_type, other), other_folders in sorted(variants.items()):
+            if other_type == res_type and other != name and (res_type, other) not in taken \
+                    and other_folders == folders:
+                # Keep the shorter (usually the primary) name as the real resource
+                alias, target = sorted((name, other), key=lambda n: (len(n), n), reverse=True)
+                pairs.append((res_type, alias, target))
+                taken.update({(res_type, alias), (res_type, target)})
+                break
+    return pairs
+
+
+def write_aliases(res_dir, pairs, dry_run):
+    """Replace each alias's rasters with <item type=...> in values/optimized_aliases.xml; returns removed paths"""
+    aliases_path = res_dir / ALIASES_FILE
+    existing = aliases_path.read_text(encoding='utf-8') if aliases_path.exists() else ''
+    items = re.findall(r'^\s*<item .*?</item>$', existing, re.M)
+    removed = []
+    for res_type, alias, target in pairs:
+        for path in sorted(res_dir.glob(f'{res_type}*/{alias}.*')):
+            if path.suffix.lower() in RASTER_EXTENSIONS:
+                removed.append(path.relative_to(res_dir).as_posix())
+                if not dry_run:
+                    path.unlink()
+        items.append(f'    <item name="{alias}" type="{res_type}">@{res_type}/{target}</item>')
+    if not dry_run:
+        aliases_path.parent.mkdir(exist_ok=True)
+        body = '\n'.join(line if line.startswith('    ') else '    ' + line.strip() for line in items)
+        aliases_path.write_text(
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<!-- Generated by scripts/optimize_android_res.py: these names had rasters identical to their target -->\n'
+            f'<resources>\n{body}\n</resources>\n', encoding='utf-8')
+    return removed
+
+
+def unreferenced_rasters(entries, app_dir):
+    """Raster resource names not mentioned by any XML or source file under app_dir"""
+    names = {(e['type'], e['name']) for e in entries}
+    text = []
+    for path in app_dir.rglob('*'):
+        if path.is_file() and path.suffix in ('.xml', '.java', '.kt', '.json'):
+            text.append(path.read_text(encoding='utf-8', errors='replace'))
+    corpus = '\n'.join(text)
+    return sorted((t, n) for t, n in names
+                  if not re.search(rf'(@{t}/|R\.{t}\.){n}\b|"{n}"', corpus))
+
+
+def settings_signature(settings):
+    keys = ('near_lossless', 'min_psnr', 'keep_format')
+    return f"v{OPTIMIZER_VERSION}:" + json.dumps({k: settings[k] for k in keys}, sort_keys=True)
+
+
+def load_cache(signature):
+    if CACHE_FILE.exists():
+        try:
+            cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+            if cache.get('settings') == signature:
+                return set(cache.get('optimized', []))
+        except (OSError, json.JSONDecodeError):
+            pass
+    return set()
+
+
+def save_cache(signature, optimized):
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps({'settings': signature, 'optimized': sorted(optimized)}, indent=1),
+                          encoding='utf-8')
+
+
+def fmt_size(n):
+    sign = '-' if n < 0 else ''
+    n = abs(n)
+    if n >= 1024 * 1024:
+        return f"{sign}{n / 1024 / 1024:.2f} MB"
+    if n >= 1024:
+        return f"{sign}{n / 1024:.1f} KB"
+    return f"{sign}{n} B"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Right-size and re-encode the Android res rasters')
+    parser.add_argument('--res', default=str(DEFAULT_RES_DIR), help=f'Android res directory (default: {DEFAULT_RES_DIR})')
+    parser.add_argument('--dry-run', action='store_true', help='Plan and report only; change no files')
+    parser.add_argument('--keep-format', action='store_true', help='Never switch PNG to WebP, only resize/recompress')
+    parser.add_argument('--near-lossless', type=int, metavar='0-100',
+                        help='Also try cwebp -near_lossless at this level (lower = smaller; needs cwebp)')
+    parser.add_argument('--min-psnr', type=float, default=45.0,
+                        help='Minimum PSNR in dB for near-lossless output (default: 45)')
+    parser.add_argument('--alias-duplicates', action='store_true',
+                        help='Replace names whose rasters all duplicate another name with resource aliases')
+    parser.add_argument('--force', action='store_true', help='Ignore the content-hash cache')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    res_dir = Path(args.res)
+    if not res_dir.is_dir():
+        print(f"[ERROR] {res_dir} not found")
+        sys.exit(1)
+
+    cwebp = shutil.which('cwebp')
+    if args.near_lossless is not None and not cwebp:
+        print("[WARN] cwebp not on PATH; near-lossless WebP disabled, using lossless only")
+    settings = {
+        'dry_run': args.dry_run,
+        'keep_format': args.keep_format,
+        'near_lossless': args.near_lossless,
+        'min_psnr': args.min_psnr,
+        'cwebp': cwebp,
+    }
+    signature = settings_signature(settings)
+    done = set() if args.force else load_cache(signature)
+
+    entries = collect_rasters(res_dir)
+    if not entries:
+        print(f"[INFO] No rasters in {res_dir}")
+        sys.exit(0)
+    before_total = sum(e['bytes'] for e in entries)
+
+    jobs = []
+    skipped = 0
+    for entry in entries:
+        path = res_dir / entry['rel']
+        if sha256_bytes(path.read_bytes()) in done:
+            skipped += 1
+            continue
+        jobs.append((path, target_size(entry, entries)))
+
+    print(f"[INFO] {len(entries)} rasters ({fmt_size(before_total)}) in {res_dir}; "
+          f"{skipped} unchanged since the last run, {len(jobs)} to check")
+    results = []
+    if jobs:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(optimize_raster, [j[0] for j in jobs], [j[1] for j in jobs],
+                                    [settings] * len(jobs)))
+
+    print()
+    print("=" * 78)
+    print(f"{'file':<40} {'size':>11} {'before':>9} {'after':>9} {'decode ms':>8}")
+    print("-" * 78)
+    for r in results:
+        rel = Path(r['path']).relative_to(res_dir).as_posix()
+        if r['action'] == 'error':
+            print(f"[ERROR] {rel}: {r['reason']}")
+            continue
+        if r['action'] == 'keep':
+            continue
+        new_rel = Path(r['new_path']).name
+        size = f"{r['new_size'][0]}x{r['new_size'][1]}"
+        decode = f"{r['old_decode_ms']:.1f}>{r['new_decode_ms']:.1f}"
+        print(f"{rel:<40} {size:>11} {fmt_size(r['old_bytes']):>9} {fmt_size(r['new_bytes']):>9} {decode:>8}")
+        if r['action'] == 'resize':
+            print(f"    resized from {r['old_size'][0]}x{r['old_size'][1]}, saved as {new_rel} ({r['format']})")
+        elif new_rel != Path(r['path']).name:
+            print(f"    -> {new_rel} ({r['format']})")
+    changed = [r for r in results if r['action'] in ('resize', 'reencode')]
+    if not changed:
+        print("  (nothing to change)")
+    print("=" * 78)
+
+    # Projected raster bytes per (original) relative path after this run
+    projected = {e['rel']: e['bytes'] for e in entries}
+    for r in changed:
+        projected[Path(r['path']).relative_to(res_dir).as_posix()] = r['new_bytes']
+
+    alias_saved = 0
+    if args.alias_duplicates:
+        pairs = alias_candidates(res_dir)
+        for res_type, alias, target in pairs:
+            print(f"[INFO] @{res_type}/{alias} -> alias of @{res_type}/{target}")
+        renamed = {Path(r['new_path']).relative_to(res_dir).as_posix(): Path(r['path']).relative_to(res_dir).as_posix()
+                   for r in changed}
+        for rel in write_aliases(res_dir, pairs, args.dry_run) if pairs else []:
+            alias_saved += projected.pop(renamed.get(rel, rel), 0)
+    # Also part of the --dry-run inventory: these are the files as they are on disk
+    duplicates = find_duplicates(res_dir)
+    if duplicates:
+        print(f"[INFO] {len(duplicates)} groups of identical rasters (kept: Android resolves each folder separately):")
+        for paths in duplicates.values():
+            print(f"  - {', '.join(paths)}")
+
+    for res_type, name in unreferenced_rasters(collect_rasters(res_dir), ANDROID_APP_DIR):
+        print(f"[WARN] @{res_type}/{name} is not referenced from the app sources (loaded by name, or unused?)")
+
+    if not args.dry_run:
+        done.update(r['output_hash'] for r in results if r['action'] != 'error')
+        save_cache(signature, done)
+
+    after_total = sum(projected.values())
+    delta = after_total - before_total
+    print()
+    verb = 'would change' if args.dry_run else 'changed'
+    print(f"[RESULT] {len(changed)} rasters {verb}; APK raster delta: {'+' if delta > 0 else ''}{fmt_size(delta)} "
+          f"({fmt_size(before_total)} -> {fmt_size(after_total)})")
+    if args.alias_duplicates and alias_saved:
+        print(f"         of which {fmt_size(alias_saved)} from resource aliases")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Decoded-Pixel Cache - Share decoded RGBA pixels between chained image stages
+Image stages (remove_bg.py -> compress_to_webp.py -> encode_tournament.py)
+each used to decode the same compressed file again. This cache stores the
+decoded RGBA array of a file as an uncompressed .npy under
+.asset-cache/pixels/, keyed by the sha256 of the file's bytes, and hands it
+back as a read-only memory map: later stages, worker processes and later runs
+get a zero-copy view instead of decoding.
+
+Stages that write a lossless file (PNG) also store the pixels they just wrote
+under the new file's hash, so the next stage in the chain hits the cache.
+
+The cache is bounded by size: every file read counts as a use (its mtime is
+bumped), and the least recently used entries are deleted once the total size
+exceeds the limit. Settings are passed to worker processes via environment
+variables, so one flag on the parent covers the whole pool:
+
+    CIV_PIXEL_CACHE=0        disable (same as --no-pixel-cache)
+    CIV_PIXEL_CACHE_MB=2048  size limit (same as --pixel-cache-mb)
+
+Usage:
+    python pixel_cache.py stats
+    python pixel_cache.py evict --max-mb 512
+    python pixel_cache.py clear
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    print("[ERROR] Pillow not installed. Run: pip install Pillow")
+    sys.exit(1)
+
+try:
+    import numpy as np
+except ImportError:
+    print("[ERROR] NumPy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from asset_paths import CACHE_DIR
+
+PIXEL_CACHE_DIR = CACHE_DIR / 'pixels'
+ENABLED_ENV = 'CIV_PIXEL_CACHE'
+MAX_MB_ENV = 'CIV_PIXEL_CACHE_MB'
+DEFAULT_MAX_MB = 2048
+
+
+def file_hash(path):
+    """Return the sha256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def decode_rgba(path):
+    """Decode an image file to a HxWx4 uint8 array"""
+    with Image.open(path) as img:
+        return np.asarray(img.convert('RGBA'))
+
+
+class PixelCache:
+    """
+    Size-bounded LRU store of decoded RGBA arrays, one .npy per source hash
+
+    Args:
+        root: Cache directory
+        max_bytes: Size limit; the least recently used entries are evicted past it
+        enabled: When False, load_rgba always decodes and nothing is stored
+    """
+
+    def __init__(self, root=PIXEL_CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024, enabled=True):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, key):
+        return self.root / key[:2] / f"{key}.npy"
+
+    def get(self, key):
+        """Read-only memory map of the cached pixels, or None"""
+        if not self.enabled:
+            return None
+        path = self.entry_path(key)
+        try:
+            pixels = np.load(path, mmap_mode='r')
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        self.hits += 1
+        return pixels
+
+    def put(self, key, pixels):
+        """Store pixels under key; returns them unchanged"""
+        pixels = np.asarray(pixels, dtype=np.uint8)
+        if not self.enabled or pixels.ndim != 3 or pixels.shape[2] != 4:
+            return pixels
+        path = self.entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name: several worker processes may decode the same miss at once
+        temp_path = path.with_name(f"{key}.{uuid.uuid4().hex[:8]}.tmp.npy")
+        out = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.uint8, shape=pixels.shape)
+        out[...] = pixels
+        out.flush()
+        del out
+        try:
+            os.replace(temp_path, path)
+        except OSError:
+            # Windows: another process has the entry mapped; its copy is identical
+            temp_path.unlink(missing_ok=True)
+        self.evict()
+        return pixels
+
+    def load_rgba(self, path, key=None):
+        """
+        Decoded RGBA pixels of an image file, from the cache when possible
+
+        Args:
+            path: Image file
+            key: The file's sha256, if the caller already has it
+        """
+        if not self.enabled:
+            return decode_rgba(path)
+        key = key or file_hash(path)
+        pixels = self.get(key)
+        if pixels is not None:
+            return pixels
+        self.misses += 1
+        return self.put(key, decode_rgba(path))
+
+    def remember(self, path, pixels):
+        """Store the pixels of a losslessly written file under that file's hash"""
+        if self.enabled:
+            self.put(file_hash(path), pixels)
+
+    def entries(self):
+        """(path, size, mtime) of every entry, oldest use first"""
+        if not self.root.exists():
+            return []
+        found = []
+        for sub in os.scandir(self.root):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith('.npy') and '.tmp.' not in entry.name:
+                    stat = entry.stat()
+                    found.append((Path(entry.path), stat.st_size, stat.st_mtime))
+        return sorted(found, key=lambda e: e[2])
+
+    def evict(self, max_bytes=None):
+        """Delete least recently used entries until the cache fits; returns (files, bytes) removed"""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = freed = 0
+        for path, size, _ in entries:
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            freed += size
+        return removed, freed
+
+
+def get_cache():
+    """PixelCache configured from the environment (see module docstring)"""
+    enabled = os.environ.get(ENABLED_ENV, '1').lower() not in ('0', 'off', 'false', 'no')
+    max_mb = float(os.environ.get(MAX_MB_ENV, DEFAULT_MAX_MB))
+    return PixelCache(max_bytes=int(max_mb * 1024 * 1024), enabled=enabled)
+
+
+def add_arguments(parser):
+    """Add --no-pixel-cache and --pixel-cache-mb to a stage's argument parser"""
+    parser.add_argument('--no-pixel-cache', action='store_true',
+                        help='Always decode from the compressed file; do not read or write the pixel cache')
+    parser.add_argument('--pixel-cache-mb', type=float,
+                        help=f'Pixel cache size limit in MB (default: {DEFAULT_MAX_MB})')
+
+
+def configure(args):
+    """Apply the parsed flags through the environment, so worker processes inherit them"""
+    if args.no_pixel_cache:
+        os.environ[ENABLED_ENV] = '0'
+    if args.pixel_cache_mb is not None:
+        os.environ[MAX_MB_ENV] = str(args.pixel_cache_mb)
+    return get_cache()
+
+
+def fmt_size(size):
+    return f"{size / 1024 / 1024:.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or trim the decoded-pixel cache')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('stats', help='Show entry count and size')
+    p_evict = sub.add_parser('evict', help='Evict least recently used entries down to a size')
+    p_evict.add_argument('--max-mb', type=float, default=DEFAULT_MAX_MB, help=f'Target size (default: {DEFAULT_MAX_MB})')
+    sub.add_parser('clear', help='Delete every entry')
+    args = parser.parse_args()
+
+    cache = get_cache()
+    if args.command == 'stats':
+        entries = cache.entries()
+        total = sum(size for _, size, _ in entries)
+        print(f"[INFO] {cache.root}: {len(entries)} entries, {fmt_size(total)} "
+              f"(limit {fmt_size(cache.max_bytes)}{'' if cache.enabled else ', disabled'})")
+        if entries:
+            age = (time.time() - entries[0][2]) / 3600
+            print(f"[INFO] Least recently used entry: {age:.1f} h ago")
+    elif args.command == 'evict':
+        removed, freed = cache.evict(int(args.max_mb * 1024 * 1024))
+        print(f"[OK] Evicted {removed} entries ({fmt_size(freed)})")
+    else:
+        removed, freed = cache.evict(0)
+        print(f"[OK] Cleared {removed} entries ({fmt_size(freed)})")
+
+
+if __name__ == '__main__':
+    main()
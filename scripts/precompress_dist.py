@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Dist Precompressor - Post-build .br/.gz siblings and asset size budgets
+Run after `npm run build`. Every compressible file in dist/ gets a gzip -9
+(.gz) and brotli q11 (.br) sibling, compressed in parallel. Compressed output
+is cached by content hash in .asset-cache/precompress/, so chunks whose
+content did not change (vendor, motion, images, ...) are copied instead of
+recompressed even though vite empties dist/ on every build.
+
+Every file is then checked against the size budgets (raw / gzip / brotli, per
+file or as a total over a glob) and the script exits 1 if any budget is
+exceeded (--report-only lists them without failing). Budgets default to
+DEFAULT_BUDGETS and can be replaced with a JSON file holding a list of entries
+of the same shape.
+
+Brotli is optional (pip install brotli); without it only .gz siblings are
+written and brotli budgets are skipped with a warning.
+
+Usage:
+    python precompress_dist.py                       # compress dist/ and check budgets
+    python precompress_dist.py --no-write            # budgets only, leave dist/ untouched
+    python precompress_dist.py --budgets budgets.json --report sizes.json
+    python precompress_dist.py --no-write --report-only --report sizes.json   # measure a build
+"""
+
+import argparse
+import fnmatch
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from asset_paths import CACHE_DIR as ASSET_CACHE_DIR, DIST_DIR
+
+DEFAULT_DIST_DIR = DIST_DIR
+CACHE_DIR = ASSET_CACHE_DIR / 'precompress'
+
+COMPRESSIBLE_EXTENSIONS = ('.js', '.mjs', '.css', '.html', '.json', '.webmanifest', '.svg',
+                           '.txt', '.xml', '.map', '.wasm')
+SIBLING_EXTENSIONS = ('.gz', '.br')
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# Files smaller than this are not worth a sibling (one TCP packet either way);
+# their compressed sizes are still measured for the budgets
+MIN_SIBLING_SIZE = 1024
+
+# Sizes are in KiB. 'scope' is 'each' (every matching file) or 'total' (sum of
+# all matching files). Patterns are fnmatch globs on the dist-relative path,
+# where '*' also matches '/'. Vite names chunks <name>-<hash>.js.
+# These are starting estimates that have not been measured against a real
+# vite build yet, so the deploy workflow runs with --report-only; set them from
+# a build's --report sizes before making them a gate.
+DEFAULT_BUDGETS = [
+    {'name': 'entry chunk', 'patterns': ['assets/index-*.js'], 'scope': 'each', 'brotli': 900},
+    {'name': 'vendor chunk', 'patterns': ['assets/vendor-*.js'], 'scope': 'each', 'brotli': 60},
+    {'name': 'motion chunk', 'patterns': ['assets/motion-*.js'], 'scope': 'each', 'brotli': 50},
+    {'name': 'any JS chunk', 'patterns': ['*.js', '*.mjs'], 'scope': 'each', 'gzip': 1200},
+    {'name': 'all JS', 'patterns': ['*.js', '*.mjs'], 'scope': 'total', 'brotli': 1200, 'gzip': 1600},
+    {'name': 'all CSS', 'patterns': ['*.css'], 'scope': 'total', 'brotli': 80},
+    {'name': 'webp image', 'patterns': ['*.webp'], 'scope': 'each', 'raw': 350},
+    {'name': 'all images', 'patterns': ['*.webp', '*.png', '*.jpg', '*.jpeg', '*.svg'],
+     'scope': 'total', 'raw': 40 * 1024},
+    {'name': 'dist total', 'patterns': ['*'], 'scope': 'total', 'raw': 64 * 1024},
+]
+
+METRICS = ('raw', 'gzip', 'brotli')
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _cached_blob(digest, ext, compress, data):
+    """Compressed bytes for `data` from the content cache, compressing on a miss"""
+    blob = CACHE_DIR / digest[:2] / f"{digest}{ext}"
+    if blob.exists():
+        return blob.read_bytes(), True
+    out = compress(data)
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    tmp = blob.with_suffix(f"{ext}.{os.getpid()}.tmp")
+    tmp.write_bytes(out)
+    tmp.replace(blob)
+    return out, False
+
+
+def _gzip(data):
+    # mtime=0 keeps the output byte-identical across builds
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _brotli(data):
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+def process_file(path, rel, write):
+    """Measure (and for compressible files, precompress) one dist file"""
+    path = Path(path)
+    data = path.read_bytes()
+    result = {'path': rel, 'raw': len(data), 'gzip': None, 'brotli': None, 'cached': 0, 'written': 0}
+    if path.suffix.lower() not in COMPRESSIBLE_EXTENSIONS:
+        return result
+
+    digest = sha256_bytes(data)
+    codecs = [('gzip', '.gz', _gzip)]
+    if brotli is not None:
+        codecs.append(('brotli', '.br', _brotli))
+    for metric, ext, compress in codecs:
+        out, hit = _cached_blob(digest, ext, compress, data)
+        result[metric] = len(out)
+        result['cached'] += hit
+        if write and len(data) >= MIN_SIBLING_SIZE and len(out) < len(data):
+            sibling = path.with_name(path.name + ext)
+            if not sibling.exists() or sibling.read_bytes() != out:
+                sibling.write_bytes(out)
+                result['written'] += 1
+    return result
+
+
+def collect_files(dist_dir):
+    """Every file under dist/ except existing compressed siblings"""
+    files = []
+    for path in sorted(dist_dir.rglob('*')):
+        if not path.is_file():
+            continue
+        if path.suffix in SIBLING_EXTENSIONS and path.with_suffix('').is_file():
+            continue
+        files.append(path)
+    return files
+
+
+def load_budgets(path):
+    if path is None:
+        return DEFAULT_BUDGETS
+    try:
+        budgets = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[ERROR] Cannot read budgets from {path}: {e}")
+        sys.exit(1)
+    if not isinstance(budgets, list):
+        print(f"[ERROR] {path}: expected a JSON list of budget entries")
+        sys.exit(1)
+    for budget in budgets:
+        if budget.get('scope', 'each') not in ('each', 'total') or not budget.get('patterns'):
+            print(f"[ERROR] {path}: bad budget entry {budget}")
+            sys.exit(1)
+    return budgets
+
+
+def matches(rel, patterns):
+    return any(fnmatch.fnmatch(rel, p) for p in patterns)
+
+
+def check_budgets(results, budgets):
+    """Returns (violations, skipped) as lists of message strings"""
+    violations = []
+    skipped = []
+    for budget in budgets:
+        selected = [r for r in results if matches(r['path'], budget['patterns'])]
+        for metric in METRICS:
+            limit_kb = budget.get(metric)
+            if limit_kb is None:
+                continue
+            limit = int(limit_kb * 1024)
+            if metric == 'brotli' and brotli is None:
+                skipped.append(f"{budget['name']}: {metric} <= {fmt_size(limit)}")
+                continue
+            # Files that are never compressed count at their raw size
+            sizes = [(r['path'], r[metric] if r[metric] is not None else r['raw']) for r in selected]
+            if budget.get('scope', 'each') == 'total':
+                total = sum(size for _, size in sizes)
+                if total > limit:
+                    violations.append(f"{budget['name']}: {metric} total {fmt_size(total)} > {fmt_size(limit)} "
+                                      f"over {len(sizes)} files")
+            else:
+                for rel, size in sizes:
+                    if size > limit:
+                        violations.append(f"{budget['name']}: {rel} {metric} {fmt_size(size)} > {fmt_size(limit)}")
+    return violations, skipped
+
+
+def fmt_size(n):
+    if n is None:
+        return '-'
+    if n >= 1024 * 1024:
+        return f"{n / 1024 / 1024:.2f} MB"
+    if n < 1024:
+        return f"{n} B"
+    return f"{n / 1024:.1f} KB"
+
+
+def print_report(results, top):
+    chunks = [r for r in results if r['gzip'] is not None]
+    chunks.sort(key=lambda r: r['raw'], reverse=True)
+    print("=" * 78)
+    print(f"{'file':<44} {'raw':>10} {'gzip':>10} {'brotli':>10}")
+    print("-" * 78)
+    for r in chunks[:top]:
+        name = r['path'] if len(r['path']) <= 44 else '...' + r['path'][-41:]
+        print(f"{name:<44} {fmt_size(r['raw']):>10} {fmt_size(r['gzip']):>10} {fmt_size(r['brotli']):>10}")
+    if len(chunks) > top:
+        print(f"  ... {len(chunks) - top} more compressible files")
+    print("-" * 78)
+
+    groups = {}
+    for r in results:
+        ext = Path(r['path']).suffix.lower() or '(none)'
+        group = groups.setdefault(ext, {'files': 0, 'raw': 0, 'gzip': 0, 'brotli': 0})
+        group['files'] += 1
+        for metric in METRICS:
+            group[metric] += r[metric] if r[metric] is not None else r['raw']
+    print(f"{'type':<20} {'files':>8} {'raw':>15} {'gzip':>15} {'brotli':>15}")
+    for ext, g in sorted(groups.items(), key=lambda kv: kv[1]['raw'], reverse=True):
+        brotli_total = fmt_size(g['brotli']) if brotli is not None else '-'
+        print(f"{ext:<20} {g['files']:>8} {fmt_size(g['raw']):>15} {fmt_size(g['gzip']):>15} {brotli_total:>15}")
+    print("=" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompress dist/ and enforce asset size budgets')
+    parser.add_argument('--dist', default=str(DEFAULT_DIST_DIR), help=f'Build output directory (default: {DEFAULT_DIST_DIR})')
+    parser.add_argument('--budgets', help='JSON file with budget entries (default: built-in DEFAULT_BUDGETS)')
+    parser.add_argument('--no-write', action='store_true', help='Only measure and check budgets; write no siblings')
+    parser.add_argument('--no-budgets', action='store_true', help='Skip the budget check')
+    parser.add_argument('--report-only', action='store_true',
+                        help='List exceeded budgets as warnings and exit 0 (for budgets not yet calibrated)')
+    parser.add_argument('--report', help='Write per-file sizes and budget results as JSON to this path')
+    parser.add_argument('--top', type=int, default=25, help='Largest compressible files to list (default: 25)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--clear-cache', action='store_true', help='Delete the compression cache first')
+    args = parser.parse_args()
+
+    dist_dir = Path(args.dist)
+    if not dist_dir.is_dir():
+        print(f"[ERROR] {dist_dir} not found; run `npm run build` first")
+        sys.exit(1)
+    if args.clear_cache and CACHE_DIR.exists():
+        shutil.rmtree(CACHE_DIR)
+        print(f"[INFO] Cleared {CACHE_DIR}")
+    if brotli is None:
+        print("[WARN] brotli not installed (pip install brotli); writing .gz only")
+
+    budgets = None if args.no_budgets else load_budgets(args.budgets)
+
+    files = collect_files(dist_dir)
+    if not files:
+        print(f"[INFO] {dist_dir} is empty")
+        sys.exit(0)
+    rels = [f.relative_to(dist_dir).as_posix() for f in files]
+    print(f"[INFO] {len(files)} files in {dist_dir} with {args.jobs} workers...")
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(process_file, files, rels, [not args.no_write] * len(files), chunksize=4))
+
+    compressible = sum(1 for r in results if r['gzip'] is not None)
+    cached = sum(r['cached'] for r in results)
+    written = sum(r['written'] for r in results)
+    codecs = 2 if brotli is not None else 1
+    print(f"[OK] {compressible} compressible files, {cached}/{compressible * codecs} "
+          f"compressions from cache, {written} siblings written")
+    print()
+    print_report(results, args.top)
+
+    violations, skipped = check_budgets(results, budgets) if budgets else ([], [])
+    for message in skipped:
+        print(f"[WARN] Budget skipped without brotli: {message}")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps({
+            'dist': str(dist_dir),
+            'files': results,
+            'violations': violations,
+            'skipped': skipped,
+        }, indent=2), encoding='utf-8')
+        print(f"[INFO] Report written to {args.report}")
+
+    print()
+    if budgets is None:
+        print("[RESULT] Budget check disabled")
+    elif violations:
+        level = 'WARN' if args.report_only else 'ERROR'
+        print(f"[{level}] {len(violations)} budget(s) exceeded:")
+        for message in violations:
+            print(f"  - {message}")
+        if not args.report_only:
+            sys.exit(1)
+    else:
+        print(f"[RESULT] All {len(budgets)} budgets met")
+
+
+if __name__ == '__main__':
+    main()
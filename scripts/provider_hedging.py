@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Hedged, latency-aware provider failover for the queue workers
+Wraps several providers (see image_providers.py) into one provider callable:
+  - a rolling latency histogram is kept per backend (provider + model),
+    seeded from earlier attempts in the queue's results table
+  - the request goes to the first healthy backend; if it has not answered
+    after the chosen percentile of that backend's latency, a hedged duplicate
+    goes to the next backend, and whichever valid image arrives first wins
+  - a backend that fails outright hands over to the next one immediately
+  - a backend whose recent error rate exceeds the limit is skipped for a
+    cooldown period, then tried again with a clean slate
+
+Each backend writes into its own scratch directory under .asset-cache/hedge/
+and only the winner is moved to <id>.png, so a slow loser can never overwrite
+the result. Python cannot cancel a blocked HTTP call, so a losing request
+keeps running in a daemon thread until it returns; its latency still feeds
+the histogram.
+
+Backends are given as specs "provider[:model][:key=value...]", e.g.
+"venus:gemini-3-pro-image" or, for a local stub with injected slowness,
+"file:delay=20-60:fail_rate=0.1".
+"""
+
+import queue
+import shutil
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from asset_paths import CACHE_DIR
+
+SCRATCH_DIR = CACHE_DIR / 'hedge'
+
+DEFAULT_POLICY = {
+    'percentile': 90.0,      # hedge after this percentile of the backend's latency
+    'initial_delay': 45.0,   # seconds, until a backend has min_samples latencies
+    'min_delay': 2.0,        # never hedge sooner than this
+    'min_samples': 8,
+    'window': 50,            # rolling window per backend (latencies and outcomes)
+    'max_error_rate': 0.5,
+    'cooldown': 120.0,       # seconds a tripped backend is skipped
+}
+
+
+class BackendStats:
+    """Rolling latency histogram and error rate for one backend"""
+
+    def __init__(self, label, window):
+        self.label = label
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.tripped_until = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+
+    def record(self, seconds, ok):
+        self.outcomes.append(bool(ok))
+        if ok:
+            self.latencies.append(seconds)
+
+    def error_rate(self):
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def percentile(self, pct):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        k = (len(ordered) - 1) * pct / 100
+        lo = int(k)
+        hi = min(lo + 1, len(ordered) - 1)
+        return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class HedgedProvider:
+    """
+    Provider callable (prompt, event_id, output_path) -> bool over several backends
+
+    Args:
+        backends: List of (label, provider callable), in order of preference
+        policy: Overrides for DEFAULT_POLICY
+        history: Optional iterable of (label, seconds, ok) from earlier runs
+
+    After each call, last_backend is the label that produced the image (or
+    the first backend tried) and last_error summarizes the failures.
+    """
+
+    def __init__(self, backends, policy=None, history=()):
+        if not backends:
+            raise ValueError("HedgedProvider needs at least one backend")
+        self.backends = backends
+        self.policy = dict(DEFAULT_POLICY, **(policy or {}))
+        self.stats = {label: BackendStats(label, self.policy['window']) for label, _ in backends}
+        self.lock = threading.Lock()
+        for label, seconds, ok in history:
+            if label in self.stats:
+                self.stats[label].record(seconds, ok)
+        self.last_backend = backends[0][0]
+        self.last_error = None
+
+    def hedge_delay(self, label):
+        """Seconds to wait on a backend before sending a hedged duplicate"""
+        stats = self.stats[label]
+        with self.lock:
+            enough = len(stats.latencies) >= self.policy['min_samples']
+            delay = stats.percentile(self.policy['percentile']) if enough else self.policy['initial_delay']
+        return max(self.policy['min_delay'], delay)
+
+    def route(self):
+        """Backends in preference order, tripped ones moved to the end"""
+        now = time.time()
+        healthy, tripped = [], []
+        with self.lock:
+            for label, provider in self.backends:
+                stats = self.stats[label]
+                if stats.tripped_until and stats.tripped_until <= now:
+                    # Cooldown over: give the backend a clean slate
+                    stats.tripped_until = 0.0
+                    stats.outcomes.clear()
+                (tripped if stats.tripped_until > now else healthy).append((label, provider))
+        return healthy + tripped
+
+    def _observe(self, label, seconds, ok):
+        with self.lock:
+            stats = self.stats[label]
+            stats.record(seconds, ok)
+            if (not ok and len(stats.outcomes) >= self.policy['min_samples']
+                    and stats.error_rate() > self.policy['max_error_rate'] and not stats.tripped_until):
+                stats.tripped_until = time.time() + self.policy['cooldown']
+                print(f"  ⚠️  {label}: error rate {stats.error_rate():.0%}, "
+                      f"routing away for {self.policy['cooldown']:.0f}s")
+
+    def __call__(self, prompt, event_id, output_path):
+        output_path = Path(output_path)
+        order = self.route()
+        results = queue.Queue()
+        call = {'winner': None, 'lock': threading.Lock()}
+        errors = []
+
+        def attempt(label, provider):
+            scratch = SCRATCH_DIR / label.replace(':', '_').replace('=', '-').replace('/', '_')
+            scratch.mkdir(parents=True, exist_ok=True)
+            scratch_path = scratch / output_path.name
+            if scratch_path.exists():
+                scratch_path.unlink()
+            started = time.perf_counter()
+            error = None
+            try:
+                ok = bool(provider(prompt, event_id, scratch_path)) and scratch_path.exists()
+                if not ok:
+                    error = 'provider returned no image'
+            except Exception as e:
+                ok = False
+                error = f"{type(e).__name__}: {e}"
+            self._observe(label, time.perf_counter() - started, ok)
+            won = False
+            with call['lock']:
+                if ok and call['winner'] is None:
+                    call['winner'] = label
+                    shutil.move(scratch_path, output_path)
+                    won = True
+            if not won and scratch_path.exists():
+                scratch_path.unlink()
+            if won:
+                with self.lock:
+                    self.stats[label].wins += 1
+            results.put((label, won, error))
+
+        def launch(index, reason=None):
+            label, provider = order[index]
+            with self.lock:
+                self.stats[label].requests += 1
+                if reason == 'hedge':
+                    self.stats[label].hedges += 1
+            if reason == 'hedge':
+                print(f"  🪁 {order[index - 1][0]} is slow, hedging {event_id} to {label}")
+            elif reason == 'failover':
+                print(f"  🔀 Failing over {event_id} to {label}")
+            threading.Thread(target=attempt, args=(label, provider), daemon=True).start()
+            return time.monotonic() + self.hedge_delay(label)
+
+        next_hedge_at = launch(0)
+        launched, pending = 1, 1
+        self.last_backend = order[0][0]
+        while pending:
+            timeout = max(0.0, next_hedge_at - time.monotonic()) if launched < len(order) else None
+            try:
+                label, won, error = results.get(timeout=timeout)
+            except queue.Empty:
+                next_hedge_at = launch(launched, 'hedge')
+                launched += 1
+                pending += 1
+                continue
+            pending -= 1
+            if won:
+                self.last_backend = label
+                self.last_error = None
+                return True
+            errors.append(f"{label}: {error}")
+            if launched < len(order):
+                # Failed outright: fail over now rather than waiting for the hedge delay
+                next_hedge_at = launch(launched, 'failover')
+                launched += 1
+                pending += 1
+        self.last_error = '; '.join(errors)
+        return False
+
+    def summary(self):
+        """Lines describing each backend's histogram, error rate and hedge wins"""
+        lines = []
+        now = time.time()
+        with self.lock:
+            for label, _ in self.backends:
+                stats = self.stats[label]
+                pcts = [stats.percentile(p) for p in (50, 90, 99)]
+                latency = '  '.join(f"p{p} {v:5.1f}s" for p, v in zip((50, 90, 99), pcts) if v is not None)
+                state = f"  routed away {stats.tripped_until - now:.0f}s" if stats.tripped_until > now else ''
+                lines.append(f"{label:<40} {stats.requests:>4} req  {stats.hedges:>3} hedged  {stats.wins:>4} won  "
+                             f"err {stats.error_rate():4.0%}  {latency or 'no samples'}{state}")
+        return lines
@@ -1,9 +1,136 @@
 from PIL import Image
+import argparse
 import sys
 import os
 import math
 
-def remove_background(input_path, output_path, target_color=(255, 0, 255), tolerance=60, soft_edge=40):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def alpha_bbox(alpha, padding=0):
+    """
+    Tight bounding box of the non-transparent pixels, expanded by padding.
+
+    Args:
+        alpha (ndarray): HxW alpha channel
+        padding (int): Pixels of transparent margin to keep around the content
+
+    Returns:
+        (left, top, right, bottom) crop box, or None if the image is fully transparent
+    """
+    # One vectorized pass per axis instead of scanning pixels
+    rows = np.flatnonzero(alpha.any(axis=1))
+    cols = np.flatnonzero(alpha.any(axis=0))
+    if rows.size == 0:
+        return None
+
+    height, width = alpha.shape
+    top = max(0, int(rows[0]) - padding)
+    bottom = min(height, int(rows[-1]) + 1 + padding)
+    left = max(0, int(cols[0]) - padding)
+    right = min(width, int(cols[-1]) + 1 + padding)
+    return left, top, right, bottom
+
+
+def _shift(array, dy, dx):
+    """Shift a 2D/3D array by (dy, dx), filling the uncovered border with zeros."""
+    out = np.zeros_like(array)
+    h, w = array.shape[:2]
+    src_y = slice(max(0, -dy), h - max(0, dy))
+    src_x = slice(max(0, -dx), w - max(0, dx))
+    dst_y = slice(max(0, dy), h - max(0, -dy))
+    dst_x = slice(max(0, dx), w - max(0, -dx))
+    out[dst_y, dst_x] = array[src_y, src_x]
+    return out
+
+
+def bleed_edges(rgba, radius=16):
+    """
+    Fill the RGB under fully transparent pixels with the nearest edge colours.
+
+    Colours are grown outward from the visible pixels one ring per iteration
+    (8-neighbour average), so bilinear filtering and lossy encoders see the
+    object's own colours at the alpha boundary instead of chroma-key noise.
+    Pixels further than `radius` from any visible pixel get the mean edge colour.
+
+    Args:
+        rgba (ndarray): HxWx4 uint8 array
+        radius (int): Maximum bleed distance in pixels
+
+    Returns:
+        New HxWx4 uint8 array with the same alpha channel
+    """
+    rgb = rgba[..., :3].astype(np.float32)
+    known = rgba[..., 3] > 0
+    if known.all() or not known.any():
+        return rgba.copy()
+
+    # Visible pixels that touch transparency: their colours are the "edge" fallback
+    neighbours = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+    touches_hole = np.zeros_like(known)
+    for dy, dx in neighbours:
+        touches_hole |= ~_shift(known, dy, dx)
+    edge = known & touches_hole
+    edge_color = rgb[edge].mean(axis=0) if edge.any() else rgb[known].mean(axis=0)
+
+    rgb[~known] = 0
+    for _ in range(radius):
+        acc = np.zeros_like(rgb)
+        count = np.zeros(known.shape, dtype=np.float32)
+        for dy, dx in neighbours:
+            shifted_known = _shift(known, dy, dx)
+            acc += _shift(rgb, dy, dx) * shifted_known[..., None]
+            count += shifted_known
+        grow = ~known & (count > 0)
+        if not grow.any():
+            break
+        rgb[grow] = acc[grow] / count[grow][:, None]
+        known = known | grow
+
+    rgb[~known] = edge_color
+    out = rgba.copy()
+    out[..., :3] = np.clip(np.rint(rgb), 0, 255).astype(np.uint8)
+    return out
+
+
+def trim_and_bleed(img, padding=2, bleed_radius=16):
+    """
+    Crop an RGBA image to its alpha bounding box and bleed edge colours.
+
+    Args:
+        img (Image): RGBA image
+        padding (int): Transparent margin kept around the content
+        bleed_radius (int): Edge bleed distance (0 disables bleeding)
+
+    Returns:
+        (Image, crop box) - the box is None when nothing was cropped
+    """
+    arr = np.asarray(img)
+    box = alpha_bbox(arr[..., 3], padding)
+    if box is None:
+        return img, None
+    left, top, right, bottom = box
+    arr = arr[top:bottom, left:right]
+    if bleed_radius > 0:
+        arr = bleed_edges(arr, bleed_radius)
+    cropped = box != (0, 0, img.width, img.height)
+    return Image.fromarray(np.ascontiguousarray(arr), 'RGBA'), box if cropped else None
+
+
+def open_rgba(path, use_pixel_cache=True):
+    """RGBA image of a file, through the decoded-pixel cache when NumPy is available"""
+    if use_pixel_cache and np is not None:
+        import pixel_cache
+
+        return Image.fromarray(pixel_cache.get_cache().load_rgba(path), 'RGBA')
+    with Image.open(path) as img:
+        return img.convert("RGBA")
+
+
+def remove_background(input_path, output_path, target_color=(255, 0, 255), tolerance=60, soft_edge=40,
+                      trim=False, padding=2, bleed_radius=16, quality=90, use_pixel_cache=True):
     """
     Removes background with specialized 'Magenta Despill' for Gold objects.
     
@@ -13,10 +140,14 @@ def remove_background(input_path, output_path, target_color=(255, 0, 255), toler
         target_color (tuple): Target color (default Magenta)
         tolerance (int): Distance for 0 alpha
         soft_edge (int): Transition distance
+        trim (bool): Crop to the alpha bounding box, bleed edge colours and save as WebP with alpha
+        padding (int): Transparent margin kept around the content when trimming
+        bleed_radius (int): Edge bleed distance in pixels when trimming
+        quality (int): WebP quality used when trimming
+        use_pixel_cache (bool): Read the input from, and store the PNG output in, the decoded-pixel cache
     """
     try:
-        img = Image.open(input_path)
-        img = img.convert("RGBA")
+        img = open_rgba(input_path, use_pixel_cache)
         datas = img.getdata()
         
         tr, tg, tb = target_color
@@ -65,8 +196,22 @@ def remove_background(input_path, output_path, target_color=(255, 0, 255), toler
         
         if os.path.dirname(output_path):
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-        img.save(output_path, "PNG")
+        
+        if trim:
+            original_size = img.size
+            img, box = trim_and_bleed(img, padding, bleed_radius)
+            if box:
+                print(f"Trimmed {original_size[0]}x{original_size[1]} -> {img.width}x{img.height}")
+            # exact=True keeps the bled colours under alpha=0 instead of letting libwebp discard them
+            output_path = os.path.splitext(output_path)[0] + ".webp"
+            img.save(output_path, "WEBP", quality=quality, alpha_quality=100, method=6, exact=True)
+        else:
+            img.save(output_path, "PNG")
+            if use_pixel_cache and np is not None:
+                # Lossless output: the next stage can reuse these pixels instead of decoding
+                import pixel_cache
+
+                pixel_cache.get_cache().remember(output_path, np.asarray(img))
         print(f"Successfully processed {input_path}")
         print(f"Saved to {output_path}")
         
@@ -75,22 +220,29 @@ def remove_background(input_path, output_path, target_color=(255, 0, 255), toler
         sys.exit(1)
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python remove_bg.py <input_file> <output_file> [run_mode] [tolerance] [softness]")
-    else:
-        input_file = sys.argv[1]
-        output_file = sys.argv[2]
-        
-        # We assume Magenta workflow as default now since that's what we are fixing
-        target_col = (255, 0, 255) 
-        
-        if len(sys.argv) > 3:
-            mode = sys.argv[3].lower()
-            if mode == 'white':
-                target_col = (255, 255, 255)
-            # if magenta, it's already set
-        
-        tol = int(sys.argv[4]) if len(sys.argv) > 4 else 80
-        soft = int(sys.argv[5]) if len(sys.argv) > 5 else 40
-        
-        remove_background(input_file, output_file, target_col, tol, soft)
+    parser = argparse.ArgumentParser(description="Chroma-key background removal with magenta despill")
+    parser.add_argument("input_file")
+    parser.add_argument("output_file")
+    parser.add_argument("run_mode", nargs="?", default="magenta", help="magenta (default) or white")
+    parser.add_argument("tolerance", nargs="?", type=int, default=80)
+    parser.add_argument("softness", nargs="?", type=int, default=40)
+    parser.add_argument("--trim", action="store_true",
+                        help="Crop to the alpha bounding box, bleed edge colours and save as WebP with alpha")
+    parser.add_argument("--padding", type=int, default=2, help="Transparent margin kept when trimming (default: 2)")
+    parser.add_argument("--bleed-radius", type=int, default=16, help="Edge bleed distance in pixels, 0 to disable (default: 16)")
+    parser.add_argument("--quality", type=int, default=90, help="WebP quality when trimming (default: 90)")
+    parser.add_argument("--no-pixel-cache", action="store_true",
+                        help="Do not read or write the decoded-pixel cache (see pixel_cache.py)")
+    args = parser.parse_args()
+    if args.trim and np is None:
+        print("[ERROR] --trim needs NumPy. Run: pip install numpy")
+        sys.exit(1)
+
+    # We assume Magenta workflow as default now since that's what we are fixing
+    target_col = (255, 0, 255)
+    if args.run_mode.lower() == 'white':
+        target_col = (255, 255, 255)
+    
+    remove_background(args.input_file, args.output_file, target_col, args.tolerance, args.softness,
+                      trim=args.trim, padding=args.padding, bleed_radius=args.bleed_radius, quality=args.quality,
+                      use_pixel_cache=not args.no_pixel_cache)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Python codec for exported .cgsave files
+Mirrors encodeSavePayload / decodeSavePayload in src/hooks/useGameState.js:
+
+    {"format": 4, "obfuscated": true, "data": "<base64>", "updatedAt": ...}
+
+where data = base64(utf8(JSON.stringify(payload)) XOR "civ_game_simple_mask_v1").
+Saves written without obfuscation (and localStorage dumps) are the payload JSON
+itself. Decoding is streamed: base64 and the XOR mask are undone chunk by chunk,
+so callers can process multi-MB saves without holding them in memory.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+
+SAVE_FORMAT_VERSION = 4
+SAVE_OBFUSCATION_KEY = b'civ_game_simple_mask_v1'
+SAVE_FILE_EXTENSION = '.cgsave'
+
+CHUNK_SIZE = 256 * 1024
+
+# JSON.stringify keeps insertion order, so the wrapper always starts like this
+_WRAPPER_HEAD = re.compile(
+    rb'^\s*\{\s*"format"\s*:\s*(\d+)\s*,\s*"obfuscated"\s*:\s*(true|false)\s*,\s*"data"\s*:\s*"')
+
+
+class SaveFormatError(Exception):
+    """Raised when a file is not a readable save"""
+
+
+def xor_mask(data, offset=0, key=SAVE_OBFUSCATION_KEY):
+    """
+    XOR bytes with the repeating save key, starting at a stream offset
+
+    Works on whole chunks via int.from_bytes instead of a per-byte loop.
+    """
+    if not data:
+        return data
+    start = offset % len(key)
+    reps = (start + len(data)) // len(key) + 1
+    mask = (key * reps)[start:start + len(data)]
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(mask, 'big')).to_bytes(len(data), 'big')
+
+
+class SaveStream:
+    """
+    Iterate the decoded payload JSON of a save in chunks
+
+    Attributes (valid once iteration has started):
+        format: Wrapper format version, or None for plain JSON saves
+        obfuscated: Whether the file used the base64 + XOR wrapper
+        file_bytes: Size of the file on disk
+        json_bytes: Decoded payload bytes produced so far
+    """
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.format = None
+        self.obfuscated = False
+        self.file_bytes = 0
+        self.json_bytes = 0
+        self.wrapper = {}
+
+    def __iter__(self):
+        self.file_bytes = os.path.getsize(self.path)
+        self.json_bytes = 0
+        with open(self.path, 'rb') as f:
+            head = f.read(self.chunk_size)
+            match = _WRAPPER_HEAD.match(head)
+            if match and match.group(2) == b'true':
+                self.format = int(match.group(1))
+                self.obfuscated = True
+                yield from self._iter_wrapped(f, head[match.end():])
+            else:
+                yield from self._iter_plain(f, head)
+
+    def _iter_plain(self, f, head):
+        chunk = head
+        while chunk:
+            self.json_bytes += len(chunk)
+            yield chunk
+            chunk = f.read(self.chunk_size)
+
+    def _iter_wrapped(self, f, rest):
+        pending = b''
+        tail = b''
+        chunk = rest
+        while True:
+            end = chunk.find(b'"')
+            body = chunk if end < 0 else chunk[:end]
+            data = pending + body
+            usable = len(data) - len(data) % 4
+            if usable:
+                decoded = xor_mask(base64.b64decode(data[:usable]), self.json_bytes)
+                self.json_bytes += len(decoded)
+                yield decoded
+            pending = data[usable:]
+            if end >= 0:
+                tail = chunk[end + 1:]
+                break
+            chunk = f.read(self.chunk_size)
+            if not chunk:
+                raise SaveFormatError(f"{self.path}: unterminated data field")
+
+        if pending:
+            decoded = xor_mask(base64.b64decode(pending + b'=' * (-len(pending) % 4)), self.json_bytes)
+            self.json_bytes += len(decoded)
+            yield decoded
+
+        # Remaining wrapper fields (updatedAt) are tiny
+        tail += f.read()
+        try:
+            self.wrapper = json.loads(b'{"_":0' + tail) if tail.strip().startswith(b',') else {}
+        except ValueError:
+            self.wrapper = {}
+        self.wrapper.pop('_', None)
+
+
+def read_save_bytes(path):
+    """Decoded payload JSON bytes of a save (loads the whole payload)"""
+    return b''.join(SaveStream(path))
+
+
+def load_save(path):
+    """Decoded payload of a save as Python objects"""
+    try:
+        return json.loads(read_save_bytes(path))
+    except ValueError as e:
+        raise SaveFormatError(f"{path}: payload is not valid JSON ({e})") from e
+
+
+def encode_save(payload_json, updated_at=None):
+    """
+    Build .cgsave wrapper bytes for payload JSON bytes (inverse of SaveStream)
+
+    Args:
+        payload_json: UTF-8 JSON bytes exactly as JSON.stringify would produce
+        updated_at: Optional updatedAt value copied into the wrapper
+    """
+    data = base64.b64encode(xor_mask(payload_json)).decode('ascii')
+    wrapper = {'format': SAVE_FORMAT_VERSION, 'obfuscated': True, 'data': data}
+    if updated_at is not None:
+        wrapper['updatedAt'] = updated_at
+    return json.dumps(wrapper, separators=(',', ':')).encode('utf-8')
+
+
+def save_hash(path):
+    """sha256 of the decoded payload, so re-exports of the same game state match"""
+    digest = hashlib.sha256()
+    for chunk in SaveStream(path):
+        digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Save Compression Lab - Measure codecs for a compressed .cgsave format version 5
+Runs every candidate over a corpus of saves (decoded payload JSON, see
+save_codec.py) and reports compression ratio, encode and decode throughput,
+and the size after base64 (what localStorage actually stores). Every candidate
+is round-trip verified against the original bytes.
+
+Candidates:
+  current       base64 wrapper used by format 4 (baseline)
+  deflate-*     raw deflate, as produced by CompressionStream('deflate-raw')
+  gzip-*        gzip, as produced by CompressionStream('gzip')
+  brotli-*      brotli (needs: pip install brotli)
+  zstd-*        zstd (needs: pip install zstandard)
+  zstd-dict-*   zstd with a dictionary trained on part of the corpus
+
+The dictionary is trained on --train-fraction of the saves and evaluated on the
+rest, so the ratios reflect saves the dictionary has not seen.
+
+Usage:
+    python save_compression_lab.py saves_dir/ [--dict-size 112640] [--dict-out save_v5.dict]
+    python save_compression_lab.py saves_dir/ --json > compression.json
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from save_codec import SaveFormatError, read_save_bytes
+from save_corpus import collect_saves
+
+from asset_paths import CACHE_DIR
+
+DEFAULT_DICT_OUT = CACHE_DIR / 'save_v5.dict'
+
+
+def _deflate_raw(level):
+    def encode(data):
+        c = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return c.compress(data) + c.flush()
+    return encode, lambda blob: zlib.decompress(blob, -15)
+
+
+def build_candidates(dictionary=None):
+    """
+    Candidate name -> (encode, decode); unavailable codecs are left out
+
+    Args:
+        dictionary: Trained zstandard.ZstdCompressionDict, or None
+    """
+    candidates = {
+        'current': (base64.b64encode, base64.b64decode),
+        'deflate-6': _deflate_raw(6),
+        'deflate-9': _deflate_raw(9),
+        'gzip-6': (lambda d: gzip.compress(d, 6, mtime=0), gzip.decompress),
+        'gzip-9': (lambda d: gzip.compress(d, 9, mtime=0), gzip.decompress),
+    }
+    if brotli is not None:
+        for quality in (5, 9, 11):
+            candidates[f'brotli-{quality}'] = (
+                lambda d, q=quality: brotli.compress(d, quality=q, mode=brotli.MODE_TEXT),
+                brotli.decompress)
+    if zstandard is not None:
+        for level in (3, 9, 19):
+            candidates[f'zstd-{level}'] = (
+                zstandard.ZstdCompressor(level=level).compress,
+                zstandard.ZstdDecompressor().decompress)
+        if dictionary is not None:
+            for level in (3, 19):
+                candidates[f'zstd-dict-{level}'] = (
+                    zstandard.ZstdCompressor(level=level, dict_data=dictionary).compress,
+                    zstandard.ZstdDecompressor(dict_data=dictionary).decompress)
+    return candidates
+
+
+def train_dictionary(samples, dict_size):
+    """Train a zstd dictionary on payload samples; None when zstandard is missing"""
+    if zstandard is None or not samples:
+        return None
+    # The trainer needs several samples; split big saves so small corpora still train
+    pieces = []
+    for sample in samples:
+        step = max(len(sample) // 8, 4096)
+        pieces.extend(sample[i:i + step] for i in range(0, len(sample), step))
+    return zstandard.train_dictionary(dict_size, pieces)
+
+
+def measure(candidates, payloads, repeat):
+    """
+    Run every candidate over every payload
+
+    Returns:
+        List of result dicts, one per candidate
+    """
+    raw_total = sum(len(p) for p in payloads)
+    results = []
+    for name, (encode, decode) in candidates.items():
+        encoded_total = 0
+        stored_total = 0
+        encode_time = 0.0
+        decode_time = 0.0
+        ok = True
+        for payload in payloads:
+            best_enc = best_dec = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                blob = encode(payload)
+                best_enc = min(best_enc, time.perf_counter() - start)
+                start = time.perf_counter()
+                restored = decode(blob)
+                best_dec = min(best_dec, time.perf_counter() - start)
+            if restored != payload:
+                ok = False
+            encode_time += best_enc
+            decode_time += best_dec
+            encoded_total += len(blob)
+            # localStorage holds strings, so binary codecs are stored base64-encoded
+            stored_total += len(blob) if name == 'current' else (len(blob) + 2) // 3 * 4
+        results.append({
+            'candidate': name,
+            'raw_bytes': raw_total,
+            'encoded_bytes': encoded_total,
+            'stored_bytes': stored_total,
+            'ratio': raw_total / encoded_total if encoded_total else 0.0,
+            'encode_mb_s': raw_total / encode_time / 1e6 if encode_time else 0.0,
+            'decode_mb_s': raw_total / decode_time / 1e6 if decode_time else 0.0,
+            'roundtrip_ok': ok,
+        })
+    return results
+
+
+def print_report(results, saves, train_count, dictionary):
+    print("=" * 78)
+    print("   Save Compression Lab")
+    print("=" * 78)
+    print(f"[INFO] Evaluated on {saves} saves ({train_count} used only for dictionary training)")
+    if dictionary is not None:
+        print(f"[INFO] zstd dictionary: {len(dictionary.as_bytes()):,} bytes")
+    missing = [name for name, mod in (('brotli', brotli), ('zstandard', zstandard)) if mod is None]
+    if missing:
+        print(f"[WARN] Not installed, skipped: {', '.join(missing)}")
+    print()
+    baseline = next((r['stored_bytes'] for r in results if r['candidate'] == 'current'), 0)
+    print(f"  {'candidate':<14} {'ratio':>7} {'stored KB':>11} {'vs fmt 4':>9} "
+          f"{'enc MB/s':>9} {'dec MB/s':>9} {'verify':>7}")
+    for r in sorted(results, key=lambda r: r['stored_bytes']):
+        saving = 1 - r['stored_bytes'] / baseline if baseline else 0.0
+        print(f"  {r['candidate']:<14} {r['ratio']:>7.2f} {r['stored_bytes'] / 1024:>11,.1f} {saving:>9.1%} "
+              f"{r['encode_mb_s']:>9.1f} {r['decode_mb_s']:>9.1f} {'OK' if r['roundtrip_ok'] else 'FAIL':>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare save compression codecs over a corpus of saves')
+    parser.add_argument('paths', nargs='+', help='Save files or directories')
+    parser.add_argument('--dict-size', type=int, default=112640, help='zstd dictionary size in bytes (default: 110 KB)')
+    parser.add_argument('--train-fraction', type=float, default=0.5,
+                        help='Share of saves used to train the dictionary (default: 0.5)')
+    parser.add_argument('--dict-out', default=str(DEFAULT_DICT_OUT),
+                        help=f'Where to export the trained dictionary (default: {DEFAULT_DICT_OUT})')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions per save, best is kept (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the train/eval split')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    payloads = []
+    for path in collect_saves(args.paths):
+        try:
+            payloads.append(read_save_bytes(path))
+        except (OSError, SaveFormatError) as e:
+            print(f"[WARN] {path}: {e}", file=sys.stderr)
+    if not payloads:
+        print("[ERROR] No readable saves found")
+        sys.exit(1)
+
+    random.Random(args.seed).shuffle(payloads)
+    train_count = int(len(payloads) * args.train_fraction) if zstandard is not None and len(payloads) > 1 else 0
+    train, evaluate = payloads[:train_count], payloads[train_count:]
+
+    dictionary = None
+    if train:
+        try:
+            dictionary = train_dictionary(train, args.dict_size)
+        except zstandard.ZstdError as e:
+            print(f"[WARN] Dictionary training failed: {e}", file=sys.stderr)
+    if dictionary is not None:
+        dict_out = Path(args.dict_out)
+        dict_out.parent.mkdir(parents=True, exist_ok=True)
+        dict_out.write_bytes(dictionary.as_bytes())
+
+    results = measure(build_candidates(dictionary), evaluate, args.repeat)
+
+    if args.json:
+        json.dump({'saves': len(evaluate), 'train_saves': train_count, 'results': results}, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(results, len(evaluate), train_count, dictionary)
+        if dictionary is not None:
+            print(f"\n[OK] Dictionary exported to {args.dict_out}")
+
+    sys.exit(0 if all(r['roundtrip_ok'] for r in results) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Save Corpus Store - Decode many .cgsave exports into a columnar analytics store
+Saves are decoded across a process pool and flattened into long-format tables:
+
+  saves      save_id, days, epoch, population, json_bytes, updated_at
+             (json_bytes is the decoded payload, not the .cgsave wrapper)
+  resources  save_id, resource, amount
+  strata     save_id, stratum, metric (pop/approval/wealth/influence/income), value
+  nations    save_id, nation, stat, value        (every numeric nation field)
+  prices     save_id, resource, price            (market.prices)
+  series     save_id, series, step, value        (history.*, priceHistory.*, ...)
+
+String columns are dictionary-encoded against a store-wide vocabulary. Each
+ingest run appends one part (NumPy .npz, or Parquet files when pyarrow is
+installed); the catalog records file hashes so re-ingesting skips known saves.
+
+Usage:
+    python save_corpus.py ingest saves_dir/ [--jobs N]
+    python save_corpus.py info
+    python save_corpus.py query prices --group-by resource --agg mean
+    python save_corpus.py query series --where series=history.population --group-by step
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("[ERROR] NumPy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from save_codec import SaveFormatError, read_save_bytes
+
+from asset_paths import CACHE_DIR
+
+DEFAULT_STORE = CACHE_DIR / 'save_corpus'
+
+STRATA_METRICS = {
+    'pop': 'popStructure',
+    'approval': 'classApproval',
+    'wealth': 'classWealth',
+    'influence': 'classInfluence',
+    'income': 'classIncome',
+}
+
+# Roots whose numeric arrays (at any depth) become time series
+SERIES_ROOTS = (
+    ('history',),
+    ('priceHistory',),
+    ('classWealthHistory',),
+    ('classNeedsHistory',),
+    ('market', 'priceHistory'),
+    ('market', 'supplyHistory'),
+    ('market', 'demandHistory'),
+)
+
+# table -> (column, kind); kind is 'cat' (dictionary-encoded), 'int' or 'float'
+TABLES = {
+    'saves': (('save_id', 'int'), ('days', 'float'), ('epoch', 'float'), ('population', 'float'),
+              ('json_bytes', 'int'), ('updated_at', 'float')),
+    'resources': (('save_id', 'int'), ('resource', 'cat'), ('amount', 'float')),
+    'strata': (('save_id', 'int'), ('stratum', 'cat'), ('metric', 'cat'), ('value', 'float')),
+    'nations': (('save_id', 'int'), ('nation', 'cat'), ('stat', 'cat'), ('value', 'float')),
+    'prices': (('save_id', 'int'), ('resource', 'cat'), ('price', 'float')),
+    'series': (('save_id', 'int'), ('series', 'cat'), ('step', 'int'), ('value', 'float')),
+}
+
+CATALOG_FILE = 'catalog.json'
+SAVE_EXTENSIONS = ('.cgsave', '.json')
+
+
+def _num(value):
+    """Numeric value as float, booleans as 0/1, anything else None"""
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _walk_series(node, path, out):
+    if isinstance(node, dict):
+        for key, child in node.items():
+            _walk_series(child, path + (str(key),), out)
+    elif isinstance(node, list) and node:
+        values = [_num(v) for v in node]
+        if all(v is not None for v in values):
+            out['.'.join(path)] = values
+
+
+def flatten_save(path):
+    """
+    Worker entry point: decode one save and flatten it into table rows
+
+    Returns:
+        Dict of table -> list of row tuples (save_id column omitted), or an
+        {'error': ...} dict if the save cannot be decoded
+    """
+    try:
+        payload = read_save_bytes(path)
+        data = json.loads(payload)
+    except (OSError, SaveFormatError) as e:
+        return {'error': str(e)}
+    except ValueError as e:
+        return {'error': f"payload is not valid JSON ({e})"}
+    if not isinstance(data, dict):
+        return {'error': 'payload is not an object'}
+
+    rows = {name: [] for name in TABLES}
+    rows['saves'].append((
+        _num(data.get('daysElapsed')), _num(data.get('epoch')), _num(data.get('population')),
+        len(payload), _num(data.get('updatedAt')),
+    ))
+
+    for resource, amount in (data.get('resources') or {}).items():
+        amount = _num(amount)
+        if amount is not None:
+            rows['resources'].append((resource, amount))
+
+    for metric, key in STRATA_METRICS.items():
+        for stratum, value in (data.get(key) or {}).items():
+            value = _num(value)
+            if value is not None:
+                rows['strata'].append((stratum, metric, value))
+
+    for nation in data.get('nations') or []:
+        if not isinstance(nation, dict):
+            continue
+        nation_id = str(nation.get('id', nation.get('name', '?')))
+        for stat, value in nation.items():
+            value = _num(value)
+            if value is not None:
+                rows['nations'].append((nation_id, stat, value))
+
+    for resource, price in ((data.get('market') or {}).get('prices') or {}).items():
+        price = _num(price)
+        if price is not None:
+            rows['prices'].append((resource, price))
+
+    series = {}
+    for root in SERIES_ROOTS:
+        node = data
+        for key in root:
+            node = node.get(key) if isinstance(node, dict) else None
+        if node is not None:
+            _walk_series(node, root, series)
+    for name, values in series.items():
+        rows['series'].extend((name, step, value) for step, value in enumerate(values))
+
+    return rows
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CorpusStore:
+    """Append-only columnar store: catalog.json plus one part per ingest run"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        catalog_path = self.root / CATALOG_FILE
+        if catalog_path.exists():
+            with open(catalog_path, 'r', encoding='utf-8') as f:
+                self.catalog = json.load(f)
+        else:
+            self.catalog = {'vocab': [], 'saves': {}, 'parts': [], 'next_save_id': 0}
+        self._codes = {s: i for i, s in enumerate(self.catalog['vocab'])}
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.catalog['vocab'])
+            self.catalog['vocab'].append(value)
+            self._codes[value] = code
+        return code
+
+    def has(self, digest):
+        return digest in self.catalog['saves']
+
+    def write_part(self, batch):
+        """
+        Persist one ingest batch
+
+        Args:
+            batch: List of (hash, file, rows) from flatten_save
+        """
+        columns = {name: {col: [] for col, _ in cols} for name, cols in TABLES.items()}
+        for digest, source, rows in batch:
+            save_id = self.catalog['next_save_id']
+            self.catalog['next_save_id'] += 1
+            self.catalog['saves'][digest] = {'save_id': save_id, 'file': source}
+            for table, cols in TABLES.items():
+                for row in rows[table]:
+                    values = (save_id,) + tuple(row)
+                    for (col, kind), value in zip(cols, values):
+                        columns[table][col].append(self.code(value) if kind == 'cat' else value)
+
+        arrays = {}
+        for table, cols in TABLES.items():
+            for col, kind in cols:
+                dtype = np.float64 if kind == 'float' else np.int64
+                values = columns[table][col]
+                if kind == 'float':
+                    values = [np.nan if v is None else v for v in values]
+                # Codes and ids are small; int32 halves the store size
+                arrays[f"{table}__{col}"] = np.asarray(values, dtype=dtype if kind == 'float' else np.int32)
+
+        part_name = f"part-{int(time.time() * 1000)}"
+        if pq is not None:
+            part_dir = self.root / part_name
+            part_dir.mkdir()
+            for table, cols in TABLES.items():
+                pq.write_table(pa.table({col: arrays[f"{table}__{col}"] for col, _ in cols}),
+                               part_dir / f"{table}.parquet", compression='zstd')
+        else:
+            np.savez_compressed(self.root / f"{part_name}.npz", **arrays)
+        self.catalog['parts'].append(part_name)
+        self._save_catalog()
+        return part_name
+
+    def _save_catalog(self):
+        temp_path = self.root / (CATALOG_FILE + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.catalog, f, ensure_ascii=False)
+        os.replace(temp_path, self.root / CATALOG_FILE)
+
+    def load_table(self, table):
+        """Concatenate one table across all parts into a dict of column arrays"""
+        cols = TABLES[table]
+        chunks = {col: [] for col, _ in cols}
+        for part in self.catalog['parts']:
+            part_dir = self.root / part
+            if part_dir.is_dir():
+                if pq is None:
+                    raise RuntimeError(f"{part} is Parquet; install pyarrow to read it")
+                t = pq.read_table(part_dir / f"{table}.parquet")
+                for col, _ in cols:
+                    chunks[col].append(t.column(col).to_numpy())
+            else:
+                with np.load(self.root / f"{part}.npz") as npz:
+                    for col, _ in cols:
+                        chunks[col].append(npz[f"{table}__{col}"])
+        return {col: np.concatenate(chunks[col]) if chunks[col] else np.array([]) for col, _ in cols}
+
+    def decode(self, codes):
+        vocab = np.asarray(self.catalog['vocab'], dtype=object)
+        return vocab[codes] if len(vocab) else codes
+
+
+def collect_saves(paths):
+    saves = []
+    for p in paths:
+        p = Path(p)
+        if p.is_dir():
+            saves.extend(f for f in p.rglob('*') if f.suffix.lower() in SAVE_EXTENSIONS)
+        elif p.exists():
+            saves.append(p)
+    return sorted(set(saves))
+
+
+def cmd_ingest(args):
+    store = CorpusStore(args.store)
+    saves = collect_saves(args.paths)
+    started = time.perf_counter()
+
+    hashes = {}
+    for path in saves:
+        digest = file_hash(path)
+        if not store.has(digest) and digest not in hashes.values():
+            hashes[path] = digest
+    skipped = len(saves) - len(hashes)
+    print(f"[INFO] {len(saves)} saves found, {skipped} already loaded (or duplicate), {len(hashes)} to ingest")
+    if not hashes:
+        return
+
+    batch = []
+    failed = 0
+    todo = list(hashes)
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for path, rows in zip(todo, pool.map(flatten_save, todo, chunksize=8)):
+            if 'error' in rows:
+                print(f"[WARN] {path.name}: {rows['error']}")
+                failed += 1
+                continue
+            batch.append((hashes[path], str(path), rows))
+
+    if batch:
+        part = store.write_part(batch)
+        print(f"[OK] Wrote {part} with {len(batch)} saves")
+    elapsed = time.perf_counter() - started
+    print(f"[RESULT] Ingested {len(batch)} saves ({failed} failed) in {elapsed:.1f}s; "
+          f"store now holds {len(store.catalog['saves'])} saves")
+
+
+def cmd_info(args):
+    store = CorpusStore(args.store)
+    backend = 'parquet' if any((store.root / p).is_dir() for p in store.catalog['parts']) else 'npz'
+    print(f"[INFO] Store: {store.root} ({backend}, {len(store.catalog['parts'])} parts)")
+    print(f"[INFO] Saves: {len(store.catalog['saves'])}  Vocabulary: {len(store.catalog['vocab'])}")
+    for table in TABLES:
+        cols = store.load_table(table)
+        print(f"  {table:<10} {len(next(iter(cols.values()))):>12,} rows")
+
+
+def cmd_query(args):
+    """Filter one table and aggregate a value column, optionally grouped"""
+    store = CorpusStore(args.store)
+    cols = store.load_table(args.table)
+    kinds = dict(TABLES[args.table])
+
+    mask = np.ones(len(next(iter(cols.values()))), dtype=bool)
+    for clause in args.where or []:
+        key, _, value = clause.partition('=')
+        if key not in cols:
+            print(f"[ERROR] Unknown column '{key}' (columns: {', '.join(cols)})")
+            sys.exit(1)
+        if kinds[key] == 'cat':
+            code = store._codes.get(value)
+            mask &= cols[key] == (code if code is not None else -1)
+        else:
+            mask &= cols[key] == float(value)
+
+    value_col = args.value or next(col for col, kind in reversed(TABLES[args.table]) if kind == 'float')
+    values = cols[value_col][mask].astype(np.float64)
+    agg = {
+        'mean': np.nanmean, 'sum': np.nansum, 'min': np.nanmin, 'max': np.nanmax,
+        'median': np.nanmedian, 'count': lambda v: float(len(v)),
+        'p95': lambda v: np.nanpercentile(v, 95),
+    }[args.agg]
+
+    if not args.group_by:
+        print(f"{args.agg}({value_col}) = {agg(values) if len(values) else float('nan'):.6g}  (rows: {len(values)})")
+        return
+
+    keys = cols[args.group_by][mask]
+    uniq, inverse = np.unique(keys, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    bounds = np.searchsorted(inverse[order], np.arange(len(uniq) + 1))
+    labels = store.decode(uniq) if kinds[args.group_by] == 'cat' else uniq
+    results = []
+    for i, label in enumerate(labels):
+        group = values[order[bounds[i]:bounds[i + 1]]]
+        results.append((label, agg(group), len(group)))
+    if args.sort:
+        results.sort(key=lambda r: r[1], reverse=True)
+    print(f"{args.group_by:<32} {args.agg + '(' + value_col + ')':>20} {'rows':>10}")
+    for label, value, n in results[:args.limit]:
+        print(f"{str(label):<32} {value:>20.6g} {n:>10,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Decode a corpus of saves into a columnar analytics store')
+    parser.add_argument('--store', default=str(DEFAULT_STORE),
+                        help=f'Store directory (default: {DEFAULT_STORE})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_ingest = sub.add_parser('ingest', help='Decode saves and append them to the store')
+    p_ingest.add_argument('paths', nargs='+', help='Save files or directories')
+    p_ingest.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help='Worker processes')
+    p_ingest.set_defaults(func=cmd_ingest)
+
+    p_info = sub.add_parser('info', help='Show store contents')
+    p_info.set_defaults(func=cmd_info)
+
+    p_query = sub.add_parser('query', help='Filter and aggregate one table')
+    p_query.add_argument('table', choices=list(TABLES))
+    p_query.add_argument('--where', action='append', help='column=value filter (repeatable)')
+    p_query.add_argument('--group-by', help='Column to group by')
+    p_query.add_argument('--value', help='Column to aggregate (default: the last float column)')
+    p_query.add_argument('--agg', default='mean', choices=['mean', 'sum', 'min', 'max', 'median', 'count', 'p95'])
+    p_query.add_argument('--sort', action='store_true', help='Sort groups by the aggregate, descending')
+    p_query.add_argument('--limit', type=int, default=50, help='Max groups to print (default: 50)')
+    p_query.set_defaults(func=cmd_query)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
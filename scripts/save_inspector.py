@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Save File Inspector - Attribute serialized bytes to each subtree of a save
+Decodes .cgsave files (base64 + XOR, see save_codec.py) in chunks and parses
+the payload JSON incrementally, recording the byte span of every value down to
+--depth levels. Array indices are folded into "[]" so e.g. all nation histories
+are summed under nations[].history. The ranked report shows what
+compactSavePayload should trim next.
+
+Usage:
+    python save_inspector.py my_game.cgsave [--depth 3] [--top 40]
+    python save_inspector.py autosave.json --json > report.json
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from save_codec import SaveFormatError, SaveStream
+
+_WS = re.compile(rb'[ \t\r\n]*')
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_SCALAR = re.compile(rb'-?[0-9][0-9eE+\-.]*|true|false|null')
+
+
+class _Frame:
+    __slots__ = ('is_object', 'path', 'start', 'key', 'expect_key')
+
+    def __init__(self, is_object, path, start):
+        self.is_object = is_object
+        self.path = path
+        self.start = start
+        self.key = None
+        self.expect_key = is_object
+
+
+class JsonSizeScanner:
+    """
+    Incremental JSON scanner that sums the serialized size of every value per path
+
+    Feed decoded JSON bytes with feed(); call finish() at the end. Only paths up
+    to max_depth are recorded; deeper values still count towards their ancestors.
+
+    Attributes:
+        sizes: path -> total bytes
+        counts: path -> number of values seen at that path
+        total: bytes of the root value
+    """
+
+    def __init__(self, max_depth=3):
+        self.max_depth = max_depth
+        self.sizes = {}
+        self.counts = {}
+        self.depths = {}
+        self.total = 0
+        self.stack = []
+        self.buffer = b''
+        self.base = 0  # absolute offset of buffer[0]
+
+    def _child_path(self):
+        if not self.stack:
+            return ()
+        parent = self.stack[-1]
+        if parent.path is None or len(parent.path) >= self.max_depth:
+            return None
+        return parent.path + ((parent.key,) if parent.is_object else ('[]',))
+
+    def _record(self, path, size):
+        if path is None:
+            return
+        if not path:
+            self.total = size
+            return
+        name = _format_path(path)
+        self.sizes[name] = self.sizes.get(name, 0) + size
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.depths[name] = len(path)
+
+    def feed(self, data, final=False):
+        buf = self.buffer + data
+        pos = 0
+        end = len(buf)
+        while True:
+            pos = _WS.match(buf, pos).end()
+            if pos >= end:
+                break
+            c = buf[pos:pos + 1]
+            frame = self.stack[-1] if self.stack else None
+
+            if c == b'"':
+                m = _STRING_BODY.match(buf, pos + 1)
+                if m is None:
+                    break  # string continues in the next chunk
+                if frame is not None and frame.is_object and frame.expect_key:
+                    # Keys are only decoded where they become part of a recorded path
+                    if frame.path is not None and len(frame.path) < self.max_depth:
+                        frame.key = json.loads(buf[pos:m.end()])
+                    frame.expect_key = False
+                else:
+                    self._record(self._child_path(), m.end() - pos)
+                pos = m.end()
+            elif c in (b'{', b'['):
+                self.stack.append(_Frame(c == b'{', self._child_path(), self.base + pos))
+                pos += 1
+            elif c in (b'}', b']'):
+                closed = self.stack.pop()
+                size = self.base + pos + 1 - closed.start
+                if closed.path is not None:
+                    self._record(closed.path, size)
+                pos += 1
+            elif c == b',':
+                if frame is not None and frame.is_object:
+                    frame.expect_key = True
+                pos += 1
+            elif c == b':':
+                pos += 1
+            else:
+                m = _SCALAR.match(buf, pos)
+                if m is None and not final and end - pos < 6:
+                    break  # partial literal ('-', 'tr', 'fals') at the chunk edge
+                if m is None:
+                    raise ValueError(f"unexpected byte {c!r} at offset {self.base + pos}")
+                if m.end() == end and not final:
+                    break  # number may continue in the next chunk
+                self._record(self._child_path(), m.end() - pos)
+                pos = m.end()
+
+        self.buffer = buf[pos:]
+        self.base += pos
+
+    def finish(self):
+        self.feed(b'', final=True)
+        if self.stack or self.buffer.strip():
+            raise ValueError("truncated JSON payload")
+
+
+def _format_path(path):
+    out = ''
+    for part in path:
+        if part == '[]':
+            out += '[]'
+        else:
+            out += ('.' if out else '') + str(part)
+    return out
+
+
+def inspect_save(path, max_depth=3):
+    """
+    Scan one save and return its size report as a dict
+
+    Only one decoded chunk (plus any string spanning a chunk edge) is held in memory.
+    """
+    stream = SaveStream(path)
+    scanner = JsonSizeScanner(max_depth)
+    for chunk in stream:
+        scanner.feed(chunk)
+    scanner.finish()
+
+    rows = []
+    for name, size in scanner.sizes.items():
+        count = scanner.counts[name]
+        rows.append({
+            'path': name,
+            'depth': scanner.depths[name],
+            'bytes': size,
+            'share': size / scanner.total if scanner.total else 0.0,
+            'count': count,
+            'avg_bytes': size / count if count else 0.0,
+        })
+    rows.sort(key=lambda r: r['bytes'], reverse=True)
+    return {
+        'file': str(path),
+        'format': stream.format,
+        'obfuscated': stream.obfuscated,
+        'file_bytes': stream.file_bytes,
+        'json_bytes': scanner.total,
+        'updated_at': stream.wrapper.get('updatedAt'),
+        'subtrees': rows,
+    }
+
+
+def print_report(report, top, min_share):
+    kb = 1024
+    print("=" * 78)
+    print(f"   Save Inspector: {Path(report['file']).name}")
+    print("=" * 78)
+    wrapper = f"format {report['format']}, obfuscated" if report['obfuscated'] else "plain JSON"
+    print(f"[INFO] File: {report['file_bytes'] / kb:,.1f} KB ({wrapper})")
+    print(f"[INFO] Payload JSON: {report['json_bytes'] / kb:,.1f} KB")
+    if report['obfuscated'] and report['json_bytes']:
+        overhead = report['file_bytes'] / report['json_bytes'] - 1
+        print(f"[INFO] Wrapper overhead: {overhead:.0%} (base64)")
+    print()
+
+    top_level = [r for r in report['subtrees'] if r['depth'] == 1]
+    print("Top-level keys:")
+    print(f"  {'key':<40} {'KB':>10} {'share':>7}")
+    for r in top_level[:top]:
+        if r['share'] < min_share:
+            break
+        print(f"  {r['path']:<40} {r['bytes'] / kb:>10,.1f} {r['share']:>7.1%}")
+    print()
+
+    print("All subtrees (ranked):")
+    print(f"  {'path':<48} {'KB':>10} {'share':>7} {'count':>7} {'avg B':>9}")
+    shown = 0
+    for r in report['subtrees']:
+        if r['share'] < min_share or shown >= top:
+            break
+        print(f"  {r['path'][:48]:<48} {r['bytes'] / kb:>10,.1f} {r['share']:>7.1%} "
+              f"{r['count']:>7,} {r['avg_bytes']:>9,.0f}")
+        shown += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Attribute serialized bytes of .cgsave files to each subtree')
+    parser.add_argument('saves', nargs='+', help='.cgsave exports or plain JSON save payloads')
+    parser.add_argument('--depth', type=int, default=3, help='Deepest path level to attribute (default: 3)')
+    parser.add_argument('--top', type=int, default=40, help='Rows to show (default: 40)')
+    parser.add_argument('--min-share', type=float, default=0.001,
+                        help='Hide subtrees below this share of the payload (default: 0.001)')
+    parser.add_argument('--json', action='store_true', help='Print the reports as JSON')
+    args = parser.parse_args()
+
+    reports = []
+    for save in args.saves:
+        try:
+            reports.append(inspect_save(save, args.depth))
+        except (OSError, SaveFormatError, ValueError) as e:
+            print(f"[ERROR] {save}: {e}", file=sys.stderr)
+
+    if args.json:
+        json.dump(reports, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for i, report in enumerate(reports):
+            if i:
+                print()
+            print_report(report, args.top, args.min_share)
+
+    sys.exit(0 if len(reports) == len(args.saves) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Simulation Benchmark - Run simulateTick headlessly across scenarios and saves
+Starts N local node processes in parallel (sim_bench_runner.mjs), each stepping
+simulateTick from a seeded scenario in src/config/scenarios.js or a decoded
+save for K ticks. Collects per-tick wall time, heap usage and the per-section
+timings simulateTick already returns in _perf.sections, and reports
+p50/p95/p99 per scenario and epoch.
+
+The JSON report can be passed back as --baseline to flag regressions.
+
+Usage:
+    python sim_bench.py                                  # all scenarios, 200 ticks each
+    python sim_bench.py --scenario agrarian_realm --scenario british_empire --runs 3
+    python sim_bench.py --save late_game.cgsave --ticks 500 -j 4
+    python sim_bench.py --output bench.json
+    python sim_bench.py --baseline bench.json --threshold 0.10
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from save_codec import SaveFormatError, read_save_bytes
+
+from asset_paths import PROJECT_DIR, SCRIPT_DIR, SRC_DIR
+
+RUNNER = SCRIPT_DIR / 'sim_bench_runner.mjs'
+SCENARIOS_FILE = SRC_DIR / 'config' / 'scenarios.js'
+
+_SCENARIO_ID = re.compile(r"^ {8}id:\s*'([^']+)'", re.M)
+
+
+def list_scenarios():
+    """Scenario ids declared in SCENARIOS (top-level entries only)"""
+    return _SCENARIO_ID.findall(SCENARIOS_FILE.read_text(encoding='utf-8'))
+
+
+def percentile(sorted_values, q):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q
+    low = int(pos)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (pos - low)
+
+
+def run_job(job, node, ticks, warmup, timeout):
+    """
+    Run one runner process and parse its JSON lines
+
+    Returns:
+        Dict with 'job', 'ticks' (list of tick records) and 'error' (or None)
+    """
+    cmd = [node, str(RUNNER), '--ticks', str(ticks), '--warmup', str(warmup), '--seed', str(job['seed'])]
+    cmd += ['--save', job['save_json']] if job.get('save_json') else ['--scenario', job['scenario']]
+    started = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, cwd=PROJECT_DIR, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'job': job, 'ticks': [], 'error': f'timed out after {timeout}s'}
+
+    records = []
+    for line in proc.stdout.splitlines():
+        if line.startswith('{'):
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                pass
+    ticks_out = [r for r in records if r.get('type') == 'tick']
+    error = None
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or [f'exit code {proc.returncode}'])[-1]
+    return {'job': job, 'ticks': ticks_out, 'error': error, 'wall_s': time.perf_counter() - started}
+
+
+def summarize(results):
+    """Group tick records by (scenario, epoch) and compute latency and heap stats"""
+    groups = {}
+    for result in results:
+        for tick in result['ticks']:
+            key = (result['job']['name'], tick.get('epoch', 0))
+            groups.setdefault(key, []).append(tick)
+
+    summary = []
+    for (name, epoch), ticks in sorted(groups.items()):
+        ms = sorted(t['ms'] for t in ticks)
+        heap = [t['heapUsed'] for t in ticks]
+        sections = {}
+        for t in ticks:
+            for section, value in (t.get('sections') or {}).items():
+                sections.setdefault(section, []).append(value)
+        section_stats = {
+            section: {'p50': percentile(sorted(values), 0.50), 'p95': percentile(sorted(values), 0.95)}
+            for section, values in sections.items()
+        }
+        summary.append({
+            'scenario': name,
+            'epoch': epoch,
+            'ticks': len(ms),
+            'mean_ms': sum(ms) / len(ms),
+            'p50_ms': percentile(ms, 0.50),
+            'p95_ms': percentile(ms, 0.95),
+            'p99_ms': percentile(ms, 0.99),
+            'max_ms': ms[-1],
+            'heap_mean_mb': sum(heap) / len(heap) / 1e6,
+            'heap_peak_mb': max(heap) / 1e6,
+            'sections': dict(sorted(section_stats.items(), key=lambda kv: kv[1]['p95'], reverse=True)),
+        })
+    return summary
+
+
+def compare(summary, baseline, threshold):
+    """
+    Compare p95 against a previous report
+
+    Returns:
+        List of (scenario, epoch, base_p95, p95, change) for rows over threshold
+    """
+    base = {(r['scenario'], r['epoch']): r for r in baseline.get('summary', [])}
+    regressions = []
+    print(f"\n  {'scenario':<24} {'epoch':>5} {'base p95':>10} {'p95':>10} {'change':>8}")
+    for row in summary:
+        old = base.get((row['scenario'], row['epoch']))
+        if not old or not old['p95_ms']:
+            continue
+        change = row['p95_ms'] / old['p95_ms'] - 1
+        flag = '  <-- regression' if change > threshold else ''
+        print(f"  {row['scenario']:<24} {row['epoch']:>5} {old['p95_ms']:>10.2f} {row['p95_ms']:>10.2f} "
+              f"{change:>+8.1%}{flag}")
+        if change > threshold:
+            regressions.append((row['scenario'], row['epoch'], old['p95_ms'], row['p95_ms'], change))
+    return regressions
+
+
+def print_summary(summary, top_sections):
+    print(f"\n  {'scenario':<24} {'epoch':>5} {'ticks':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'max ms':>8} {'heap MB':>8}")
+    for row in summary:
+        print(f"  {row['scenario']:<24} {row['epoch']:>5} {row['ticks']:>6} {row['p50_ms']:>8.2f} "
+              f"{row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['max_ms']:>8.2f} {row['heap_peak_mb']:>8.1f}")
+        if top_sections:
+            hot = list(row['sections'].items())[:top_sections]
+            print("        " + ", ".join(f"{name} {stats['p95']:.2f}" for name, stats in hot))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark simulateTick across scenarios and saves')
+    parser.add_argument('--scenario', action='append', help='Scenario id (repeatable; default: all scenarios)')
+    parser.add_argument('--save', action='append', help='.cgsave or save JSON to start from (repeatable)')
+    parser.add_argument('--ticks', type=int, default=200, help='Measured ticks per run (default: 200)')
+    parser.add_argument('--warmup', type=int, default=10, help='Unmeasured warm-up ticks (default: 10)')
+    parser.add_argument('--runs', type=int, default=1, help='Runs per scenario with different seeds (default: 1)')
+    parser.add_argument('--seed', type=int, default=1, help='Seed of the first run (default: 1)')
+    parser.add_argument('--jobs', '-j', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='Parallel node processes (default: half the CPUs)')
+    parser.add_argument('--node', default='node', help='Node executable (default: node)')
+    parser.add_argument('--timeout', type=float, default=900, help='Seconds per run before it is killed')
+    parser.add_argument('--sections', type=int, default=3, help='Hottest tick sections to print per row')
+    parser.add_argument('--output', help='Write the JSON report here')
+    parser.add_argument('--baseline', help='Previous JSON report to compare p95 against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Relative p95 increase counted as a regression (default: 0.10)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("   simulateTick Benchmark")
+    print("=" * 70)
+
+    temp_dir = tempfile.TemporaryDirectory(prefix='sim_bench_')
+    sources = []
+    for save in args.save or []:
+        # The runner reads plain payload JSON; decode .cgsave wrappers here
+        try:
+            payload = read_save_bytes(save)
+        except (OSError, SaveFormatError) as e:
+            print(f"[ERROR] {save}: {e}")
+            sys.exit(1)
+        save_json = Path(temp_dir.name) / (Path(save).stem + '.json')
+        save_json.write_bytes(payload)
+        sources.append({'name': Path(save).stem, 'save_json': str(save_json)})
+    scenarios = args.scenario or ([] if args.save else list_scenarios())
+    sources += [{'name': s, 'scenario': s} for s in scenarios]
+
+    jobs = [dict(source, seed=args.seed + run) for source in sources for run in range(args.runs)]
+    print(f"[INFO] {len(jobs)} runs x {args.ticks} ticks ({args.warmup} warm-up), {args.jobs} parallel")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(lambda job: run_job(job, args.node, args.ticks, args.warmup, args.timeout), jobs))
+    temp_dir.cleanup()
+
+    for result in results:
+        if result['error']:
+            print(f"[ERROR] {result['job']['name']} (seed {result['job']['seed']}): {result['error']}")
+
+    summary = summarize(results)
+    print_summary(summary, args.sections)
+    print(f"\n[RESULT] {sum(len(r['ticks']) for r in results)} ticks measured in "
+          f"{time.perf_counter() - started:.1f}s")
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'ticks': args.ticks,
+        'warmup': args.warmup,
+        'runs': args.runs,
+        'node': subprocess.run([args.node, '--version'], capture_output=True, text=True).stdout.strip(),
+        'summary': summary,
+        'errors': [{'name': r['job']['name'], 'seed': r['job']['seed'], 'error': r['error']}
+                   for r in results if r['error']],
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"[OK] Report written to {args.output}")
+
+    failed = bool(report['errors'])
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(summary, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n[ERROR] {len(regressions)} scenario/epoch rows regressed by more than {args.threshold:.0%}")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
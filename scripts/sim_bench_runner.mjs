@@ -0,0 +1,242 @@
+// Headless simulateTick runner used by sim_bench.py
+//
+// Loads a scenario from src/config/scenarios.js (or a decoded save payload JSON),
+// then steps simulateTick for K ticks, feeding each result back into the next
+// tick's state the way useGameLoop does for the core fields. Math.random is
+// replaced by a seeded PRNG so runs are repeatable.
+//
+// Output is one JSON object per line on stdout:
+//   {"type":"tick","tick":0,"epoch":3,"ms":12.3,"heapUsed":...,"sections":{...}}
+//   {"type":"done","ticks":K,"totalMs":...}
+//
+// --capture FILE additionally writes each measured tick's input state and
+// simulateTick result (the worker's SIMULATE and RESULT payloads) to FILE, one
+// {"tick":N,"state":{...},"result":{...}} per line, for tick_delta.py.
+//
+// Usage:
+//   node scripts/sim_bench_runner.mjs --scenario agrarian_realm --ticks 200 --seed 1
+//   node scripts/sim_bench_runner.mjs --save decoded_save.json --ticks 200
+//   node scripts/sim_bench_runner.mjs --scenario agrarian_realm --ticks 50 --capture ticks.jsonl
+
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath, pathToFileURL } from 'url';
+import './node_src_loader.mjs';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+const rootDir = path.join(__dirname, '..');
+
+function parseArgs(argv) {
+    const args = { ticks: 100, warmup: 5, seed: 1, scenario: null, save: null, difficulty: null, capture: null };
+    for (let i = 0; i < argv.length; i++) {
+        const key = argv[i].replace(/^--/, '');
+        const value = argv[i + 1];
+        i++;
+        if (key === 'ticks' || key === 'warmup' || key === 'seed') {
+            args[key] = Number(value);
+        } else {
+            args[key] = value;
+        }
+    }
+    return args;
+}
+
+// mulberry32
+function seededRandom(seed) {
+    let a = seed >>> 0;
+    return () => {
+        a = (a + 0x6D2B79F5) >>> 0;
+        let t = a;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+const INITIAL_RESOURCES = {
+    food: 200, wood: 200, stone: 200, cloth: 80, plank: 0, brick: 0, iron: 0, tools: 0,
+    copper: 0, papyrus: 0, spice: 0, coffee: 0, coal: 0, steel: 0, silver: 400, science: 0, culture: 300,
+};
+
+const isTradable = (RESOURCES, key) => {
+    if (key === 'silver') return false;
+    const def = RESOURCES[key];
+    return !!def && def.type !== 'virtual';
+};
+
+// Mirrors the initial state builders in useGameState.js (which can't be imported
+// here because the hook module pulls in React and Capacitor)
+function buildScenarioState(config, scenario) {
+    const { RESOURCES, STRATA, COUNTRIES } = config;
+    const overrides = scenario.overrides || {};
+    const strataKeys = Object.keys(STRATA);
+    const perStratum = (fn) => Object.fromEntries(strataKeys.map(key => [key, fn(key)]));
+
+    const prices = {};
+    const resourceTaxRates = {};
+    Object.keys(RESOURCES).forEach(key => {
+        if (!isTradable(RESOURCES, key)) return;
+        prices[key] = Math.max(0.5, RESOURCES[key].basePrice || 1);
+        resourceTaxRates[key] = 0.05;
+    });
+
+    const popStructure = overrides.popStructure || {};
+    const scenarioPopulation = Object.values(popStructure).reduce((sum, v) => sum + (Number(v) || 0), 0);
+    const population = typeof overrides.population === 'number' ? overrides.population : (scenarioPopulation || 5);
+
+    const nations = COUNTRIES.map(nation => {
+        const wealth = nation.wealth ?? 800;
+        const basePopulation = 1000 + Math.floor(Math.random() * 500);
+        return {
+            ...nation,
+            relation: overrides.nationRelations?.[nation.id] ?? 50,
+            treaties: Array.isArray(nation.treaties) ? nation.treaties : [],
+            organizationMemberships: [],
+            overseasAssets: [],
+            warScore: 0,
+            isAtWar: false,
+            wealth,
+            budget: Math.floor(wealth * 0.5),
+            inventory: {},
+            enemyLosses: 0,
+            warDuration: 0,
+            militaryStrength: 1.0,
+            population: basePopulation,
+            wealthTemplate: wealth,
+            economyTraits: { ...nation.economyTraits, baseWealth: wealth, basePopulation },
+        };
+    });
+
+    return {
+        resources: { ...INITIAL_RESOURCES, ...(overrides.resources || {}) },
+        buildings: { farm: 1, lumber_camp: 1, loom_house: 1, ...(overrides.buildings || {}) },
+        buildingUpgrades: overrides.buildingUpgrades || {},
+        techsUnlocked: overrides.techsUnlocked || [],
+        epoch: typeof overrides.epoch === 'number' ? overrides.epoch : 0,
+        population,
+        maxPop: Math.max(overrides.maxPop || 10, population),
+        maxPopBonus: overrides.maxPopBonus || 0,
+        popStructure,
+        classApproval: overrides.classApproval || {},
+        classInfluence: overrides.classInfluence || {},
+        classWealth: { ...perStratum(key => STRATA[key].startingWealth || 0), ...(overrides.classWealth || {}) },
+        classWealthHistory: perStratum(() => []),
+        classNeedsHistory: perStratum(() => []),
+        livingStandardStreaks: perStratum(() => ({ streak: 0, level: null })),
+        currentStability: typeof overrides.stability === 'number' ? overrides.stability : 50,
+        rulingCoalition: overrides.rulingCoalition || [],
+        army: overrides.army || {},
+        market: {
+            prices: { ...prices, ...(overrides.marketPrices || {}) },
+            demand: {}, supply: {}, wages: {}, priceHistory: {}, supplyHistory: {}, demandHistory: {},
+        },
+        taxPolicies: {
+            headTaxRates: perStratum(() => 1),
+            resourceTaxRates,
+            businessTaxRates: {},
+            exportTariffMultipliers: {},
+            importTariffMultipliers: {},
+        },
+        nations,
+        decrees: [],
+        activeDecrees: {},
+        merchantState: { pendingTrades: [], lastTradeTime: 0 },
+        tradeRoutes: { routes: [] },
+        gameSpeed: 1,
+        tick: 0,
+        daysElapsed: 0,
+    };
+}
+
+// Save payloads name a few fields differently from simulateTick's parameters
+function buildSaveState(payload) {
+    return {
+        ...payload,
+        tradeRoutes: Array.isArray(payload.tradeRoutes?.routes) ? payload.tradeRoutes : { routes: [] },
+        currentStability: payload.stability ?? 50,
+        previousLegitimacy: payload.legitimacy ?? 0,
+        gameSpeed: 1,
+        tick: payload.daysElapsed || 0,
+    };
+}
+
+// Fields of the simulateTick result that become the next tick's input
+function applyResult(state, result) {
+    const next = { ...state };
+    const copy = [
+        'resources', 'population', 'popStructure', 'birthAccumulator', 'maxPop', 'classApproval',
+        'classInfluence', 'classWealth', 'nations', 'merchantState', 'livingStandardStreaks',
+        'buildingUpgrades', 'migrationCooldowns', 'diplomacyOrganizations', 'overseasInvestments',
+        'foreignInvestments', 'activeBuffs', 'activeDebuffs', 'tradeOpportunities', 'army',
+    ];
+    copy.forEach(key => {
+        if (result[key] !== undefined) next[key] = result[key];
+    });
+    if (result.tradeRoutes) next.tradeRoutes = result.tradeRoutes;
+    if (result.market) next.market = { ...state.market, ...result.market };
+    if (typeof result.stability === 'number') next.currentStability = result.stability;
+    if (typeof result.legitimacy === 'number') next.previousLegitimacy = result.legitimacy;
+    if (result.taxShock) next.previousTaxShock = result.taxShock;
+    next.daysElapsed = (state.daysElapsed || 0) + 1;
+    next.tick = (state.tick || 0) + 1;
+    return next;
+}
+
+async function main() {
+    const args = parseArgs(process.argv.slice(2));
+    // stdout carries the JSON lines; simulation logging goes to stderr
+    console.log = console.error;
+    console.info = console.error;
+    Math.random = seededRandom(args.seed);
+
+    const srcUrl = (relative) => pathToFileURL(path.join(rootDir, 'src', relative)).href;
+    const { simulateTick } = await import(srcUrl('logic/simulation.js'));
+
+    let state;
+    if (args.save) {
+        state = buildSaveState(JSON.parse(fs.readFileSync(args.save, 'utf8')));
+    } else {
+        const config = await import(srcUrl('config/index.js'));
+        const { getScenarioById } = await import(srcUrl('config/scenarios.js'));
+        const scenario = getScenarioById(args.scenario);
+        if (!scenario) {
+            console.error(`Unknown scenario: ${args.scenario}`);
+            process.exit(2);
+        }
+        state = buildScenarioState(config, scenario);
+    }
+    if (args.difficulty) state.difficulty = args.difficulty;
+
+    const write = (obj) => process.stdout.write(JSON.stringify(obj) + '\n');
+    const captureFd = args.capture ? fs.openSync(args.capture, 'w') : null;
+    const runStart = performance.now();
+    for (let i = 0; i < args.warmup + args.ticks; i++) {
+        const start = performance.now();
+        const result = simulateTick(state);
+        const ms = performance.now() - start;
+        if (captureFd !== null && i >= args.warmup) {
+            // Serialized after timing, so capturing does not skew ms
+            fs.writeSync(captureFd, JSON.stringify({ tick: i - args.warmup, state, result }) + '\n');
+        }
+        state = applyResult(state, result);
+        if (i < args.warmup) continue;
+        write({
+            type: 'tick',
+            tick: i - args.warmup,
+            epoch: state.epoch ?? 0,
+            ms,
+            heapUsed: process.memoryUsage().heapUsed,
+            nations: state.nations?.length || 0,
+            population: state.population,
+            sections: result?._perf?.sections || null,
+        });
+    }
+    if (captureFd !== null) fs.closeSync(captureFd);
+    write({ type: 'done', ticks: args.ticks, totalMs: performance.now() - runStart });
+}
+
+main().catch(error => {
+    console.error(error.stack || error.message);
+    process.exit(1);
+});
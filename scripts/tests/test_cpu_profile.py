@@ -0,0 +1,61 @@
+"""Stack folding and run-directory handling in cpu_profile.py"""
+
+import json
+
+from cpu_profile import load_profiles, profile_files
+
+
+def frame(name, line=0):
+    # V8 pseudo-frames such as (root) carry no script URL
+    url = '' if name.startswith('(') else 'file:///app/sim.js'
+    return {'functionName': name, 'url': url, 'lineNumber': line}
+
+
+# (root) -> main -> [load -> compile, simulateTick -> step], plus a GC pseudo-frame
+PROFILE = {
+    'nodes': [
+        {'id': 1, 'callFrame': frame('(root)'), 'children': [2, 7]},
+        {'id': 2, 'callFrame': frame('main', 1), 'children': [3, 5]},
+        {'id': 3, 'callFrame': frame('load', 2), 'children': [4]},
+        {'id': 4, 'callFrame': frame('compile', 3)},
+        {'id': 5, 'callFrame': frame('simulateTick', 4), 'children': [6]},
+        {'id': 6, 'callFrame': frame('step', 5)},
+        {'id': 7, 'callFrame': frame('(garbage collector)')},
+    ],
+    'startTime': 0,
+    'endTime': 100,
+    'samples': [4, 6, 6, 5, 7, 4],
+    # Each sample is weighted by the delta that follows it
+    'timeDeltas': [0, 10, 10, 10, 10, 10],
+}
+
+
+def write(path, data=PROFILE):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+def test_only_stacks_under_the_root_are_folded(tmp_path):
+    profile = load_profiles([write(tmp_path / 'a.cpuprofile')])
+    assert profile.sampled_us == 40
+    assert profile.excluded_us == 10
+    assert set(profile.stacks) == {
+        'simulateTick (/app/sim.js:5);step (/app/sim.js:6)',
+        'simulateTick (/app/sim.js:5)',
+        '(garbage collector)',
+    }
+    assert profile.total_us['simulateTick (/app/sim.js:5)'] == 30
+
+
+def test_whole_process_without_a_root(tmp_path):
+    profile = load_profiles([write(tmp_path / 'a.cpuprofile')], root='')
+    assert profile.sampled_us == 50
+    assert profile.excluded_us == 0
+    assert profile.self_us['compile (/app/sim.js:4)'] == 10
+
+
+def test_run_directory_resolves_to_main_thread_profiles(tmp_path):
+    main = write(tmp_path / 'CPU.20260101.120000.4242.0.001.cpuprofile')
+    write(tmp_path / 'CPU.20260101.120000.4242.1.002.cpuprofile')
+    assert profile_files(tmp_path) == [main]
+    assert profile_files(main) == [main]
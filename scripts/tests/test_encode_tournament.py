@@ -0,0 +1,94 @@
+"""Winner selection and size reporting in encode_tournament.py"""
+
+import sys
+
+import pytest
+from PIL import Image
+
+import encode_tournament
+import pixel_cache
+from encode_tournament import is_lossy_source, pick_winner, size_change
+
+
+def result(candidate, size, ssim):
+    return {'candidate': candidate, 'data': b'', 'size': size, 'ssim': ssim}
+
+
+def test_smallest_passing_candidate_wins():
+    results = [result('a', 300, 0.99), result('b', 200, 0.98), result('c', 100, 0.90), None]
+    winner, reason = pick_winner(results, 0.97, source_size=1000, min_saving=0.1)
+    assert reason is None
+    assert winner['candidate'] == 'b'
+
+
+def test_no_candidate_passes_the_gate():
+    assert pick_winner([result('a', 100, 0.5), None], 0.97) == (None, 'gate')
+
+
+def test_original_kept_when_winner_is_larger():
+    # A 49 KB q40 source must not be replaced by a 57 KB q75 encoding
+    results = [result('webp_q75_m4', 57 * 1024, 0.99)]
+    assert pick_winner(results, 0.97, source_size=49 * 1024, min_saving=0.1) == (None, 'saving')
+
+
+def test_original_kept_when_saving_is_below_the_margin():
+    results = [result('webp_q85_m6', 990, 0.99)]
+    assert pick_winner(results, 0.97, source_size=1000, min_saving=0.1) == (None, 'saving')
+    winner, _ = pick_winner(results, 0.97, source_size=1000, min_saving=0.0)
+    assert winner['candidate'] == 'webp_q85_m6'
+
+
+def test_size_change_sign():
+    assert size_change(49, 57) == '+16%'
+    assert size_change(100, 83) == '-17%'
+    assert size_change(0, 10) == '+0%'
+
+
+def test_lossy_source_detection(tmp_path):
+    img = Image.new('RGB', (16, 16), (200, 80, 40))
+    paths = {
+        'lossy.webp': {'format': 'WEBP', 'quality': 40},
+        'lossless.webp': {'format': 'WEBP', 'lossless': True},
+        'photo.jpg': {'format': 'JPEG'},
+        'art.png': {'format': 'PNG'},
+    }
+    for name, options in paths.items():
+        img.save(tmp_path / name, **options)
+    rgba = Image.new('RGBA', (16, 16), (200, 80, 40, 128))
+    rgba.save(tmp_path / 'alpha.webp', format='WEBP', quality=40)
+
+    assert is_lossy_source(tmp_path / 'lossy.webp')
+    assert is_lossy_source(tmp_path / 'alpha.webp')
+    assert is_lossy_source(tmp_path / 'photo.jpg')
+    assert not is_lossy_source(tmp_path / 'lossless.webp')
+    assert not is_lossy_source(tmp_path / 'art.png')
+
+
+def run_tournament(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, 'argv', ['encode_tournament.py', *args, '--jobs', '1', '--no-pixel-cache'])
+    with pytest.raises(SystemExit) as exit_info:
+        encode_tournament.main()
+    assert exit_info.value.code == 0
+    return capsys.readouterr().out
+
+
+def test_webp_winner_is_up_to_date_on_the_next_run(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(encode_tournament, 'CACHE_DIR', tmp_path / 'cache')
+    monkeypatch.setattr(encode_tournament, 'WINNERS_FILE', tmp_path / 'cache' / 'winners.json')
+    monkeypatch.setenv(pixel_cache.ENABLED_ENV, '1')
+    images = tmp_path / 'images'
+    images.mkdir()
+    # A smooth gradient: a large PNG that webp encodes far smaller
+    Image.linear_gradient('L').convert('RGB').save(images / 'sky.png')
+
+    out = run_tournament(monkeypatch, capsys, str(images), '--formats', 'webp')
+    assert '1 in tournament' in out
+    webp = images / 'sky.webp'
+    first = webp.read_bytes()
+    mtime = webp.stat().st_mtime_ns
+
+    out = run_tournament(monkeypatch, capsys, str(images), '--formats', 'webp')
+    # sky.webp is the winner of sky.png, not a second source
+    assert '[INFO] 1 images: 0 in tournament, 0 reusing recorded winner, 1 already up to date' in out
+    assert webp.read_bytes() == first
+    assert webp.stat().st_mtime_ns == mtime
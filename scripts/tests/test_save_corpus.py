@@ -0,0 +1,43 @@
+"""Row extraction in save_corpus.py"""
+
+import json
+
+from save_codec import encode_save
+from save_corpus import flatten_save
+
+PAYLOAD = {
+    'daysElapsed': 120,
+    'epoch': 2,
+    'population': 345,
+    'updatedAt': 1700000000000,
+    'resources': {'food': 50.5, 'wood': 12},
+    'market': {'prices': {'food': 1.25}},
+    'history': {'population': [300, 320, 345]},
+}
+
+
+def test_json_bytes_is_the_decoded_payload(tmp_path):
+    payload = json.dumps(PAYLOAD, separators=(',', ':')).encode('utf-8')
+    path = tmp_path / 'slot.cgsave'
+    path.write_bytes(encode_save(payload, updated_at=PAYLOAD['updatedAt']))
+    assert path.stat().st_size > len(payload)
+
+    rows = flatten_save(path)
+    assert rows['saves'] == [(120.0, 2.0, 345.0, len(payload), 1700000000000.0)]
+    assert sorted(rows['resources']) == [('food', 50.5), ('wood', 12.0)]
+    assert rows['prices'] == [('food', 1.25)]
+    assert rows['series'] == [('history.population', 0, 300.0), ('history.population', 1, 320.0),
+                              ('history.population', 2, 345.0)]
+
+
+def test_plain_json_save(tmp_path):
+    payload = json.dumps(PAYLOAD).encode('utf-8')
+    path = tmp_path / 'slot.json'
+    path.write_bytes(payload)
+    assert flatten_save(path)['saves'][0][3] == len(payload)
+
+
+def test_undecodable_save_is_reported(tmp_path):
+    path = tmp_path / 'broken.json'
+    path.write_text('{"daysElapsed": ', encoding='utf-8')
+    assert 'error' in flatten_save(path)
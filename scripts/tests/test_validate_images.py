@@ -0,0 +1,76 @@
+"""Geometry and content rules in validate_images.py"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import validate_images
+from validate_images import DEFAULT_RULES, check_content, check_geometry, generate_validated, parse_aspect
+
+
+def gradient(width, height):
+    """Detailed enough to survive the thumbnail: every colour channel varies"""
+    x = np.linspace(0, 255, width)[None, :].repeat(height, 0)
+    y = np.linspace(0, 255, height)[:, None].repeat(width, 1)
+    rgb = np.stack([x, y, (x + y) / 2], axis=-1).astype(np.uint8)
+    return Image.fromarray(rgb, 'RGB')
+
+
+@pytest.mark.parametrize('size', [(1024, 1024), (1024, 585), (1024, 576), (1024, 571), (688, 384)])
+def test_default_geometry_accepts_shipped_sizes(size):
+    assert check_geometry(size, DEFAULT_RULES) is None
+
+
+def test_default_geometry_rejects_odd_shapes():
+    assert 'too small' in check_geometry((256, 256), DEFAULT_RULES)
+    assert 'aspect ratio' in check_geometry((1024, 400), DEFAULT_RULES)
+
+
+def test_parse_aspect():
+    assert parse_aspect('16:9') == (16 / 9,)
+    assert parse_aspect('1:1, 16:9') == (1.0, 16 / 9)
+    assert parse_aspect('0') == ()
+    rules = dict(DEFAULT_RULES, aspect=parse_aspect('16:9'))
+    assert 'aspect ratio' in check_geometry((1024, 1024), rules)
+
+
+def test_blank_image_rejected(tmp_path):
+    path = tmp_path / 'blank.png'
+    Image.new('RGB', (512, 512), (255, 255, 255)).save(path)
+    assert 'blank' in check_content(path, DEFAULT_RULES)
+
+
+def test_transparent_background_is_ignored(tmp_path):
+    # A cut-out sprite: most pixels are transparent black, the sprite itself is detailed
+    canvas = np.zeros((512, 512, 4), dtype=np.uint8)
+    canvas[128:384, 128:384, :3] = np.asarray(gradient(256, 256))
+    canvas[128:384, 128:384, 3] = 255
+    path = tmp_path / 'sprite.png'
+    Image.fromarray(canvas, 'RGBA').save(path)
+    assert check_content(path, DEFAULT_RULES) is None
+
+    empty = tmp_path / 'empty.png'
+    Image.new('RGBA', (512, 512), (0, 0, 0, 0)).save(empty)
+    assert 'transparent' in check_content(empty, DEFAULT_RULES)
+
+
+def test_generate_validated_retries_rejected_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_images, 'QUARANTINE_DIR', tmp_path / 'quarantine')
+    output = tmp_path / 'out' / 'event.png'
+    output.parent.mkdir()
+    images = [Image.new('RGB', (1024, 576), (0, 0, 0)), gradient(1024, 576)]
+
+    def generate():
+        images.pop(0).save(output)
+        return True
+
+    assert generate_validated(generate, output, DEFAULT_RULES, max_attempts=2)
+    assert not images
+    assert (tmp_path / 'quarantine' / 'out' / 'event.png').exists()
+
+
+def test_generate_validated_skips_existing_images(tmp_path):
+    output = tmp_path / 'event.png'
+    Image.new('RGB', (16, 16)).save(output)
+    assert generate_validated(lambda: True, output, DEFAULT_RULES)
+    assert output.exists()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Tick Delta Analyzer - Size the worker message payload field by field
+useSimulationWorker.js posts the whole game state to simulation.worker.js
+every tick and the worker posts the whole simulateTick result back, both
+through structured clone. This tool takes a sequence of snapshots and, for
+every key down to --depth levels, measures its serialized size and how often
+it actually changes from one snapshot to the next:
+
+  - captured ticks: `capture` runs sim_bench_runner.mjs --capture, which writes
+    each tick's input state and result (the SIMULATE and RESULT payloads) as
+    JSON lines; the two directions are analyzed separately
+  - consecutive autosaves: .cgsave exports or save JSON, ordered by daysElapsed
+
+Array elements are matched by their `id` field when every element has one
+(so a nation inserted at the front does not mark all later ones as changed),
+otherwise by index, and folded into "[]" in the report: nations[].history sums
+over all nations.
+
+A delta protocol is estimated at each depth: per transition it sends every
+value at that depth (or a shallower leaf) whose serialized bytes changed,
+plus PATH_OVERHEAD bytes and the path per changed or removed value. The
+ranked table lists the fields whose bytes are re-sent unchanged most, i.e.
+what dominates transfer cost while rarely changing.
+
+Usage:
+    python tick_delta.py capture --scenario agrarian_realm --ticks 100 --output ticks.jsonl
+    python tick_delta.py analyze ticks.jsonl [--depth 3] [--top 30]
+    python tick_delta.py analyze autosave_*.cgsave --json > delta.json
+"""
+
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from save_codec import SaveFormatError, load_save, read_save_bytes
+
+from asset_paths import PROJECT_DIR, SCRIPT_DIR
+
+RUNNER = SCRIPT_DIR / 'sim_bench_runner.mjs'
+
+# Bytes a delta message spends per changed value besides the path and value
+# ({"p":...,"v":...} framing in JSON, or a tag + length in a binary protocol)
+PATH_OVERHEAD = 8
+
+
+def _dumps(value):
+    """Compact JSON bytes, as JSON.stringify writes them"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _element_keys(items):
+    """Stable keys for array elements: 'id=<id>' when every element has a unique id, else the index"""
+    ids = [item.get('id') if isinstance(item, dict) else None for item in items]
+    if items and all(isinstance(i, (str, int)) for i in ids) and len(set(ids)) == len(ids):
+        return [f"id={i}" for i in ids]
+    return [str(n) for n in range(len(items))]
+
+
+def flatten(value, max_depth):
+    """
+    Serialized size and digest of every value down to max_depth
+
+    Parents are assembled from their children's bytes, so each leaf is
+    serialized once. Returns {path tuple: (size, digest, expanded)}; path
+    parts are keys, or (element key,) tuples for array elements, and expanded
+    is True for containers whose children are listed.
+    """
+    nodes = {}
+
+    def walk(node, path, depth):
+        if depth < max_depth and isinstance(node, dict) and node:
+            parts = [_dumps(key) + b':' + walk(child, path + (key,), depth + 1) for key, child in node.items()]
+            data = b'{' + b','.join(parts) + b'}'
+        elif depth < max_depth and isinstance(node, list) and node:
+            keys = _element_keys(node)
+            data = b'[' + b','.join(walk(child, path + ((key,),), depth + 1) for key, child in zip(keys, node)) + b']'
+        else:
+            data = _dumps(node)
+            nodes[path] = (len(data), hashlib.blake2b(data, digest_size=8).digest(), False)
+            return data
+        nodes[path] = (len(data), hashlib.blake2b(data, digest_size=8).digest(), True)
+        return data
+
+    walk(value, (), 0)
+    return nodes
+
+
+def folded(path):
+    """Report label of a path: array element keys become []"""
+    out = ''
+    for part in path:
+        if isinstance(part, tuple):
+            out += '[]'
+        else:
+            out += ('.' if out else '') + str(part)
+    return out or '(root)'
+
+
+def _path_bytes(path):
+    return len(folded(path)) + sum(len(part[0]) for part in path if isinstance(part, tuple))
+
+
+class DeltaStats:
+    """Accumulates per-field sizes and change counts over consecutive snapshots of one channel"""
+
+    def __init__(self, name, max_depth):
+        self.name = name
+        self.max_depth = max_depth
+        self.previous = None
+        self.snapshots = 0
+        self.transitions = 0
+        self.full_bytes = []
+        self.delta_bytes = defaultdict(list)                # depth -> bytes per transition
+        self.fields = defaultdict(lambda: [0, 0, 0, 0])     # label -> [bytes, changed bytes, values, changed values]
+        self.depths = {}
+
+    def add(self, snapshot):
+        nodes = flatten(snapshot, self.max_depth)
+        self.snapshots += 1
+        self.full_bytes.append(nodes[()][0])
+        previous, self.previous = self.previous, nodes
+        if previous is None:
+            return
+        self.transitions += 1
+        delta = [0] * (self.max_depth + 1)
+        for path, (size, digest, expanded) in nodes.items():
+            depth = len(path)
+            old = previous.get(path)
+            changed = old is None or old[1] != digest
+            label = folded(path)
+            self.depths[label] = depth
+            field = self.fields[label]
+            field[0] += size
+            field[2] += 1
+            if changed:
+                field[1] += size
+                field[3] += 1
+                # The value is one unit of the delta at its own depth, and at every
+                # deeper level when it is a leaf there
+                for level in range(depth, self.max_depth + 1) if not expanded else (depth,):
+                    delta[level] += size + _path_bytes(path) + PATH_OVERHEAD
+        for path, (_, _, expanded) in previous.items():
+            if path not in nodes:
+                for level in range(len(path), self.max_depth + 1) if not expanded else (len(path),):
+                    delta[level] += _path_bytes(path) + PATH_OVERHEAD
+        for level in range(self.max_depth + 1):
+            self.delta_bytes[level].append(delta[level])
+
+    def report(self):
+        n = max(self.transitions, 1)
+        rows = []
+        for label, (size, changed, values, changed_values) in self.fields.items():
+            rows.append({
+                'path': label,
+                'depth': self.depths[label],
+                'avg_bytes': size / n,
+                'avg_changed_bytes': changed / n,
+                'avg_unchanged_bytes': (size - changed) / n,
+                'change_rate': changed_values / values if values else 0.0,
+                'values': values / n,
+            })
+        rows.sort(key=lambda r: r['avg_unchanged_bytes'], reverse=True)
+        full = sum(self.full_bytes[1:]) / n if self.transitions else 0.0
+        protocols = []
+        for level in range(self.max_depth + 1):
+            sent = self.delta_bytes[level]
+            avg = sum(sent) / len(sent) if sent else 0.0
+            protocols.append({
+                'depth': level,
+                'avg_bytes': avg,
+                'max_bytes': max(sent) if sent else 0,
+                'saving': 1 - avg / full if full else 0.0,
+            })
+        return {
+            'channel': self.name,
+            'snapshots': self.snapshots,
+            'transitions': self.transitions,
+            'avg_full_bytes': full,
+            'max_full_bytes': max(self.full_bytes) if self.full_bytes else 0,
+            'delta': protocols,
+            'fields': rows,
+        }
+
+
+def iter_capture(path):
+    """(channel, snapshot) pairs of a --capture JSON lines file"""
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise SaveFormatError(f"{path}:{line_no}: not a JSON line ({e})") from e
+            if 'state' in record or 'result' in record:
+                for channel in ('state', 'result'):
+                    if record.get(channel) is not None:
+                        yield channel, record[channel]
+            else:
+                yield 'state', record
+
+
+def load_saves(paths):
+    """Decoded save payloads, ordered by daysElapsed when every save has it"""
+    saves = [(path, load_save(path)) for path in paths]
+    if all(isinstance(payload.get('daysElapsed'), (int, float)) for _, payload in saves):
+        saves.sort(key=lambda item: item[1]['daysElapsed'])
+    else:
+        print("[WARN] Not every save has daysElapsed; using the order given")
+    return saves
+
+
+def analyze(inputs, max_depth):
+    """Run DeltaStats over capture files and/or saves; returns one report per channel"""
+    channels = {}
+
+    def stats(name):
+        if name not in channels:
+            channels[name] = DeltaStats(name, max_depth)
+        return channels[name]
+
+    save_paths = []
+    for path in inputs:
+        if path.endswith('.jsonl'):
+            for channel, snapshot in iter_capture(path):
+                stats(channel).add(snapshot)
+        else:
+            save_paths.append(path)
+    if save_paths:
+        for path, payload in load_saves(save_paths):
+            stats('save').add(payload)
+    return [s.report() for s in channels.values()]
+
+
+def fmt_kb(size):
+    return f"{size / 1024:,.1f}"
+
+
+def print_report(report, top, min_bytes):
+    title = {'state': 'main -> worker (SIMULATE payload)', 'result': 'worker -> main (RESULT payload)',
+             'save': 'consecutive saves'}.get(report['channel'], report['channel'])
+    print("=" * 78)
+    print(f"   Tick Delta: {title}")
+    print("=" * 78)
+    print(f"[INFO] {report['snapshots']} snapshots, {report['transitions']} transitions")
+    if not report['transitions']:
+        print("[WARN] Need at least two snapshots to measure changes")
+        return
+    print(f"[INFO] Full payload: {fmt_kb(report['avg_full_bytes'])} KB avg, "
+          f"{fmt_kb(report['max_full_bytes'])} KB max per message")
+    print()
+    print("Delta protocol estimate (changed values at each depth):")
+    for p in report['delta'][1:]:
+        print(f"  depth {p['depth']}:  {fmt_kb(p['avg_bytes']):>10} KB avg  {fmt_kb(p['max_bytes']):>10} KB max  "
+              f"saves {p['saving']:.1%}")
+    print()
+    print("Fields re-sent unchanged (ranked by unchanged KB per message):")
+    print(f"  {'path':<44} {'KB':>9} {'unchanged':>10} {'changes':>8} {'values':>7}")
+    shown = 0
+    for r in report['fields']:
+        if shown >= top or r['avg_unchanged_bytes'] < min_bytes:
+            break
+        if r['depth'] == 0:
+            continue
+        print(f"  {r['path'][:44]:<44} {fmt_kb(r['avg_bytes']):>9} {fmt_kb(r['avg_unchanged_bytes']):>10} "
+              f"{r['change_rate']:>8.0%} {r['values']:>7,.0f}")
+        shown += 1
+
+
+def cmd_capture(args):
+    cmd = [args.node, str(RUNNER), '--ticks', str(args.ticks), '--warmup', str(args.warmup),
+           '--seed', str(args.seed), '--capture', str(Path(args.output).resolve())]
+    temp_json = None
+    if args.save:
+        # The runner reads plain payload JSON; decode .cgsave wrappers here
+        try:
+            payload = read_save_bytes(args.save)
+        except (OSError, SaveFormatError) as e:
+            print(f"[ERROR] {args.save}: {e}")
+            return 1
+        temp_json = Path(args.output).with_suffix('.start.json')
+        temp_json.write_bytes(payload)
+        cmd += ['--save', str(temp_json.resolve())]
+    else:
+        cmd += ['--scenario', args.scenario]
+    print(f"[INFO] Capturing {args.ticks} ticks to {args.output}")
+    try:
+        proc = subprocess.run(cmd, cwd=PROJECT_DIR, capture_output=True, text=True)
+    except FileNotFoundError:
+        print(f"[ERROR] {args.node} not found; install Node.js or pass --node")
+        return 1
+    finally:
+        if temp_json is not None:
+            temp_json.unlink(missing_ok=True)
+    if proc.returncode != 0:
+        print(f"[ERROR] Runner failed: {(proc.stderr.strip().splitlines() or ['no output'])[-1]}")
+        return 1
+    print(f"[OK] Wrote {Path(args.output).stat().st_size / 1024 / 1024:,.1f} MB")
+    return 0
+
+
+def cmd_analyze(args):
+    try:
+        reports = analyze(args.inputs, args.depth)
+    except (OSError, SaveFormatError) as e:
+        print(f"[ERROR] {e}")
+        return 1
+    if args.json:
+        json.dump(reports, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+    for i, report in enumerate(reports):
+        if i:
+            print()
+        print_report(report, args.top, args.min_bytes)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure per-field size and change rate between ticks or saves')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_capture = sub.add_parser('capture', help='Run the headless simulation and capture each tick')
+    source = p_capture.add_mutually_exclusive_group(required=True)
+    source.add_argument('--scenario', help='Scenario id from src/config/scenarios.js')
+    source.add_argument('--save', help='.cgsave or save JSON to start from')
+    p_capture.add_argument('--output', required=True, help='Capture file (.jsonl)')
+    p_capture.add_argument('--ticks', type=int, default=100, help='Ticks to capture (default: 100)')
+    p_capture.add_argument('--warmup', type=int, default=5, help='Uncaptured warm-up ticks (default: 5)')
+    p_capture.add_argument('--seed', type=int, default=1)
+    p_capture.add_argument('--node', default='node', help='Node executable (default: node)')
+
+    p_analyze = sub.add_parser('analyze', help='Report sizes, change rates and delta estimates')
+    p_analyze.add_argument('inputs', nargs='+', help='Capture .jsonl files, or .cgsave/save JSON snapshots')
+    p_analyze.add_argument('--depth', type=int, default=3, help='Deepest path level to track (default: 3)')
+    p_analyze.add_argument('--top', type=int, default=30, help='Fields to show (default: 30)')
+    p_analyze.add_argument('--min-bytes', type=float, default=64,
+                           help='Hide fields re-sending fewer unchanged bytes per message (default: 64)')
+    p_analyze.add_argument('--json', action='store_true', help='Print the reports as JSON')
+
+    args = parser.parse_args()
+    return cmd_capture(args) if args.command == 'capture' else cmd_analyze(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Image Validation Gate - Catch broken generator output before it reaches the game
+Checks run cheapest first and stop at the first failure:
+  1. Container integrity: PNG chunk CRCs / IEND, JPEG SOI/EOI, WebP RIFF size,
+     then a full decode that fails on truncated data
+  2. Geometry: aspect ratio and min/max dimension
+  3. Content: vectorized blank / low-entropy / dominant-colour test on the
+     opaque pixels of a thumbnail, which catches blank canvases and
+     text-only refusals
+The defaults accept the art shipped under src/assets/images (1:1 and 16:9,
+384px and up). With --quarantine, bad files are moved to
+.asset-cache/quarantine/ with a reason file; generators skip only existing
+images, so the next generator run re-queues them. The generators validate
+their own output the same way (generate_validated) and retry rejected images.
+
+Usage:
+    python validate_images.py [paths...] [--aspect 1:1,16:9] [--jobs N]
+    python validate_images.py public/images/events --aspect 16:9 --quarantine
+"""
+
+import argparse
+import json
+import os
+import shutil
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageFile
+except ImportError:
+    print("[ERROR] Pillow not installed. Run: pip install Pillow")
+    sys.exit(1)
+
+try:
+    import numpy as np
+except ImportError:
+    print("[ERROR] NumPy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+# Truncated files must fail the decode test, never be padded with grey
+ImageFile.LOAD_TRUNCATED_IMAGES = False
+
+from asset_paths import CACHE_DIR, EVENT_IMAGES_DIR
+
+DEFAULT_IMAGES_DIR = EVENT_IMAGES_DIR
+QUARANTINE_DIR = CACHE_DIR / 'quarantine'
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+DEFAULT_ASPECTS = '1:1,16:9'
+
+DEFAULT_RULES = {
+    'aspect': (1.0, 16 / 9),
+    'aspect_tolerance': 0.05,
+    'min_dimension': 384,
+    'max_dimension': 4096,
+    'min_entropy': 2.0,
+    'min_stddev': 6.0,
+    'max_dominant': 0.85,
+    'thumbnail': 64,
+}
+
+
+def parse_aspect(value):
+    """Parse '16:9', '1.777' or a comma-separated list into accepted ratios ('0' disables the check)"""
+    ratios = []
+    for part in value.split(','):
+        part = part.strip()
+        if ':' in part:
+            w, h = part.split(':', 1)
+            ratios.append(float(w) / float(h))
+        elif part:
+            ratios.append(float(part))
+    return tuple(r for r in ratios if r)
+
+
+def check_png_chunks(data):
+    """Walk PNG chunks and verify every CRC and the IEND terminator"""
+    pos = 8
+    while pos + 8 <= len(data):
+        length, = struct.unpack('>I', data[pos:pos + 4])
+        chunk_type = data[pos + 4:pos + 8]
+        end = pos + 12 + length
+        if end > len(data):
+            return f"truncated {chunk_type.decode('latin-1')} chunk"
+        crc, = struct.unpack('>I', data[end - 4:end])
+        if zlib.crc32(data[pos + 4:end - 4]) & 0xffffffff != crc:
+            return f"CRC mismatch in {chunk_type.decode('latin-1')} chunk"
+        if chunk_type == b'IEND':
+            return None
+        pos = end
+    return "missing IEND chunk"
+
+
+def check_container(path):
+    """
+    Stage 1a: cheap structural checks on the raw bytes
+
+    Returns:
+        Problem description, or None if the container looks complete
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < 16:
+        return "file too small to be an image"
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return check_png_chunks(data)
+    if data[:3] == b'\xff\xd8\xff':
+        # Allow trailing padding after EOI, which some encoders emit
+        return None if b'\xff\xd9' in data[-64:] else "JPEG missing EOI marker"
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        riff_size, = struct.unpack('<I', data[4:8])
+        return None if riff_size + 8 <= len(data) else "WebP RIFF size exceeds file length"
+    if data.lstrip()[:1] in (b'{', b'<'):
+        return "not an image (looks like a JSON/HTML error body)"
+    return "unknown image format"
+
+
+def check_decode(path):
+    """Stage 1b: full decode, which raises on truncated pixel data"""
+    try:
+        with Image.open(path) as img:
+            img.load()
+            return None, img.size
+    except Exception as e:
+        return f"decode failed: {e}", None
+
+
+def check_geometry(size, rules):
+    """Stage 2: aspect ratio and dimension bounds"""
+    width, height = size
+    if min(width, height) < rules['min_dimension']:
+        return f"too small ({width}x{height}, min {rules['min_dimension']}px)"
+    if max(width, height) > rules['max_dimension']:
+        return f"too large ({width}x{height}, max {rules['max_dimension']}px)"
+    aspects = rules['aspect']
+    if isinstance(aspects, (int, float)):
+        aspects = (aspects,) if aspects else ()
+    if aspects:
+        ratio = width / height
+        if all(abs(ratio - a) / a > rules['aspect_tolerance'] for a in aspects):
+            expected = ' or '.join(f"{a:.3f}" for a in aspects)
+            return f"aspect ratio {ratio:.3f} (expected {expected})"
+    return None
+
+
+def check_content(path, rules):
+    """
+    Stage 3: blank / low-information detector on a small thumbnail
+
+    Uses reduced-resolution decoding (draft) where the format supports it, then
+    grey-level entropy, contrast and dominant-colour share, all vectorized.
+    Transparent pixels are left out, so a cut-out sprite is judged by the
+    sprite and not by the colour its transparent background happens to hold.
+    """
+    size = rules['thumbnail']
+    with Image.open(path) as img:
+        img.draft('RGB', (size * 4, size * 4))
+        img = img.convert('RGBA')
+        img.thumbnail((size, size))
+        rgba = np.asarray(img)
+
+    rgb = rgba[..., :3][rgba[..., 3] >= 128]
+    if rgb.size == 0:
+        return "blank image (fully transparent)"
+
+    grey = rgb @ np.array([0.299, 0.587, 0.114])
+    stddev = float(grey.std())
+    if stddev < rules['min_stddev']:
+        return f"blank image (grey stddev {stddev:.1f})"
+
+    hist = np.bincount(grey.astype(np.uint8) // 4, minlength=64).astype(np.float64)
+    p = hist[hist > 0] / hist.sum()
+    entropy = float(-(p * np.log2(p)).sum())
+    if entropy < rules['min_entropy']:
+        return f"low entropy ({entropy:.2f} bits)"
+
+    # Text-only refusals are mostly one flat background colour
+    quantized = (rgb >> 4).astype(np.int32)
+    keys = (quantized[:, 0] << 8) | (quantized[:, 1] << 4) | quantized[:, 2]
+    dominant = float(np.bincount(keys).max() / keys.size)
+    if dominant > rules['max_dominant']:
+        return f"dominated by one colour ({dominant:.0%} of pixels)"
+    return None
+
+
+def validate_image(path, rules=None):
+    """
+    Run all validation stages on one image
+
+    Returns:
+        Dict with 'path', 'ok' and 'reason' (None when ok)
+    """
+    rules = {**DEFAULT_RULES, **(rules or {})}
+    path = Path(path)
+    try:
+        reason = check_container(path)
+        if reason is None:
+            reason, size = check_decode(path)
+            if reason is None:
+                reason = check_geometry(size, rules) or check_content(path, rules)
+    except Exception as e:
+        reason = f"validation error: {e}"
+    return {'path': str(path), 'ok': reason is None, 'reason': reason}
+
+
+def quarantine(path, reason):
+    """Move a bad image out of the asset tree and record why"""
+    path = Path(path)
+    target_dir = QUARANTINE_DIR / path.parent.name
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / path.name
+    shutil.move(str(path), str(target))
+    with open(target.with_suffix(target.suffix + '.json'), 'w', encoding='utf-8') as f:
+        json.dump({'source': str(path), 'reason': reason}, f, ensure_ascii=False, indent=2)
+    return target
+
+
+def generate_validated(generate, output_path, rules, max_attempts=2, delay=0.0, overwrites=False):
+    """
+    Call a generator until its output passes validation
+
+    generate() writes output_path and returns truthy on success. A file that
+    already existed before the first call is taken to be a skipped image and
+    is not re-validated, unless the generator overwrites existing files.
+    Rejected output is quarantined, so a retry (or the next run) regenerates it.
+
+    Returns:
+        True if output_path holds an accepted image
+    """
+    output_path = Path(output_path)
+    existed = output_path.exists() and not overwrites
+    for attempt in range(1, max_attempts + 1):
+        if attempt > 1:
+            time.sleep(delay)
+            print(f"  🔁 Retrying {output_path.stem} (attempt {attempt}/{max_attempts})")
+        if not generate():
+            continue
+        if existed or rules is None:
+            return True
+        check = validate_image(output_path, rules)
+        if check['ok']:
+            return True
+        quarantine(output_path, check['reason'])
+        print(f"  ⚠️  Rejected {output_path.name}: {check['reason']}")
+    return False
+
+
+def collect_images(paths):
+    """Expand files and directories into a sorted list of images"""
+    images = []
+    for p in paths:
+        p = Path(p)
+        if p.is_dir():
+            images.extend(f for f in p.iterdir() if f.suffix.lower() in IMAGE_EXTENSIONS)
+        elif p.suffix.lower() in IMAGE_EXTENSIONS:
+            images.append(p)
+    return sorted(set(images))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate generated/processed images, optionally quarantining bad ones')
+    parser.add_argument('paths', nargs='*', default=[str(DEFAULT_IMAGES_DIR)],
+                        help=f'Image files or directories (default: {DEFAULT_IMAGES_DIR})')
+    parser.add_argument('--aspect', default=DEFAULT_ASPECTS,
+                        help=f"Accepted aspect ratios, e.g. 16:9 or 1:1,16:9, or 0 to skip (default: {DEFAULT_ASPECTS})")
+    parser.add_argument('--aspect-tolerance', type=float, default=DEFAULT_RULES['aspect_tolerance'],
+                        help='Relative aspect ratio tolerance (default: 0.05)')
+    parser.add_argument('--min-size', type=int, default=DEFAULT_RULES['min_dimension'],
+                        help=f"Minimum width/height in pixels (default: {DEFAULT_RULES['min_dimension']})")
+    parser.add_argument('--max-size', type=int, default=DEFAULT_RULES['max_dimension'],
+                        help='Maximum width/height in pixels (default: 4096)')
+    parser.add_argument('--min-entropy', type=float, default=DEFAULT_RULES['min_entropy'],
+                        help=f"Minimum grey-level entropy in bits (default: {DEFAULT_RULES['min_entropy']})")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--quarantine', action='store_true',
+                        help='Move bad files to the quarantine dir (default: only report)')
+    args = parser.parse_args()
+
+    rules = {
+        'aspect': parse_aspect(args.aspect),
+        'aspect_tolerance': args.aspect_tolerance,
+        'min_dimension': args.min_size,
+        'max_dimension': args.max_size,
+        'min_entropy': args.min_entropy,
+    }
+
+    images = collect_images(args.paths)
+    if not images:
+        print("[INFO] No images found")
+        sys.exit(0)
+
+    print(f"[INFO] Validating {len(images)} images with {args.jobs} workers...")
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(validate_image, images, [rules] * len(images), chunksize=4))
+
+    bad = [r for r in results if not r['ok']]
+    for r in bad:
+        name = Path(r['path']).name
+        if args.quarantine:
+            target = quarantine(r['path'], r['reason'])
+            print(f"[QUARANTINED] {name}: {r['reason']} -> {target}")
+        else:
+            print(f"[BAD] {name}: {r['reason']}")
+
+    print()
+    print(f"[RESULT] OK: {len(results) - len(bad)}  Bad: {len(bad)}")
+    if bad:
+        ids = ','.join(Path(r['path']).stem for r in bad)
+        if args.quarantine:
+            print("[NEXT] Quarantined images are missing again, so a normal generator run re-queues them:")
+        print(f"       --only {ids}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
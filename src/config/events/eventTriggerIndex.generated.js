@@ -0,0 +1,19 @@
+// Generated by scripts/build_event_index.py from the event arrays combined in
+// src/config/events/index.js. Do not edit; re-run the script instead.
+// source-hash: d9f0993b411f02f4dbbc440e7c1c3034e764c3934c55df78fa1d93845c55d316
+
+const deepFreeze = (value) => {
+    if (value && typeof value === 'object') {
+        Object.values(value).forEach(deepFreeze);
+        Object.freeze(value);
+    }
+    return value;
+};
+
+export const EVENT_TRIGGER_INDEX = deepFreeze({
+    "eventCount": 263,
+    "epochCount": 8,
+    "ids": ["plague_outbreak", "merchant_caravan", "good_harvest", "technological_breakthrough", "natural_disaster", "stone_age_hungry_peasants", "stone_age_elder_council", "bronze_age_miner_unrest", "bronze_age_merchant_boom", "classical_scribe_salon", "classical_landowner_pressure", "feudal_knight_parade", "feudal_cleric_scandal", "age_of_exploration_merchant_monopoly", "age_of_exploration_colonial_unrest", "enlightenment_pamphlet_storm", "enlightenment_coffeehouse_circle", "industrial_general_strike", "industrial_capitalist_boom", "comet_sighted", "inventor_plea", "great_flood", "stone_age_new_water", "stone_age_stranger_footprints", "stone_age_harsh_winter", "stone_age_unexpected_discovery", "stone_age_tribal_legend", "bronze_age_bronze_vein", "bronze_age_merchant_plea", "bronze_age_drought", "bronze_age_new_priest", "bronze_age_skirmish", "classical_philosopher_challenge", "classical_written_law", "classical_artistic_patronage", "classical_aqueduct_proposal", "feudal_guild_charter", "feudal_crusade_call", "feudal_levy_dispute", "feudal_university_founding", "feudal_plague_doctor", "exploration_new_world", "exploration_renaissance_artist", "exploration_banking_family", "exploration_mercenary_offer", "exploration_gunpowder_plot", "bread_price_crisis", "worker_peasant_alliance", "land_reform_proposal", "progressive_tax_debate", "slave_gladiator_revolt", "assassination_plot", "bank_run_panic", "colonial_tea_protest", "machine_breakers", "constitutional_crisis", "spy_scandal", "robber_baron_monopoly", "three_estates_assembly", "salt_tax_protest", "merchant_scholar_alliance", "military_coup_threat", "great_famine", "peasant_crusade", "urban_rural_tension", "foreign_drug_trade", "guild_monopoly_crisis", "court_faction_war", "eight_hour_day_movement", "anti_foreign_movement", "bread_and_circuses", "palace_guard_demands", "nobles_charter_demand", "tenant_strike", "currency_crisis", "witch_hunt_hysteria", "church_noble_alliance", "succession_dispute", "bread_riot", "guild_master_corruption", "peasant_jacquerie", "union_recognition_fight", "enclosure_movement", "press_freedom_debate", "tax_farmer_abuse", "reign_of_terror", "stock_market_crash", "education_reform_debate", "religious_schism", "mammoth_hunt", "fire_discovery", "cave_dispute", "shaman_ritual", "stone_tool_innovation", "wild_beast_taming", "sacred_cave_paintings", "tribal_marriage", "great_flood_legend", "first_pottery", "star_reader", "bone_oracle", "rival_tribe_encounter", "bronze_secret", "writing_invention", "irrigation_project", "slave_rebellion_bronze", "city_state_alliance", "philosophy_school", "olympic_games", "democratic_reform", "theatrical_competition", "gladiator_question", "crusade_call", "black_death", "peasant_revolt_feudal", "cathedral_construction", "guild_monopoly", "new_world_discovery", "printing_revolution", "reformation_movement", "spice_trade_war", "witch_trials", "encyclopedie", "salon_culture", "social_contract", "scientific_academy", "vaccination_debate", "factory_conditions", "railway_mania", "labor_union_formation", "urban_poverty", "communist_manifesto", "ritual_reform", "wandering_sage", "great_wall_project", "vassal_rebellion", "frontier_general_rebellion", "disarm_generals", "radical_reform", "emperor_personal_campaign", "grand_secretary_reform", "universal_taxation", "black_ships", "defenestration", "cave_painting_masterpiece", "wolf_domestication", "star_gazer", "first_fermentation", "obsidian_trade", "burial_rites", "code_of_law", "flood_myth", "standardized_weights", "oracle_bones", "bronze_collapse_fear", "chariot_warfare", "great_library", "silk_road_opening", "roman_roads", "academy_founding", "census_taking", "aqueduct_project", "magna_carta_demand", "knightly_tournament", "university_founding", "alchemist_discovery", "hanseatic_league", "chivalric_romance", "potato_introduction", "heliocentrism", "privateer_commission", "tulip_mania", "kabuki_plays", "tea_trade_boom", "hot_air_balloon", "mozart_concert", "lightning_rod", "taxation_representation", "agricultural_revolution", "romanticism_movement", "steam_engine_revolution", "telephone_patent", "impressionist_exhibition", "world_fair", "x_ray_discovery", "suffrage_march", "burning_books", "maritime_ban", "exam_scandal", "great_wall_project", "paper_money_crisis", "trade_boom", "silk_road_revival", "harvest_festival", "locust_plague", "new_technology", "mining_discovery", "luxury_craze", "tea_coffee_introduction", "currency_crisis", "banking_emergence", "labor_shortage", "guild_conflict", "forest_depletion", "salt_shortage", "foreign_embargo", "trade_route_discovery", "bubble_economy", "counterfeiting_ring", "tulip_mania", "south_sea_bubble", "merchant_league", "trading_company", "great_famine", "salt_tax_rebellion", "coin_debasement", "enclosure_movement", "railroad_mania", "bank_run", "winter_preparation", "festival_season", "fashion_trend", "construction_boom", "arms_race", "academic_boom", "brewing_prosperity", "raw_material_shortage", "noble_extravagance", "wage_demands", "coffee_craze", "furniture_fashion", "border_dispute", "diplomatic_incident", "spy_discovered", "trade_delegation", "trade_war", "resource_competition", "military_alliance_offer", "arms_race", "war_threat", "cultural_exchange", "religious_mission", "refugee_crisis", "plague_spread", "natural_disaster_aid", "royal_marriage", "succession_crisis", "intelligence_opportunity", "sabotage_discovered", "tribute_demand", "vassal_rebellion", "great_congress", "secret_alliance", "intercepted_telegram", "colonial_standoff", "diplomatic_insult", "assassination_abroad", "forced_trade", "appeasement_demand", "strategic_canal", "weapons_deployment", "colonial_conference", "naval_arms_race"],
+    "epochBuckets": {"0": [2, 4, 5, 6, 21, 22, 23, 24, 25, 26, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 144, 145, 146, 147, 148, 149, 193, 194, 201, 204, 219, 220, 226], "1": [0, 1, 2, 4, 6, 7, 8, 19, 21, 27, 28, 29, 30, 31, 89, 92, 96, 99, 101, 102, 103, 104, 105, 106, 132, 150, 151, 152, 153, 154, 155, 191, 193, 194, 196, 201, 204, 219, 220, 221, 222, 223, 224, 225, 226, 231, 242, 243, 244], "2": [0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 19, 21, 32, 33, 34, 35, 48, 50, 51, 62, 70, 71, 74, 77, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 132, 133, 134, 135, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 186, 188, 189, 191, 192, 193, 194, 195, 196, 197, 199, 201, 202, 203, 204, 205, 208, 213, 214, 215, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 230, 231, 232, 233, 234, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 249], "3": [0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 19, 21, 36, 37, 38, 39, 40, 46, 48, 50, 51, 61, 62, 63, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 84, 88, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 132, 133, 134, 135, 136, 137, 138, 139, 143, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 207, 208, 211, 213, 214, 215, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250], "4": [0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 19, 21, 40, 41, 42, 43, 44, 45, 46, 48, 49, 51, 53, 58, 61, 62, 63, 64, 66, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 82, 84, 88, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 133, 134, 135, 136, 137, 138, 139, 140, 141, 143, 157, 158, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 211, 212, 213, 214, 215, 216, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 252, 255, 260], "5": [0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 19, 20, 21, 42, 43, 44, 45, 46, 47, 48, 49, 51, 52, 53, 55, 56, 58, 59, 60, 61, 62, 64, 65, 66, 67, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 82, 83, 84, 85, 87, 88, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 136, 137, 138, 139, 140, 141, 142, 143, 157, 158, 160, 161, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 187, 188, 190, 191, 193, 194, 195, 196, 197, 198, 199, 200, 201, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262], "6": [0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 46, 47, 48, 49, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 76, 77, 78, 79, 81, 82, 83, 84, 85, 86, 87, 88, 117, 118, 119, 120, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 140, 141, 142, 157, 158, 160, 161, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 193, 194, 198, 201, 204, 207, 210, 212, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 233, 234, 235, 238, 240, 242, 244, 247, 248, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262], "7": [0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 46, 47, 48, 49, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 76, 77, 78, 79, 81, 82, 83, 84, 85, 86, 87, 88, 127, 128, 129, 130, 131, 157, 158, 160, 161, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 193, 194, 201, 204, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230]},
+    "gates": [[80, 0], [0, 0], [0, 0], [0, 100], [60, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 800], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [30, 0], [0, 0], [15, 0], [20, 0], [0, 0], [25, 0], [30, 0], [40, 0], [50, 0], [35, 0], [60, 0], [80, 0], [35, 0], [0, 0], [40, 0], [0, 0], [0, 0], [0, 0], [50, 0], [40, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [50, 0], [0, 0], [0, 0], [100, 0], [40, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [50, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [40, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [30, 0], [0, 0], [40, 0], [0, 0], [0, 0], [20, 0], [0, 0], [25, 0], [0, 0], [0, 0], [0, 0], [0, 0], [30, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [100, 0], [150, 0], [250, 0], [200, 0], [350, 0], [250, 0], [300, 0], [350, 0], [350, 0], [350, 0], [350, 0], [250, 0], [40, 0], [20, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [300, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [100, 0], [150, 0], [100, 0], [150, 0], [120, 0], [60, 0], [120, 0], [50, 0], [80, 0], [80, 0], [70, 0], [100, 0], [100, 0], [80, 0], [150, 0], [100, 0], [100, 0], [100, 0], [100, 0], [100, 0], [250, 0], [130, 0], [80, 0], [120, 0], [150, 0], [120, 0], [150, 0], [150, 0], [150, 0], [150, 0], [200, 0], [180, 0], [150, 0], [50, 0], [80, 0], [100, 0], [120, 0], [100, 0], [80, 0], [60, 0], [80, 0], [120, 0], [100, 0], [150, 0], [100, 0], [100, 0], [150, 0], [200, 0], [150, 0], [200, 0], [180, 0], [200, 0], [200, 0], [150, 0], [150, 0], [150, 0], [150, 0], [150, 0], [150, 0], [200, 0], [200, 0], [200, 0], [200, 0], [150, 0], [250, 0], [250, 0], [200, 0], [250, 0], [250, 0], [200, 0], [250, 0], [250, 0], [250, 0], [250, 0], [200, 0], [250, 0], [250, 0]],
+});
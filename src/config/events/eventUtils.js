@@ -1,6 +1,18 @@
 // Event utility functions
 // Helper functions for event triggering and selection
 
+/**
+ * 检查事件的时代条件（canTriggerEvent 的时代部分，也用于校验预编译的时代索引）
+ * @param {Object} event - 事件对象
+ * @param {number} epoch - 当前时代
+ * @returns {boolean} - 该时代是否满足事件的时代条件
+ */
+export function isEpochAllowed(event, epoch) {
+    const conditions = event.triggerConditions;
+    if (!conditions) return true;
+    return !((conditions.minEpoch !== undefined && epoch < conditions.minEpoch) || (conditions.maxEpoch !== undefined && epoch > conditions.maxEpoch));
+}
+
 /**
  * 检查事件是否可以触发
  * @param {Object} event - 事件对象
@@ -18,7 +30,7 @@ export function canTriggerEvent(event, gameState) {
     }
 
     // 检查时代条件
-    if ((conditions.minEpoch !== undefined && gameState.epoch < conditions.minEpoch) || (conditions.maxEpoch !== undefined && gameState.epoch > conditions.maxEpoch)) {
+    if (!isEpochAllowed(event, gameState.epoch)) {
         return false;
     }
 
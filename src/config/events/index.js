@@ -6,7 +6,8 @@ import { CLASS_CONFLICT_EVENTS } from './classConflictEvents.js';
 import { EPOCH_EVENTS } from './epochEvents.js';
 import { economicEvents as ECONOMIC_EVENTS } from './economicEvents.js';
 import { STATIC_DIPLOMATIC_EVENTS } from './staticDiplomaticEvents.js';
-import { canTriggerEvent, getRandomEvent as getRandomEventFromList } from './eventUtils.js';
+import { canTriggerEvent, isEpochAllowed, getRandomEvent as getRandomEventFromList } from './eventUtils.js';
+import { EVENT_TRIGGER_INDEX } from './eventTriggerIndex.generated.js';
 import {
     createWarDeclarationEvent,
     createGiftEvent,
@@ -58,9 +59,61 @@ export const EVENTS = [...BASE_EVENTS, ...CLASS_CONFLICT_EVENTS, ...EPOCH_EVENTS
 // Re-export event utility functions
 export { canTriggerEvent };
 
+// Epoch buckets and population/science gates precompiled by
+// scripts/build_event_index.py; only trusted while they still describe this
+// EVENTS array (otherwise fall back to a full scan). Beyond ids, every event
+// whose epoch gate admits an epoch must be in that epoch's bucket, and every
+// non-zero gate must equal the event's own threshold, so an edited
+// minEpoch/maxEpoch/minPopulation/minScience without a rebuild is caught.
+// A zero gate filters nothing, so it is always safe.
+const gatesMatch = (event, [minPopulation, minScience]) => {
+    const conditions = event.triggerConditions || {};
+    return (!minPopulation || minPopulation === conditions.minPopulation)
+        && (!minScience || minScience === conditions.minScience);
+};
+
+const isEventIndexValid = () => {
+    if (EVENT_TRIGGER_INDEX.eventCount !== EVENTS.length
+        || !EVENT_TRIGGER_INDEX.ids.every((id, i) => EVENTS[i]?.id === id)
+        || !EVENTS.every((event, i) => gatesMatch(event, EVENT_TRIGGER_INDEX.gates[i]))) {
+        return false;
+    }
+    for (let epoch = 0; epoch < EVENT_TRIGGER_INDEX.epochCount; epoch++) {
+        const bucket = new Set(EVENT_TRIGGER_INDEX.epochBuckets[epoch] || []);
+        for (let i = 0; i < EVENTS.length; i++) {
+            if (!bucket.has(i) && isEpochAllowed(EVENTS[i], epoch)) return false;
+        }
+    }
+    return true;
+};
+const EVENT_INDEX_VALID = isEventIndexValid();
+if (!EVENT_INDEX_VALID && import.meta.env?.DEV) {
+    console.warn('[events] eventTriggerIndex.generated.js is stale; run: python scripts/build_event_index.py');
+}
+// The epoch bucket without the events whose population or science gate the state
+// misses. The comparisons are the ones canTriggerEvent makes, so every dropped
+// event would have been rejected anyway; without resources the science gate is
+// left to canTriggerEvent.
+const getEpochCandidates = (gameState) => {
+    const epoch = gameState?.epoch;
+    if (!EVENT_INDEX_VALID || !Number.isInteger(epoch)) return null;
+    const bucket = EVENT_TRIGGER_INDEX.epochBuckets[epoch];
+    if (!bucket) return null;
+    const { population, resources } = gameState;
+    const candidates = [];
+    for (const i of bucket) {
+        const [minPopulation, minScience] = EVENT_TRIGGER_INDEX.gates[i];
+        if (minPopulation && population < minPopulation) continue;
+        if (minScience && resources && resources.science < minScience) continue;
+        candidates.push(EVENTS[i]);
+    }
+    return candidates;
+};
+
 // Export getRandomEvent that uses the combined EVENTS array
+// Buckets keep EVENTS order, so the eligible list matches a full scan
 export function getRandomEvent(gameState) {
-    return getRandomEventFromList(gameState, EVENTS);
+    return getRandomEventFromList(gameState, getEpochCandidates(gameState) || EVENTS);
 }
 
 // Re-export diplomatic event creators
@@ -0,0 +1,277 @@
+// Generated by scripts/build_resource_index.py from src/config/buildings.js,
+// buildingUpgrades.js and industryChains.js. Do not edit; re-run the script instead.
+// source-hash: 927fffe3bd750c66bb2861e02f04b00120e68d948f0318eecfe606f572c64b2a
+
+const deepFreeze = (value) => {
+    if (value && typeof value === 'object') {
+        Object.values(value).forEach(deepFreeze);
+        Object.freeze(value);
+    }
+    return value;
+};
+
+export const RESOURCE_PRODUCERS = deepFreeze({
+    "ale": [{"buildingId": "large_estate", "level": 2, "amount": 0.03}, {"buildingId": "brewery", "level": 0, "amount": 1.8}, {"buildingId": "brewery", "level": 1, "amount": 2.34}, {"buildingId": "brewery", "level": 2, "amount": 4.05}, {"buildingId": "monastery_cellar", "level": 0, "amount": 3.0}, {"buildingId": "monastery_cellar", "level": 1, "amount": 3.9}, {"buildingId": "monastery_cellar", "level": 2, "amount": 6.75}, {"buildingId": "cannery", "level": 2, "amount": 0.3}, {"buildingId": "distillery", "level": 0, "amount": 7.875}, {"buildingId": "distillery", "level": 1, "amount": 10.2375}, {"buildingId": "distillery", "level": 2, "amount": 17.71875}],
+    "brick": [{"buildingId": "stone_workshop", "level": 2, "amount": 0.15}, {"buildingId": "brickworks", "level": 0, "amount": 3.6}, {"buildingId": "brickworks", "level": 1, "amount": 4.68}, {"buildingId": "brickworks", "level": 2, "amount": 8.1}, {"buildingId": "building_materials_plant", "level": 0, "amount": 12.375}, {"buildingId": "building_materials_plant", "level": 1, "amount": 16.0875}, {"buildingId": "building_materials_plant", "level": 2, "amount": 27.84375}, {"buildingId": "prefab_factory", "level": 0, "amount": 22.0}, {"buildingId": "prefab_factory", "level": 1, "amount": 28.6}, {"buildingId": "prefab_factory", "level": 2, "amount": 49.5}],
+    "cloth": [{"buildingId": "large_estate", "level": 2, "amount": 0.1}, {"buildingId": "loom_house", "level": 0, "amount": 2.88}, {"buildingId": "loom_house", "level": 1, "amount": 3.744}, {"buildingId": "loom_house", "level": 2, "amount": 6.48}, {"buildingId": "wool_workshop", "level": 0, "amount": 4.8}, {"buildingId": "wool_workshop", "level": 1, "amount": 6.24}, {"buildingId": "wool_workshop", "level": 2, "amount": 10.8}, {"buildingId": "textile_mill", "level": 0, "amount": 12.5}, {"buildingId": "textile_mill", "level": 1, "amount": 16.25}, {"buildingId": "textile_mill", "level": 2, "amount": 28.125}, {"buildingId": "garment_factory", "level": 2, "amount": 0.5}, {"buildingId": "mechanized_farm", "level": 2, "amount": 0.2}],
+    "coal": [{"buildingId": "mine", "level": 2, "amount": 0.05}, {"buildingId": "coal_mine", "level": 0, "amount": 3.0}, {"buildingId": "coal_mine", "level": 1, "amount": 5.0}, {"buildingId": "coal_mine", "level": 2, "amount": 8.0}, {"buildingId": "shaft_mine", "level": 2, "amount": 0.1}],
+    "coffee": [{"buildingId": "coffee_plantation", "level": 0, "amount": 0.6}, {"buildingId": "coffee_plantation", "level": 1, "amount": 0.78}, {"buildingId": "coffee_plantation", "level": 2, "amount": 1.35}],
+    "copper": [{"buildingId": "quarry", "level": 2, "amount": 0.02}, {"buildingId": "copper_mine", "level": 0, "amount": 0.6667}, {"buildingId": "copper_mine", "level": 1, "amount": 0.8667}, {"buildingId": "copper_mine", "level": 2, "amount": 1.5}, {"buildingId": "shaft_mine", "level": 0, "amount": 0.96}, {"buildingId": "shaft_mine", "level": 1, "amount": 1.248}, {"buildingId": "shaft_mine", "level": 2, "amount": 2.16}, {"buildingId": "industrial_mine", "level": 0, "amount": 0.9577}, {"buildingId": "industrial_mine", "level": 1, "amount": 1.245}, {"buildingId": "industrial_mine", "level": 2, "amount": 2.153925}],
+    "culture": [{"buildingId": "culinary_kitchen", "level": 2, "amount": 0.08}, {"buildingId": "brewery", "level": 2, "amount": 0.05}, {"buildingId": "loom_house", "level": 2, "amount": 0.05}, {"buildingId": "dye_works", "level": 2, "amount": 0.05}, {"buildingId": "tailor_workshop", "level": 0, "amount": 0.5}, {"buildingId": "tailor_workshop", "level": 1, "amount": 0.65}, {"buildingId": "tailor_workshop", "level": 2, "amount": 1.125}, {"buildingId": "church", "level": 0, "amount": 3.2}, {"buildingId": "church", "level": 1, "amount": 3.8}, {"buildingId": "church", "level": 2, "amount": 5.5}, {"buildingId": "monastery_cellar", "level": 0, "amount": 1.2}, {"buildingId": "monastery_cellar", "level": 1, "amount": 1.56}, {"buildingId": "monastery_cellar", "level": 2, "amount": 2.7}, {"buildingId": "wool_workshop", "level": 2, "amount": 0.05}, {"buildingId": "amphitheater", "level": 0, "amount": 5.4}, {"buildingId": "amphitheater", "level": 1, "amount": 6.5}, {"buildingId": "amphitheater", "level": 2, "amount": 9.0}, {"buildingId": "navigator_school", "level": 0, "amount": 1.0}, {"buildingId": "navigator_school", "level": 1, "amount": 1.2}, {"buildingId": "navigator_school", "level": 2, "amount": 1.8}, {"buildingId": "dye_workshop", "level": 2, "amount": 0.08}, {"buildingId": "coffee_house", "level": 0, "amount": 4.0}, {"buildingId": "coffee_house", "level": 1, "amount": 4.8}, {"buildingId": "coffee_house", "level": 2, "amount": 7.0}, {"buildingId": "rail_depot", "level": 2, "amount": 0.125}, {"buildingId": "printing_house", "level": 0, "amount": 2.0}, {"buildingId": "printing_house", "level": 1, "amount": 2.4}, {"buildingId": "printing_house", "level": 2, "amount": 3.6}, {"buildingId": "library", "level": 2, "amount": 0.12}, {"buildingId": "market", "level": 2, "amount": 0.225}, {"buildingId": "garment_factory", "level": 0, "amount": 0.45}, {"buildingId": "garment_factory", "level": 1, "amount": 0.585}, {"buildingId": "garment_factory", "level": 2, "amount": 1.0125}, {"buildingId": "furniture_factory", "level": 0, "amount": 0.45}, {"buildingId": "furniture_factory", "level": 1, "amount": 0.585}, {"buildingId": "furniture_factory", "level": 2, "amount": 1.0125}, {"buildingId": "distillery", "level": 2, "amount": 0.12}, {"buildingId": "publishing_house", "level": 0, "amount": 2.0}, {"buildingId": "university", "level": 0, "amount": 0.96}, {"buildingId": "university", "level": 1, "amount": 1.3}, {"buildingId": "university", "level": 2, "amount": 2.25}, {"buildingId": "opera_house", "level": 0, "amount": 4.0}, {"buildingId": "opera_house", "level": 1, "amount": 5.6875}, {"buildingId": "opera_house", "level": 2, "amount": 9.8438}, {"buildingId": "stock_exchange", "level": 0, "amount": 0.8}],
+    "delicacies": [{"buildingId": "culinary_kitchen", "level": 0, "amount": 2.0}, {"buildingId": "culinary_kitchen", "level": 1, "amount": 2.6}, {"buildingId": "culinary_kitchen", "level": 2, "amount": 4.5}, {"buildingId": "cannery", "level": 0, "amount": 7.875}, {"buildingId": "cannery", "level": 1, "amount": 10.2375}, {"buildingId": "cannery", "level": 2, "amount": 17.71875}],
+    "dye": [{"buildingId": "dye_works", "level": 0, "amount": 0.9}, {"buildingId": "dye_works", "level": 1, "amount": 1.17}, {"buildingId": "dye_works", "level": 2, "amount": 2.025}, {"buildingId": "dye_workshop", "level": 0, "amount": 1.8}, {"buildingId": "dye_workshop", "level": 1, "amount": 2.34}, {"buildingId": "dye_workshop", "level": 2, "amount": 4.05}],
+    "fine_clothes": [{"buildingId": "tailor_workshop", "level": 0, "amount": 1.2}, {"buildingId": "tailor_workshop", "level": 1, "amount": 1.56}, {"buildingId": "tailor_workshop", "level": 2, "amount": 2.7}, {"buildingId": "wool_workshop", "level": 0, "amount": 0.3}, {"buildingId": "wool_workshop", "level": 1, "amount": 0.39}, {"buildingId": "wool_workshop", "level": 2, "amount": 0.675}, {"buildingId": "dye_workshop", "level": 0, "amount": 0.45}, {"buildingId": "dye_workshop", "level": 1, "amount": 0.585}, {"buildingId": "dye_workshop", "level": 2, "amount": 1.0125}, {"buildingId": "textile_mill", "level": 0, "amount": 1.5}, {"buildingId": "textile_mill", "level": 1, "amount": 1.95}, {"buildingId": "textile_mill", "level": 2, "amount": 3.375}, {"buildingId": "garment_factory", "level": 0, "amount": 4.2}, {"buildingId": "garment_factory", "level": 1, "amount": 5.46}, {"buildingId": "garment_factory", "level": 2, "amount": 9.45}],
+    "food": [{"buildingId": "farm", "level": 0, "amount": 4.8}, {"buildingId": "farm", "level": 1, "amount": 6.24}, {"buildingId": "farm", "level": 2, "amount": 10.8}, {"buildingId": "trading_post", "level": 0, "amount": 4}, {"buildingId": "trading_post", "level": 1, "amount": 5.2}, {"buildingId": "trading_post", "level": 2, "amount": 9.0}, {"buildingId": "large_estate", "level": 0, "amount": 24.0}, {"buildingId": "large_estate", "level": 1, "amount": 31.2}, {"buildingId": "large_estate", "level": 2, "amount": 54.0}, {"buildingId": "lumber_camp", "level": 2, "amount": 0.15}, {"buildingId": "coffee_plantation", "level": 2, "amount": 0.5}, {"buildingId": "hardwood_camp", "level": 2, "amount": 0.2}, {"buildingId": "rail_depot", "level": 2, "amount": 0.625}, {"buildingId": "market", "level": 0, "amount": 3.0}, {"buildingId": "market", "level": 1, "amount": 3.9}, {"buildingId": "market", "level": 2, "amount": 6.75}, {"buildingId": "trade_port", "level": 0, "amount": 2.6667}, {"buildingId": "trade_port", "level": 1, "amount": 3.467}, {"buildingId": "trade_port", "level": 2, "amount": 6.0}, {"buildingId": "mechanized_farm", "level": 0, "amount": 38.5}, {"buildingId": "mechanized_farm", "level": 1, "amount": 50.05}, {"buildingId": "mechanized_farm", "level": 2, "amount": 86.625}],
+    "furniture": [{"buildingId": "furniture_workshop", "level": 0, "amount": 1.6}, {"buildingId": "furniture_workshop", "level": 1, "amount": 2.08}, {"buildingId": "furniture_workshop", "level": 2, "amount": 3.6}, {"buildingId": "sawmill", "level": 2, "amount": 0.05}, {"buildingId": "lumber_mill", "level": 2, "amount": 0.144}, {"buildingId": "furniture_factory", "level": 0, "amount": 7.875}, {"buildingId": "furniture_factory", "level": 1, "amount": 10.2375}, {"buildingId": "furniture_factory", "level": 2, "amount": 17.71875}],
+    "iron": [{"buildingId": "mine", "level": 0, "amount": 0.9}, {"buildingId": "mine", "level": 1, "amount": 1.65}, {"buildingId": "mine", "level": 2, "amount": 2.86}, {"buildingId": "coal_mine", "level": 2, "amount": 0.2}, {"buildingId": "shaft_mine", "level": 0, "amount": 1.44}, {"buildingId": "shaft_mine", "level": 1, "amount": 1.872}, {"buildingId": "shaft_mine", "level": 2, "amount": 3.24}, {"buildingId": "industrial_mine", "level": 0, "amount": 2.9616}, {"buildingId": "industrial_mine", "level": 1, "amount": 3.85}, {"buildingId": "industrial_mine", "level": 2, "amount": 6.663075}],
+    "maxPop": [{"buildingId": "hut", "level": 0, "amount": 3}, {"buildingId": "house", "level": 0, "amount": 8}, {"buildingId": "manor_house", "level": 0, "amount": 9}, {"buildingId": "townhouse", "level": 0, "amount": 10}, {"buildingId": "civic_apartment", "level": 0, "amount": 11}, {"buildingId": "granary", "level": 0, "amount": 6}, {"buildingId": "rail_depot", "level": 0, "amount": 14}, {"buildingId": "rail_depot", "level": 1, "amount": 15}, {"buildingId": "rail_depot", "level": 2, "amount": 16}, {"buildingId": "apartment_block", "level": 0, "amount": 11}],
+    "militaryCapacity": [{"buildingId": "barracks", "level": 0, "amount": 10}, {"buildingId": "training_ground", "level": 0, "amount": 20}, {"buildingId": "fortress", "level": 0, "amount": 40}],
+    "papyrus": [{"buildingId": "reed_works", "level": 0, "amount": 0.9}, {"buildingId": "reed_works", "level": 1, "amount": 1.17}, {"buildingId": "reed_works", "level": 2, "amount": 2.025}, {"buildingId": "paper_mill", "level": 0, "amount": 5.0}, {"buildingId": "paper_mill", "level": 1, "amount": 6.5}, {"buildingId": "paper_mill", "level": 2, "amount": 11.25}],
+    "plank": [{"buildingId": "sawmill", "level": 0, "amount": 3.47}, {"buildingId": "sawmill", "level": 1, "amount": 4.511}, {"buildingId": "sawmill", "level": 2, "amount": 7.8075}, {"buildingId": "lumber_mill", "level": 0, "amount": 17.1429}, {"buildingId": "lumber_mill", "level": 1, "amount": 22.2858}, {"buildingId": "lumber_mill", "level": 2, "amount": 38.5715}, {"buildingId": "furniture_factory", "level": 2, "amount": 0.4}],
+    "science": [{"buildingId": "reed_works", "level": 2, "amount": 0.05}, {"buildingId": "church", "level": 2, "amount": 0.15}, {"buildingId": "monastery_cellar", "level": 2, "amount": 0.08}, {"buildingId": "navigator_school", "level": 0, "amount": 0.75}, {"buildingId": "navigator_school", "level": 1, "amount": 0.78}, {"buildingId": "navigator_school", "level": 2, "amount": 1.35}, {"buildingId": "coffee_house", "level": 0, "amount": 1.3333}, {"buildingId": "coffee_house", "level": 1, "amount": 1.733}, {"buildingId": "coffee_house", "level": 2, "amount": 3.0}, {"buildingId": "factory", "level": 2, "amount": 0.2}, {"buildingId": "printing_house", "level": 0, "amount": 2.4}, {"buildingId": "printing_house", "level": 1, "amount": 3.12}, {"buildingId": "printing_house", "level": 2, "amount": 5.4}, {"buildingId": "library", "level": 0, "amount": 1.0667}, {"buildingId": "library", "level": 1, "amount": 1.3867}, {"buildingId": "library", "level": 2, "amount": 2.4}, {"buildingId": "dockyard", "level": 2, "amount": 0.05}, {"buildingId": "publishing_house", "level": 0, "amount": 5.0}, {"buildingId": "university", "level": 0, "amount": 3.6}, {"buildingId": "university", "level": 1, "amount": 4.875}, {"buildingId": "university", "level": 2, "amount": 8.4375}, {"buildingId": "opera_house", "level": 2, "amount": 0.1875}],
+    "silver": [{"buildingId": "trading_post", "level": 0, "amount": 1.6}, {"buildingId": "trading_post", "level": 1, "amount": 2.08}, {"buildingId": "trading_post", "level": 2, "amount": 3.6}, {"buildingId": "church", "level": 0, "amount": 0.6667}, {"buildingId": "church", "level": 1, "amount": 1.2}, {"buildingId": "church", "level": 2, "amount": 2.0}, {"buildingId": "amphitheater", "level": 1, "amount": 0.8}, {"buildingId": "amphitheater", "level": 2, "amount": 1.5}, {"buildingId": "coffee_house", "level": 1, "amount": 0.6}, {"buildingId": "coffee_house", "level": 2, "amount": 1.2}, {"buildingId": "rail_depot", "level": 0, "amount": 2.7}, {"buildingId": "rail_depot", "level": 1, "amount": 3.51}, {"buildingId": "rail_depot", "level": 2, "amount": 6.075}, {"buildingId": "market", "level": 1, "amount": 0.45}, {"buildingId": "market", "level": 2, "amount": 0.75}, {"buildingId": "dockyard", "level": 2, "amount": 0.25}, {"buildingId": "trade_port", "level": 1, "amount": 0.15}, {"buildingId": "trade_port", "level": 2, "amount": 0.4}, {"buildingId": "distillery", "level": 0, "amount": 1.8}, {"buildingId": "distillery", "level": 1, "amount": 2.34}, {"buildingId": "distillery", "level": 2, "amount": 4.05}, {"buildingId": "opera_house", "level": 0, "amount": 1.1429}, {"buildingId": "opera_house", "level": 1, "amount": 1.625}, {"buildingId": "opera_house", "level": 2, "amount": 2.8125}, {"buildingId": "stock_exchange", "level": 0, "amount": 8.0}],
+    "spice": [{"buildingId": "trading_post", "level": 2, "amount": 0.02}, {"buildingId": "coffee_plantation", "level": 2, "amount": 0.02}, {"buildingId": "dockyard", "level": 0, "amount": 0.84}, {"buildingId": "dockyard", "level": 1, "amount": 0.9}, {"buildingId": "dockyard", "level": 2, "amount": 1.55}],
+    "steel": [{"buildingId": "factory", "level": 2, "amount": 0.1}, {"buildingId": "steel_foundry", "level": 0, "amount": 0.7}, {"buildingId": "steel_foundry", "level": 1, "amount": 1.2}, {"buildingId": "steel_foundry", "level": 2, "amount": 2.4}, {"buildingId": "steel_works", "level": 0, "amount": 1.44}],
+    "stone": [{"buildingId": "quarry", "level": 0, "amount": 3.0}, {"buildingId": "quarry", "level": 1, "amount": 3.9}, {"buildingId": "quarry", "level": 2, "amount": 6.75}, {"buildingId": "copper_mine", "level": 2, "amount": 0.15}, {"buildingId": "stone_workshop", "level": 0, "amount": 4.375}, {"buildingId": "stone_workshop", "level": 1, "amount": 4.55}, {"buildingId": "stone_workshop", "level": 2, "amount": 7.875}],
+    "tools": [{"buildingId": "brickworks", "level": 2, "amount": 0.02}, {"buildingId": "stone_tool_workshop", "level": 0, "amount": 0.75}, {"buildingId": "stone_tool_workshop", "level": 1, "amount": 0.975}, {"buildingId": "stone_tool_workshop", "level": 2, "amount": 1.35}, {"buildingId": "bronze_foundry", "level": 0, "amount": 1.3333}, {"buildingId": "bronze_foundry", "level": 1, "amount": 1.95}, {"buildingId": "bronze_foundry", "level": 2, "amount": 2.7}, {"buildingId": "iron_tool_workshop", "level": 0, "amount": 2.0}, {"buildingId": "iron_tool_workshop", "level": 1, "amount": 2.925}, {"buildingId": "iron_tool_workshop", "level": 2, "amount": 4.05}, {"buildingId": "factory", "level": 0, "amount": 15.0}, {"buildingId": "factory", "level": 1, "amount": 22.0}, {"buildingId": "factory", "level": 2, "amount": 32.0}, {"buildingId": "steel_foundry", "level": 2, "amount": 0.2}, {"buildingId": "metallurgy_workshop", "level": 0, "amount": 3.4286}, {"buildingId": "metallurgy_workshop", "level": 1, "amount": 3.9}, {"buildingId": "metallurgy_workshop", "level": 2, "amount": 6.75}, {"buildingId": "steel_works", "level": 0, "amount": 0.96}, {"buildingId": "paper_mill", "level": 2, "amount": 0.06}],
+    "wood": [{"buildingId": "lumber_camp", "level": 0, "amount": 3.84}, {"buildingId": "lumber_camp", "level": 1, "amount": 4.992}, {"buildingId": "lumber_camp", "level": 2, "amount": 8.64}, {"buildingId": "hardwood_camp", "level": 0, "amount": 5.76}, {"buildingId": "hardwood_camp", "level": 1, "amount": 6.24}, {"buildingId": "hardwood_camp", "level": 2, "amount": 10.8}, {"buildingId": "logging_company", "level": 0, "amount": 20.0}, {"buildingId": "logging_company", "level": 1, "amount": 26.0}, {"buildingId": "logging_company", "level": 2, "amount": 45.0}],
+});
+
+export const RESOURCE_CONSUMERS = deepFreeze({
+    "ale": [{"buildingId": "amphitheater", "level": 2, "amount": 0.03}, {"buildingId": "rail_depot", "level": 0, "amount": 0.36}, {"buildingId": "rail_depot", "level": 1, "amount": 0.1}, {"buildingId": "rail_depot", "level": 2, "amount": 0.15}],
+    "brick": [{"buildingId": "town_hall", "level": 0, "amount": 0.2}, {"buildingId": "church", "level": 0, "amount": 0.0533}, {"buildingId": "amphitheater", "level": 0, "amount": 0.045}, {"buildingId": "printing_house", "level": 0, "amount": 0.08}, {"buildingId": "market", "level": 0, "amount": 0.075}, {"buildingId": "magistrate_office", "level": 0, "amount": 0.03}, {"buildingId": "prefab_factory", "level": 0, "amount": 3.0}, {"buildingId": "prefab_factory", "level": 1, "amount": 3.9}, {"buildingId": "prefab_factory", "level": 2, "amount": 6.75}, {"buildingId": "university", "level": 0, "amount": 0.072}, {"buildingId": "opera_house", "level": 0, "amount": 0.0571}],
+    "cloth": [{"buildingId": "large_estate", "level": 2, "amount": 0.05}, {"buildingId": "furniture_workshop", "level": 0, "amount": 0.4}, {"buildingId": "furniture_workshop", "level": 1, "amount": 0.25}, {"buildingId": "furniture_workshop", "level": 2, "amount": 0.35}, {"buildingId": "dye_works", "level": 2, "amount": 0.05}, {"buildingId": "tailor_workshop", "level": 0, "amount": 1.5}, {"buildingId": "tailor_workshop", "level": 1, "amount": 1.725}, {"buildingId": "tailor_workshop", "level": 2, "amount": 2.7}, {"buildingId": "dye_workshop", "level": 0, "amount": 0.6}, {"buildingId": "dye_workshop", "level": 1, "amount": 0.5}, {"buildingId": "dye_workshop", "level": 2, "amount": 0.7}, {"buildingId": "sawmill", "level": 2, "amount": 0.05}, {"buildingId": "dockyard", "level": 2, "amount": 0.06}, {"buildingId": "trade_port", "level": 2, "amount": 0.06}, {"buildingId": "garment_factory", "level": 0, "amount": 3.75}, {"buildingId": "garment_factory", "level": 1, "amount": 4.875}, {"buildingId": "garment_factory", "level": 2, "amount": 8.4375}, {"buildingId": "furniture_factory", "level": 0, "amount": 1.8}, {"buildingId": "furniture_factory", "level": 1, "amount": 2.34}, {"buildingId": "furniture_factory", "level": 2, "amount": 4.05}],
+    "coal": [{"buildingId": "shaft_mine", "level": 2, "amount": 0.15}, {"buildingId": "rail_depot", "level": 0, "amount": 0.72}, {"buildingId": "rail_depot", "level": 1, "amount": 0.375}, {"buildingId": "rail_depot", "level": 2, "amount": 0.5625}, {"buildingId": "factory", "level": 0, "amount": 2.0}, {"buildingId": "factory", "level": 1, "amount": 3.0}, {"buildingId": "factory", "level": 2, "amount": 4.2}, {"buildingId": "steel_foundry", "level": 0, "amount": 0.7}, {"buildingId": "steel_foundry", "level": 1, "amount": 1.2}, {"buildingId": "steel_foundry", "level": 2, "amount": 2.4}, {"buildingId": "garment_factory", "level": 0, "amount": 0.45}, {"buildingId": "garment_factory", "level": 1, "amount": 0.585}, {"buildingId": "garment_factory", "level": 2, "amount": 1.0125}, {"buildingId": "furniture_factory", "level": 0, "amount": 0.5625}, {"buildingId": "furniture_factory", "level": 1, "amount": 0.73125}, {"buildingId": "furniture_factory", "level": 2, "amount": 1.265625}, {"buildingId": "metallurgy_workshop", "level": 2, "amount": 0.08}, {"buildingId": "steel_works", "level": 0, "amount": 1.2}, {"buildingId": "building_materials_plant", "level": 0, "amount": 0.45}, {"buildingId": "building_materials_plant", "level": 1, "amount": 0.585}, {"buildingId": "building_materials_plant", "level": 2, "amount": 1.0125}, {"buildingId": "prefab_factory", "level": 0, "amount": 0.8}, {"buildingId": "prefab_factory", "level": 1, "amount": 1.04}, {"buildingId": "prefab_factory", "level": 2, "amount": 1.8}, {"buildingId": "cannery", "level": 0, "amount": 0.5625}, {"buildingId": "cannery", "level": 1, "amount": 0.73125}, {"buildingId": "cannery", "level": 2, "amount": 1.265625}, {"buildingId": "distillery", "level": 0, "amount": 0.45}, {"buildingId": "distillery", "level": 1, "amount": 0.585}, {"buildingId": "distillery", "level": 2, "amount": 1.0125}, {"buildingId": "paper_mill", "level": 0, "amount": 0.3}, {"buildingId": "paper_mill", "level": 1, "amount": 0.39}, {"buildingId": "paper_mill", "level": 2, "amount": 0.675}, {"buildingId": "publishing_house", "level": 0, "amount": 0.3}, {"buildingId": "industrial_mine", "level": 0, "amount": 0.5231}, {"buildingId": "industrial_mine", "level": 1, "amount": 0.68}, {"buildingId": "industrial_mine", "level": 2, "amount": 1.125}, {"buildingId": "mechanized_farm", "level": 0, "amount": 0.35}, {"buildingId": "mechanized_farm", "level": 1, "amount": 0.455}, {"buildingId": "mechanized_farm", "level": 2, "amount": 0.7875}, {"buildingId": "logging_company", "level": 0, "amount": 0.25}, {"buildingId": "logging_company", "level": 1, "amount": 0.325}, {"buildingId": "logging_company", "level": 2, "amount": 0.5625}],
+    "coffee": [{"buildingId": "navigator_school", "level": 2, "amount": 0.03}, {"buildingId": "coffee_house", "level": 0, "amount": 0.5333}, {"buildingId": "coffee_house", "level": 1, "amount": 0.2}, {"buildingId": "coffee_house", "level": 2, "amount": 0.3}, {"buildingId": "printing_house", "level": 0, "amount": 0.2}, {"buildingId": "printing_house", "level": 1, "amount": 0.09}, {"buildingId": "printing_house", "level": 2, "amount": 0.15}, {"buildingId": "market", "level": 1, "amount": 0.075}, {"buildingId": "market", "level": 2, "amount": 0.12}, {"buildingId": "textile_mill", "level": 2, "amount": 0.0533}, {"buildingId": "publishing_house", "level": 0, "amount": 0.4}, {"buildingId": "university", "level": 0, "amount": 0.24}, {"buildingId": "university", "level": 1, "amount": 0.1875}, {"buildingId": "university", "level": 2, "amount": 0.25}, {"buildingId": "opera_house", "level": 2, "amount": 0.1}, {"buildingId": "stock_exchange", "level": 0, "amount": 0.24}],
+    "copper": [{"buildingId": "bronze_foundry", "level": 0, "amount": 0.8}, {"buildingId": "bronze_foundry", "level": 1, "amount": 0.75}, {"buildingId": "bronze_foundry", "level": 2, "amount": 1.05}, {"buildingId": "metallurgy_workshop", "level": 0, "amount": 0.3429}, {"buildingId": "metallurgy_workshop", "level": 1, "amount": 0.25}, {"buildingId": "metallurgy_workshop", "level": 2, "amount": 0.4}],
+    "culture": [{"buildingId": "town_hall", "level": 0, "amount": 0.03}],
+    "delicacies": [{"buildingId": "town_hall", "level": 0, "amount": 0.1}, {"buildingId": "coffee_house", "level": 0, "amount": 0.2667}, {"buildingId": "coffee_house", "level": 1, "amount": 0.08}, {"buildingId": "coffee_house", "level": 2, "amount": 0.1}, {"buildingId": "rail_depot", "level": 0, "amount": 0.18}, {"buildingId": "rail_depot", "level": 1, "amount": 0.05}, {"buildingId": "rail_depot", "level": 2, "amount": 0.075}, {"buildingId": "university", "level": 0, "amount": 0.18}, {"buildingId": "university", "level": 1, "amount": 0.125}, {"buildingId": "university", "level": 2, "amount": 0.15}, {"buildingId": "opera_house", "level": 0, "amount": 0.2286}, {"buildingId": "opera_house", "level": 1, "amount": 0.15}, {"buildingId": "opera_house", "level": 2, "amount": 0.225}],
+    "dye": [{"buildingId": "loom_house", "level": 2, "amount": 0.03}, {"buildingId": "tailor_workshop", "level": 0, "amount": 0.3}, {"buildingId": "tailor_workshop", "level": 1, "amount": 0.345}, {"buildingId": "tailor_workshop", "level": 2, "amount": 0.54}, {"buildingId": "wool_workshop", "level": 2, "amount": 0.05}, {"buildingId": "textile_mill", "level": 0, "amount": 0.75}, {"buildingId": "textile_mill", "level": 1, "amount": 0.975}, {"buildingId": "textile_mill", "level": 2, "amount": 1.6875}, {"buildingId": "garment_factory", "level": 0, "amount": 0.75}, {"buildingId": "garment_factory", "level": 1, "amount": 0.975}, {"buildingId": "garment_factory", "level": 2, "amount": 1.6875}, {"buildingId": "mechanized_farm", "level": 2, "amount": 0.03}],
+    "fine_clothes": [{"buildingId": "town_hall", "level": 0, "amount": 0.05}, {"buildingId": "church", "level": 0, "amount": 0.1333}, {"buildingId": "church", "level": 1, "amount": 0.04}, {"buildingId": "church", "level": 2, "amount": 0.05}, {"buildingId": "amphitheater", "level": 0, "amount": 0.225}, {"buildingId": "amphitheater", "level": 1, "amount": 0.06}, {"buildingId": "amphitheater", "level": 2, "amount": 0.08}, {"buildingId": "opera_house", "level": 0, "amount": 0.2857}, {"buildingId": "opera_house", "level": 1, "amount": 0.25}, {"buildingId": "opera_house", "level": 2, "amount": 0.375}],
+    "food": [{"buildingId": "lumber_camp", "level": 1, "amount": 0.15}, {"buildingId": "quarry", "level": 1, "amount": 0.15}, {"buildingId": "quarry", "level": 2, "amount": 0.25}, {"buildingId": "copper_mine", "level": 1, "amount": 0.2}, {"buildingId": "copper_mine", "level": 2, "amount": 0.35}, {"buildingId": "culinary_kitchen", "level": 0, "amount": 2.0}, {"buildingId": "culinary_kitchen", "level": 1, "amount": 1.2}, {"buildingId": "culinary_kitchen", "level": 2, "amount": 1.8}, {"buildingId": "brewery", "level": 0, "amount": 1.8}, {"buildingId": "brewery", "level": 1, "amount": 1.0}, {"buildingId": "brewery", "level": 2, "amount": 1.5}, {"buildingId": "dye_works", "level": 0, "amount": 0.75}, {"buildingId": "dye_works", "level": 1, "amount": 0.6}, {"buildingId": "dye_works", "level": 2, "amount": 0.9}, {"buildingId": "mine", "level": 1, "amount": 0.3}, {"buildingId": "mine", "level": 2, "amount": 0.45}, {"buildingId": "coal_mine", "level": 1, "amount": 0.8}, {"buildingId": "coal_mine", "level": 2, "amount": 1.2}, {"buildingId": "monastery_cellar", "level": 0, "amount": 2.7}, {"buildingId": "monastery_cellar", "level": 1, "amount": 3.105}, {"buildingId": "monastery_cellar", "level": 2, "amount": 4.86}, {"buildingId": "wool_workshop", "level": 0, "amount": 0.9}, {"buildingId": "wool_workshop", "level": 1, "amount": 1.035}, {"buildingId": "wool_workshop", "level": 2, "amount": 1.62}, {"buildingId": "stone_workshop", "level": 1, "amount": 0.15}, {"buildingId": "stone_workshop", "level": 2, "amount": 0.25}, {"buildingId": "hardwood_camp", "level": 1, "amount": 0.2}, {"buildingId": "hardwood_camp", "level": 2, "amount": 0.35}, {"buildingId": "dye_workshop", "level": 0, "amount": 1.2}, {"buildingId": "dye_workshop", "level": 1, "amount": 0.9}, {"buildingId": "dye_workshop", "level": 2, "amount": 1.2}, {"buildingId": "textile_mill", "level": 0, "amount": 2.0}, {"buildingId": "textile_mill", "level": 1, "amount": 2.6}, {"buildingId": "textile_mill", "level": 2, "amount": 4.5}, {"buildingId": "cannery", "level": 0, "amount": 5.625}, {"buildingId": "cannery", "level": 1, "amount": 7.3125}, {"buildingId": "cannery", "level": 2, "amount": 12.65625}, {"buildingId": "distillery", "level": 0, "amount": 4.5}, {"buildingId": "distillery", "level": 1, "amount": 5.85}, {"buildingId": "distillery", "level": 2, "amount": 10.125}, {"buildingId": "industrial_mine", "level": 1, "amount": 0.8}, {"buildingId": "industrial_mine", "level": 2, "amount": 1.0}, {"buildingId": "logging_company", "level": 1, "amount": 0.4}, {"buildingId": "logging_company", "level": 2, "amount": 0.55}],
+    "furniture": [{"buildingId": "church", "level": 0, "amount": 0.1333}, {"buildingId": "church", "level": 1, "amount": 0.05}, {"buildingId": "church", "level": 2, "amount": 0.06}],
+    "iron": [{"buildingId": "dye_workshop", "level": 2, "amount": 0.02}, {"buildingId": "iron_tool_workshop", "level": 0, "amount": 1.0667}, {"buildingId": "iron_tool_workshop", "level": 1, "amount": 0.975}, {"buildingId": "iron_tool_workshop", "level": 2, "amount": 1.5}, {"buildingId": "steel_foundry", "level": 0, "amount": 0.7}, {"buildingId": "steel_foundry", "level": 1, "amount": 1.2}, {"buildingId": "steel_foundry", "level": 2, "amount": 2.4}, {"buildingId": "metallurgy_workshop", "level": 0, "amount": 1.7143}, {"buildingId": "metallurgy_workshop", "level": 1, "amount": 1.2}, {"buildingId": "metallurgy_workshop", "level": 2, "amount": 1.8}, {"buildingId": "steel_works", "level": 0, "amount": 1.44}, {"buildingId": "cannery", "level": 0, "amount": 0.675}, {"buildingId": "cannery", "level": 1, "amount": 0.8775}, {"buildingId": "cannery", "level": 2, "amount": 1.51875}, {"buildingId": "mechanized_farm", "level": 1, "amount": 0.06}, {"buildingId": "mechanized_farm", "level": 2, "amount": 0.1}],
+    "papyrus": [{"buildingId": "trading_post", "level": 2, "amount": 0.01}, {"buildingId": "town_hall", "level": 0, "amount": 0.02}, {"buildingId": "church", "level": 2, "amount": 0.02}, {"buildingId": "navigator_school", "level": 1, "amount": 0.05}, {"buildingId": "navigator_school", "level": 2, "amount": 0.08}, {"buildingId": "printing_house", "level": 0, "amount": 0.8}, {"buildingId": "printing_house", "level": 1, "amount": 0.48}, {"buildingId": "printing_house", "level": 2, "amount": 0.75}, {"buildingId": "library", "level": 1, "amount": 0.08}, {"buildingId": "library", "level": 2, "amount": 0.15}, {"buildingId": "market", "level": 1, "amount": 0.12}, {"buildingId": "market", "level": 2, "amount": 0.18}, {"buildingId": "magistrate_office", "level": 0, "amount": 0.015}, {"buildingId": "publishing_house", "level": 0, "amount": 2.0}, {"buildingId": "university", "level": 0, "amount": 0.36}, {"buildingId": "university", "level": 1, "amount": 0.3125}, {"buildingId": "university", "level": 2, "amount": 0.4375}, {"buildingId": "stock_exchange", "level": 0, "amount": 0.32}],
+    "plank": [{"buildingId": "furniture_workshop", "level": 0, "amount": 1.3333}, {"buildingId": "furniture_workshop", "level": 1, "amount": 1.0}, {"buildingId": "furniture_workshop", "level": 2, "amount": 1.5}, {"buildingId": "furniture_factory", "level": 0, "amount": 5.625}, {"buildingId": "furniture_factory", "level": 1, "amount": 7.3125}, {"buildingId": "furniture_factory", "level": 2, "amount": 12.65625}],
+    "science": [{"buildingId": "town_hall", "level": 0, "amount": 0.05}, {"buildingId": "shaft_mine", "level": 0, "amount": 0.05}, {"buildingId": "shaft_mine", "level": 1, "amount": 0.065}, {"buildingId": "shaft_mine", "level": 2, "amount": 0.11}, {"buildingId": "dye_workshop", "level": 0, "amount": 0.02}, {"buildingId": "dye_workshop", "level": 1, "amount": 0.026}, {"buildingId": "dye_workshop", "level": 2, "amount": 0.045}, {"buildingId": "rail_depot", "level": 0, "amount": 0.15}, {"buildingId": "rail_depot", "level": 1, "amount": 0.195}, {"buildingId": "rail_depot", "level": 2, "amount": 0.3375}, {"buildingId": "factory", "level": 0, "amount": 0.5}, {"buildingId": "factory", "level": 1, "amount": 0.75}, {"buildingId": "factory", "level": 2, "amount": 1.0}, {"buildingId": "printing_house", "level": 0, "amount": 0.3}, {"buildingId": "printing_house", "level": 1, "amount": 0.2}, {"buildingId": "printing_house", "level": 2, "amount": 0.35}, {"buildingId": "steel_foundry", "level": 0, "amount": 0.2}, {"buildingId": "steel_foundry", "level": 1, "amount": 0.3}, {"buildingId": "steel_foundry", "level": 2, "amount": 0.6}, {"buildingId": "library", "level": 2, "amount": 0.15}, {"buildingId": "steel_works", "level": 0, "amount": 0.4}, {"buildingId": "university", "level": 0, "amount": 0.5}, {"buildingId": "university", "level": 1, "amount": 0.4}, {"buildingId": "university", "level": 2, "amount": 0.7}],
+    "spice": [{"buildingId": "culinary_kitchen", "level": 2, "amount": 0.06}, {"buildingId": "brewery", "level": 2, "amount": 0.03}, {"buildingId": "dye_workshop", "level": 0, "amount": 0.075}, {"buildingId": "dye_workshop", "level": 1, "amount": 0.06}, {"buildingId": "dye_workshop", "level": 2, "amount": 0.08}, {"buildingId": "trade_port", "level": 0, "amount": 0.4}, {"buildingId": "trade_port", "level": 1, "amount": 0.46}, {"buildingId": "trade_port", "level": 2, "amount": 0.72}],
+    "steel": [{"buildingId": "factory", "level": 0, "amount": 2.0}, {"buildingId": "factory", "level": 1, "amount": 3.0}, {"buildingId": "factory", "level": 2, "amount": 4.2}, {"buildingId": "prefab_factory", "level": 0, "amount": 0.4}, {"buildingId": "prefab_factory", "level": 1, "amount": 0.52}, {"buildingId": "prefab_factory", "level": 2, "amount": 0.9}],
+    "stone": [{"buildingId": "brickworks", "level": 0, "amount": 1.5}, {"buildingId": "brickworks", "level": 1, "amount": 1.725}, {"buildingId": "brickworks", "level": 2, "amount": 2.7}, {"buildingId": "stone_tool_workshop", "level": 0, "amount": 1.2}, {"buildingId": "stone_tool_workshop", "level": 1, "amount": 1.35}, {"buildingId": "stone_tool_workshop", "level": 2, "amount": 1.8}, {"buildingId": "building_materials_plant", "level": 0, "amount": 4.5}, {"buildingId": "building_materials_plant", "level": 1, "amount": 5.85}, {"buildingId": "building_materials_plant", "level": 2, "amount": 10.125}, {"buildingId": "prefab_factory", "level": 0, "amount": 2.0}, {"buildingId": "prefab_factory", "level": 1, "amount": 2.6}, {"buildingId": "prefab_factory", "level": 2, "amount": 4.5}],
+    "tools": [{"buildingId": "farm", "level": 1, "amount": 0.04}, {"buildingId": "farm", "level": 2, "amount": 0.08}, {"buildingId": "trading_post", "level": 1, "amount": 0.01}, {"buildingId": "trading_post", "level": 2, "amount": 0.02}, {"buildingId": "large_estate", "level": 1, "amount": 0.1}, {"buildingId": "large_estate", "level": 2, "amount": 0.18}, {"buildingId": "lumber_camp", "level": 1, "amount": 0.05}, {"buildingId": "lumber_camp", "level": 2, "amount": 0.1}, {"buildingId": "quarry", "level": 1, "amount": 0.06}, {"buildingId": "quarry", "level": 2, "amount": 0.12}, {"buildingId": "copper_mine", "level": 0, "amount": 0.0267}, {"buildingId": "copper_mine", "level": 1, "amount": 0.05}, {"buildingId": "copper_mine", "level": 2, "amount": 0.1}, {"buildingId": "reed_works", "level": 1, "amount": 0.01}, {"buildingId": "reed_works", "level": 2, "amount": 0.02}, {"buildingId": "culinary_kitchen", "level": 0, "amount": 0.1333}, {"buildingId": "culinary_kitchen", "level": 1, "amount": 0.08}, {"buildingId": "culinary_kitchen", "level": 2, "amount": 0.12}, {"buildingId": "brewery", "level": 1, "amount": 0.01}, {"buildingId": "brewery", "level": 2, "amount": 0.02}, {"buildingId": "furniture_workshop", "level": 0, "amount": 0.1333}, {"buildingId": "furniture_workshop", "level": 1, "amount": 0.08}, {"buildingId": "furniture_workshop", "level": 2, "amount": 0.12}, {"buildingId": "loom_house", "level": 1, "amount": 0.02}, {"buildingId": "loom_house", "level": 2, "amount": 0.04}, {"buildingId": "dye_works", "level": 1, "amount": 0.02}, {"buildingId": "dye_works", "level": 2, "amount": 0.04}, {"buildingId": "tailor_workshop", "level": 0, "amount": 0.06}, {"buildingId": "tailor_workshop", "level": 1, "amount": 0.069}, {"buildingId": "tailor_workshop", "level": 2, "amount": 0.108}, {"buildingId": "mine", "level": 0, "amount": 0.072}, {"buildingId": "mine", "level": 1, "amount": 0.08}, {"buildingId": "mine", "level": 2, "amount": 0.15}, {"buildingId": "coffee_plantation", "level": 1, "amount": 0.03}, {"buildingId": "coffee_plantation", "level": 2, "amount": 0.06}, {"buildingId": "coal_mine", "level": 0, "amount": 0.2}, {"buildingId": "coal_mine", "level": 1, "amount": 0.35}, {"buildingId": "coal_mine", "level": 2, "amount": 0.55}, {"buildingId": "wool_workshop", "level": 0, "amount": 0.045}, {"buildingId": "wool_workshop", "level": 1, "amount": 0.05175}, {"buildingId": "wool_workshop", "level": 2, "amount": 0.081}, {"buildingId": "stone_workshop", "level": 0, "amount": 0.075}, {"buildingId": "stone_workshop", "level": 1, "amount": 0.08}, {"buildingId": "stone_workshop", "level": 2, "amount": 0.12}, {"buildingId": "hardwood_camp", "level": 0, "amount": 0.096}, {"buildingId": "hardwood_camp", "level": 1, "amount": 0.1}, {"buildingId": "hardwood_camp", "level": 2, "amount": 0.15}, {"buildingId": "shaft_mine", "level": 0, "amount": 0.144}, {"buildingId": "shaft_mine", "level": 1, "amount": 0.14}, {"buildingId": "shaft_mine", "level": 2, "amount": 0.2}, {"buildingId": "sawmill", "level": 1, "amount": 0.03}, {"buildingId": "sawmill", "level": 2, "amount": 0.06}, {"buildingId": "brickworks", "level": 1, "amount": 0.02}, {"buildingId": "brickworks", "level": 2, "amount": 0.04}, {"buildingId": "bronze_foundry", "level": 1, "amount": 0.015}, {"buildingId": "bronze_foundry", "level": 2, "amount": 0.03}, {"buildingId": "iron_tool_workshop", "level": 1, "amount": 0.015}, {"buildingId": "iron_tool_workshop", "level": 2, "amount": 0.03}, {"buildingId": "dockyard", "level": 1, "amount": 0.02}, {"buildingId": "dockyard", "level": 2, "amount": 0.03}, {"buildingId": "textile_mill", "level": 1, "amount": 0.04}, {"buildingId": "textile_mill", "level": 2, "amount": 0.0692}, {"buildingId": "lumber_mill", "level": 1, "amount": 0.024}, {"buildingId": "lumber_mill", "level": 2, "amount": 0.048}, {"buildingId": "industrial_mine", "level": 0, "amount": 0.2615}, {"buildingId": "industrial_mine", "level": 1, "amount": 0.33995}, {"buildingId": "industrial_mine", "level": 2, "amount": 0.588375}, {"buildingId": "mechanized_farm", "level": 0, "amount": 0.175}, {"buildingId": "mechanized_farm", "level": 1, "amount": 0.2275}, {"buildingId": "mechanized_farm", "level": 2, "amount": 0.39375}, {"buildingId": "logging_company", "level": 0, "amount": 0.1333}, {"buildingId": "logging_company", "level": 1, "amount": 0.1563}, {"buildingId": "logging_company", "level": 2, "amount": 0.270825}],
+    "wood": [{"buildingId": "farm", "level": 1, "amount": 0.06}, {"buildingId": "farm", "level": 2, "amount": 0.1}, {"buildingId": "large_estate", "level": 1, "amount": 0.15}, {"buildingId": "large_estate", "level": 2, "amount": 0.25}, {"buildingId": "quarry", "level": 1, "amount": 0.15}, {"buildingId": "quarry", "level": 2, "amount": 0.25}, {"buildingId": "copper_mine", "level": 1, "amount": 0.2}, {"buildingId": "copper_mine", "level": 2, "amount": 0.35}, {"buildingId": "reed_works", "level": 0, "amount": 0.75}, {"buildingId": "brewery", "level": 0, "amount": 0.3}, {"buildingId": "brewery", "level": 1, "amount": 0.15}, {"buildingId": "brewery", "level": 2, "amount": 0.25}, {"buildingId": "mine", "level": 1, "amount": 0.2}, {"buildingId": "mine", "level": 2, "amount": 0.35}, {"buildingId": "coal_mine", "level": 1, "amount": 0.5}, {"buildingId": "coal_mine", "level": 2, "amount": 0.8}, {"buildingId": "monastery_cellar", "level": 0, "amount": 0.45}, {"buildingId": "monastery_cellar", "level": 1, "amount": 0.5175}, {"buildingId": "monastery_cellar", "level": 2, "amount": 0.81}, {"buildingId": "shaft_mine", "level": 0, "amount": 0.3}, {"buildingId": "shaft_mine", "level": 1, "amount": 0.3}, {"buildingId": "shaft_mine", "level": 2, "amount": 0.4}, {"buildingId": "sawmill", "level": 0, "amount": 1.6}, {"buildingId": "sawmill", "level": 1, "amount": 1.4}, {"buildingId": "sawmill", "level": 2, "amount": 2.0}, {"buildingId": "brickworks", "level": 0, "amount": 0.45}, {"buildingId": "brickworks", "level": 1, "amount": 0.5175}, {"buildingId": "brickworks", "level": 2, "amount": 0.81}, {"buildingId": "stone_tool_workshop", "level": 0, "amount": 1.5}, {"buildingId": "stone_tool_workshop", "level": 1, "amount": 1.65}, {"buildingId": "stone_tool_workshop", "level": 2, "amount": 2.25}, {"buildingId": "bronze_foundry", "level": 0, "amount": 0.5333}, {"buildingId": "bronze_foundry", "level": 1, "amount": 0.45}, {"buildingId": "bronze_foundry", "level": 2, "amount": 0.675}, {"buildingId": "iron_tool_workshop", "level": 0, "amount": 0.6667}, {"buildingId": "iron_tool_workshop", "level": 1, "amount": 0.6}, {"buildingId": "iron_tool_workshop", "level": 2, "amount": 0.9}, {"buildingId": "dockyard", "level": 0, "amount": 0.6}, {"buildingId": "dockyard", "level": 1, "amount": 0.4}, {"buildingId": "dockyard", "level": 2, "amount": 0.6}, {"buildingId": "lumber_mill", "level": 0, "amount": 6.4286}, {"buildingId": "lumber_mill", "level": 1, "amount": 8.3572}, {"buildingId": "lumber_mill", "level": 2, "amount": 14.4644}, {"buildingId": "metallurgy_workshop", "level": 0, "amount": 0.9143}, {"buildingId": "metallurgy_workshop", "level": 1, "amount": 0.6}, {"buildingId": "metallurgy_workshop", "level": 2, "amount": 0.9}, {"buildingId": "building_materials_plant", "level": 0, "amount": 1.35}, {"buildingId": "building_materials_plant", "level": 1, "amount": 1.755}, {"buildingId": "building_materials_plant", "level": 2, "amount": 3.0375}, {"buildingId": "paper_mill", "level": 0, "amount": 3.0}, {"buildingId": "paper_mill", "level": 1, "amount": 3.9}, {"buildingId": "paper_mill", "level": 2, "amount": 6.75}, {"buildingId": "industrial_mine", "level": 1, "amount": 0.4}, {"buildingId": "industrial_mine", "level": 2, "amount": 0.6}],
+});
+
+export const BUILDING_LEVEL_IO = deepFreeze({
+    "farm": [{"level": 0, "name": "农田", "input": {}, "output": {"food": 4.8}, "jobs": {"peasant": 3}, "owner": "peasant"}, {"level": 1, "name": "灌溉田", "input": {"tools": 0.04, "wood": 0.06}, "output": {"food": 6.24}, "jobs": {"peasant": 3}, "owner": "peasant"}, {"level": 2, "name": "精耕田", "input": {"tools": 0.08, "wood": 0.1}, "output": {"food": 10.8}, "jobs": {"peasant": 4}, "owner": "peasant"}],
+    "trading_post": [{"level": 0, "name": "贸易站", "input": {}, "output": {"food": 4, "silver": 1.6}, "jobs": {"merchant": 2}, "owner": "merchant"}, {"level": 1, "name": "商铺", "input": {"tools": 0.01}, "output": {"food": 5.2, "silver": 2.08}, "jobs": {"merchant": 2}, "owner": "merchant"}, {"level": 2, "name": "商会", "input": {"tools": 0.02, "papyrus": 0.01}, "output": {"food": 9.0, "silver": 3.6, "spice": 0.02}, "jobs": {"merchant": 3}, "owner": "merchant"}],
+    "large_estate": [{"level": 0, "name": "庄园", "input": {}, "output": {"food": 24.0}, "jobs": {"serf": 8, "landowner": 1}, "owner": "landowner"}, {"level": 1, "name": "繁荣庄园", "input": {"tools": 0.1, "wood": 0.15}, "output": {"food": 31.2}, "jobs": {"serf": 8, "landowner": 1}, "owner": "landowner"}, {"level": 2, "name": "领主庄园", "input": {"tools": 0.18, "wood": 0.25, "cloth": 0.05}, "output": {"food": 54.0, "cloth": 0.1, "ale": 0.03}, "jobs": {"serf": 9, "landowner": 1}, "owner": "landowner"}],
+    "lumber_camp": [{"level": 0, "name": "伐木场", "input": {}, "output": {"wood": 3.84}, "jobs": {"lumberjack": 3}, "owner": "lumberjack"}, {"level": 1, "name": "大伐木场", "input": {"tools": 0.05, "food": 0.15}, "output": {"wood": 4.992}, "jobs": {"lumberjack": 3}, "owner": "lumberjack"}, {"level": 2, "name": "林场", "input": {"tools": 0.1}, "output": {"wood": 8.64, "food": 0.15}, "jobs": {"lumberjack": 4}, "owner": "lumberjack"}],
+    "quarry": [{"level": 0, "name": "采石场", "input": {}, "output": {"stone": 3.0}, "jobs": {"miner": 3}, "owner": "miner"}, {"level": 1, "name": "深坑采石场", "input": {"tools": 0.06, "wood": 0.15, "food": 0.15}, "output": {"stone": 3.9}, "jobs": {"miner": 3}, "owner": "miner"}, {"level": 2, "name": "大采石场", "input": {"tools": 0.12, "wood": 0.25, "food": 0.25}, "output": {"stone": 6.75, "copper": 0.02}, "jobs": {"miner": 4}, "owner": "miner"}],
+    "copper_mine": [{"level": 0, "name": "铜矿井", "input": {"tools": 0.0267}, "output": {"copper": 0.6667}, "jobs": {"miner": 4}, "owner": "miner"}, {"level": 1, "name": "深铜矿", "input": {"tools": 0.05, "wood": 0.2, "food": 0.2}, "output": {"copper": 0.8667}, "jobs": {"miner": 4}, "owner": "miner"}, {"level": 2, "name": "大铜矿", "input": {"tools": 0.1, "wood": 0.35, "food": 0.35}, "output": {"copper": 1.5, "stone": 0.15}, "jobs": {"miner": 5}, "owner": "miner"}],
+    "reed_works": [{"level": 0, "name": "造纸工坊", "input": {"wood": 0.75}, "output": {"papyrus": 0.9}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 1, "name": "改良造纸坊", "input": {"tools": 0.01}, "output": {"papyrus": 1.17}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 2, "name": "大造纸坊", "input": {"tools": 0.02}, "output": {"papyrus": 2.025, "science": 0.05}, "jobs": {"worker": 4}, "owner": "worker"}],
+    "culinary_kitchen": [{"level": 0, "name": "烹饪坊", "input": {"tools": 0.1333, "food": 2.0}, "output": {"delicacies": 2.0}, "jobs": {"artisan": 3, "peasant": 1}, "owner": "artisan"}, {"level": 1, "name": "精致厨房", "input": {"tools": 0.08, "food": 1.2}, "output": {"delicacies": 2.6}, "jobs": {"artisan": 3, "peasant": 1}, "owner": "artisan"}, {"level": 2, "name": "御膳房", "input": {"tools": 0.12, "food": 1.8, "spice": 0.06}, "output": {"delicacies": 4.5, "culture": 0.08}, "jobs": {"artisan": 3, "peasant": 2}, "owner": "artisan"}],
+    "brewery": [{"level": 0, "name": "酿造坊", "input": {"food": 1.8, "wood": 0.3}, "output": {"ale": 1.8}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 1, "name": "大酒坊", "input": {"food": 1.0, "wood": 0.15, "tools": 0.01}, "output": {"ale": 2.34}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 2, "name": "酿酒工坊", "input": {"food": 1.5, "wood": 0.25, "tools": 0.02, "spice": 0.03}, "output": {"ale": 4.05, "culture": 0.05}, "jobs": {"worker": 4}, "owner": "worker"}],
+    "furniture_workshop": [{"level": 0, "name": "家具工坊", "input": {"tools": 0.1333, "plank": 1.3333, "cloth": 0.4}, "output": {"furniture": 1.6}, "jobs": {"artisan": 4}, "owner": "artisan"}, {"level": 1, "name": "精工家具坊", "input": {"tools": 0.08, "plank": 1.0, "cloth": 0.25}, "output": {"furniture": 2.08}, "jobs": {"artisan": 4}, "owner": "artisan"}, {"level": 2, "name": "大家具坊", "input": {"tools": 0.12, "plank": 1.5, "cloth": 0.35}, "output": {"furniture": 3.6}, "jobs": {"artisan": 5}, "owner": "artisan"}],
+    "loom_house": [{"level": 0, "name": "织布坊", "input": {}, "output": {"cloth": 2.88}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 1, "name": "织布坊", "input": {"tools": 0.02}, "output": {"cloth": 3.744}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 2, "name": "大织布坊", "input": {"tools": 0.04, "dye": 0.03}, "output": {"cloth": 6.48, "culture": 0.05}, "jobs": {"worker": 4}, "owner": "worker"}],
+    "dye_works": [{"level": 0, "name": "染坊", "input": {"food": 0.75}, "output": {"dye": 0.9}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 1, "name": "大染坊", "input": {"food": 0.6, "tools": 0.02}, "output": {"dye": 1.17}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 2, "name": "染色工坊", "input": {"food": 0.9, "tools": 0.04, "cloth": 0.05}, "output": {"dye": 2.025, "culture": 0.05}, "jobs": {"worker": 4}, "owner": "worker"}],
+    "tailor_workshop": [{"level": 0, "name": "成衣作坊", "input": {"tools": 0.06, "cloth": 1.5, "dye": 0.3}, "output": {"fine_clothes": 1.2, "culture": 0.5}, "jobs": {"artisan": 3}, "owner": "artisan"}, {"level": 1, "name": "高级成衣坊", "input": {"tools": 0.069, "cloth": 1.725, "dye": 0.345}, "output": {"fine_clothes": 1.56, "culture": 0.65}, "jobs": {"artisan": 3}, "owner": "artisan"}, {"level": 2, "name": "御用成衣坊", "input": {"tools": 0.108, "cloth": 2.7, "dye": 0.54}, "output": {"fine_clothes": 2.7, "culture": 1.125}, "jobs": {"artisan": 4}, "owner": "artisan"}],
+    "mine": [{"level": 0, "name": "铁矿井", "input": {"tools": 0.072}, "output": {"iron": 0.9}, "jobs": {"miner": 9, "landowner": 1}, "owner": "landowner"}, {"level": 1, "name": "深井铁矿", "input": {"tools": 0.08, "wood": 0.2, "food": 0.3}, "output": {"iron": 1.65}, "jobs": {"miner": 7, "landowner": 1}, "owner": "landowner"}, {"level": 2, "name": "大铁矿", "input": {"tools": 0.15, "wood": 0.35, "food": 0.45}, "output": {"iron": 2.86, "coal": 0.05}, "jobs": {"miner": 9, "landowner": 1}, "owner": "landowner"}],
+    "coffee_plantation": [{"level": 0, "name": "咖啡种植园", "input": {}, "output": {"coffee": 0.6}, "jobs": {"serf": 6, "merchant": 1}, "owner": "merchant"}, {"level": 1, "name": "大种植园", "input": {"tools": 0.03}, "output": {"coffee": 0.78}, "jobs": {"serf": 6, "merchant": 1}, "owner": "merchant"}, {"level": 2, "name": "种植园庄园", "input": {"tools": 0.06}, "output": {"coffee": 1.35, "spice": 0.02, "food": 0.5}, "jobs": {"serf": 8, "merchant": 1}, "owner": "merchant"}],
+    "coal_mine": [{"level": 0, "name": "煤矿", "input": {"tools": 0.2}, "output": {"coal": 3.0}, "jobs": {"miner": 12, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "深煤矿", "input": {"tools": 0.35, "wood": 0.5, "food": 0.8}, "output": {"coal": 5.0}, "jobs": {"miner": 13, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "大煤矿", "input": {"tools": 0.55, "wood": 0.8, "food": 1.2}, "output": {"coal": 8.0, "iron": 0.2}, "jobs": {"miner": 9, "capitalist": 1}, "owner": "capitalist"}],
+    "hut": [{"level": 0, "name": "简陋小屋", "input": {}, "output": {"maxPop": 3}, "jobs": {}, "owner": null}],
+    "house": [{"level": 0, "name": "木屋", "input": {}, "output": {"maxPop": 8}, "jobs": {}, "owner": null}],
+    "manor_house": [{"level": 0, "name": "石砌宅邸", "input": {}, "output": {"maxPop": 9}, "jobs": {}, "owner": null}],
+    "townhouse": [{"level": 0, "name": "联排住宅", "input": {}, "output": {"maxPop": 10}, "jobs": {}, "owner": null}],
+    "civic_apartment": [{"level": 0, "name": "阁楼公馆", "input": {}, "output": {"maxPop": 11}, "jobs": {}, "owner": null}],
+    "granary": [{"level": 0, "name": "粮仓", "input": {}, "output": {"maxPop": 6}, "jobs": {}, "owner": null}],
+    "town_hall": [{"level": 0, "name": "市政厅", "input": {"brick": 0.2, "papyrus": 0.02, "delicacies": 0.1, "fine_clothes": 0.05, "culture": 0.03, "science": 0.05}, "output": {}, "jobs": {"official": 7}, "owner": null}],
+    "church": [{"level": 0, "name": "教堂", "input": {"furniture": 0.1333, "fine_clothes": 0.1333, "brick": 0.0533}, "output": {"culture": 3.2, "silver": 0.6667}, "jobs": {"cleric": 4}, "owner": "cleric"}, {"level": 1, "name": "大教堂", "input": {"furniture": 0.05, "fine_clothes": 0.04}, "output": {"culture": 3.8, "silver": 1.2}, "jobs": {"cleric": 3}, "owner": "cleric"}, {"level": 2, "name": "主教座堂", "input": {"furniture": 0.06, "fine_clothes": 0.05, "papyrus": 0.02}, "output": {"culture": 5.5, "silver": 2.0, "science": 0.15}, "jobs": {"cleric": 4}, "owner": "cleric"}],
+    "monastery_cellar": [{"level": 0, "name": "修道院酒窖", "input": {"food": 2.7, "wood": 0.45}, "output": {"ale": 3.0, "culture": 1.2}, "jobs": {"cleric": 1, "worker": 3}, "owner": "cleric"}, {"level": 1, "name": "修道院大酒窖", "input": {"food": 3.105, "wood": 0.5175}, "output": {"ale": 3.9, "culture": 1.56}, "jobs": {"cleric": 1, "worker": 3}, "owner": "cleric"}, {"level": 2, "name": "酿酒修道院", "input": {"food": 4.86, "wood": 0.81}, "output": {"ale": 6.75, "culture": 2.7, "science": 0.08}, "jobs": {"cleric": 2, "worker": 2}, "owner": "cleric"}],
+    "wool_workshop": [{"level": 0, "name": "纺织工场", "input": {"food": 0.9, "tools": 0.045}, "output": {"cloth": 4.8, "fine_clothes": 0.3}, "jobs": {"serf": 4, "worker": 3}, "owner": "worker"}, {"level": 1, "name": "大纺织工场", "input": {"food": 1.035, "tools": 0.05175}, "output": {"cloth": 6.24, "fine_clothes": 0.39}, "jobs": {"serf": 4, "worker": 3}, "owner": "worker"}, {"level": 2, "name": "领主纺织工场", "input": {"food": 1.62, "tools": 0.081, "dye": 0.05}, "output": {"cloth": 10.8, "fine_clothes": 0.675, "culture": 0.05}, "jobs": {"serf": 5, "worker": 3}, "owner": "worker"}],
+    "stone_workshop": [{"level": 0, "name": "采石工场", "input": {"tools": 0.075}, "output": {"stone": 4.375}, "jobs": {"miner": 4, "worker": 1}, "owner": "miner"}, {"level": 1, "name": "大采石工场", "input": {"tools": 0.08, "food": 0.15}, "output": {"stone": 4.55}, "jobs": {"miner": 4, "worker": 1}, "owner": "miner"}, {"level": 2, "name": "皇家采石场", "input": {"tools": 0.12, "food": 0.25}, "output": {"stone": 7.875, "brick": 0.15}, "jobs": {"miner": 5, "worker": 1}, "owner": "miner"}],
+    "hardwood_camp": [{"level": 0, "name": "硬木林场", "input": {"tools": 0.096}, "output": {"wood": 5.76}, "jobs": {"lumberjack": 5, "worker": 1}, "owner": "lumberjack"}, {"level": 1, "name": "特用林场", "input": {"tools": 0.1, "food": 0.2}, "output": {"wood": 6.24}, "jobs": {"lumberjack": 5, "worker": 1}, "owner": "lumberjack"}, {"level": 2, "name": "皇家御林", "input": {"tools": 0.15, "food": 0.35}, "output": {"wood": 10.8, "food": 0.2}, "jobs": {"lumberjack": 6, "worker": 1}, "owner": "lumberjack"}],
+    "amphitheater": [{"level": 0, "name": "剧场", "input": {"fine_clothes": 0.225, "brick": 0.045}, "output": {"culture": 5.4}, "jobs": {"cleric": 3}, "owner": "cleric"}, {"level": 1, "name": "大剧场", "input": {"fine_clothes": 0.06}, "output": {"culture": 6.5, "silver": 0.8}, "jobs": {"cleric": 2}, "owner": "cleric"}, {"level": 2, "name": "宏伟剧场", "input": {"fine_clothes": 0.08, "ale": 0.03}, "output": {"culture": 9.0, "silver": 1.5}, "jobs": {"cleric": 2}, "owner": "cleric"}],
+    "navigator_school": [{"level": 0, "name": "航海学院", "input": {}, "output": {"science": 0.75, "culture": 1.0}, "jobs": {"navigator": 3, "scribe": 1}, "owner": "scribe"}, {"level": 1, "name": "航海学府", "input": {"papyrus": 0.05}, "output": {"science": 0.78, "culture": 1.2}, "jobs": {"navigator": 3, "scribe": 1}, "owner": "scribe"}, {"level": 2, "name": "皇家航海学院", "input": {"papyrus": 0.08, "coffee": 0.03}, "output": {"science": 1.35, "culture": 1.8}, "jobs": {"navigator": 4, "scribe": 1}, "owner": "scribe"}],
+    "shaft_mine": [{"level": 0, "name": "竖井矿场", "input": {"tools": 0.144, "wood": 0.3, "science": 0.05}, "output": {"iron": 1.44, "copper": 0.96}, "jobs": {"miner": 6, "engineer": 1}, "owner": "miner"}, {"level": 1, "name": "通风矿井", "input": {"tools": 0.14, "wood": 0.3, "science": 0.065}, "output": {"iron": 1.872, "copper": 1.248}, "jobs": {"miner": 6, "engineer": 1}, "owner": "miner"}, {"level": 2, "name": "蒸汽矿井", "input": {"tools": 0.2, "coal": 0.15, "wood": 0.4, "science": 0.11}, "output": {"iron": 3.24, "copper": 2.16, "coal": 0.1}, "jobs": {"miner": 7, "engineer": 1}, "owner": "miner"}],
+    "dye_workshop": [{"level": 0, "name": "印染工坊", "input": {"food": 1.2, "cloth": 0.6, "spice": 0.075, "science": 0.02}, "output": {"dye": 1.8, "fine_clothes": 0.45}, "jobs": {"artisan": 3, "worker": 2}, "owner": "artisan"}, {"level": 1, "name": "大印染工坊", "input": {"food": 0.9, "cloth": 0.5, "spice": 0.06, "science": 0.026}, "output": {"dye": 2.34, "fine_clothes": 0.585}, "jobs": {"artisan": 3, "worker": 2}, "owner": "artisan"}, {"level": 2, "name": "皇家印染工坊", "input": {"food": 1.2, "cloth": 0.7, "spice": 0.08, "iron": 0.02, "science": 0.045}, "output": {"dye": 4.05, "fine_clothes": 1.0125, "culture": 0.08}, "jobs": {"artisan": 4, "worker": 2}, "owner": "artisan"}],
+    "coffee_house": [{"level": 0, "name": "咖啡馆", "input": {"coffee": 0.5333, "delicacies": 0.2667}, "output": {"culture": 4.0, "science": 1.3333}, "jobs": {"merchant": 1, "scribe": 3}, "owner": "merchant"}, {"level": 1, "name": "文人咖啡馆", "input": {"coffee": 0.2, "delicacies": 0.08}, "output": {"culture": 4.8, "science": 1.733, "silver": 0.6}, "jobs": {"merchant": 1, "scribe": 2}, "owner": "merchant"}, {"level": 2, "name": "沙龙", "input": {"coffee": 0.3, "delicacies": 0.1}, "output": {"culture": 7.0, "science": 3.0, "silver": 1.2}, "jobs": {"merchant": 1, "scribe": 3}, "owner": "merchant"}],
+    "rail_depot": [{"level": 0, "name": "铁路枢纽", "input": {"coal": 0.72, "ale": 0.36, "delicacies": 0.18, "science": 0.15}, "output": {"silver": 2.7, "maxPop": 14}, "jobs": {"engineer": 4, "merchant": 3, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大铁路站", "input": {"coal": 0.375, "ale": 0.1, "delicacies": 0.05, "science": 0.195}, "output": {"silver": 3.51, "maxPop": 15}, "jobs": {"engineer": 4, "merchant": 3, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "铁路枢纽", "input": {"coal": 0.5625, "ale": 0.15, "delicacies": 0.075, "science": 0.3375}, "output": {"silver": 6.075, "maxPop": 16, "food": 0.625, "culture": 0.125}, "jobs": {"engineer": 5, "merchant": 4, "capitalist": 1}, "owner": "capitalist"}],
+    "sawmill": [{"level": 0, "name": "锯木厂", "input": {"wood": 1.6}, "output": {"plank": 3.47}, "jobs": {"worker": 4}, "owner": "worker"}, {"level": 1, "name": "水力锯木坊", "input": {"wood": 1.4, "tools": 0.03}, "output": {"plank": 4.511}, "jobs": {"worker": 4}, "owner": "worker"}, {"level": 2, "name": "大锯木坊", "input": {"wood": 2.0, "tools": 0.06, "cloth": 0.05}, "output": {"plank": 7.8075, "furniture": 0.05}, "jobs": {"worker": 5}, "owner": "worker"}],
+    "brickworks": [{"level": 0, "name": "砖窑", "input": {"stone": 1.5, "wood": 0.45}, "output": {"brick": 3.6}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 1, "name": "改良砖窑", "input": {"stone": 1.725, "wood": 0.5175, "tools": 0.02}, "output": {"brick": 4.68}, "jobs": {"worker": 3}, "owner": "worker"}, {"level": 2, "name": "大砖窑", "input": {"stone": 2.7, "wood": 0.81, "tools": 0.04}, "output": {"brick": 8.1, "tools": 0.02}, "jobs": {"worker": 4}, "owner": "worker"}],
+    "stone_tool_workshop": [{"level": 0, "name": "石器作坊", "input": {"wood": 1.5, "stone": 1.2}, "output": {"tools": 0.75}, "jobs": {"artisan": 3}, "owner": "artisan"}, {"level": 1, "name": "工匠铺", "input": {"wood": 1.65, "stone": 1.35}, "output": {"tools": 0.975}, "jobs": {"artisan": 3}, "owner": "artisan"}, {"level": 2, "name": "大工匠铺", "input": {"wood": 2.25, "stone": 1.8}, "output": {"tools": 1.35}, "jobs": {"artisan": 3}, "owner": "artisan"}],
+    "bronze_foundry": [{"level": 0, "name": "青铜铸坊", "input": {"copper": 0.8, "wood": 0.5333}, "output": {"tools": 1.3333}, "jobs": {"worker": 3, "artisan": 1}, "owner": "artisan"}, {"level": 1, "name": "改良铸坊", "input": {"copper": 0.75, "wood": 0.45, "tools": 0.015}, "output": {"tools": 1.95}, "jobs": {"worker": 3, "artisan": 1}, "owner": "artisan"}, {"level": 2, "name": "大铸坊", "input": {"copper": 1.05, "wood": 0.675, "tools": 0.03}, "output": {"tools": 2.7}, "jobs": {"worker": 3, "artisan": 1}, "owner": "artisan"}],
+    "iron_tool_workshop": [{"level": 0, "name": "铁器铺", "input": {"wood": 0.6667, "iron": 1.0667}, "output": {"tools": 2.0}, "jobs": {"worker": 3, "artisan": 1}, "owner": "artisan"}, {"level": 1, "name": "精铁工坊", "input": {"wood": 0.6, "iron": 0.975, "tools": 0.015}, "output": {"tools": 2.925}, "jobs": {"worker": 3, "artisan": 1}, "owner": "artisan"}, {"level": 2, "name": "大铁匠铺", "input": {"wood": 0.9, "iron": 1.5, "tools": 0.03}, "output": {"tools": 4.05}, "jobs": {"worker": 3, "artisan": 1}, "owner": "artisan"}],
+    "factory": [{"level": 0, "name": "工厂", "input": {"steel": 2.0, "coal": 2.0, "science": 0.5}, "output": {"tools": 15.0}, "jobs": {"worker": 20, "engineer": 4, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大工厂", "input": {"steel": 3.0, "coal": 3.0, "science": 0.75}, "output": {"tools": 22.0}, "jobs": {"worker": 20, "engineer": 4, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "制造中心", "input": {"steel": 4.2, "coal": 4.2, "science": 1.0}, "output": {"tools": 32.0, "steel": 0.1, "science": 0.2}, "jobs": {"worker": 21, "engineer": 4, "capitalist": 1}, "owner": "capitalist"}],
+    "printing_house": [{"level": 0, "name": "印刷所", "input": {"papyrus": 0.8, "coffee": 0.2, "brick": 0.08, "science": 0.3}, "output": {"science": 2.4, "culture": 2.0}, "jobs": {"artisan": 5, "scribe": 3, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大印刷所", "input": {"papyrus": 0.48, "coffee": 0.09, "science": 0.2}, "output": {"science": 3.12, "culture": 2.4}, "jobs": {"artisan": 5, "scribe": 3, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "出版社", "input": {"papyrus": 0.75, "coffee": 0.15, "science": 0.35}, "output": {"science": 5.4, "culture": 3.6}, "jobs": {"artisan": 5, "scribe": 3, "capitalist": 1}, "owner": "capitalist"}],
+    "steel_foundry": [{"level": 0, "name": "炼钢厂", "input": {"iron": 0.7, "coal": 0.7, "science": 0.2}, "output": {"steel": 0.7}, "jobs": {"engineer": 5, "worker": 7, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大炼钢厂", "input": {"iron": 1.2, "coal": 1.2, "science": 0.3}, "output": {"steel": 1.2}, "jobs": {"engineer": 5, "worker": 7, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "钢铁联合厂", "input": {"iron": 2.4, "coal": 2.4, "science": 0.6}, "output": {"steel": 2.4, "tools": 0.2}, "jobs": {"engineer": 5, "worker": 8, "capitalist": 1}, "owner": "capitalist"}],
+    "library": [{"level": 0, "name": "图书馆", "input": {}, "output": {"science": 1.0667}, "jobs": {"scribe": 4}, "owner": "scribe"}, {"level": 1, "name": "学堂", "input": {"papyrus": 0.08}, "output": {"science": 1.3867}, "jobs": {"scribe": 4}, "owner": "scribe"}, {"level": 2, "name": "书院", "input": {"papyrus": 0.15, "science": 0.15}, "output": {"science": 2.4, "culture": 0.12}, "jobs": {"scribe": 5}, "owner": "scribe"}],
+    "market": [{"level": 0, "name": "市场", "input": {"brick": 0.075}, "output": {"food": 3.0}, "jobs": {"merchant": 3}, "owner": "merchant"}, {"level": 1, "name": "大市场", "input": {"papyrus": 0.12, "coffee": 0.075}, "output": {"food": 3.9, "silver": 0.45}, "jobs": {"merchant": 4, "scribe": 1}, "owner": "merchant"}, {"level": 2, "name": "交易所", "input": {"papyrus": 0.18, "coffee": 0.12}, "output": {"food": 6.75, "silver": 0.75, "culture": 0.225}, "jobs": {"merchant": 5, "scribe": 1}, "owner": "merchant"}],
+    "magistrate_office": [{"level": 0, "name": "官署", "input": {"papyrus": 0.015, "brick": 0.03}, "output": {}, "jobs": {"official": 3, "scribe": 1}, "owner": null}],
+    "dockyard": [{"level": 0, "name": "船坞", "input": {"wood": 0.6}, "output": {"spice": 0.84}, "jobs": {"navigator": 3, "worker": 2, "merchant": 1}, "owner": "merchant"}, {"level": 1, "name": "大船坞", "input": {"wood": 0.4, "tools": 0.02}, "output": {"spice": 0.9}, "jobs": {"navigator": 2, "worker": 2, "merchant": 1}, "owner": "merchant"}, {"level": 2, "name": "皇家船厂", "input": {"wood": 0.6, "tools": 0.03, "cloth": 0.06}, "output": {"spice": 1.55, "silver": 0.25, "science": 0.05}, "jobs": {"navigator": 3, "worker": 2, "merchant": 1}, "owner": "merchant"}],
+    "trade_port": [{"level": 0, "name": "贸易港", "input": {"spice": 0.4}, "output": {"food": 2.6667}, "jobs": {"merchant": 4}, "owner": "merchant"}, {"level": 1, "name": "繁荣港口", "input": {"spice": 0.46}, "output": {"food": 3.467, "silver": 0.15}, "jobs": {"merchant": 4}, "owner": "merchant"}, {"level": 2, "name": "贸易枢纽", "input": {"spice": 0.72, "cloth": 0.06}, "output": {"food": 6.0, "silver": 0.4}, "jobs": {"merchant": 5}, "owner": "merchant"}],
+    "barracks": [{"level": 0, "name": "兵营", "input": {}, "output": {"militaryCapacity": 10}, "jobs": {}, "owner": null}],
+    "training_ground": [{"level": 0, "name": "训练场", "input": {}, "output": {"militaryCapacity": 20}, "jobs": {}, "owner": null}],
+    "fortress": [{"level": 0, "name": "要塞", "input": {}, "output": {"militaryCapacity": 40}, "jobs": {}, "owner": null}],
+    "textile_mill": [{"level": 0, "name": "纺织厂", "input": {"food": 2.0, "dye": 0.75}, "output": {"cloth": 12.5, "fine_clothes": 1.5}, "jobs": {"worker": 15, "artisan": 4, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大纺织厂", "input": {"food": 2.6, "dye": 0.975, "tools": 0.04}, "output": {"cloth": 16.25, "fine_clothes": 1.95}, "jobs": {"worker": 15, "artisan": 4, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "纺织工场", "input": {"food": 4.5, "dye": 1.6875, "tools": 0.0692, "coffee": 0.0533}, "output": {"cloth": 28.125, "fine_clothes": 3.375}, "jobs": {"worker": 16, "artisan": 4, "capitalist": 1}, "owner": "capitalist"}],
+    "garment_factory": [{"level": 0, "name": "服装工厂", "input": {"cloth": 3.75, "dye": 0.75, "coal": 0.45}, "output": {"fine_clothes": 4.2, "culture": 0.45}, "jobs": {"worker": 18, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大服装厂", "input": {"cloth": 4.875, "dye": 0.975, "coal": 0.585}, "output": {"fine_clothes": 5.46, "culture": 0.585}, "jobs": {"worker": 18, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "服装公司", "input": {"cloth": 8.4375, "dye": 1.6875, "coal": 1.0125}, "output": {"fine_clothes": 9.45, "culture": 1.0125, "cloth": 0.5}, "jobs": {"worker": 20, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "lumber_mill": [{"level": 0, "name": "木材加工厂", "input": {"wood": 6.4286}, "output": {"plank": 17.1429}, "jobs": {"worker": 10, "artisan": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大木材厂", "input": {"wood": 8.3572, "tools": 0.024}, "output": {"plank": 22.2858}, "jobs": {"worker": 10, "artisan": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "木业公司", "input": {"wood": 14.4644, "tools": 0.048}, "output": {"plank": 38.5715, "furniture": 0.144}, "jobs": {"worker": 11, "artisan": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "furniture_factory": [{"level": 0, "name": "家具工厂", "input": {"plank": 5.625, "cloth": 1.8, "coal": 0.5625}, "output": {"furniture": 7.875, "culture": 0.45}, "jobs": {"worker": 17, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大家具厂", "input": {"plank": 7.3125, "cloth": 2.34, "coal": 0.73125}, "output": {"furniture": 10.2375, "culture": 0.585}, "jobs": {"worker": 17, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "家具公司", "input": {"plank": 12.65625, "cloth": 4.05, "coal": 1.265625}, "output": {"furniture": 17.71875, "culture": 1.0125, "plank": 0.4}, "jobs": {"worker": 18, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "metallurgy_workshop": [{"level": 0, "name": "冶金工坊", "input": {"iron": 1.7143, "copper": 0.3429, "wood": 0.9143}, "output": {"tools": 3.4286}, "jobs": {"worker": 5, "artisan": 2, "engineer": 1}, "owner": "artisan"}, {"level": 1, "name": "精密冶金坊", "input": {"iron": 1.2, "copper": 0.25, "wood": 0.6}, "output": {"tools": 3.9}, "jobs": {"worker": 4, "artisan": 2, "engineer": 1}, "owner": "artisan"}, {"level": 2, "name": "大冶金坊", "input": {"iron": 1.8, "copper": 0.4, "wood": 0.9, "coal": 0.08}, "output": {"tools": 6.75}, "jobs": {"worker": 5, "artisan": 2, "engineer": 1}, "owner": "artisan"}],
+    "steel_works": [{"level": 0, "name": "钢铁联合体", "input": {"iron": 1.44, "coal": 1.2, "science": 0.4}, "output": {"steel": 1.44, "tools": 0.96}, "jobs": {"worker": 18, "engineer": 5, "capitalist": 2}, "owner": "capitalist"}],
+    "building_materials_plant": [{"level": 0, "name": "建材厂", "input": {"stone": 4.5, "wood": 1.35, "coal": 0.45}, "output": {"brick": 12.375}, "jobs": {"worker": 14, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大建材厂", "input": {"stone": 5.85, "wood": 1.755, "coal": 0.585}, "output": {"brick": 16.0875}, "jobs": {"worker": 14, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "建材公司", "input": {"stone": 10.125, "wood": 3.0375, "coal": 1.0125}, "output": {"brick": 27.84375}, "jobs": {"worker": 15, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "prefab_factory": [{"level": 0, "name": "预制构件厂", "input": {"brick": 3.0, "steel": 0.4, "stone": 2.0, "coal": 0.8}, "output": {"brick": 22.0}, "jobs": {"worker": 20, "engineer": 4, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大预制厂", "input": {"brick": 3.9, "steel": 0.52, "stone": 2.6, "coal": 1.04}, "output": {"brick": 28.6}, "jobs": {"worker": 20, "engineer": 4, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "建筑材料公司", "input": {"brick": 6.75, "steel": 0.9, "stone": 4.5, "coal": 1.8}, "output": {"brick": 49.5}, "jobs": {"worker": 21, "engineer": 4, "capitalist": 1}, "owner": "capitalist"}],
+    "cannery": [{"level": 0, "name": "罐头厂", "input": {"food": 5.625, "iron": 0.675, "coal": 0.5625}, "output": {"delicacies": 7.875}, "jobs": {"worker": 17, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大罐头厂", "input": {"food": 7.3125, "iron": 0.8775, "coal": 0.73125}, "output": {"delicacies": 10.2375}, "jobs": {"worker": 17, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "食品公司", "input": {"food": 12.65625, "iron": 1.51875, "coal": 1.265625}, "output": {"delicacies": 17.71875, "ale": 0.3}, "jobs": {"worker": 18, "artisan": 5, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "distillery": [{"level": 0, "name": "蒸馏酒厂", "input": {"food": 4.5, "coal": 0.45}, "output": {"ale": 7.875, "silver": 1.8}, "jobs": {"worker": 12, "artisan": 2, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大蒸馏厂", "input": {"food": 5.85, "coal": 0.585}, "output": {"ale": 10.2375, "silver": 2.34}, "jobs": {"worker": 12, "artisan": 2, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "酒业公司", "input": {"food": 10.125, "coal": 1.0125}, "output": {"ale": 17.71875, "silver": 4.05, "culture": 0.12}, "jobs": {"worker": 13, "artisan": 2, "capitalist": 1}, "owner": "capitalist"}],
+    "paper_mill": [{"level": 0, "name": "造纸厂", "input": {"wood": 3.0, "coal": 0.3}, "output": {"papyrus": 5.0}, "jobs": {"worker": 10, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大造纸厂", "input": {"wood": 3.9, "coal": 0.39}, "output": {"papyrus": 6.5}, "jobs": {"worker": 10, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "造纸公司", "input": {"wood": 6.75, "coal": 0.675}, "output": {"papyrus": 11.25, "tools": 0.06}, "jobs": {"worker": 11, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "publishing_house": [{"level": 0, "name": "出版社", "input": {"papyrus": 2.0, "coffee": 0.4, "coal": 0.3}, "output": {"science": 5.0, "culture": 2.0}, "jobs": {"scribe": 8, "artisan": 4, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "industrial_mine": [{"level": 0, "name": "工业矿场", "input": {"tools": 0.2615, "coal": 0.5231}, "output": {"iron": 2.9616, "copper": 0.9577}, "jobs": {"miner": 17, "engineer": 2, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大工业矿场", "input": {"tools": 0.33995, "coal": 0.68, "wood": 0.4, "food": 0.8}, "output": {"iron": 3.85, "copper": 1.245}, "jobs": {"miner": 17, "engineer": 2, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "矿业公司", "input": {"tools": 0.588375, "coal": 1.125, "wood": 0.6, "food": 1.0}, "output": {"iron": 6.663075, "copper": 2.153925}, "jobs": {"miner": 18, "engineer": 2, "capitalist": 1}, "owner": "capitalist"}],
+    "mechanized_farm": [{"level": 0, "name": "机械化农场", "input": {"tools": 0.175, "coal": 0.35}, "output": {"food": 38.5}, "jobs": {"peasant": 8, "worker": 8, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大机械农场", "input": {"tools": 0.2275, "coal": 0.455, "iron": 0.06}, "output": {"food": 50.05}, "jobs": {"peasant": 8, "worker": 8, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "工业农场", "input": {"tools": 0.39375, "coal": 0.7875, "iron": 0.1, "dye": 0.03}, "output": {"food": 86.625, "cloth": 0.2}, "jobs": {"peasant": 9, "worker": 8, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "logging_company": [{"level": 0, "name": "伐木公司", "input": {"tools": 0.1333, "coal": 0.25}, "output": {"wood": 20.0}, "jobs": {"lumberjack": 11, "worker": 7, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 1, "name": "大伐木公司", "input": {"tools": 0.1563, "coal": 0.325, "food": 0.4}, "output": {"wood": 26.0}, "jobs": {"lumberjack": 11, "worker": 7, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}, {"level": 2, "name": "林业公司", "input": {"tools": 0.270825, "coal": 0.5625, "food": 0.55}, "output": {"wood": 45.0}, "jobs": {"lumberjack": 12, "worker": 7, "engineer": 1, "capitalist": 1}, "owner": "capitalist"}],
+    "apartment_block": [{"level": 0, "name": "公寓楼", "input": {}, "output": {"maxPop": 11}, "jobs": {}, "owner": null}],
+    "university": [{"level": 0, "name": "大学", "input": {"papyrus": 0.36, "coffee": 0.24, "delicacies": 0.18, "brick": 0.072, "science": 0.5}, "output": {"science": 3.6, "culture": 0.96}, "jobs": {"scribe": 5, "engineer": 2, "official": 2}, "owner": "scribe"}, {"level": 1, "name": "著名学府", "input": {"papyrus": 0.3125, "coffee": 0.1875, "delicacies": 0.125, "science": 0.4}, "output": {"science": 4.875, "culture": 1.3}, "jobs": {"scribe": 5, "engineer": 2, "official": 2}, "owner": "scribe"}, {"level": 2, "name": "皇家学院", "input": {"papyrus": 0.4375, "coffee": 0.25, "delicacies": 0.15, "science": 0.7}, "output": {"science": 8.4375, "culture": 2.25}, "jobs": {"scribe": 6, "engineer": 2, "official": 2}, "owner": "scribe"}],
+    "opera_house": [{"level": 0, "name": "歌剧院", "input": {"fine_clothes": 0.2857, "delicacies": 0.2286, "brick": 0.0571}, "output": {"culture": 4.0, "silver": 1.1429}, "jobs": {"cleric": 5, "artisan": 2, "merchant": 1}, "owner": "cleric"}, {"level": 1, "name": "大歌剧院", "input": {"fine_clothes": 0.25, "delicacies": 0.15}, "output": {"culture": 5.6875, "silver": 1.625}, "jobs": {"cleric": 5, "artisan": 2, "merchant": 1}, "owner": "cleric"}, {"level": 2, "name": "皇家歌剧院", "input": {"fine_clothes": 0.375, "delicacies": 0.225, "coffee": 0.1}, "output": {"culture": 9.8438, "silver": 2.8125, "science": 0.1875}, "jobs": {"cleric": 6, "artisan": 2, "merchant": 1}, "owner": "cleric"}],
+    "stock_exchange": [{"level": 0, "name": "证券交易所", "input": {"papyrus": 0.32, "coffee": 0.24}, "output": {"silver": 8.0, "culture": 0.8}, "jobs": {"merchant": 10, "scribe": 3, "capitalist": 2}, "owner": "capitalist"}],
+});
+
+export const BUILDING_UNLOCKS = deepFreeze({
+    "farm": {"epoch": 0, "requiresTech": null},
+    "trading_post": {"epoch": 0, "requiresTech": "barter"},
+    "large_estate": {"epoch": 3, "requiresTech": "feudalism"},
+    "lumber_camp": {"epoch": 0, "requiresTech": null},
+    "quarry": {"epoch": 0, "requiresTech": null},
+    "copper_mine": {"epoch": 1, "requiresTech": "copper_mining"},
+    "reed_works": {"epoch": 2, "requiresTech": "papyrus_cultivation"},
+    "culinary_kitchen": {"epoch": 2, "requiresTech": "culinary_arts"},
+    "brewery": {"epoch": 2, "requiresTech": "brewing"},
+    "furniture_workshop": {"epoch": 2, "requiresTech": "carpentry"},
+    "loom_house": {"epoch": 0, "requiresTech": null},
+    "dye_works": {"epoch": 1, "requiresTech": null},
+    "tailor_workshop": {"epoch": 1, "requiresTech": "tools"},
+    "mine": {"epoch": 2, "requiresTech": "ironworking"},
+    "coffee_plantation": {"epoch": 5, "requiresTech": "coffee_agronomy"},
+    "coal_mine": {"epoch": 6, "requiresTech": "coal_gasification"},
+    "hut": {"epoch": 0, "requiresTech": null},
+    "house": {"epoch": 2, "requiresTech": "urban_planning"},
+    "manor_house": {"epoch": 3, "requiresTech": "manor_architecture"},
+    "townhouse": {"epoch": 4, "requiresTech": "colonial_architecture"},
+    "civic_apartment": {"epoch": 5, "requiresTech": "enlightened_urbanism"},
+    "granary": {"epoch": 1, "requiresTech": "granary_architecture"},
+    "town_hall": {"epoch": 3, "requiresTech": "bureaucracy"},
+    "church": {"epoch": 3, "requiresTech": "theology"},
+    "monastery_cellar": {"epoch": 3, "requiresTech": "monastic_brewing"},
+    "wool_workshop": {"epoch": 3, "requiresTech": "wool_trade"},
+    "stone_workshop": {"epoch": 3, "requiresTech": "masonry_guild"},
+    "hardwood_camp": {"epoch": 3, "requiresTech": "forestry_management"},
+    "amphitheater": {"epoch": 1, "requiresTech": "amphitheater_design"},
+    "navigator_school": {"epoch": 4, "requiresTech": "navigator_schooling"},
+    "shaft_mine": {"epoch": 4, "requiresTech": "advanced_metallurgy"},
+    "dye_workshop": {"epoch": 4, "requiresTech": "new_world_dyes"},
+    "coffee_house": {"epoch": 5, "requiresTech": "coffeehouse_philosophy"},
+    "rail_depot": {"epoch": 6, "requiresTech": "rail_network"},
+    "sawmill": {"epoch": 1, "requiresTech": "tools"},
+    "brickworks": {"epoch": 0, "requiresTech": "pottery"},
+    "stone_tool_workshop": {"epoch": 0, "requiresTech": "tool_making"},
+    "bronze_foundry": {"epoch": 1, "requiresTech": "bronze_working"},
+    "iron_tool_workshop": {"epoch": 2, "requiresTech": "ironworking"},
+    "factory": {"epoch": 6, "requiresTech": "industrialization"},
+    "printing_house": {"epoch": 5, "requiresTech": "printing_press"},
+    "steel_foundry": {"epoch": 6, "requiresTech": "steel_alloys"},
+    "library": {"epoch": 0, "requiresTech": null},
+    "market": {"epoch": 1, "requiresTech": "caravan_trade"},
+    "magistrate_office": {"epoch": 1, "requiresTech": "early_administration"},
+    "dockyard": {"epoch": 4, "requiresTech": "cartography"},
+    "trade_port": {"epoch": 4, "requiresTech": "charter_companies"},
+    "barracks": {"epoch": 0, "requiresTech": null},
+    "training_ground": {"epoch": 2, "requiresTech": "military_training"},
+    "fortress": {"epoch": 4, "requiresTech": "fortification"},
+    "textile_mill": {"epoch": 5, "requiresTech": "mechanized_weaving"},
+    "garment_factory": {"epoch": 6, "requiresTech": "assembly_line"},
+    "lumber_mill": {"epoch": 5, "requiresTech": "hydraulic_sawing"},
+    "furniture_factory": {"epoch": 6, "requiresTech": "mass_production"},
+    "metallurgy_workshop": {"epoch": 4, "requiresTech": "advanced_metallurgy"},
+    "steel_works": {"epoch": 6, "requiresTech": "bessemer_process"},
+    "building_materials_plant": {"epoch": 5, "requiresTech": "industrial_ceramics"},
+    "prefab_factory": {"epoch": 6, "requiresTech": "standardized_construction"},
+    "cannery": {"epoch": 6, "requiresTech": "food_preservation"},
+    "distillery": {"epoch": 5, "requiresTech": "distillation"},
+    "paper_mill": {"epoch": 5, "requiresTech": "wood_pulp_process"},
+    "publishing_house": {"epoch": 6, "requiresTech": "mass_media"},
+    "industrial_mine": {"epoch": 6, "requiresTech": "deep_shaft_mining"},
+    "mechanized_farm": {"epoch": 6, "requiresTech": "agricultural_machinery"},
+    "logging_company": {"epoch": 6, "requiresTech": "steam_logging"},
+    "apartment_block": {"epoch": 6, "requiresTech": "urban_architecture"},
+    "university": {"epoch": 5, "requiresTech": "higher_education"},
+    "opera_house": {"epoch": 5, "requiresTech": "grand_arts"},
+    "stock_exchange": {"epoch": 6, "requiresTech": "financial_capitalism"},
+});
+
+export const EPOCH_BUILDINGS = deepFreeze({
+    "0": ["farm", "trading_post", "lumber_camp", "quarry", "loom_house", "hut", "brickworks", "stone_tool_workshop", "library", "barracks"],
+    "1": ["copper_mine", "dye_works", "tailor_workshop", "granary", "amphitheater", "sawmill", "bronze_foundry", "market", "magistrate_office"],
+    "2": ["reed_works", "culinary_kitchen", "brewery", "furniture_workshop", "mine", "house", "iron_tool_workshop", "training_ground"],
+    "3": ["large_estate", "manor_house", "town_hall", "church", "monastery_cellar", "wool_workshop", "stone_workshop", "hardwood_camp"],
+    "4": ["townhouse", "navigator_school", "shaft_mine", "dye_workshop", "dockyard", "trade_port", "fortress", "metallurgy_workshop"],
+    "5": ["coffee_plantation", "civic_apartment", "coffee_house", "printing_house", "textile_mill", "lumber_mill", "building_materials_plant", "distillery", "paper_mill", "university", "opera_house"],
+    "6": ["coal_mine", "rail_depot", "factory", "steel_foundry", "garment_factory", "furniture_factory", "steel_works", "prefab_factory", "cannery", "publishing_house", "industrial_mine", "mechanized_farm", "logging_company", "apartment_block", "stock_exchange"],
+});
+
+export const RESOURCE_CHAINS = deepFreeze({
+    "ale": ["food_chain"],
+    "cloth": ["textile_chain"],
+    "coal": ["mining_chain", "military_chain"],
+    "coffee": ["luxury_chain"],
+    "copper": ["mining_chain", "military_chain"],
+    "culture": ["knowledge_chain", "luxury_chain"],
+    "delicacies": ["food_chain"],
+    "dye": ["textile_chain"],
+    "fine_clothes": ["textile_chain"],
+    "food": ["food_chain", "textile_chain", "military_chain"],
+    "furniture": ["wood_chain"],
+    "iron": ["mining_chain", "military_chain"],
+    "military_power": ["military_chain"],
+    "papyrus": ["knowledge_chain"],
+    "plank": ["wood_chain"],
+    "science": ["knowledge_chain"],
+    "silver": ["military_chain"],
+    "spice": ["luxury_chain"],
+    "steel": ["mining_chain"],
+    "stone": ["wood_chain", "mining_chain"],
+    "tools": ["mining_chain"],
+    "weapons": ["military_chain"],
+    "wood": ["wood_chain"],
+});
+
+export const BUILDING_CHAINS = deepFreeze({
+    "armory": ["military_chain"],
+    "barracks": ["military_chain"],
+    "brewery": ["food_chain"],
+    "coal_mine": ["mining_chain"],
+    "coffee_house": ["luxury_chain"],
+    "coffee_plantation": ["luxury_chain"],
+    "copper_mine": ["mining_chain", "military_chain"],
+    "culinary_kitchen": ["food_chain"],
+    "dye_works": ["textile_chain"],
+    "factory": ["mining_chain"],
+    "farm": ["food_chain"],
+    "forge": ["mining_chain", "military_chain"],
+    "furniture_workshop": ["wood_chain"],
+    "granary": ["food_chain"],
+    "large_estate": ["food_chain"],
+    "library": ["knowledge_chain"],
+    "loom_house": ["textile_chain"],
+    "lumber_camp": ["wood_chain"],
+    "mine": ["mining_chain", "military_chain"],
+    "monastery_cellar": ["food_chain"],
+    "printing_house": ["knowledge_chain"],
+    "quarry": ["mining_chain"],
+    "reed_works": ["knowledge_chain"],
+    "sawmill": ["wood_chain"],
+    "scriptorium": ["knowledge_chain"],
+    "smelter": ["mining_chain"],
+    "spice_market": ["luxury_chain"],
+    "steel_mill": ["mining_chain"],
+    "tailor_workshop": ["textile_chain"],
+    "trade_port": ["luxury_chain"],
+    "training_ground": ["military_chain"],
+    "university": ["knowledge_chain"],
+});
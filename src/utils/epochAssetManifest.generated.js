@@ -0,0 +1,166 @@
+// Generated by scripts/build_asset_manifest.py from the images in src/assets/images,
+// the building/event configs and prompts/*.md. Do not edit; re-run the script instead.
+// source-hash: f3a3552e59548999f53f5d5cb0c8db41b34286f048933cc93429bce91ed2c15c
+
+const deepFreeze = (value) => {
+    if (value && typeof value === 'object') {
+        Object.values(value).forEach(deepFreeze);
+        Object.freeze(value);
+    }
+    return value;
+};
+
+export const EPOCH_ASSET_MANIFEST = deepFreeze({
+    "0": {"preload": ["backgrounds/bg_era_0_stone", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/stone_age_harsh_winter", "events/stone_age_hungry_peasants", "events/stone_age_new_water", "events/stone_age_stranger_footprints", "events/stone_age_tribal_legend", "events/stone_age_unexpected_discovery", "events/stone_tool_innovation", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "bytes": 2934144, "introduced": ["backgrounds/bg_era_0_stone", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/stone_age_harsh_winter", "events/stone_age_hungry_peasants", "events/stone_age_new_water", "events/stone_age_stranger_footprints", "events/stone_age_tribal_legend", "events/stone_age_unexpected_discovery", "events/stone_tool_innovation", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "introducedBytes": 2934144},
+    "1": {"preload": ["backgrounds/bg_era_1_bronze", "buildings/amphitheater", "buildings/bronze_foundry", "buildings/copper_mine", "buildings/dye_works", "buildings/granary", "buildings/magistrate_office", "buildings/market", "buildings/sawmill", "buildings/tailor_workshop", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/bronze_age_bronze_vein", "events/bronze_age_drought", "events/bronze_age_merchant_plea", "events/bronze_age_new_priest", "events/bronze_age_skirmish", "events/bronze_age_merchant_boom", "events/bronze_age_miner_unrest", "events/comet_sighted", "events/merchant_caravan", "events/plague_outbreak", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "bytes": 5003638, "introduced": ["backgrounds/bg_era_1_bronze", "buildings/amphitheater", "buildings/bronze_foundry", "buildings/copper_mine", "buildings/dye_works", "buildings/granary", "buildings/magistrate_office", "buildings/market", "buildings/sawmill", "buildings/tailor_workshop", "events/bronze_age_bronze_vein", "events/bronze_age_drought", "events/bronze_age_merchant_plea", "events/bronze_age_new_priest", "events/bronze_age_skirmish", "events/bronze_age_merchant_boom", "events/bronze_age_miner_unrest", "events/comet_sighted", "events/merchant_caravan", "events/plague_outbreak"], "introducedBytes": 2820464},
+    "2": {"preload": ["backgrounds/bg_era_2_classical", "buildings/brewery", "buildings/culinary_kitchen", "buildings/furniture_workshop", "buildings/house", "buildings/iron_tool_workshop", "buildings/mine", "buildings/reed_works", "buildings/training_ground", "buildings/amphitheater", "buildings/bronze_foundry", "buildings/copper_mine", "buildings/dye_works", "buildings/granary", "buildings/magistrate_office", "buildings/market", "buildings/sawmill", "buildings/tailor_workshop", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/classical_aqueduct_proposal", "events/classical_artistic_patronage", "events/classical_philosopher_challenge", "events/classical_written_law", "events/currency_crisis", "events/great_famine", "events/assassination_plot", "events/bread_and_circuses", "events/classical_landowner_pressure", "events/classical_scribe_salon", "events/land_reform_proposal", "events/palace_guard_demands", "events/succession_dispute", "events/technological_breakthrough", "events/bronze_age_merchant_boom", "events/bronze_age_miner_unrest", "events/comet_sighted", "events/merchant_caravan", "events/plague_outbreak", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "bytes": 8399094, "introduced": ["backgrounds/bg_era_2_classical", "buildings/brewery", "buildings/culinary_kitchen", "buildings/furniture_workshop", "buildings/house", "buildings/iron_tool_workshop", "buildings/mine", "buildings/reed_works", "buildings/training_ground", "events/classical_aqueduct_proposal", "events/classical_artistic_patronage", "events/classical_philosopher_challenge", "events/classical_written_law", "events/currency_crisis", "events/great_famine", "events/assassination_plot", "events/bread_and_circuses", "events/classical_landowner_pressure", "events/classical_scribe_salon", "events/land_reform_proposal", "events/palace_guard_demands", "events/succession_dispute", "events/technological_breakthrough"], "introducedBytes": 4230574},
+    "3": {"preload": ["backgrounds/bg_era_3_feudal", "buildings/church", "buildings/hardwood_camp", "buildings/large_estate", "buildings/manor_house", "buildings/monastery_cellar", "buildings/stone_workshop", "buildings/town_hall", "buildings/wool_workshop", "buildings/brewery", "buildings/culinary_kitchen", "buildings/furniture_workshop", "buildings/house", "buildings/iron_tool_workshop", "buildings/mine", "buildings/reed_works", "buildings/training_ground", "buildings/amphitheater", "buildings/bronze_foundry", "buildings/copper_mine", "buildings/dye_works", "buildings/granary", "buildings/magistrate_office", "buildings/market", "buildings/sawmill", "buildings/tailor_workshop", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/feudal_crusade_call", "events/feudal_guild_charter", "events/feudal_levy_dispute", "events/feudal_university_founding", "events/feudal_plague_doctor", "events/peasant_crusade", "events/currency_crisis", "events/great_famine", "events/bread_price_crisis", "events/feudal_cleric_scandal", "events/feudal_knight_parade", "events/military_coup_threat", "events/assassination_plot", "events/bread_and_circuses", "events/classical_landowner_pressure", "events/classical_scribe_salon", "events/land_reform_proposal", "events/palace_guard_demands", "events/succession_dispute", "events/technological_breakthrough", "events/bronze_age_merchant_boom", "events/bronze_age_miner_unrest", "events/comet_sighted", "events/merchant_caravan", "events/plague_outbreak", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "bytes": 10680674, "introduced": ["backgrounds/bg_era_3_feudal", "buildings/church", "buildings/hardwood_camp", "buildings/large_estate", "buildings/manor_house", "buildings/monastery_cellar", "buildings/stone_workshop", "buildings/town_hall", "buildings/wool_workshop", "events/feudal_crusade_call", "events/feudal_guild_charter", "events/feudal_levy_dispute", "events/feudal_university_founding", "events/feudal_plague_doctor", "events/peasant_crusade", "events/bread_price_crisis", "events/feudal_cleric_scandal", "events/feudal_knight_parade", "events/military_coup_threat"], "introducedBytes": 3344112},
+    "4": {"preload": ["backgrounds/bg_era_4_exploration", "buildings/dockyard", "buildings/dye_workshop", "buildings/fortress", "buildings/metallurgy_workshop", "buildings/navigator_school", "buildings/shaft_mine", "buildings/townhouse", "buildings/trade_port", "buildings/church", "buildings/hardwood_camp", "buildings/large_estate", "buildings/manor_house", "buildings/monastery_cellar", "buildings/stone_workshop", "buildings/town_hall", "buildings/wool_workshop", "buildings/brewery", "buildings/culinary_kitchen", "buildings/furniture_workshop", "buildings/house", "buildings/iron_tool_workshop", "buildings/mine", "buildings/reed_works", "buildings/training_ground", "buildings/amphitheater", "buildings/bronze_foundry", "buildings/copper_mine", "buildings/dye_works", "buildings/granary", "buildings/magistrate_office", "buildings/market", "buildings/sawmill", "buildings/tailor_workshop", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/exploration_new_world", "events/exploration_banking_family", "events/exploration_gunpowder_plot", "events/exploration_mercenary_offer", "events/exploration_renaissance_artist", "events/feudal_plague_doctor", "events/peasant_crusade", "events/age_of_exploration_colonial_unrest", "events/age_of_exploration_merchant_monopoly", "events/currency_crisis", "events/great_famine", "events/bread_price_crisis", "events/feudal_cleric_scandal", "events/feudal_knight_parade", "events/military_coup_threat", "events/assassination_plot", "events/bread_and_circuses", "events/classical_landowner_pressure", "events/classical_scribe_salon", "events/land_reform_proposal", "events/palace_guard_demands", "events/succession_dispute", "events/technological_breakthrough", "events/bronze_age_merchant_boom", "events/bronze_age_miner_unrest", "events/comet_sighted", "events/merchant_caravan", "events/plague_outbreak", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "bytes": 12288768, "introduced": ["backgrounds/bg_era_4_exploration", "buildings/dockyard", "buildings/dye_workshop", "buildings/fortress", "buildings/metallurgy_workshop", "buildings/navigator_school", "buildings/shaft_mine", "buildings/townhouse", "buildings/trade_port", "events/exploration_new_world", "events/exploration_banking_family", "events/exploration_gunpowder_plot", "events/exploration_mercenary_offer", "events/exploration_renaissance_artist", "events/age_of_exploration_colonial_unrest", "events/age_of_exploration_merchant_monopoly"], "introducedBytes": 2540052},
+    "5": {"preload": ["buildings/building_materials_plant", "buildings/civic_apartment", "buildings/coffee_house", "buildings/coffee_plantation", "buildings/cultural_salon", "buildings/distillery", "buildings/lumber_mill", "buildings/national_archives", "buildings/opera_house", "buildings/paper_mill", "buildings/printing_house", "buildings/research_institute", "buildings/textile_mill", "buildings/university", "buildings/dockyard", "buildings/dye_workshop", "buildings/fortress", "buildings/metallurgy_workshop", "buildings/navigator_school", "buildings/shaft_mine", "buildings/townhouse", "buildings/trade_port", "buildings/church", "buildings/hardwood_camp", "buildings/large_estate", "buildings/manor_house", "buildings/monastery_cellar", "buildings/stone_workshop", "buildings/town_hall", "buildings/wool_workshop", "buildings/brewery", "buildings/culinary_kitchen", "buildings/furniture_workshop", "buildings/house", "buildings/iron_tool_workshop", "buildings/mine", "buildings/reed_works", "buildings/training_ground", "buildings/amphitheater", "buildings/bronze_foundry", "buildings/copper_mine", "buildings/dye_works", "buildings/granary", "buildings/magistrate_office", "buildings/market", "buildings/sawmill", "buildings/tailor_workshop", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/exploration_banking_family", "events/exploration_gunpowder_plot", "events/exploration_mercenary_offer", "events/exploration_renaissance_artist", "events/enlightenment_coffeehouse_circle", "events/enlightenment_pamphlet_storm", "events/inventor_plea", "events/age_of_exploration_colonial_unrest", "events/age_of_exploration_merchant_monopoly", "events/currency_crisis", "events/great_famine", "events/bread_price_crisis", "events/feudal_cleric_scandal", "events/feudal_knight_parade", "events/military_coup_threat", "events/assassination_plot", "events/bread_and_circuses", "events/classical_landowner_pressure", "events/classical_scribe_salon", "events/land_reform_proposal", "events/palace_guard_demands", "events/succession_dispute", "events/technological_breakthrough", "events/bronze_age_merchant_boom", "events/bronze_age_miner_unrest", "events/comet_sighted", "events/merchant_caravan", "events/plague_outbreak", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "bytes": 13519520, "introduced": ["buildings/building_materials_plant", "buildings/civic_apartment", "buildings/coffee_house", "buildings/coffee_plantation", "buildings/cultural_salon", "buildings/distillery", "buildings/lumber_mill", "buildings/national_archives", "buildings/opera_house", "buildings/paper_mill", "buildings/printing_house", "buildings/research_institute", "buildings/textile_mill", "buildings/university", "events/enlightenment_coffeehouse_circle", "events/enlightenment_pamphlet_storm", "events/inventor_plea"], "introducedBytes": 2104672},
+    "6": {"preload": ["backgrounds/bg_era_6_industrial", "buildings/apartment_block", "buildings/cannery", "buildings/coal_mine", "buildings/factory", "buildings/furniture_factory", "buildings/garment_factory", "buildings/industrial_mine", "buildings/logging_company", "buildings/mechanized_farm", "buildings/prefab_factory", "buildings/publishing_house", "buildings/rail_depot", "buildings/steel_foundry", "buildings/steel_works", "buildings/stock_exchange", "buildings/building_materials_plant", "buildings/civic_apartment", "buildings/coffee_house", "buildings/coffee_plantation", "buildings/cultural_salon", "buildings/distillery", "buildings/lumber_mill", "buildings/national_archives", "buildings/opera_house", "buildings/paper_mill", "buildings/printing_house", "buildings/research_institute", "buildings/textile_mill", "buildings/university", "buildings/dockyard", "buildings/dye_workshop", "buildings/fortress", "buildings/metallurgy_workshop", "buildings/navigator_school", "buildings/shaft_mine", "buildings/townhouse", "buildings/trade_port", "buildings/church", "buildings/hardwood_camp", "buildings/large_estate", "buildings/manor_house", "buildings/monastery_cellar", "buildings/stone_workshop", "buildings/town_hall", "buildings/wool_workshop", "buildings/brewery", "buildings/culinary_kitchen", "buildings/furniture_workshop", "buildings/house", "buildings/iron_tool_workshop", "buildings/mine", "buildings/reed_works", "buildings/training_ground", "buildings/amphitheater", "buildings/bronze_foundry", "buildings/copper_mine", "buildings/dye_works", "buildings/granary", "buildings/magistrate_office", "buildings/market", "buildings/sawmill", "buildings/tailor_workshop", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/industrial_capitalist_boom", "events/industrial_general_strike", "events/enlightenment_coffeehouse_circle", "events/enlightenment_pamphlet_storm", "events/inventor_plea", "events/age_of_exploration_colonial_unrest", "events/age_of_exploration_merchant_monopoly", "events/bread_price_crisis", "events/feudal_cleric_scandal", "events/feudal_knight_parade", "events/military_coup_threat", "events/assassination_plot", "events/bread_and_circuses", "events/classical_landowner_pressure", "events/classical_scribe_salon", "events/land_reform_proposal", "events/palace_guard_demands", "events/succession_dispute", "events/technological_breakthrough", "events/bronze_age_merchant_boom", "events/bronze_age_miner_unrest", "events/comet_sighted", "events/merchant_caravan", "events/plague_outbreak", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "bytes": 14752572, "introduced": ["backgrounds/bg_era_6_industrial", "buildings/apartment_block", "buildings/cannery", "buildings/coal_mine", "buildings/factory", "buildings/furniture_factory", "buildings/garment_factory", "buildings/industrial_mine", "buildings/logging_company", "buildings/mechanized_farm", "buildings/prefab_factory", "buildings/publishing_house", "buildings/rail_depot", "buildings/steel_foundry", "buildings/steel_works", "buildings/stock_exchange", "events/industrial_capitalist_boom", "events/industrial_general_strike"], "introducedBytes": 2107484},
+    "7": {"preload": ["backgrounds/bg_era_7_information", "buildings/apartment_block", "buildings/cannery", "buildings/coal_mine", "buildings/factory", "buildings/furniture_factory", "buildings/garment_factory", "buildings/industrial_mine", "buildings/logging_company", "buildings/mechanized_farm", "buildings/prefab_factory", "buildings/publishing_house", "buildings/rail_depot", "buildings/steel_foundry", "buildings/steel_works", "buildings/stock_exchange", "buildings/building_materials_plant", "buildings/civic_apartment", "buildings/coffee_house", "buildings/coffee_plantation", "buildings/cultural_salon", "buildings/distillery", "buildings/lumber_mill", "buildings/national_archives", "buildings/opera_house", "buildings/paper_mill", "buildings/printing_house", "buildings/research_institute", "buildings/textile_mill", "buildings/university", "buildings/dockyard", "buildings/dye_workshop", "buildings/fortress", "buildings/metallurgy_workshop", "buildings/navigator_school", "buildings/shaft_mine", "buildings/townhouse", "buildings/trade_port", "buildings/church", "buildings/hardwood_camp", "buildings/large_estate", "buildings/manor_house", "buildings/monastery_cellar", "buildings/stone_workshop", "buildings/town_hall", "buildings/wool_workshop", "buildings/brewery", "buildings/culinary_kitchen", "buildings/furniture_workshop", "buildings/house", "buildings/iron_tool_workshop", "buildings/mine", "buildings/reed_works", "buildings/training_ground", "buildings/amphitheater", "buildings/bronze_foundry", "buildings/copper_mine", "buildings/dye_works", "buildings/granary", "buildings/magistrate_office", "buildings/market", "buildings/sawmill", "buildings/tailor_workshop", "buildings/barracks", "buildings/brickworks", "buildings/farm", "buildings/hut", "buildings/library", "buildings/loom_house", "buildings/lumber_camp", "buildings/quarry", "buildings/stone_tool_workshop", "buildings/trading_post", "events/industrial_capitalist_boom", "events/industrial_general_strike", "events/enlightenment_coffeehouse_circle", "events/enlightenment_pamphlet_storm", "events/inventor_plea", "events/age_of_exploration_colonial_unrest", "events/age_of_exploration_merchant_monopoly", "events/bread_price_crisis", "events/feudal_cleric_scandal", "events/feudal_knight_parade", "events/military_coup_threat", "events/assassination_plot", "events/bread_and_circuses", "events/classical_landowner_pressure", "events/classical_scribe_salon", "events/land_reform_proposal", "events/palace_guard_demands", "events/succession_dispute", "events/technological_breakthrough", "events/bronze_age_merchant_boom", "events/bronze_age_miner_unrest", "events/comet_sighted", "events/merchant_caravan", "events/plague_outbreak", "events/good_harvest", "events/great_flood", "events/natural_disaster", "events/stone_age_elder_council"], "bytes": 14766672, "introduced": ["backgrounds/bg_era_7_information"], "introducedBytes": 88012},
+});
+
+export const ASSET_FILES = deepFreeze({
+    "backgrounds/Gemini_Generated_Image_ksizagksizagksiz": ["backgrounds/Gemini_Generated_Image_ksizagksizagksiz.webp", 136822],
+    "backgrounds/bg_era_0_stone": ["backgrounds/bg_era_0_stone.webp", 75434],
+    "backgrounds/bg_era_1_bronze": ["backgrounds/bg_era_1_bronze.webp", 226366],
+    "backgrounds/bg_era_2_classical": ["backgrounds/bg_era_2_classical.webp", 158792],
+    "backgrounds/bg_era_3_feudal": ["backgrounds/bg_era_3_feudal.webp", 128006],
+    "backgrounds/bg_era_4_exploration": ["backgrounds/bg_era_4_exploration.webp", 260916],
+    "backgrounds/bg_era_6_industrial": ["backgrounds/bg_era_6_industrial.webp", 73912],
+    "backgrounds/bg_era_7_information": ["backgrounds/bg_era_7_information.webp", 88012],
+    "buildings/amphitheater": ["buildings/amphitheater.webp", 181834],
+    "buildings/apartment_block": ["buildings/apartment_block.webp", 110464],
+    "buildings/barracks": ["buildings/barracks.webp", 177158],
+    "buildings/brewery": ["buildings/brewery.webp", 110324],
+    "buildings/brickworks": ["buildings/brickworks.webp", 199476],
+    "buildings/bronze_foundry": ["buildings/bronze_foundry.webp", 116150],
+    "buildings/building_materials_plant": ["buildings/building_materials_plant.webp", 128178],
+    "buildings/cannery": ["buildings/cannery.webp", 114428],
+    "buildings/church": ["buildings/church.webp", 110646],
+    "buildings/civic_apartment": ["buildings/civic_apartment.webp", 206812],
+    "buildings/coal_mine": ["buildings/coal_mine.webp", 104096],
+    "buildings/coffee_house": ["buildings/coffee_house.webp", 128608],
+    "buildings/coffee_plantation": ["buildings/coffee_plantation.webp", 153744],
+    "buildings/copper_mine.bak": ["buildings/copper_mine.bak.webp", 162730],
+    "buildings/copper_mine": ["buildings/copper_mine.webp", 173132],
+    "buildings/culinary_kitchen": ["buildings/culinary_kitchen.webp", 119378],
+    "buildings/cultural_salon": ["buildings/cultural_salon.webp", 152098],
+    "buildings/distillery": ["buildings/distillery.webp", 134546],
+    "buildings/dockyard": ["buildings/dockyard.webp", 164638],
+    "buildings/dye_works": ["buildings/dye_works.webp", 190736],
+    "buildings/dye_workshop": ["buildings/dye_workshop.webp", 165088],
+    "buildings/factory": ["buildings/factory.webp", 129572],
+    "buildings/farm": ["buildings/farm.webp", 200422],
+    "buildings/fortress": ["buildings/fortress.webp", 144598],
+    "buildings/furniture_factory": ["buildings/furniture_factory.webp", 147098],
+    "buildings/furniture_workshop": ["buildings/furniture_workshop.webp", 125380],
+    "buildings/garment_factory": ["buildings/garment_factory.webp", 143692],
+    "buildings/granary": ["buildings/granary.webp", 136998],
+    "buildings/hardwood_camp": ["buildings/hardwood_camp.webp", 184480],
+    "buildings/house": ["buildings/house.webp", 149722],
+    "buildings/hut": ["buildings/hut.webp", 161568],
+    "buildings/industrial_mine": ["buildings/industrial_mine.webp", 127740],
+    "buildings/iron_tool_workshop": ["buildings/iron_tool_workshop.webp", 121498],
+    "buildings/large_estate": ["buildings/large_estate.webp", 113392],
+    "buildings/library": ["buildings/library.webp", 151672],
+    "buildings/logging_company": ["buildings/logging_company.webp", 143378],
+    "buildings/loom_house": ["buildings/loom_house.webp", 205352],
+    "buildings/lumber_camp": ["buildings/lumber_camp.webp", 195834],
+    "buildings/lumber_mill.bak": ["buildings/lumber_mill.bak.webp", 169334],
+    "buildings/lumber_mill": ["buildings/lumber_mill.webp", 130294],
+    "buildings/magistrate_office": ["buildings/magistrate_office.webp", 236336],
+    "buildings/manor_house": ["buildings/manor_house.webp", 181100],
+    "buildings/market": ["buildings/market.webp", 168630],
+    "buildings/mechanized_farm": ["buildings/mechanized_farm.webp", 120902],
+    "buildings/metallurgy_workshop": ["buildings/metallurgy_workshop.webp", 137728],
+    "buildings/mine": ["buildings/mine.webp", 123292],
+    "buildings/monastery_cellar": ["buildings/monastery_cellar.webp", 130320],
+    "buildings/national_archives": ["buildings/national_archives.webp", 121182],
+    "buildings/navigator_school": ["buildings/navigator_school.webp", 107194],
+    "buildings/opera_house": ["buildings/opera_house.webp", 128872],
+    "buildings/paper_mill": ["buildings/paper_mill.webp", 113182],
+    "buildings/prefab_factory": ["buildings/prefab_factory.webp", 108860],
+    "buildings/printing_house": ["buildings/printing_house.webp", 92502],
+    "buildings/publishing_house": ["buildings/publishing_house.webp", 152858],
+    "buildings/quarry": ["buildings/quarry.webp", 163096],
+    "buildings/rail_depot": ["buildings/rail_depot.webp", 148996],
+    "buildings/reed_works": ["buildings/reed_works.webp", 142980],
+    "buildings/research_institute": ["buildings/research_institute.webp", 135920],
+    "buildings/sawmill": ["buildings/sawmill.webp", 166016],
+    "buildings/shaft_mine": ["buildings/shaft_mine.webp", 155898],
+    "buildings/steel_foundry": ["buildings/steel_foundry.webp", 105612],
+    "buildings/steel_works": ["buildings/steel_works.webp", 94820],
+    "buildings/stock_exchange": ["buildings/stock_exchange.webp", 125454],
+    "buildings/stone_tool_workshop": ["buildings/stone_tool_workshop.webp", 150654],
+    "buildings/stone_workshop": ["buildings/stone_workshop.webp", 135074],
+    "buildings/tailor_workshop": ["buildings/tailor_workshop.webp", 156798],
+    "buildings/textile_mill": ["buildings/textile_mill.webp", 108070],
+    "buildings/town_hall": ["buildings/town_hall.webp", 101426],
+    "buildings/townhouse": ["buildings/townhouse.webp", 156614],
+    "buildings/trade_port": ["buildings/trade_port.webp", 120562],
+    "buildings/trading_post": ["buildings/trading_post.webp", 174222],
+    "buildings/training_ground": ["buildings/training_ground.webp", 137974],
+    "buildings/university": ["buildings/university.webp", 115644],
+    "buildings/wool_workshop": ["buildings/wool_workshop.webp", 150390],
+    "events/age_of_exploration_colonial_unrest": ["events/age_of_exploration_colonial_unrest.webp", 220490],
+    "events/age_of_exploration_merchant_monopoly": ["events/age_of_exploration_merchant_monopoly.webp", 198714],
+    "events/assassination_plot": ["events/assassination_plot.webp", 150448],
+    "events/bread_and_circuses": ["events/bread_and_circuses.webp", 250416],
+    "events/bread_price_crisis": ["events/bread_price_crisis.webp", 272066],
+    "events/bronze_age_bronze_vein": ["events/bronze_age_bronze_vein.webp", 88244],
+    "events/bronze_age_drought": ["events/bronze_age_drought.webp", 74706],
+    "events/bronze_age_merchant_boom": ["events/bronze_age_merchant_boom.webp", 115714],
+    "events/bronze_age_merchant_plea": ["events/bronze_age_merchant_plea.webp", 79220],
+    "events/bronze_age_miner_unrest": ["events/bronze_age_miner_unrest.webp", 61558],
+    "events/bronze_age_new_priest": ["events/bronze_age_new_priest.webp", 92480],
+    "events/bronze_age_skirmish": ["events/bronze_age_skirmish.webp", 274102],
+    "events/classical_aqueduct_proposal": ["events/classical_aqueduct_proposal.webp", 188734],
+    "events/classical_artistic_patronage": ["events/classical_artistic_patronage.webp", 234340],
+    "events/classical_landowner_pressure": ["events/classical_landowner_pressure.webp", 179454],
+    "events/classical_philosopher_challenge": ["events/classical_philosopher_challenge.webp", 273488],
+    "events/classical_scribe_salon": ["events/classical_scribe_salon.webp", 238522],
+    "events/classical_written_law": ["events/classical_written_law.webp", 207178],
+    "events/comet_sighted": ["events/comet_sighted.webp", 38290],
+    "events/currency_crisis": ["events/currency_crisis.webp", 194340],
+    "events/enlightenment_coffeehouse_circle": ["events/enlightenment_coffeehouse_circle.webp", 85280],
+    "events/enlightenment_pamphlet_storm": ["events/enlightenment_pamphlet_storm.webp", 92954],
+    "events/exploration_banking_family": ["events/exploration_banking_family.webp", 118178],
+    "events/exploration_gunpowder_plot": ["events/exploration_gunpowder_plot.webp", 53098],
+    "events/exploration_mercenary_offer": ["events/exploration_mercenary_offer.webp", 100654],
+    "events/exploration_new_world": ["events/exploration_new_world.webp", 185228],
+    "events/exploration_renaissance_artist": ["events/exploration_renaissance_artist.webp", 250454],
+    "events/feudal_cleric_scandal": ["events/feudal_cleric_scandal.webp", 182190],
+    "events/feudal_crusade_call": ["events/feudal_crusade_call.webp", 145516],
+    "events/feudal_guild_charter": ["events/feudal_guild_charter.webp", 223754],
+    "events/feudal_knight_parade": ["events/feudal_knight_parade.webp", 237548],
+    "events/feudal_levy_dispute": ["events/feudal_levy_dispute.webp", 202316],
+    "events/feudal_plague_doctor": ["events/feudal_plague_doctor.webp", 158408],
+    "events/feudal_university_founding": ["events/feudal_university_founding.webp", 232366],
+    "events/good_harvest": ["events/good_harvest.webp", 90740],
+    "events/great_famine": ["events/great_famine.webp", 157708],
+    "events/great_flood": ["events/great_flood.webp", 145618],
+    "events/industrial_capitalist_boom": ["events/industrial_capitalist_boom.webp", 92960],
+    "events/industrial_general_strike": ["events/industrial_general_strike.webp", 62642],
+    "events/inventor_plea": ["events/inventor_plea.webp", 76786],
+    "events/land_reform_proposal": ["events/land_reform_proposal.webp", 232438],
+    "events/merchant_caravan": ["events/merchant_caravan.webp", 92808],
+    "events/military_coup_threat": ["events/military_coup_threat.webp", 185746],
+    "events/natural_disaster": ["events/natural_disaster.webp", 68214],
+    "events/palace_guard_demands": ["events/palace_guard_demands.webp", 206584],
+    "events/peasant_crusade": ["events/peasant_crusade.webp", 269368],
+    "events/plague_outbreak": ["events/plague_outbreak.webp", 150346],
+    "events/stone_age_elder_council": ["events/stone_age_elder_council.webp", 99148],
+    "events/stone_age_harsh_winter": ["events/stone_age_harsh_winter.webp", 92104],
+    "events/stone_age_hungry_peasants": ["events/stone_age_hungry_peasants.webp", 64774],
+    "events/stone_age_new_water": ["events/stone_age_new_water.webp", 144546],
+    "events/stone_age_stranger_footprints": ["events/stone_age_stranger_footprints.webp", 84716],
+    "events/stone_age_tribal_legend": ["events/stone_age_tribal_legend.webp", 78990],
+    "events/stone_age_unexpected_discovery": ["events/stone_age_unexpected_discovery.webp", 79788],
+    "events/stone_tool_innovation": ["events/stone_tool_innovation.webp", 130618],
+    "events/succession_dispute": ["events/succession_dispute.webp", 237554],
+    "events/technological_breakthrough": ["events/technological_breakthrough.webp", 290030],
+});
+
+export const UNASSIGNED_ASSETS = deepFreeze(["backgrounds/Gemini_Generated_Image_ksizagksizagksiz", "buildings/copper_mine.bak", "buildings/lumber_mill.bak"]);
@@ -0,0 +1,91 @@
+import { afterEach, describe, expect, it, vi } from 'vitest';
+import { EVENTS, getRandomEvent } from '../../src/config/events';
+import { canTriggerEvent, getRandomEvent as getRandomEventFromList } from '../../src/config/events/eventUtils';
+
+const EPOCH_COUNT = 8;
+const INDEX_MODULE = '../../src/config/events/eventTriggerIndex.generated.js';
+
+const makeState = (epoch, overrides = {}) => ({
+    epoch,
+    population: 100000,
+    resources: { science: 100000 },
+    popStructure: { peasant: 500, worker: 200, merchant: 50, knight: 50, cleric: 30 },
+    classApproval: { peasant: 30, worker: 30, merchant: 70, knight: 70, cleric: 50 },
+    classInfluence: { peasant: 10, worker: 10, merchant: 30, knight: 30, cleric: 20 },
+    classWealth: { peasant: 100, worker: 100, merchant: 5000, knight: 3000, cleric: 800 },
+    nations: [],
+    ...overrides,
+});
+
+// Every event getRandomEvent can return, in selection order: drive Math.random across each slot
+const selectableIds = (select, state) => {
+    const count = EVENTS.filter(event => canTriggerEvent(event, state)).length;
+    const ids = [];
+    for (let k = 0; k < count; k++) {
+        vi.spyOn(Math, 'random').mockReturnValue((k + 0.5) / count);
+        ids.push(select(state)?.id);
+    }
+    return ids;
+};
+
+const fullScanIds = (state) => EVENTS.filter(event => canTriggerEvent(event, state)).map(event => event.id);
+
+describe('epoch-bucketed event selection', () => {
+    afterEach(() => {
+        vi.restoreAllMocks();
+        vi.doUnmock(INDEX_MODULE);
+        vi.resetModules();
+    });
+
+    it('selects from the same eligible events as a full scan in every epoch', () => {
+        // The middle state passes some population and science gates and misses others
+        const variants = [{}, { population: 5, resources: { science: 0 } }, { population: 70, resources: { science: 500 } }];
+        for (let epoch = 0; epoch < EPOCH_COUNT; epoch++) {
+            for (const state of variants.map(overrides => makeState(epoch, overrides))) {
+                const expected = fullScanIds(state);
+                expect(selectableIds(getRandomEvent, state)).toEqual(expected);
+                expect(selectableIds(s => getRandomEventFromList(s, EVENTS), state)).toEqual(expected);
+            }
+        }
+    });
+
+    it('falls back to a full scan when an epoch bucket misses an eligible event', async () => {
+        const state = makeState(2);
+        const dropped = EVENTS.findIndex(event => canTriggerEvent(event, state));
+        expect(dropped).toBeGreaterThanOrEqual(0);
+
+        // As if the event's minEpoch was lowered without re-running build_event_index.py
+        vi.doMock(INDEX_MODULE, async (importOriginal) => {
+            const { EVENT_TRIGGER_INDEX } = await importOriginal();
+            const epochBuckets = { ...EVENT_TRIGGER_INDEX.epochBuckets, 2: EVENT_TRIGGER_INDEX.epochBuckets[2].filter(i => i !== dropped) };
+            return { EVENT_TRIGGER_INDEX: { ...EVENT_TRIGGER_INDEX, epochBuckets } };
+        });
+        vi.resetModules();
+        vi.spyOn(console, 'warn').mockImplementation(() => {});
+        const events = await import('../../src/config/events');
+
+        const ids = selectableIds(events.getRandomEvent, state);
+        expect(ids).toContain(EVENTS[dropped].id);
+        expect(ids).toEqual(fullScanIds(state));
+    });
+
+    it('falls back to a full scan when a population gate is stale', async () => {
+        const state = makeState(2, { population: 100 });
+        const gated = EVENTS.findIndex(event => event.triggerConditions?.minPopulation && canTriggerEvent(event, state));
+        expect(gated).toBeGreaterThanOrEqual(0);
+
+        // As if the event's minPopulation was lowered without re-running build_event_index.py
+        vi.doMock(INDEX_MODULE, async (importOriginal) => {
+            const { EVENT_TRIGGER_INDEX } = await importOriginal();
+            const gates = EVENT_TRIGGER_INDEX.gates.map((gate, i) => (i === gated ? [state.population + 1, gate[1]] : gate));
+            return { EVENT_TRIGGER_INDEX: { ...EVENT_TRIGGER_INDEX, gates } };
+        });
+        vi.resetModules();
+        vi.spyOn(console, 'warn').mockImplementation(() => {});
+        const events = await import('../../src/config/events');
+
+        const ids = selectableIds(events.getRandomEvent, state);
+        expect(ids).toContain(EVENTS[gated].id);
+        expect(ids).toEqual(fullScanIds(state));
+    });
+});